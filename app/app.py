@@ -1,6 +1,12 @@
 import reflex as rx
 import reflex_enterprise as rxe
-from app.pages import dashboard_page
+from app.pages import (
+    activity_page,
+    analytics_page,
+    compliance_page,
+    dashboard_page,
+    portfolio_page,
+)
 
 app = rxe.App(
     theme=rx.theme(appearance="light"),
@@ -11,4 +17,8 @@ app = rxe.App(
         )
     ],
 )
-app.add_page(dashboard_page, route="/")
\ No newline at end of file
+app.add_page(dashboard_page, route="/")
+app.add_page(analytics_page, route="/analytics")
+app.add_page(activity_page, route="/activity")
+app.add_page(compliance_page, route="/compliance")
+app.add_page(portfolio_page, route="/boards")
\ No newline at end of file
@@ -6,6 +6,7 @@ from .modals import (
     add_stock_modal,
     deal_detail_modal,
     ocean_archive_modal,
+    save_view_modal,
 )
 from .header import header
 
@@ -17,5 +18,6 @@ __all__ = [
     "add_stock_modal",
     "deal_detail_modal",
     "ocean_archive_modal",
+    "save_view_modal",
     "header",
-]
\ No newline at end of file
+]
@@ -0,0 +1,134 @@
+import reflex as rx
+from app.components.analytics import TD_CLASS, TH_CLASS
+from app.models import ActivityDay, StateTransitionLog
+from app.states.activity_state import ActivityState
+
+
+def activity_filters() -> rx.Component:
+    """
+    Filter bar choosing the user and date range of the activity feed.
+
+    Returns:
+        rx.Component: The filter bar component.
+    """
+    input_class = "rounded-md border border-gray-300 p-2 text-sm focus:border-blue-500 focus:ring-1 focus:ring-blue-500"
+    return rx.el.div(
+        rx.el.select(
+            rx.foreach(
+                ActivityState.available_users,
+                lambda user: rx.el.option(user, value=user),
+            ),
+            value=ActivityState.feed_user,
+            on_change=ActivityState.set_feed_user,
+            class_name=input_class,
+        ),
+        rx.el.input(
+            type="date",
+            value=ActivityState.start_date,
+            on_change=ActivityState.set_start_date,
+            class_name=input_class,
+        ),
+        rx.el.span("to", class_name="text-sm text-gray-500"),
+        rx.el.input(
+            type="date",
+            value=ActivityState.end_date,
+            on_change=ActivityState.set_end_date,
+            class_name=input_class,
+        ),
+        rx.el.button(
+            rx.icon("x", class_name="h-4 w-4 mr-1"),
+            "Clear",
+            on_click=ActivityState.clear_filters,
+            class_name="flex items-center px-3 py-2 text-gray-500 hover:text-gray-700 text-sm font-medium hover:bg-gray-100 rounded-lg transition-colors",
+        ),
+        class_name="flex flex-wrap items-center gap-3",
+    )
+
+
+def daily_activity_strip() -> rx.Component:
+    """
+    One cell per day, shaded by the user's transition count that day.
+
+    Returns:
+        rx.Component: The strip component.
+    """
+
+    def cell(day: ActivityDay) -> rx.Component:
+        return rx.el.div(
+            title=f"{day.date}: {day.count}",
+            class_name="h-6 w-4 rounded-sm bg-blue-600",
+            style={"opacity": 0.08 + day.intensity * 0.92},
+        )
+
+    return rx.el.div(
+        rx.foreach(ActivityState.activity_days, cell),
+        class_name="flex flex-wrap gap-1",
+    )
+
+
+def activity_feed_table() -> rx.Component:
+    """
+    The current page of the user's transitions, newest first.
+
+    Returns:
+        rx.Component: The table with its pager.
+    """
+
+    def row(log: StateTransitionLog) -> rx.Component:
+        return rx.el.tr(
+            rx.el.td(
+                rx.moment(log.timestamp, format="MMM D, HH:mm"), class_name=TD_CLASS
+            ),
+            rx.el.td(log.ticker, class_name=TD_CLASS + " font-semibold"),
+            rx.el.td(log.previous_stage, class_name=TD_CLASS + " text-gray-500"),
+            rx.el.td(log.new_stage, class_name=TD_CLASS + " text-blue-600"),
+            rx.el.td(
+                log.user_comment,
+                rx.cond(
+                    log.is_forced_transition,
+                    rx.el.span(
+                        "FORCED",
+                        class_name="ml-2 text-[10px] font-bold text-amber-800 bg-amber-50 px-1 rounded border border-amber-100",
+                    ),
+                ),
+                class_name=TD_CLASS,
+            ),
+        )
+
+    pager_class = "px-3 py-1 text-sm border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-40 disabled:cursor-not-allowed"
+    return rx.el.div(
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    rx.el.th("When", class_name=TH_CLASS),
+                    rx.el.th("Ticker", class_name=TH_CLASS),
+                    rx.el.th("From", class_name=TH_CLASS),
+                    rx.el.th("To", class_name=TH_CLASS),
+                    rx.el.th("Comment", class_name=TH_CLASS),
+                )
+            ),
+            rx.el.tbody(rx.foreach(ActivityState.feed_logs, row)),
+            class_name="w-full",
+        ),
+        rx.el.div(
+            rx.el.span(
+                ActivityState.feed_range_label, class_name="text-sm text-gray-500"
+            ),
+            rx.el.div(
+                rx.el.button(
+                    "Newer",
+                    on_click=ActivityState.previous_page,
+                    disabled=~ActivityState.has_previous_page,
+                    class_name=pager_class,
+                ),
+                rx.el.button(
+                    "Older",
+                    on_click=ActivityState.next_page,
+                    disabled=~ActivityState.has_next_page,
+                    class_name=pager_class,
+                ),
+                class_name="flex gap-2",
+            ),
+            class_name="flex justify-between items-center mt-3",
+        ),
+    )
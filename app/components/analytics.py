@@ -0,0 +1,308 @@
+import reflex as rx
+from app.models import (
+    HeatmapCell,
+    HeatmapRow,
+    StageConversion,
+    StageTimeStat,
+    ThroughputWeek,
+)
+from app.states.analytics_state import AnalyticsState
+
+TH_CLASS = (
+    "text-left text-xs font-medium text-gray-500 uppercase tracking-wider py-2 px-3"
+)
+TD_CLASS = "text-sm text-gray-700 py-2 px-3 border-b border-gray-100"
+
+
+def kpi_card(label: str, value: rx.Var, icon: str) -> rx.Component:
+    """
+    Small card showing a single headline number.
+
+    Args:
+        label (str): Caption under the number.
+        value (rx.Var): The number.
+        icon (str): Lucide icon name.
+
+    Returns:
+        rx.Component: The card component.
+    """
+    return rx.el.div(
+        rx.icon(icon, class_name="h-5 w-5 text-blue-600"),
+        rx.el.div(
+            rx.el.p(value, class_name="text-2xl font-bold text-gray-900"),
+            rx.el.p(label, class_name="text-xs text-gray-500 uppercase tracking-wider"),
+        ),
+        class_name="flex items-center gap-4 bg-white border border-gray-200 rounded-lg p-4 shadow-sm",
+    )
+
+
+def analytics_panel(title: str, *children: rx.Component) -> rx.Component:
+    """
+    White panel with a heading, used for each analytics section.
+
+    Args:
+        title (str): The panel heading.
+        *children (rx.Component): The panel body.
+
+    Returns:
+        rx.Component: The panel component.
+    """
+    return rx.el.section(
+        rx.el.h2(title, class_name="text-sm font-semibold text-gray-900 mb-3"),
+        *children,
+        class_name="bg-white border border-gray-200 rounded-lg p-4 shadow-sm overflow-x-auto",
+    )
+
+
+def stage_times_table() -> rx.Component:
+    """
+    Table of median, p90 and mean days spent in each stage.
+
+    Returns:
+        rx.Component: The table component.
+    """
+
+    def row(stat: StageTimeStat) -> rx.Component:
+        return rx.el.tr(
+            rx.el.td(stat.stage, class_name=TD_CLASS + " font-medium"),
+            rx.el.td(stat.exits, class_name=TD_CLASS),
+            rx.el.td(stat.median_days, class_name=TD_CLASS),
+            rx.el.td(stat.p90_days, class_name=TD_CLASS),
+            rx.el.td(stat.mean_days, class_name=TD_CLASS),
+        )
+
+    return rx.el.table(
+        rx.el.thead(
+            rx.el.tr(
+                rx.el.th("Stage", class_name=TH_CLASS),
+                rx.el.th("Exits", class_name=TH_CLASS),
+                rx.el.th("Median Days", class_name=TH_CLASS),
+                rx.el.th("P90 Days", class_name=TH_CLASS),
+                rx.el.th("Mean Days", class_name=TH_CLASS),
+            )
+        ),
+        rx.el.tbody(rx.foreach(AnalyticsState.stage_times, row)),
+        class_name="w-full",
+    )
+
+
+def conversion_table() -> rx.Component:
+    """
+    Funnel table of conversion from each stage to the next.
+
+    Returns:
+        rx.Component: The table component.
+    """
+
+    def row(conversion: StageConversion) -> rx.Component:
+        return rx.el.tr(
+            rx.el.td(
+                f"{conversion.from_stage} → {conversion.to_stage}",
+                class_name=TD_CLASS + " font-medium",
+            ),
+            rx.el.td(conversion.conversions, class_name=TD_CLASS),
+            rx.el.td(conversion.exits, class_name=TD_CLASS),
+            rx.el.td(f"{(conversion.rate * 100).to(int)}%", class_name=TD_CLASS),
+        )
+
+    return rx.el.table(
+        rx.el.thead(
+            rx.el.tr(
+                rx.el.th("Transition", class_name=TH_CLASS),
+                rx.el.th("Converted", class_name=TH_CLASS),
+                rx.el.th("Exits", class_name=TH_CLASS),
+                rx.el.th("Rate", class_name=TH_CLASS),
+            )
+        ),
+        rx.el.tbody(rx.foreach(AnalyticsState.conversions, row)),
+        class_name="w-full",
+    )
+
+
+def throughput_chart() -> rx.Component:
+    """
+    Horizontal bars of weekly entries into Execute and Ocean.
+
+    Returns:
+        rx.Component: The chart component.
+    """
+
+    def bar(week: ThroughputWeek) -> rx.Component:
+        scale = AnalyticsState.max_weekly_throughput
+        return rx.el.div(
+            rx.el.span(
+                week.week_start, class_name="text-xs text-gray-500 w-24 shrink-0"
+            ),
+            rx.el.div(
+                rx.el.div(
+                    class_name="h-3 bg-green-500 rounded-l",
+                    style={"width": f"{week.execute * 100 / scale}%"},
+                ),
+                rx.el.div(
+                    class_name="h-3 bg-slate-400 rounded-r",
+                    style={"width": f"{week.ocean * 100 / scale}%"},
+                ),
+                class_name="flex flex-1",
+            ),
+            rx.el.span(
+                f"{week.execute} / {week.ocean}",
+                class_name="text-xs text-gray-600 w-16 text-right shrink-0",
+            ),
+            class_name="flex items-center gap-3 py-0.5",
+        )
+
+    return rx.el.div(
+        rx.el.div(
+            rx.el.span("■ Execute", class_name="text-green-600"),
+            rx.el.span("■ Ocean", class_name="text-slate-500"),
+            class_name="flex gap-4 text-xs mb-2",
+        ),
+        rx.foreach(AnalyticsState.throughput, bar),
+    )
+
+
+def transition_heatmap() -> rx.Component:
+    """
+    Heatmap of moves between each pair of stages, read from the store's
+    pre-aggregated transition counts.
+
+    Returns:
+        rx.Component: The heatmap component.
+    """
+
+    def cell(value: HeatmapCell) -> rx.Component:
+        return rx.el.td(
+            rx.cond(value.count > 0, value.count, ""),
+            class_name=rx.cond(
+                value.intensity > 0.5,
+                "text-xs text-center text-white w-16 h-10 border border-white",
+                "text-xs text-center text-gray-700 w-16 h-10 border border-white",
+            ),
+            style={"backgroundColor": f"rgba(37, 99, 235, {value.intensity})"},
+        )
+
+    def row(heatmap_row: HeatmapRow) -> rx.Component:
+        return rx.el.tr(
+            rx.el.th(
+                heatmap_row.stage,
+                class_name="text-right text-xs font-medium text-gray-600 pr-3",
+            ),
+            rx.foreach(heatmap_row.cells, cell),
+        )
+
+    return rx.el.div(
+        rx.el.select(
+            rx.foreach(
+                ["All Moves", "Forced", "Unforced"],
+                lambda option: rx.el.option(option, value=option),
+            ),
+            value=AnalyticsState.heatmap_forced,
+            on_change=AnalyticsState.set_heatmap_forced,
+            class_name="rounded-md border border-gray-300 p-2 text-sm mb-3",
+        ),
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    rx.el.th("From → To", class_name="text-xs text-gray-400 pr-3"),
+                    rx.foreach(
+                        AnalyticsState.heatmap_rows,
+                        lambda heatmap_row: rx.el.th(
+                            heatmap_row.stage,
+                            class_name="text-xs font-medium text-gray-600 px-1 pb-2",
+                        ),
+                    ),
+                )
+            ),
+            rx.el.tbody(rx.foreach(AnalyticsState.heatmap_rows, row)),
+        ),
+    )
+
+
+def analytics_filters() -> rx.Component:
+    """
+    Filter bar restricting the analytics to a user and date range.
+
+    Returns:
+        rx.Component: The filter bar component.
+    """
+    input_class = "rounded-md border border-gray-300 p-2 text-sm focus:border-blue-500 focus:ring-1 focus:ring-blue-500"
+    return rx.el.div(
+        rx.el.select(
+            rx.el.option("All Users", value="All Users"),
+            rx.foreach(
+                AnalyticsState.available_users,
+                lambda user: rx.el.option(user, value=user),
+            ),
+            value=rx.cond(
+                AnalyticsState.filter_user == "",
+                "All Users",
+                AnalyticsState.filter_user,
+            ),
+            on_change=AnalyticsState.set_filter_user,
+            class_name=input_class,
+        ),
+        rx.el.input(
+            type="date",
+            value=AnalyticsState.start_date,
+            on_change=AnalyticsState.set_start_date,
+            class_name=input_class,
+        ),
+        rx.el.span("to", class_name="text-sm text-gray-500"),
+        rx.el.input(
+            type="date",
+            value=AnalyticsState.end_date,
+            on_change=AnalyticsState.set_end_date,
+            class_name=input_class,
+        ),
+        rx.el.button(
+            rx.icon("x", class_name="h-4 w-4 mr-1"),
+            "Clear",
+            on_click=AnalyticsState.clear_filters,
+            class_name="flex items-center px-3 py-2 text-gray-500 hover:text-gray-700 text-sm font-medium hover:bg-gray-100 rounded-lg transition-colors",
+        ),
+        class_name="flex flex-wrap items-center gap-3",
+    )
+
+
+def audit_trail_check() -> rx.Component:
+    """
+    Runs the audit trail check as a background job and lists its findings.
+
+    Returns:
+        rx.Component: The audit check component.
+    """
+    return rx.el.div(
+        rx.el.div(
+            rx.el.button(
+                rx.icon("shield-check", class_name="h-4 w-4 mr-2"),
+                "Verify Audit Trail",
+                on_click=AnalyticsState.verify_audit_trail,
+                disabled=AnalyticsState.active_job_id != "",
+                class_name="flex items-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors disabled:opacity-50",
+            ),
+            rx.cond(
+                AnalyticsState.active_job_id != "",
+                rx.el.button(
+                    rx.icon("circle-x", class_name="h-4 w-4 mr-2"),
+                    f"Cancel {AnalyticsState.active_job_label}",
+                    on_click=AnalyticsState.cancel_active_job,
+                    class_name="flex items-center px-4 py-2 bg-amber-50 text-amber-700 border border-amber-200 text-sm font-medium rounded-lg hover:bg-amber-100 transition-colors",
+                ),
+            ),
+            class_name="flex gap-3 mb-3",
+        ),
+        rx.cond(
+            AnalyticsState.audit_summary != "",
+            rx.el.p(
+                AnalyticsState.audit_summary,
+                class_name="text-sm text-gray-700 mb-2",
+            ),
+        ),
+        rx.el.ul(
+            rx.foreach(
+                AnalyticsState.audit_problems,
+                lambda problem: rx.el.li(problem, class_name="text-xs text-red-700"),
+            ),
+            class_name="space-y-1",
+        ),
+    )
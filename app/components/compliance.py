@@ -0,0 +1,222 @@
+import reflex as rx
+from app.components.analytics import TD_CLASS, TH_CLASS
+from app.models import ReviewQueueItem
+from app.services.review_queue import REVIEW_STATUSES
+from app.states.compliance_state import ComplianceState
+
+ACTION_CLASS = "px-2 py-1 text-xs font-medium rounded-md border transition-colors"
+
+
+def review_status_tabs() -> rx.Component:
+    """
+    One tab per review status with the number of transitions in it.
+
+    Returns:
+        rx.Component: The tab bar component.
+    """
+
+    def tab(status: str, label: str) -> rx.Component:
+        return rx.el.button(
+            label,
+            rx.el.span(
+                ComplianceState.review_counts[status],
+                class_name="ml-2 px-1.5 rounded-full bg-gray-100 text-gray-600 text-xs",
+            ),
+            on_click=ComplianceState.set_review_status(status),
+            class_name=rx.cond(
+                ComplianceState.review_status == status,
+                "flex items-center px-3 py-2 text-sm font-medium border-b-2 border-blue-600 text-blue-700",
+                "flex items-center px-3 py-2 text-sm font-medium border-b-2 border-transparent text-gray-500 hover:text-gray-700",
+            ),
+        )
+
+    return rx.el.div(
+        *[tab(status, label) for status, label in REVIEW_STATUSES.items()],
+        class_name="flex gap-2 border-b border-gray-200",
+    )
+
+
+def review_toolbar() -> rx.Component:
+    """
+    Reviewer picker, review note and the batch approval button.
+
+    Returns:
+        rx.Component: The toolbar component.
+    """
+    input_class = "rounded-md border border-gray-300 p-2 text-sm focus:border-blue-500 focus:ring-1 focus:ring-blue-500"
+    return rx.el.div(
+        rx.el.select(
+            rx.foreach(
+                ComplianceState.available_users,
+                lambda user: rx.el.option(user, value=user),
+            ),
+            value=ComplianceState.reviewer,
+            on_change=ComplianceState.set_reviewer,
+            class_name=input_class,
+        ),
+        rx.el.input(
+            placeholder="Review note (required to reject)",
+            value=ComplianceState.review_note,
+            on_change=ComplianceState.set_review_note,
+            class_name=input_class + " flex-1 min-w-[240px]",
+        ),
+        rx.el.button(
+            rx.icon("check-check", class_name="h-4 w-4 mr-2"),
+            f"Approve selected ({ComplianceState.selected_count})",
+            on_click=ComplianceState.approve_selected,
+            disabled=ComplianceState.selected_count == 0,
+            class_name="flex items-center px-4 py-2 bg-green-600 text-white text-sm font-medium rounded-lg hover:bg-green-700 transition-colors disabled:opacity-40 disabled:cursor-not-allowed",
+        ),
+        class_name="flex flex-wrap items-center gap-3",
+    )
+
+
+def review_actions(item: ReviewQueueItem) -> rx.Component:
+    """
+    Buttons for the actions open on one transition's review.
+
+    Args:
+        item (ReviewQueueItem): The transition and its review.
+
+    Returns:
+        rx.Component: The action buttons.
+    """
+    status = item.review.status
+    decide = rx.fragment(
+        rx.el.button(
+            "Approve",
+            on_click=ComplianceState.approve_review(item.log.id),
+            class_name=ACTION_CLASS
+            + " border-green-200 text-green-700 hover:bg-green-50",
+        ),
+        rx.el.button(
+            "Reject",
+            on_click=ComplianceState.reject_review(item.log.id),
+            class_name=ACTION_CLASS + " border-red-200 text-red-700 hover:bg-red-50",
+        ),
+    )
+    return rx.el.div(
+        rx.match(
+            status,
+            (
+                "pending",
+                rx.el.button(
+                    "Claim",
+                    on_click=ComplianceState.claim_review(item.log.id),
+                    class_name=ACTION_CLASS
+                    + " border-gray-300 text-gray-700 hover:bg-gray-50",
+                ),
+            ),
+            (
+                "claimed",
+                rx.el.button(
+                    "Release",
+                    on_click=ComplianceState.release_review(item.log.id),
+                    class_name=ACTION_CLASS
+                    + " border-gray-300 text-gray-700 hover:bg-gray-50",
+                ),
+            ),
+            rx.fragment(),
+        ),
+        rx.cond((status == "pending") | (status == "claimed"), decide),
+        class_name="flex gap-1",
+    )
+
+
+def review_queue_table() -> rx.Component:
+    """
+    The current page of forced transitions in the selected status, oldest
+    first, with their rationale and review.
+
+    Returns:
+        rx.Component: The table with its pager.
+    """
+
+    def row(item: ReviewQueueItem) -> rx.Component:
+        return rx.el.tr(
+            rx.el.td(
+                rx.el.input(
+                    type="checkbox",
+                    checked=ComplianceState.selected_log_ids.contains(item.log.id),
+                    on_change=lambda _: ComplianceState.toggle_selected(item.log.id),
+                ),
+                class_name=TD_CLASS,
+            ),
+            rx.el.td(
+                rx.moment(item.log.timestamp, format="MMM D, YYYY HH:mm"),
+                class_name=TD_CLASS,
+            ),
+            rx.el.td(item.log.ticker, class_name=TD_CLASS + " font-semibold"),
+            rx.el.td(
+                f"{item.log.previous_stage} → {item.log.new_stage}",
+                class_name=TD_CLASS,
+            ),
+            rx.el.td(item.log.updated_by, class_name=TD_CLASS),
+            rx.el.td(
+                item.log.forced_rationale,
+                class_name=TD_CLASS + " max-w-[280px] text-amber-800",
+            ),
+            rx.el.td(
+                rx.cond(
+                    item.review.reviewed_by != "",
+                    rx.el.div(
+                        rx.el.span(item.review.reviewed_by, class_name="block"),
+                        rx.el.span(
+                            item.review.review_note,
+                            class_name="block text-xs text-gray-500",
+                        ),
+                    ),
+                    item.review.claimed_by,
+                ),
+                class_name=TD_CLASS,
+            ),
+            rx.el.td(review_actions(item), class_name=TD_CLASS),
+        )
+
+    pager_class = "px-3 py-1 text-sm border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-40 disabled:cursor-not-allowed"
+    return rx.el.div(
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    rx.el.th(
+                        rx.el.input(
+                            type="checkbox",
+                            checked=ComplianceState.selected_count > 0,
+                            on_change=lambda _: ComplianceState.toggle_select_page(),
+                        ),
+                        class_name=TH_CLASS,
+                    ),
+                    rx.el.th("When", class_name=TH_CLASS),
+                    rx.el.th("Ticker", class_name=TH_CLASS),
+                    rx.el.th("Move", class_name=TH_CLASS),
+                    rx.el.th("Moved By", class_name=TH_CLASS),
+                    rx.el.th("Rationale", class_name=TH_CLASS),
+                    rx.el.th("Reviewer", class_name=TH_CLASS),
+                    rx.el.th("", class_name=TH_CLASS),
+                )
+            ),
+            rx.el.tbody(rx.foreach(ComplianceState.review_items, row)),
+            class_name="w-full",
+        ),
+        rx.el.div(
+            rx.el.span(
+                ComplianceState.review_range_label, class_name="text-sm text-gray-500"
+            ),
+            rx.el.div(
+                rx.el.button(
+                    "Older",
+                    on_click=ComplianceState.previous_page,
+                    disabled=~ComplianceState.has_previous_page,
+                    class_name=pager_class,
+                ),
+                rx.el.button(
+                    "Newer",
+                    on_click=ComplianceState.next_page,
+                    disabled=~ComplianceState.has_next_page,
+                    class_name=pager_class,
+                ),
+                class_name="flex gap-2",
+            ),
+            class_name="flex justify-between items-center mt-3",
+        ),
+    )
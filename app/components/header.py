@@ -2,6 +2,94 @@ import reflex as rx
 from app.states.kanban_state import KanbanState
 
 
+def saved_view_item(view: rx.Var) -> rx.Component:
+    """
+    Menu entry for one saved view, with open, export and delete actions.
+
+    Args:
+        view (rx.Var): The SavedView.
+
+    Returns:
+        rx.Component: The submenu for the view.
+    """
+    return rx.menu.sub(
+        rx.menu.sub_trigger(
+            rx.cond(view.shared, rx.icon("users", size=14), rx.icon("user", size=14)),
+            view.name,
+        ),
+        rx.menu.sub_content(
+            rx.menu.item("Open", on_click=KanbanState.apply_view(view.id)),
+            rx.menu.item("Export CSV", on_click=KanbanState.export_view(view.id)),
+            rx.cond(
+                view.owner == KanbanState.modal_user,
+                rx.menu.item(
+                    "Delete", color="red", on_click=KanbanState.delete_view(view.id)
+                ),
+            ),
+        ),
+    )
+
+
+def saved_views_menu() -> rx.Component:
+    """
+    Dropdown listing the user's own and shared saved views.
+
+    Returns:
+        rx.Component: The saved views menu.
+    """
+    return rx.menu.root(
+        rx.menu.trigger(
+            rx.el.button(
+                rx.icon("bookmark", class_name="h-4 w-4 mr-2"),
+                rx.cond(
+                    KanbanState.active_view_id != "",
+                    KanbanState.active_view_name,
+                    "Views",
+                ),
+                class_name=rx.cond(
+                    KanbanState.active_view_id != "",
+                    "flex items-center justify-center px-4 py-2 bg-blue-50 text-blue-700 border border-blue-200 text-sm font-medium rounded-lg hover:bg-blue-100 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
+                    "flex items-center justify-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
+                ),
+            )
+        ),
+        rx.menu.content(
+            rx.menu.item(
+                rx.icon("bookmark-plus", size=14),
+                "Save current filters...",
+                on_click=KanbanState.open_view_modal,
+            ),
+            rx.cond(
+                KanbanState.saved_views.length() > 0,
+                rx.menu.separator(),
+            ),
+            rx.foreach(KanbanState.saved_views, saved_view_item),
+        ),
+    )
+
+
+def board_switcher() -> rx.Component:
+    """
+    Picks the board shown on the dashboard. Hidden when the deployment has
+    a single board.
+
+    Returns:
+        rx.Component: The board select.
+    """
+    return rx.cond(
+        KanbanState.boards.length() > 1,
+        rx.el.select(
+            rx.foreach(
+                KanbanState.boards,
+                lambda board: rx.el.option(board.name, value=board.id),
+            ),
+            value=KanbanState.board_id,
+            on_change=KanbanState.switch_board,
+            class_name="rounded-md border border-gray-300 py-1 pl-2 pr-8 text-sm font-medium text-gray-700 focus:border-blue-500 focus:ring-1 focus:ring-blue-500",
+        ),
+    )
+
+
 def header() -> rx.Component:
     """
     Application header with search, filters, and actions.
@@ -19,6 +107,17 @@ def header() -> rx.Component:
                         "Stock State Tracker",
                         class_name="text-xl font-bold text-gray-900 tracking-tight",
                     ),
+                    board_switcher(),
+                    rx.cond(
+                        KanbanState.moves_since_last_visit > 0,
+                        rx.el.button(
+                            f"{KanbanState.moves_since_last_visit} transitions since your last visit",
+                            rx.icon("x", class_name="h-3 w-3 ml-1"),
+                            on_click=KanbanState.dismiss_visit_summary,
+                            title="Dismiss",
+                            class_name="hidden md:flex items-center px-2 py-0.5 text-xs font-medium text-blue-700 bg-blue-50 border border-blue-200 rounded-full hover:bg-blue-100",
+                        ),
+                    ),
                     class_name="flex items-center gap-3",
                 ),
                 rx.el.button(
@@ -46,8 +145,11 @@ def header() -> rx.Component:
                     ),
                     class_name="relative w-full md:w-auto",
                 ),
+                saved_views_menu(),
                 rx.cond(
-                    (KanbanState.search_query != "") | KanbanState.show_stale_only,
+                    (KanbanState.search_query != "")
+                    | KanbanState.show_stale_only
+                    | (KanbanState.active_view_id != ""),
                     rx.el.button(
                         rx.icon("x", class_name="h-4 w-4 mr-1"),
                         "Clear",
@@ -69,6 +171,42 @@ def header() -> rx.Component:
                         "flex items-center justify-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
                     ),
                 ),
+                rx.cond(
+                    KanbanState.active_job_id != "",
+                    rx.el.button(
+                        rx.icon("circle-x", class_name="h-4 w-4 mr-2"),
+                        f"Cancel {KanbanState.active_job_label}",
+                        on_click=KanbanState.cancel_active_job,
+                        class_name="flex items-center justify-center px-4 py-2 bg-amber-50 text-amber-700 border border-amber-200 text-sm font-medium rounded-lg hover:bg-amber-100 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
+                    ),
+                ),
+                rx.cond(
+                    KanbanState.boards.length() > 1,
+                    rx.el.a(
+                        rx.icon("layout-grid", class_name="h-4 w-4 mr-2"),
+                        "Boards",
+                        href="/boards",
+                        class_name="flex items-center justify-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
+                    ),
+                ),
+                rx.el.a(
+                    rx.icon("chart-column", class_name="h-4 w-4 mr-2"),
+                    "Analytics",
+                    href="/analytics",
+                    class_name="flex items-center justify-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
+                ),
+                rx.el.a(
+                    rx.icon("user-round", class_name="h-4 w-4 mr-2"),
+                    "Activity",
+                    href="/activity",
+                    class_name="flex items-center justify-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
+                ),
+                rx.el.a(
+                    rx.icon("shield-check", class_name="h-4 w-4 mr-2"),
+                    "Compliance",
+                    href="/compliance",
+                    class_name="flex items-center justify-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors w-full md:w-auto min-h-[44px] md:min-h-[38px]",
+                ),
                 rx.el.button(
                     rx.icon("download", class_name="h-4 w-4 mr-2"),
                     "Export CSV",
@@ -90,4 +228,4 @@ def header() -> rx.Component:
             class_name="flex flex-col md:flex-row justify-between items-center max-w-[1800px] mx-auto w-full",
         ),
         class_name="bg-white border-b border-gray-200 px-6 py-4 z-20 relative",
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,26 @@
+from reflex.vars.base import Var
+
+# crypto.randomUUID only exists in secure contexts (HTTPS or localhost), so
+# on a plain-HTTP origin a version 4 UUID is built from getRandomValues,
+# which is available everywhere, or from Math.random as a last resort.
+_RANDOM_UUID_JS = (
+    "(globalThis.crypto && crypto.randomUUID ? crypto.randomUUID() : "
+    "'10000000-1000-4000-8000-100000000000'.replace(/[018]/g, (c) => "
+    "(c ^ ((globalThis.crypto && crypto.getRandomValues "
+    "? crypto.getRandomValues(new Uint8Array(1))[0] : Math.random() * 256) "
+    "& (15 >> (c / 4)))).toString(16)))"
+)
+
+
+def new_idempotency_key() -> Var[str]:
+    """
+    Returns a client-side expression that generates a fresh idempotency key.
+
+    The expression is evaluated in the browser when the event fires, so the
+    key is embedded in the queued event payload and resent unchanged if the
+    websocket reconnects and the event is retried.
+
+    Returns:
+        Var[str]: A JS expression evaluating to a random UUID string.
+    """
+    return Var(_js_expr=_RANDOM_UUID_JS, _var_type=str)
@@ -1,5 +1,8 @@
 import reflex as rx
 from app.states.kanban_state import KanbanState
+from app.components.idempotency import new_idempotency_key
+from app.models import Stock
+from app.services.saved_views import VIEW_SORTS
 
 
 def confirmation_modal() -> rx.Component:
@@ -80,7 +83,7 @@ def confirmation_modal() -> rx.Component:
                 ),
                 rx.el.button(
                     "Save & Move",
-                    on_click=KanbanState.confirm_move,
+                    on_click=KanbanState.confirm_move(new_idempotency_key()),
                     disabled=KanbanState.modal_comment == "",
                     class_name="px-4 py-2 text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700 disabled:opacity-50 disabled:cursor-not-allowed",
                 ),
@@ -163,7 +166,7 @@ def force_transition_modal() -> rx.Component:
                 ),
                 rx.el.button(
                     "Confirm Force Move",
-                    on_click=KanbanState.confirm_force_move,
+                    on_click=KanbanState.confirm_force_move(new_idempotency_key()),
                     disabled=KanbanState.force_rationale == "",
                     class_name="px-4 py-2 text-sm font-medium text-white bg-amber-600 rounded-md hover:bg-amber-700 disabled:opacity-50 disabled:cursor-not-allowed",
                 ),
@@ -233,7 +236,7 @@ def add_stock_modal() -> rx.Component:
                 ),
                 rx.el.button(
                     "Create Stock",
-                    on_click=KanbanState.submit_new_stock,
+                    on_click=KanbanState.submit_new_stock(new_idempotency_key()),
                     class_name="px-4 py-2 text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700",
                 ),
                 class_name="flex justify-end gap-3",
@@ -246,6 +249,118 @@ def add_stock_modal() -> rx.Component:
     )
 
 
+def save_view_modal() -> rx.Component:
+    """
+    Modal for saving the current search and stale filters as a named view.
+
+    Returns:
+        rx.Component: The save view dialog component.
+    """
+    return rx.dialog.root(
+        rx.dialog.content(
+            rx.dialog.title("Save View"),
+            rx.dialog.description(
+                "Saves the current search and stale filter with the criteria below.",
+                class_name="mb-4",
+            ),
+            rx.el.div(
+                rx.el.label(
+                    "View Name",
+                    class_name="text-sm font-medium text-gray-700 block mb-1",
+                ),
+                rx.el.input(
+                    placeholder="e.g. Stale forced moves",
+                    on_change=KanbanState.set_view_name,
+                    class_name="w-full rounded-md border border-gray-300 p-2 text-sm mb-3 focus:border-blue-500 focus:ring-1 focus:ring-blue-500",
+                    default_value=KanbanState.view_name,
+                ),
+                rx.el.label(
+                    "Stages (none selected shows all)",
+                    class_name="text-sm font-medium text-gray-700 block mb-1",
+                ),
+                rx.el.div(
+                    rx.foreach(
+                        KanbanState.stages,
+                        lambda stage: rx.el.button(
+                            stage,
+                            on_click=KanbanState.toggle_view_stage(stage),
+                            class_name=rx.cond(
+                                KanbanState.view_stages.contains(stage),
+                                "px-2 py-1 text-xs font-medium rounded-md border border-blue-500 bg-blue-50 text-blue-700",
+                                "px-2 py-1 text-xs font-medium rounded-md border border-gray-300 bg-white text-gray-600 hover:bg-gray-50",
+                            ),
+                        ),
+                    ),
+                    class_name="flex flex-wrap gap-2 mb-3",
+                ),
+                rx.el.label(
+                    "Last Moved By",
+                    class_name="text-sm font-medium text-gray-700 block mb-1",
+                ),
+                rx.el.select(
+                    rx.el.option("Anyone", value=""),
+                    rx.foreach(
+                        KanbanState.available_users,
+                        lambda user: rx.el.option(user, value=user),
+                    ),
+                    value=KanbanState.view_moved_by,
+                    on_change=KanbanState.set_view_moved_by,
+                    class_name="w-full rounded-md border border-gray-300 p-2 text-sm mb-3 focus:border-blue-500 focus:ring-1 focus:ring-blue-500",
+                ),
+                rx.el.label(
+                    "Sort By",
+                    class_name="text-sm font-medium text-gray-700 block mb-1",
+                ),
+                rx.el.select(
+                    *[
+                        rx.el.option(label, value=value)
+                        for value, label in VIEW_SORTS.items()
+                    ],
+                    value=KanbanState.view_sort,
+                    on_change=KanbanState.set_view_sort,
+                    class_name="w-full rounded-md border border-gray-300 p-2 text-sm mb-3 focus:border-blue-500 focus:ring-1 focus:ring-blue-500",
+                ),
+                rx.el.label(
+                    rx.checkbox(
+                        checked=KanbanState.view_forced_only,
+                        on_change=KanbanState.set_view_forced_only,
+                    ),
+                    "Forced transitions only",
+                    class_name="flex items-center gap-2 text-sm text-gray-700 mb-2",
+                ),
+                rx.el.label(
+                    rx.checkbox(
+                        checked=KanbanState.view_shared,
+                        on_change=KanbanState.set_view_shared,
+                    ),
+                    "Share with all users",
+                    class_name="flex items-center gap-2 text-sm text-gray-700 mb-6",
+                ),
+                class_name="flex flex-col",
+            ),
+            rx.el.div(
+                rx.dialog.close(
+                    rx.el.button(
+                        "Cancel",
+                        on_click=KanbanState.close_view_modal,
+                        class_name="px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50",
+                    )
+                ),
+                rx.el.button(
+                    "Save View",
+                    on_click=KanbanState.save_view,
+                    class_name="px-4 py-2 text-sm font-medium text-white bg-blue-600 rounded-md hover:bg-blue-700",
+                ),
+                class_name="flex justify-end gap-3",
+            ),
+        ),
+        open=KanbanState.is_view_modal_open,
+        on_open_change=lambda open: rx.cond(
+            open, rx.noop(), KanbanState.close_view_modal
+        ),
+    )
+
+
 def deal_detail_modal() -> rx.Component:
     """
     Modal for viewing and editing deal details.
@@ -458,19 +573,62 @@ def deal_detail_modal() -> rx.Component:
     )
 
 
+def archived_stock_row(stock: Stock) -> rx.Component:
+    """
+    One stock in cold storage, with a button restoring it to the stage the
+    board's rules restore archived stocks to, if there is one.
+
+    Args:
+        stock (Stock): The archived stock.
+
+    Returns:
+        rx.Component: The row component.
+    """
+    return rx.el.div(
+        rx.el.div(
+            rx.el.span(stock.ticker, class_name="font-bold text-gray-700"),
+            rx.el.span(stock.company_name, class_name="text-sm text-gray-500 ml-2"),
+            class_name="flex items-center cursor-pointer",
+            on_click=lambda: KanbanState.open_detail_modal(stock.id),
+        ),
+        rx.el.div(
+            rx.el.span(
+                rx.moment(stock.current_stage_entered_at, from_now=True),
+                class_name="text-xs text-gray-400",
+            ),
+            rx.cond(
+                KanbanState.restore_stage != "",
+                rx.el.button(
+                    f"Restore to {KanbanState.restore_stage}",
+                    on_click=lambda: KanbanState.restore_archived_stock(
+                        stock.id, new_idempotency_key()
+                    ),
+                    class_name="px-2 py-1 text-xs font-medium text-blue-700 border border-blue-200 rounded-md hover:bg-blue-50",
+                ),
+            ),
+            class_name="flex items-center gap-3",
+        ),
+        class_name="flex items-center justify-between p-3 bg-white border border-dashed border-gray-300 rounded-lg",
+        key=stock.id,
+    )
+
+
 def ocean_archive_modal() -> rx.Component:
     """
-    Modal for viewing the Ocean archive list.
-    Triggered by clicking the Ocean summary card.
+    Modal for viewing the archive stage's list, e.g. Ocean's.
+    Triggered by clicking the archive stage's summary card.
+
+    Lists the archive stage's stocks still on the board, then pages through
+    the ones moved to cold storage.
 
     Returns:
         rx.Component: The ocean archive dialog component.
     """
     return rx.dialog.root(
         rx.dialog.content(
-            rx.dialog.title("Ocean Archive"),
+            rx.dialog.title(f"{KanbanState.archive_stage} Archive"),
             rx.dialog.description(
-                f"Archived deals ({KanbanState.ocean_stocks.length()} total)",
+                f"Archived deals ({KanbanState.ocean_stocks.length() + KanbanState.archived_ocean_count} total)",
                 class_name="mb-4",
             ),
             rx.scroll_area(
@@ -500,6 +658,26 @@ def ocean_archive_modal() -> rx.Component:
                             key=stock.id,
                         ),
                     ),
+                    rx.cond(
+                        KanbanState.archived_ocean_count > 0,
+                        rx.el.div(
+                            rx.el.h4(
+                                f"Cold storage ({KanbanState.archived_ocean_count})",
+                                class_name="text-xs font-semibold uppercase tracking-wide text-gray-500 mt-4",
+                            ),
+                            rx.foreach(KanbanState.archived_stocks, archived_stock_row),
+                            rx.cond(
+                                KanbanState.archived_stocks.length()
+                                < KanbanState.archived_ocean_count,
+                                rx.el.button(
+                                    "Load more",
+                                    on_click=KanbanState.load_more_archived,
+                                    class_name="px-3 py-1 text-sm text-gray-700 border border-gray-300 rounded-md hover:bg-gray-50 self-center",
+                                ),
+                            ),
+                            class_name="flex flex-col gap-2",
+                        ),
+                    ),
                     class_name="flex flex-col gap-2",
                 ),
                 class_name="max-h-[500px] pr-2",
@@ -521,4 +699,4 @@ def ocean_archive_modal() -> rx.Component:
         on_open_change=lambda open: rx.cond(
             open, rx.noop(), KanbanState.close_ocean_modal
         ),
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,68 @@
+import reflex as rx
+from app.components.analytics import TD_CLASS, TH_CLASS
+from app.models import BoardSummary
+from app.states.portfolio_state import PortfolioState
+
+
+def board_summary_table() -> rx.Component:
+    """
+    One row per board with its stocks in each stage, activity and open
+    reviews, and a closing row with the portfolio total.
+
+    Returns:
+        rx.Component: The table component.
+    """
+
+    def cells(summary: BoardSummary) -> list[rx.Component]:
+        return [
+            rx.el.td(summary.stocks, class_name=TD_CLASS + " font-semibold"),
+            rx.foreach(
+                PortfolioState.stage_columns,
+                lambda stage: rx.el.td(
+                    summary.stage_counts[stage], class_name=TD_CLASS
+                ),
+            ),
+            rx.el.td(summary.moves_this_week, class_name=TD_CLASS),
+            rx.el.td(summary.pending_reviews, class_name=TD_CLASS),
+            rx.el.td(summary.archived_stocks, class_name=TD_CLASS),
+        ]
+
+    def row(summary: BoardSummary) -> rx.Component:
+        return rx.el.tr(
+            rx.el.td(
+                rx.el.button(
+                    summary.name,
+                    on_click=PortfolioState.open_board(summary.board_id),
+                    class_name="text-blue-700 font-medium hover:underline",
+                ),
+                class_name=TD_CLASS,
+            ),
+            *cells(summary),
+        )
+
+    return rx.el.table(
+        rx.el.thead(
+            rx.el.tr(
+                rx.el.th("Board", class_name=TH_CLASS),
+                rx.el.th("Stocks", class_name=TH_CLASS),
+                rx.foreach(
+                    PortfolioState.stage_columns,
+                    lambda stage: rx.el.th(stage, class_name=TH_CLASS),
+                ),
+                rx.el.th("Moves (7d)", class_name=TH_CLASS),
+                rx.el.th("Pending Reviews", class_name=TH_CLASS),
+                rx.el.th("Cold Storage", class_name=TH_CLASS),
+            )
+        ),
+        rx.el.tbody(
+            rx.foreach(PortfolioState.summaries, row),
+            rx.el.tr(
+                rx.el.td(
+                    PortfolioState.total.name, class_name=TD_CLASS + " font-semibold"
+                ),
+                *cells(PortfolioState.total),
+                class_name="bg-gray-50",
+            ),
+        ),
+        class_name="w-full",
+    )
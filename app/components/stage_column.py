@@ -3,13 +3,15 @@ import reflex_enterprise as rxe
 from app.states.kanban_state import KanbanState
 from app.models import StageDef
 from app.components.stock_card import draggable_stock_card
+from app.services.stage_order import STAGE_SORTS
 
 
 @rx.memo
 def droppable_stage_column(stage: StageDef) -> rx.Component:
     """
     Renders a droppable column for a specific stage.
-    Includes special handling for 'Ocean' stage (summary view) vs standard list.
+    The board's archive stage, such as Ocean, shows a summary card opening
+    its archive instead of the card list.
 
     Args:
         stage (StageDef): The definition of the stage to render.
@@ -19,6 +21,7 @@ def droppable_stage_column(stage: StageDef) -> rx.Component:
     """
     drop_params = rxe.dnd.DropTarget.collected_params
     stocks_in_stage = KanbanState.stocks_by_stage[stage.name]
+    stage_count = KanbanState.stage_counts[stage.name]
     base_style = f"flex-shrink-0 w-full md:w-80 {stage.bg_color} rounded-xl p-4 h-full overflow-y-auto border {stage.border_color} transition-colors"
     active_style = f"flex-shrink-0 w-full md:w-80 {stage.bg_color} rounded-xl p-4 h-full overflow-y-auto border-2 border-blue-400 transition-colors"
     return rxe.dnd.drop_target(
@@ -27,25 +30,47 @@ def droppable_stage_column(stage: StageDef) -> rx.Component:
                 rx.el.div(
                     rx.el.h3(stage.name, class_name=f"font-semibold {stage.color}"),
                     rx.el.span(
-                        stocks_in_stage.length(),
+                        stage_count,
                         class_name="ml-2 px-2 py-0.5 text-xs font-medium bg-white/50 text-gray-600 rounded-full border border-gray-100",
                     ),
                     class_name="flex items-center",
                 ),
+                rx.cond(
+                    ~stage.archive,
+                    rx.el.select(
+                        *[
+                            rx.el.option(label, value=value)
+                            for value, label in STAGE_SORTS.items()
+                        ],
+                        value=KanbanState.stage_sorts[stage.name],
+                        on_change=lambda value: KanbanState.set_stage_sort(
+                            stage.name, value
+                        ),
+                        aria_label="Sort cards",
+                        class_name="text-xs text-gray-600 bg-white/60 border border-gray-200 rounded-md px-1 py-0.5",
+                    ),
+                ),
                 class_name=f"flex items-center justify-between mb-4 sticky top-0 {stage.bg_color} backdrop-blur py-2 z-10",
             ),
             rx.el.div(
                 rx.cond(
-                    stage.name == "Ocean",
+                    stage.archive,
                     rx.el.div(
                         rx.el.div(
                             rx.el.span(
                                 "🌊", class_name="text-4xl mb-2 block text-center"
                             ),
                             rx.el.span(
-                                f"{stocks_in_stage.length()} Deals in Ocean",
+                                f"{stage_count} Deals in {stage.name}",
                                 class_name="font-bold text-slate-700 block text-center",
                             ),
+                            rx.cond(
+                                KanbanState.archived_ocean_count > 0,
+                                rx.el.span(
+                                    f"+{KanbanState.archived_ocean_count} in cold storage",
+                                    class_name="text-xs text-slate-600 block text-center",
+                                ),
+                            ),
                             rx.el.span(
                                 "Click to view archive",
                                 class_name="text-xs text-slate-500 block text-center mt-1",
@@ -57,10 +82,20 @@ def droppable_stage_column(stage: StageDef) -> rx.Component:
                     ),
                     rx.cond(
                         stocks_in_stage.length() > 0,
-                        rx.foreach(
-                            stocks_in_stage,
-                            lambda stock: draggable_stock_card(
-                                key=stock.id, stock=stock
+                        rx.fragment(
+                            rx.foreach(
+                                stocks_in_stage,
+                                lambda stock: draggable_stock_card(
+                                    key=stock.id, stock=stock
+                                ),
+                            ),
+                            rx.cond(
+                                stage_count > stocks_in_stage.length(),
+                                rx.el.button(
+                                    f"Show more ({stage_count - stocks_in_stage.length()} hidden)",
+                                    on_click=KanbanState.show_more_stocks(stage.name),
+                                    class_name="w-full py-2 text-sm font-medium text-gray-600 bg-white/60 border border-dashed border-gray-300 rounded-lg hover:bg-white transition-colors",
+                                ),
                             ),
                         ),
                         rx.el.div(
@@ -81,4 +116,4 @@ def droppable_stage_column(stage: StageDef) -> rx.Component:
         ),
         accept=["stock"],
         on_drop=lambda item: KanbanState.handle_drop(item, stage.name),
-    )
\ No newline at end of file
+    )
@@ -2,6 +2,7 @@ import reflex as rx
 import reflex_enterprise as rxe
 from app.states.kanban_state import KanbanState
 from app.models import Stock
+from app.components.idempotency import new_idempotency_key
 
 
 @rx.memo
@@ -51,7 +52,9 @@ def draggable_stock_card(stock: Stock) -> rx.Component:
                         rx.menu.separator(),
                         rx.menu.item(
                             "Delete Stock",
-                            on_click=lambda: KanbanState.delete_stock(stock.id),
+                            on_click=lambda: KanbanState.delete_stock(
+                                stock.id, new_idempotency_key()
+                            ),
                             class_name="text-red-600 cursor-pointer hover:bg-red-50",
                         ),
                     ),
@@ -123,4 +126,4 @@ def draggable_stock_card(stock: Stock) -> rx.Component:
         type="stock",
         item={"stock_id": stock.id, "ticker": stock.ticker},
         key=stock.id,
-    )
\ No newline at end of file
+    )
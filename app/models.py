@@ -12,6 +12,30 @@ def get_utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def parse_effective_timestamp(value: str) -> datetime:
+    """
+    Parse a user- or client-supplied effective timestamp into UTC.
+
+    Accepts the `datetime-local` format used by the transition modals
+    (YYYY-MM-DDTHH:MM, interpreted in server local time) as well as full
+    ISO 8601 strings with an optional offset, as sent by queued clients.
+
+    Args:
+        value (str): The timestamp string.
+
+    Returns:
+        datetime: The timestamp converted to UTC.
+
+    Raises:
+        ValueError: If the string is not a recognised timestamp.
+    """
+    try:
+        parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M")
+    except ValueError:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed.astimezone(timezone.utc)
+
+
 class Stock(rx.Base):
     """
     Represents a stock in the Kanban portfolio tracker.
@@ -48,64 +72,167 @@ class StateTransitionLog(rx.Base):
     previous_log_id: int | None = None
 
 
+class ForcedReview(rx.Base):
+    """
+    Compliance review of one forced transition.
+
+    Every forced transition log gets a review, pending until a reviewer
+    claims and then approves or rejects it. The log itself stays untouched.
+    """
+
+    log_id: int
+    status: str = "pending"
+    claimed_by: str = ""
+    claimed_at: datetime | None = None
+    reviewed_by: str = ""
+    reviewed_at: datetime | None = None
+    review_note: str = ""
+
+
+class ReviewQueueItem(rx.Base):
+    """
+    A forced transition together with its review, as listed in the queue.
+    """
+
+    log: StateTransitionLog
+    review: ForcedReview
+
+
+class UserActivity(rx.Base):
+    """
+    Summary of one user's transitions for the activity feed.
+    """
+
+    user: str
+    transitions: int = 0
+    moves: int = 0
+    forced_moves: int = 0
+    forced_ratio: float = 0.0
+    today: int = 0
+    transitions_per_day: float = 0.0
+
+
+class ActivityDay(rx.Base):
+    """
+    Number of transitions a user recorded on one UTC day.
+    """
+
+    date: str
+    count: int = 0
+    intensity: float = 0.0
+
+
+class SavedView(rx.Base):
+    """
+    A named board filter saved by an analyst.
+
+    Empty criteria match every stock, so a view with only a name shows the
+    whole board.
+    """
+
+    id: str
+    name: str
+    owner: str
+    shared: bool = False
+    query: str = ""
+    stale_only: bool = False
+    stages: list[str] = []
+    moved_by: str = ""
+    forced_only: bool = False
+    sort: str = "board"
+
+
 class StageDef(rx.Base):
     """
     Defines the properties of a Kanban stage including styling.
+
+    `archive` is not read from the boards file: it marks the board's
+    archive stage, worked out from its transition rules.
     """
 
     name: str
     color: str
     bg_color: str
     border_color: str
+    archive: bool = False
+
+
+class BoardDef(rx.Base):
+    """
+    A board of the deployment: one desk's pipeline with its own stages.
+
+    Each board's stocks and logs live in their own store, in the shared
+    backend under the board's key prefix or in a backend of its own.
+    """
+
+    id: str
+    name: str
+    stages: list[StageDef] = []
+    backend: str = ""
+
+
+class BoardSummary(rx.Base):
+    """
+    Headline figures of one board for the cross-board overview.
+    """
+
+    board_id: str
+    name: str
+    stocks: int = 0
+    stage_counts: dict[str, int] = {}
+    logs: int = 0
+    moves_this_week: int = 0
+    pending_reviews: int = 0
+    archived_stocks: int = 0
+
+
+class StageTimeStat(rx.Base):
+    """
+    Time stocks spent in a stage before leaving it.
+    """
+
+    stage: str
+    exits: int = 0
+    median_days: float = 0.0
+    p90_days: float = 0.0
+    mean_days: float = 0.0
 
 
-STAGES_DATA: list[dict[str, str]] = [
-    {
-        "name": "Universe",
-        "color": "text-gray-700",
-        "bg_color": "bg-gray-50",
-        "border_color": "border-gray-200",
-    },
-    {
-        "name": "Prospects",
-        "color": "text-blue-700",
-        "bg_color": "bg-blue-50",
-        "border_color": "border-blue-200",
-    },
-    {
-        "name": "Outreach",
-        "color": "text-indigo-700",
-        "bg_color": "bg-indigo-50",
-        "border_color": "border-indigo-200",
-    },
-    {
-        "name": "Discovery",
-        "color": "text-purple-700",
-        "bg_color": "bg-purple-50",
-        "border_color": "border-purple-200",
-    },
-    {
-        "name": "Live Deal",
-        "color": "text-orange-700",
-        "bg_color": "bg-orange-50",
-        "border_color": "border-orange-200",
-    },
-    {
-        "name": "Execute",
-        "color": "text-green-700",
-        "bg_color": "bg-green-50",
-        "border_color": "border-green-200",
-    },
-    {
-        "name": "Tracker",
-        "color": "text-teal-700",
-        "bg_color": "bg-teal-50",
-        "border_color": "border-teal-200",
-    },
-    {
-        "name": "Ocean",
-        "color": "text-slate-700",
-        "bg_color": "bg-slate-200",
-        "border_color": "border-slate-400",
-    },
-]
\ No newline at end of file
+class StageConversion(rx.Base):
+    """
+    Share of stocks leaving a stage that moved on to the next one.
+    """
+
+    from_stage: str
+    to_stage: str
+    exits: int = 0
+    conversions: int = 0
+    rate: float = 0.0
+
+
+class ThroughputWeek(rx.Base):
+    """
+    Number of stocks entering the closing stages in one week.
+    """
+
+    week_start: str
+    execute: int = 0
+    ocean: int = 0
+
+
+class HeatmapCell(rx.Base):
+    """
+    One from-stage/to-stage cell of the transition heatmap.
+    """
+
+    count: int = 0
+    intensity: float = 0.0
+
+
+class HeatmapRow(rx.Base):
+    """
+    Transition counts out of one stage, one cell per destination stage.
+    """
+
+    stage: str
+    cells: list[HeatmapCell] = []
@@ -1,3 +1,13 @@
 from .dashboard import dashboard_page
+from .analytics import analytics_page
+from .activity import activity_page
+from .compliance import compliance_page
+from .portfolio import portfolio_page
 
-__all__ = ["dashboard_page"]
\ No newline at end of file
+__all__ = [
+    "dashboard_page",
+    "analytics_page",
+    "activity_page",
+    "compliance_page",
+    "portfolio_page",
+]
\ No newline at end of file
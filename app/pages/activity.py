@@ -0,0 +1,66 @@
+import reflex as rx
+from app.states.activity_state import ActivityState
+from app.components.activity import (
+    activity_feed_table,
+    activity_filters,
+    daily_activity_strip,
+)
+from app.components.analytics import analytics_panel, kpi_card
+
+
+def activity_page() -> rx.Component:
+    """
+    Per-user activity feed: one analyst's transitions with their totals,
+    forced-move ratio and daily activity.
+
+    Returns:
+        rx.Component: The activity page component.
+    """
+    return rx.el.div(
+        rx.el.header(
+            rx.el.div(
+                rx.el.div(
+                    rx.icon("user-round", class_name="h-6 w-6 text-blue-600"),
+                    rx.el.h1(
+                        "User Activity",
+                        class_name="text-xl font-bold text-gray-900 tracking-tight",
+                    ),
+                    rx.el.span(
+                        ActivityState.board_name,
+                        class_name="px-2 py-0.5 text-xs font-medium text-gray-600 bg-gray-100 rounded-full",
+                    ),
+                    class_name="flex items-center gap-3",
+                ),
+                rx.el.a(
+                    rx.icon("arrow-left", class_name="h-4 w-4 mr-2"),
+                    "Back to Board",
+                    href="/",
+                    class_name="flex items-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors",
+                ),
+                class_name="flex justify-between items-center max-w-[1800px] mx-auto w-full",
+            ),
+            class_name="bg-white border-b border-gray-200 px-6 py-4",
+        ),
+        rx.el.main(
+            activity_filters(),
+            rx.el.div(
+                kpi_card("Transitions", ActivityState.summary.transitions, "activity"),
+                kpi_card("Moves", ActivityState.summary.moves, "arrow-right"),
+                kpi_card(
+                    "Forced Moves", ActivityState.forced_ratio_label, "triangle-alert"
+                ),
+                kpi_card("Today", ActivityState.summary.today, "calendar"),
+                kpi_card(
+                    "Per Day (30d)",
+                    ActivityState.summary.transitions_per_day,
+                    "gauge",
+                ),
+                class_name="grid grid-cols-2 md:grid-cols-5 gap-4",
+            ),
+            analytics_panel("Daily Activity", daily_activity_strip()),
+            analytics_panel("Transitions", activity_feed_table()),
+            class_name="flex flex-col gap-6 p-6 max-w-[1800px] mx-auto w-full",
+        ),
+        class_name="min-h-screen font-['Inter'] bg-gray-50",
+        on_mount=ActivityState.refresh,
+    )
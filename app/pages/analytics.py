@@ -0,0 +1,69 @@
+import reflex as rx
+from app.states.analytics_state import AnalyticsState
+from app.components.analytics import (
+    analytics_filters,
+    analytics_panel,
+    audit_trail_check,
+    conversion_table,
+    kpi_card,
+    stage_times_table,
+    throughput_chart,
+    transition_heatmap,
+)
+
+
+def analytics_page() -> rx.Component:
+    """
+    Pipeline analytics dashboard: stage cycle times, conversion funnel,
+    move counts and weekly throughput.
+
+    Returns:
+        rx.Component: The analytics page component.
+    """
+    return rx.el.div(
+        rx.el.header(
+            rx.el.div(
+                rx.el.div(
+                    rx.icon("chart-column", class_name="h-6 w-6 text-blue-600"),
+                    rx.el.h1(
+                        "Pipeline Analytics",
+                        class_name="text-xl font-bold text-gray-900 tracking-tight",
+                    ),
+                    rx.el.span(
+                        AnalyticsState.board_name,
+                        class_name="px-2 py-0.5 text-xs font-medium text-gray-600 bg-gray-100 rounded-full",
+                    ),
+                    class_name="flex items-center gap-3",
+                ),
+                rx.el.a(
+                    rx.icon("arrow-left", class_name="h-4 w-4 mr-2"),
+                    "Back to Board",
+                    href="/",
+                    class_name="flex items-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors",
+                ),
+                class_name="flex justify-between items-center max-w-[1800px] mx-auto w-full",
+            ),
+            class_name="bg-white border-b border-gray-200 px-6 py-4",
+        ),
+        rx.el.main(
+            analytics_filters(),
+            rx.el.div(
+                kpi_card("Transitions", AnalyticsState.log_count, "activity"),
+                kpi_card("Forward Moves", AnalyticsState.forward_moves, "arrow-right"),
+                kpi_card("Backward Moves", AnalyticsState.backward_moves, "arrow-left"),
+                kpi_card("Forced Moves", AnalyticsState.forced_moves, "triangle-alert"),
+                class_name="grid grid-cols-2 md:grid-cols-4 gap-4",
+            ),
+            rx.el.div(
+                analytics_panel("Time in Stage", stage_times_table()),
+                analytics_panel("Conversion Funnel", conversion_table()),
+                class_name="grid grid-cols-1 xl:grid-cols-2 gap-4",
+            ),
+            analytics_panel("Stage Transitions", transition_heatmap()),
+            analytics_panel("Weekly Throughput", throughput_chart()),
+            analytics_panel("Audit Trail", audit_trail_check()),
+            class_name="flex flex-col gap-6 p-6 max-w-[1800px] mx-auto w-full",
+        ),
+        class_name="min-h-screen font-['Inter'] bg-gray-50",
+        on_mount=AnalyticsState.refresh,
+    )
@@ -0,0 +1,53 @@
+import reflex as rx
+from app.states.compliance_state import ComplianceState
+from app.components.analytics import analytics_panel
+from app.components.compliance import (
+    review_queue_table,
+    review_status_tabs,
+    review_toolbar,
+)
+
+
+def compliance_page() -> rx.Component:
+    """
+    Compliance review queue: forced transitions waiting for review, with
+    claim, approve and reject actions.
+
+    Returns:
+        rx.Component: The compliance page component.
+    """
+    return rx.el.div(
+        rx.el.header(
+            rx.el.div(
+                rx.el.div(
+                    rx.icon("shield-check", class_name="h-6 w-6 text-blue-600"),
+                    rx.el.h1(
+                        "Compliance Review",
+                        class_name="text-xl font-bold text-gray-900 tracking-tight",
+                    ),
+                    rx.el.span(
+                        ComplianceState.board_name,
+                        class_name="px-2 py-0.5 text-xs font-medium text-gray-600 bg-gray-100 rounded-full",
+                    ),
+                    class_name="flex items-center gap-3",
+                ),
+                rx.el.a(
+                    rx.icon("arrow-left", class_name="h-4 w-4 mr-2"),
+                    "Back to Board",
+                    href="/",
+                    class_name="flex items-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors",
+                ),
+                class_name="flex justify-between items-center max-w-[1800px] mx-auto w-full",
+            ),
+            class_name="bg-white border-b border-gray-200 px-6 py-4",
+        ),
+        rx.el.main(
+            review_toolbar(),
+            analytics_panel(
+                "Forced Transitions", review_status_tabs(), review_queue_table()
+            ),
+            class_name="flex flex-col gap-6 p-6 max-w-[1800px] mx-auto w-full",
+        ),
+        class_name="min-h-screen font-['Inter'] bg-gray-50",
+        on_mount=ComplianceState.refresh,
+    )
@@ -8,79 +8,118 @@ from app.components import (
     add_stock_modal,
     deal_detail_modal,
     ocean_archive_modal,
+    save_view_modal,
 )
 
 
-def dashboard_page() -> rx.Component:
+def mobile_board() -> rx.Component:
     """
-    Main dashboard page for the Kanban board.
-    Composes the header, board columns, and global modals.
+    Stage tabs and the active stage's column, for narrow viewports.
 
     Returns:
-        rx.Component: The dashboard page component.
+        rx.Component: The mobile board.
     """
-    return rx.el.div(
-        header(),
-        rx.el.main(
+    return rx.fragment(
+        rx.el.div(
             rx.el.div(
-                rx.el.div(
-                    rx.foreach(
-                        KanbanState.stages,
-                        lambda stage_name: rx.el.button(
-                            stage_name,
-                            on_click=lambda: KanbanState.set_mobile_active_stage(
-                                stage_name
-                            ),
-                            class_name=rx.cond(
-                                KanbanState.mobile_active_stage == stage_name,
-                                "px-4 py-2 text-sm font-semibold text-blue-600 border-b-2 border-blue-600 whitespace-nowrap min-h-[44px]",
-                                "px-4 py-2 text-sm font-medium text-gray-500 hover:text-gray-700 whitespace-nowrap min-h-[44px]",
-                            ),
+                rx.foreach(
+                    KanbanState.stages,
+                    lambda stage_name: rx.el.button(
+                        stage_name,
+                        on_click=lambda: KanbanState.set_mobile_active_stage(
+                            stage_name
+                        ),
+                        class_name=rx.cond(
+                            KanbanState.mobile_active_stage == stage_name,
+                            "px-4 py-2 text-sm font-semibold text-blue-600 border-b-2 border-blue-600 whitespace-nowrap min-h-[44px]",
+                            "px-4 py-2 text-sm font-medium text-gray-500 hover:text-gray-700 whitespace-nowrap min-h-[44px]",
                         ),
                     ),
-                    class_name="flex overflow-x-auto no-scrollbar gap-2 px-4 border-b border-gray-200 bg-white",
                 ),
-                class_name="md:hidden sticky top-0 z-10",
+                class_name="flex overflow-x-auto no-scrollbar gap-2 px-4 border-b border-gray-200 bg-white",
             ),
-            rx.el.div(
-                rx.foreach(
-                    KanbanState.stage_defs,
-                    lambda stage: rx.cond(
-                        KanbanState.mobile_active_stage == stage.name,
-                        rx.el.div(
-                            droppable_stage_column(stage=stage),
-                            class_name="h-full w-full p-4",
-                        ),
-                        rx.fragment(),
+            class_name="sticky top-0 z-10",
+        ),
+        rx.el.div(
+            rx.foreach(
+                KanbanState.stage_defs,
+                lambda stage: rx.cond(
+                    KanbanState.mobile_active_stage == stage.name,
+                    rx.el.div(
+                        droppable_stage_column(stage=stage),
+                        class_name="h-full w-full p-4",
                     ),
+                    rx.fragment(),
                 ),
-                class_name="md:hidden w-full h-full flex-1 overflow-hidden",
             ),
+            class_name="w-full h-full flex-1 overflow-hidden",
+        ),
+    )
+
+
+def desktop_board() -> rx.Component:
+    """
+    All stage columns side by side in a horizontal scroll area.
+
+    Returns:
+        rx.Component: The desktop board.
+    """
+    return rx.el.div(
+        rx.scroll_area(
             rx.el.div(
-                rx.scroll_area(
-                    rx.el.div(
-                        rx.foreach(
-                            KanbanState.stage_defs,
-                            lambda stage: rx.el.div(
-                                droppable_stage_column(stage=stage),
-                                class_name="w-80 flex-shrink-0 h-full",
-                            ),
-                        ),
-                        class_name="flex flex-row gap-6 px-6 pb-6 h-full min-w-max",
+                rx.foreach(
+                    KanbanState.stage_defs,
+                    lambda stage: rx.el.div(
+                        droppable_stage_column(stage=stage),
+                        class_name="w-80 flex-shrink-0 h-full",
                     ),
-                    scrollbars="horizontal",
-                    type="always",
-                    class_name="w-full h-full",
                 ),
-                class_name="hidden md:flex w-full h-full flex-1 overflow-hidden",
+                class_name="flex flex-row gap-6 px-6 pb-6 h-full min-w-max",
+            ),
+            scrollbars="horizontal",
+            type="always",
+            class_name="w-full h-full",
+        ),
+        class_name="flex w-full h-full flex-1 overflow-hidden",
+    )
+
+
+def dashboard_page() -> rx.Component:
+    """
+    Main dashboard page for the Kanban board.
+    Composes the header, board columns, and global modals.
+
+    Returns:
+        rx.Component: The dashboard page component.
+    """
+    return rx.el.div(
+        header(),
+        rx.window_event_listener(
+            on_resize=KanbanState.set_viewport_width.debounce(200)
+        ),
+        rx.el.main(
+            # Only the layout for the current viewport is mounted, so each
+            # card exists once in the DOM.
+            rx.cond(
+                KanbanState.is_desktop_layout,
+                desktop_board(),
+                mobile_board(),
             ),
             class_name="flex-1 overflow-hidden py-0 md:py-6 bg-gray-100 flex flex-col",
         ),
         confirmation_modal(),
-        force_transition_modal(),
-        add_stock_modal(),
-        deal_detail_modal(),
-        ocean_archive_modal(),
+        # Rarely used modals are mounted only while open, so the board's first
+        # render and every later state update skip their trees.
+        rx.cond(KanbanState.is_force_modal_open, force_transition_modal()),
+        rx.cond(KanbanState.is_add_modal_open, add_stock_modal()),
+        rx.cond(KanbanState.is_detail_modal_open, deal_detail_modal()),
+        rx.cond(KanbanState.is_ocean_modal_open, ocean_archive_modal()),
+        rx.cond(KanbanState.is_view_modal_open, save_view_modal()),
         class_name="flex flex-col h-screen font-['Inter'] bg-gray-50",
-        on_mount=KanbanState.on_load,
-    )
\ No newline at end of file
+        on_mount=[
+            KanbanState.on_load,
+            rx.call_script(
+                "window.innerWidth", callback=KanbanState.set_viewport_width
+            ),
+        ],
+    )
@@ -0,0 +1,55 @@
+import reflex as rx
+from app.states.portfolio_state import PortfolioState
+from app.components.analytics import analytics_panel, kpi_card
+from app.components.portfolio import board_summary_table
+
+
+def portfolio_page() -> rx.Component:
+    """
+    Cross-board overview: every desk's board with its stage counts and
+    activity, and the portfolio total.
+
+    Returns:
+        rx.Component: The portfolio page component.
+    """
+    return rx.el.div(
+        rx.el.header(
+            rx.el.div(
+                rx.el.div(
+                    rx.icon("layout-grid", class_name="h-6 w-6 text-blue-600"),
+                    rx.el.h1(
+                        "Portfolio Overview",
+                        class_name="text-xl font-bold text-gray-900 tracking-tight",
+                    ),
+                    class_name="flex items-center gap-3",
+                ),
+                rx.el.a(
+                    rx.icon("arrow-left", class_name="h-4 w-4 mr-2"),
+                    "Back to Board",
+                    href="/",
+                    class_name="flex items-center px-4 py-2 bg-white text-gray-700 border border-gray-300 text-sm font-medium rounded-lg hover:bg-gray-50 transition-colors",
+                ),
+                class_name="flex justify-between items-center max-w-[1800px] mx-auto w-full",
+            ),
+            class_name="bg-white border-b border-gray-200 px-6 py-4",
+        ),
+        rx.el.main(
+            rx.el.div(
+                kpi_card("Boards", PortfolioState.summaries.length(), "layout-grid"),
+                kpi_card("Stocks", PortfolioState.total.stocks, "layers"),
+                kpi_card(
+                    "Moves (7d)", PortfolioState.total.moves_this_week, "activity"
+                ),
+                kpi_card(
+                    "Pending Reviews",
+                    PortfolioState.total.pending_reviews,
+                    "shield-check",
+                ),
+                class_name="grid grid-cols-2 md:grid-cols-4 gap-4",
+            ),
+            analytics_panel("Boards", board_summary_table()),
+            class_name="flex flex-col gap-6 p-6 max-w-[1800px] mx-auto w-full",
+        ),
+        class_name="min-h-screen font-['Inter'] bg-gray-50",
+        on_mount=PortfolioState.refresh,
+    )
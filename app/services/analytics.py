@@ -0,0 +1,347 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from app.models import (
+    StageConversion,
+    StageTimeStat,
+    StateTransitionLog,
+    ThroughputWeek,
+)
+from app.services.board_store import BoardStore, get_board_store
+from app.services.boards import default_board_id
+
+SECONDS_PER_DAY = 86_400
+SECONDS_PER_WEEK = 7 * SECONDS_PER_DAY
+# 1970-01-01 was a Thursday; weeks are counted from the Monday before it.
+WEEK_OFFSET_SECONDS = 3 * SECONDS_PER_DAY
+NO_STAGE = -1
+# Reports kept per board, one per recently used (users, start, end) slice.
+REPORT_CACHE_SIZE = 64
+
+
+@dataclass
+class PipelineReport:
+    """
+    Pipeline analytics over one slice of the transition log.
+
+    Attributes:
+        log_count (int): Logs in the slice, including initial creations.
+        stage_times (list[StageTimeStat]): Time spent per stage before exiting.
+        conversions (list[StageConversion]): Conversion between adjacent stages.
+        forward_moves (int): Moves to a later stage.
+        backward_moves (int): Moves to an earlier stage.
+        forced_moves (int): Moves made with a forced override.
+        throughput (list[ThroughputWeek]): Weekly entries into Execute and Ocean.
+    """
+
+    log_count: int = 0
+    stage_times: list[StageTimeStat] = field(default_factory=list)
+    conversions: list[StageConversion] = field(default_factory=list)
+    forward_moves: int = 0
+    backward_moves: int = 0
+    forced_moves: int = 0
+    throughput: list[ThroughputWeek] = field(default_factory=list)
+
+
+class LogColumns:
+    """
+    The transition log held as parallel numpy arrays, one entry per log.
+
+    Stages and users are stored as integer codes. Arrays grow by doubling, so
+    appending the logs added since the last refresh is amortised O(1) each.
+    """
+
+    def __init__(self, stage_names: list[str], capacity: int = 1024):
+        """
+        Args:
+            stage_names (list[str]): Stages in pipeline order; codes follow it.
+            capacity (int): Initial number of rows allocated.
+        """
+        self.stage_codes = {name: code for code, name in enumerate(stage_names)}
+        self.user_codes: dict[str, int] = {}
+        self.size = 0
+        self.previous_stage = np.empty(capacity, dtype=np.int16)
+        self.new_stage = np.empty(capacity, dtype=np.int16)
+        self.days = np.empty(capacity, dtype=np.float64)
+        self.forced = np.empty(capacity, dtype=np.bool_)
+        self.user = np.empty(capacity, dtype=np.int32)
+        self.timestamp = np.empty(capacity, dtype=np.int64)
+
+    def append(self, logs: list[StateTransitionLog]) -> None:
+        """
+        Appends logs to the columns.
+
+        Args:
+            logs (list[StateTransitionLog]): Logs in append order.
+        """
+        if not logs:
+            return
+        self._reserve(self.size + len(logs))
+        end = self.size + len(logs)
+        rows = slice(self.size, end)
+        self.previous_stage[rows] = [
+            self.stage_codes.get(log.previous_stage, NO_STAGE) for log in logs
+        ]
+        self.new_stage[rows] = [
+            self.stage_codes.get(log.new_stage, NO_STAGE) for log in logs
+        ]
+        self.days[rows] = [log.days_in_previous_stage for log in logs]
+        self.forced[rows] = [log.is_forced_transition for log in logs]
+        self.user[rows] = [
+            self.user_codes.setdefault(log.updated_by, len(self.user_codes))
+            for log in logs
+        ]
+        self.timestamp[rows] = [
+            int(log.timestamp.timestamp()) if log.timestamp else 0 for log in logs
+        ]
+        self.size = end
+
+    def _reserve(self, size: int) -> None:
+        """Grows every column to hold at least `size` rows."""
+        capacity = len(self.days)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in (
+            "previous_stage",
+            "new_stage",
+            "days",
+            "forced",
+            "user",
+            "timestamp",
+        ):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self.size] = column[: self.size]
+            setattr(self, name, grown)
+
+
+class PipelineAnalytics:
+    """
+    Computes pipeline analytics over the board's transition log, archived
+    logs included, like the transition heatmap.
+
+    The log is mirrored into LogColumns, which only reads logs appended since
+    the last call and is rebuilt, archived segments first, when the store
+    starts a new log epoch. Reports of the most recently used (users, start,
+    end) slices are cached until new logs arrive.
+    """
+
+    def __init__(self, store: BoardStore):
+        """
+        Args:
+            store (BoardStore): The board whose log is analysed.
+        """
+        self.store = store
+        self._lock = threading.Lock()
+        self._columns = LogColumns(store.stage_names)
+        self._epoch = -1
+        # Hot logs mirrored so far; the columns also hold the archived ones.
+        self._hot_size = 0
+        self._cache: OrderedDict[tuple, PipelineReport] = OrderedDict()
+
+    def report(
+        self,
+        users: list[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> PipelineReport:
+        """
+        Returns analytics for a slice of the log.
+
+        Args:
+            users (list[str] | None): Only count logs made by these users.
+            start (datetime | None): Only count logs at or after this time.
+            end (datetime | None): Only count logs before this time.
+
+        Returns:
+            PipelineReport: The analytics for the slice.
+        """
+        key = (tuple(sorted(users)) if users else None, start, end)
+        with self._lock:
+            self._refresh()
+            report = self._cache.get(key)
+            if report is not None:
+                self._cache.move_to_end(key)
+                return report
+            report = self._cache[key] = self._compute(users, start, end)
+            if len(self._cache) > REPORT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return report
+
+    def _refresh(self) -> None:
+        """Brings the columns up to date with the store's log."""
+        columns = self._columns
+        store = self.store
+        if store.log_epoch == self._epoch and store.log_count() == self._hot_size:
+            return
+        epoch, segments, new_logs = store.log_tail(self._hot_size, self._epoch)
+        if epoch != self._epoch:
+            # The store reloaded or archived part of its log; rebuild.
+            self._columns = columns = LogColumns(store.stage_names)
+            for segment in segments:
+                columns.append(segment.decode())
+            self._epoch = epoch
+            self._hot_size = 0
+        columns.append(new_logs)
+        self._hot_size += len(new_logs)
+        self._cache.clear()
+
+    def _compute(
+        self,
+        users: list[str] | None,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> PipelineReport:
+        """Computes a report over the columns in a single vectorized pass."""
+        c = self._columns
+        n = c.size
+        stage_names = self.store.stage_names
+        stage_count = len(stage_names)
+        previous = c.previous_stage[:n]
+        new = c.new_stage[:n]
+        days = c.days[:n]
+        forced = c.forced[:n]
+        timestamp = c.timestamp[:n]
+
+        mask = np.ones(n, dtype=np.bool_)
+        if users:
+            codes = [c.user_codes[u] for u in users if u in c.user_codes]
+            mask &= np.isin(c.user[:n], codes)
+        if start is not None:
+            mask &= timestamp >= int(start.timestamp())
+        if end is not None:
+            mask &= timestamp < int(end.timestamp())
+        moves = mask & (previous != NO_STAGE) & (new != NO_STAGE)
+
+        move_from = previous[moves].astype(np.int64)
+        move_to = new[moves].astype(np.int64)
+        move_days = days[moves]
+
+        # Stage times: sort exits by (stage, days) so each stage's durations
+        # are a contiguous sorted run, then read quantiles by position.
+        order = np.lexsort((move_days, move_from))
+        sorted_stage = move_from[order]
+        sorted_days = move_days[order]
+        bounds = np.searchsorted(sorted_stage, np.arange(stage_count + 1))
+        exits = np.bincount(move_from, minlength=stage_count)
+        total_days = np.bincount(move_from, weights=move_days, minlength=stage_count)
+        stage_times = []
+        for code, name in enumerate(stage_names):
+            run = sorted_days[bounds[code] : bounds[code + 1]]
+            stage_times.append(
+                StageTimeStat(
+                    stage=name,
+                    exits=int(exits[code]),
+                    median_days=_sorted_quantile(run, 0.5),
+                    p90_days=_sorted_quantile(run, 0.9),
+                    mean_days=round(float(total_days[code] / exits[code]), 1)
+                    if exits[code]
+                    else 0.0,
+                )
+            )
+
+        pairs = np.bincount(
+            move_from * stage_count + move_to, minlength=stage_count * stage_count
+        ).reshape(stage_count, stage_count)
+        conversions = [
+            StageConversion(
+                from_stage=stage_names[code],
+                to_stage=stage_names[code + 1],
+                exits=int(exits[code]),
+                conversions=int(pairs[code, code + 1]),
+                rate=round(float(pairs[code, code + 1] / exits[code]), 3)
+                if exits[code]
+                else 0.0,
+            )
+            for code in range(stage_count - 1)
+        ]
+
+        return PipelineReport(
+            log_count=int(mask.sum()),
+            stage_times=stage_times,
+            conversions=conversions,
+            forward_moves=int((move_to > move_from).sum()),
+            backward_moves=int((move_to < move_from).sum()),
+            forced_moves=int((forced & moves).sum()),
+            throughput=self._weekly_throughput(mask, new, timestamp),
+        )
+
+    def _weekly_throughput(
+        self, mask: np.ndarray, new: np.ndarray, timestamp: np.ndarray
+    ) -> list[ThroughputWeek]:
+        """Counts entries into Execute and Ocean per Monday-based week."""
+        codes = self._columns.stage_codes
+        execute = mask & (new == codes.get("Execute", NO_STAGE)) & (timestamp > 0)
+        ocean = mask & (new == codes.get("Ocean", NO_STAGE)) & (timestamp > 0)
+        entered = execute | ocean
+        if not entered.any():
+            return []
+        week = (timestamp + WEEK_OFFSET_SECONDS) // SECONDS_PER_WEEK
+        first = int(week[entered].min())
+        span = int(week[entered].max()) - first + 1
+        execute_counts = np.bincount(week[execute] - first, minlength=span)
+        ocean_counts = np.bincount(week[ocean] - first, minlength=span)
+        epoch_monday = datetime(1970, 1, 1, tzinfo=timezone.utc) - timedelta(days=3)
+        return [
+            ThroughputWeek(
+                week_start=(epoch_monday + timedelta(weeks=first + i)).strftime(
+                    "%Y-%m-%d"
+                ),
+                execute=int(execute_counts[i]),
+                ocean=int(ocean_counts[i]),
+            )
+            for i in range(span)
+        ]
+
+
+def _sorted_quantile(values: np.ndarray, q: float) -> float:
+    """
+    Linear-interpolated quantile of an already sorted array.
+
+    Args:
+        values (np.ndarray): Sorted values.
+        q (float): Quantile in [0, 1].
+
+    Returns:
+        float: The quantile rounded to one decimal, or 0.0 if empty.
+    """
+    if not len(values):
+        return 0.0
+    position = q * (len(values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    fraction = position - lower
+    return round(float(values[lower] * (1 - fraction) + values[upper] * fraction), 1)
+
+
+_pipeline_analytics: dict[str, PipelineAnalytics] = {}
+_pipeline_analytics_lock = threading.Lock()
+
+
+def get_pipeline_analytics(board_id: str | None = None) -> PipelineAnalytics:
+    """
+    Returns the process-wide analytics engine for a board's store.
+
+    Args:
+        board_id (str | None): ID of the board. Defaults to the default
+            board.
+
+    Returns:
+        PipelineAnalytics: The analytics engine.
+    """
+    board_id = board_id or default_board_id()
+    analytics = _pipeline_analytics.get(board_id)
+    if analytics is None:
+        with _pipeline_analytics_lock:
+            analytics = _pipeline_analytics.get(board_id)
+            if analytics is None:
+                analytics = _pipeline_analytics[board_id] = PipelineAnalytics(
+                    get_board_store(board_id)
+                )
+    return analytics
@@ -0,0 +1,403 @@
+import json
+import threading
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from app.models import Stock, StateTransitionLog
+
+# Records compressed together; a lookup decodes at most one segment.
+ARCHIVE_SEGMENT_SIZE = 2048
+# Decoded segments kept for repeated reads, e.g. paging the Ocean archive.
+DECODED_SEGMENT_CACHE = 16
+
+
+def months_before(moment: datetime, months: int) -> datetime:
+    """
+    Returns the same time of day a number of calendar months earlier.
+
+    The day is clamped to the end of shorter months, so 31 March minus one
+    month is 28 or 29 February.
+
+    Args:
+        moment (datetime): The starting point.
+        months (int): Calendar months to go back.
+
+    Returns:
+        datetime: The earlier moment, in the same timezone.
+    """
+    month = moment.year * 12 + moment.month - 1 - months
+    year, month = divmod(month, 12)
+    next_month = datetime(year + (month == 11), (month + 1) % 12 + 1, 1)
+    last_day = (next_month - timedelta(days=1)).day
+    return moment.replace(year=year, month=month + 1, day=min(moment.day, last_day))
+
+
+@dataclass(frozen=True)
+class ArchivePolicy:
+    """
+    When stocks and logs leave the hot working set.
+
+    Attributes:
+        ocean_days (int): Days a stock must have been in Ocean before it is
+            archived; 0 keeps every stock hot.
+        log_months (int): Calendar months after which a transition log is
+            archived; 0 keeps every log hot. Forced transitions still
+            waiting for a compliance review are never archived.
+    """
+
+    ocean_days: int = 180
+    log_months: int = 24
+
+    def stock_cutoff(self, now: datetime) -> datetime | None:
+        """Returns the Ocean entry time before which stocks are archived."""
+        return now - timedelta(days=self.ocean_days) if self.ocean_days else None
+
+    def log_cutoff(self, now: datetime) -> datetime | None:
+        """Returns the effective time before which logs are archived."""
+        return months_before(now, self.log_months) if self.log_months else None
+
+
+class ArchiveSegment:
+    """
+    An immutable run of archived records of one model, stored as
+    zlib-compressed JSON.
+
+    Records are kept in (stock_id, id) order, so a stock's logs sit in one
+    or two neighbouring segments. The IDs and stock IDs are held
+    uncompressed in typed arrays, so a segment can be searched by binary
+    search without decoding it. Segments are picklable and are handed to
+    job processes as they are.
+    """
+
+    __slots__ = (
+        "count",
+        "ids",
+        "model",
+        "payload",
+        "positions",
+        "stock_ids",
+    )
+
+    def __init__(
+        self,
+        model: type[Stock] | type[StateTransitionLog],
+        records: list[Stock] | list[StateTransitionLog],
+    ):
+        """
+        Args:
+            model (type): Stock or StateTransitionLog.
+            records (list): The records, already in (stock_id, id) order.
+        """
+        self.model = model
+        # Field values are taken and restored as they are; the records were
+        # validated when they were created.
+        self.payload = zlib.compress(
+            json.dumps(
+                [vars(record) for record in records], default=datetime.isoformat
+            ).encode()
+        )
+        order = sorted(range(len(records)), key=lambda i: records[i].id)
+        self.ids = array("q", (records[i].id for i in order))
+        self.positions = array("l", order)
+        self.stock_ids = array("q", (_stock_id(record) for record in records))
+        self.count = len(records)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the memory held by the payload and the ID arrays."""
+        return len(self.payload) + sum(
+            column.itemsize * len(column)
+            for column in (self.ids, self.positions, self.stock_ids)
+        )
+
+    def decode(self) -> list[Stock] | list[StateTransitionLog]:
+        """
+        Decompresses and parses every record.
+
+        Returns:
+            list: The records in (stock_id, id) order.
+        """
+        rows = json.loads(zlib.decompress(self.payload))
+        moments = [
+            name
+            for name, field in self.model.__fields__.items()
+            if field.type_ is datetime
+        ]
+        for row in rows:
+            for name in moments:
+                if row[name] is not None:
+                    row[name] = datetime.fromisoformat(row[name])
+        return [self.model.construct(**row) for row in rows]
+
+    def position(self, record_id: int) -> int | None:
+        """
+        Locates a record by ID without decoding the segment.
+
+        Args:
+            record_id (int): ID of the record.
+
+        Returns:
+            int | None: Its index in decode() order, or None if absent.
+        """
+        i = bisect_left(self.ids, record_id)
+        if i < len(self.ids) and self.ids[i] == record_id:
+            return self.positions[i]
+        return None
+
+    def stock_range(self, stock_id: int) -> tuple[int, int]:
+        """Returns the index range in decode() order of one stock's records."""
+        return bisect_left(self.stock_ids, stock_id), bisect_right(
+            self.stock_ids, stock_id
+        )
+
+
+def _stock_id(record: Stock | StateTransitionLog) -> int:
+    """Returns the stock a record belongs to."""
+    return record.id if isinstance(record, Stock) else record.stock_id
+
+
+def build_segments(
+    model: type[Stock] | type[StateTransitionLog],
+    records: Iterable[Stock] | Iterable[StateTransitionLog],
+) -> list[ArchiveSegment]:
+    """
+    Compresses records into segments of ARCHIVE_SEGMENT_SIZE.
+
+    Args:
+        model (type): Stock or StateTransitionLog.
+        records (Iterable): The records, in any order.
+
+    Returns:
+        list[ArchiveSegment]: The segments, by ascending stock ID.
+    """
+    ordered = sorted(records, key=lambda record: (_stock_id(record), record.id))
+    return [
+        ArchiveSegment(model, ordered[i : i + ARCHIVE_SEGMENT_SIZE])
+        for i in range(0, len(ordered), ARCHIVE_SEGMENT_SIZE)
+    ]
+
+
+def decode_segments(
+    segments: Iterable[ArchiveSegment],
+) -> Iterator[Stock | StateTransitionLog]:
+    """
+    Yields every record of the segments, e.g. for an audit export.
+
+    Args:
+        segments (Iterable[ArchiveSegment]): The segments.
+
+    Yields:
+        Stock | StateTransitionLog: The records, segment by segment.
+    """
+    for segment in segments:
+        yield from segment.decode()
+
+
+class ColdArchive:
+    """
+    The cold tier of a board: Ocean stocks and old transition logs moved
+    out of the hot working set into compressed segments.
+
+    Archived stocks are tracked in a directory from ID to segment. A
+    restored or deleted stock is dropped from the directory while its
+    segment stays untouched, so segments are never rewritten. Logs are
+    immutable and stay archived. Recently decoded segments are cached.
+    """
+
+    def __init__(self):
+        self._stock_segments: list[ArchiveSegment] = []
+        self._log_segments: list[ArchiveSegment] = []
+        self._stock_directory: dict[int, ArchiveSegment] = {}
+        self._tickers: dict[str, int] = {}
+        self._log_count = 0
+        self._decoded: OrderedDict[int, list] = OrderedDict()
+        self._decoded_lock = threading.Lock()
+
+    def add_stocks(self, stocks: list[Stock]) -> None:
+        """
+        Archives stocks that have left the hot tier.
+
+        Args:
+            stocks (list[Stock]): The stocks.
+        """
+        for segment in build_segments(Stock, stocks):
+            self._stock_segments.append(segment)
+            for stock_id in segment.ids:
+                self._stock_directory[stock_id] = segment
+        for stock in stocks:
+            self._tickers[stock.ticker] = stock.id
+
+    def add_logs(self, logs: list[StateTransitionLog]) -> None:
+        """
+        Archives logs that have left the hot tier.
+
+        Args:
+            logs (list[StateTransitionLog]): The logs.
+        """
+        self._log_segments.extend(build_segments(StateTransitionLog, logs))
+        self._log_count += len(logs)
+
+    def _records(self, segment: ArchiveSegment) -> list:
+        """Returns a segment's decoded records, from the cache if possible."""
+        key = id(segment)
+        with self._decoded_lock:
+            records = self._decoded.get(key)
+            if records is not None:
+                self._decoded.move_to_end(key)
+                return records
+        records = segment.decode()
+        with self._decoded_lock:
+            self._decoded[key] = records
+            if len(self._decoded) > DECODED_SEGMENT_CACHE:
+                self._decoded.popitem(last=False)
+        return records
+
+    def stock_count(self) -> int:
+        """Returns the number of archived stocks."""
+        return len(self._stock_directory)
+
+    def log_count(self) -> int:
+        """Returns the number of archived logs."""
+        return self._log_count
+
+    def has_ticker(self, ticker: str) -> bool:
+        """Returns whether an archived stock holds a ticker."""
+        return ticker in self._tickers
+
+    def get_stock(self, stock_id: int) -> Stock | None:
+        """
+        Looks up an archived stock.
+
+        Args:
+            stock_id (int): ID of the stock.
+
+        Returns:
+            Stock | None: The stock, or None if it is not archived.
+        """
+        segment = self._stock_directory.get(stock_id)
+        if segment is None:
+            return None
+        return self._records(segment)[segment.position(stock_id)]
+
+    def forget_stock(self, stock_id: int) -> Stock | None:
+        """
+        Drops a stock from the archive when it is restored or deleted.
+
+        Args:
+            stock_id (int): ID of the stock.
+
+        Returns:
+            Stock | None: The archived copy, or None if it was not archived.
+        """
+        stock = self.get_stock(stock_id)
+        if stock is None:
+            return None
+        del self._stock_directory[stock_id]
+        self._tickers.pop(stock.ticker, None)
+        return stock.copy()
+
+    def stocks(self, offset: int = 0, limit: int | None = None) -> list[Stock]:
+        """
+        Returns a page of archived stocks, most recently archived first.
+
+        Whole segments before the page are skipped using their ID arrays,
+        so only the segments holding the page are decoded.
+
+        Args:
+            offset (int): Stocks to skip.
+            limit (int | None): Maximum number of stocks, or None for all.
+
+        Returns:
+            list[Stock]: The stocks.
+        """
+        page: list[Stock] = []
+        for segment in reversed(self._stock_segments):
+            if limit is not None and len(page) >= limit:
+                break
+            live = [
+                stock_id
+                for stock_id in segment.ids
+                if self._stock_directory.get(stock_id) is segment
+            ]
+            if offset >= len(live):
+                offset -= len(live)
+                continue
+            records = self._records(segment)
+            for stock_id in live[offset:]:
+                if limit is not None and len(page) >= limit:
+                    break
+                page.append(records[segment.position(stock_id)])
+            offset = 0
+        return page
+
+    def logs_for_stock(self, stock_id: int) -> list[StateTransitionLog]:
+        """
+        Returns a stock's archived logs.
+
+        Args:
+            stock_id (int): ID of the stock.
+
+        Returns:
+            list[StateTransitionLog]: The logs in ID order.
+        """
+        logs = []
+        for segment in self._log_segments:
+            if not segment.stock_ids or not (
+                segment.stock_ids[0] <= stock_id <= segment.stock_ids[-1]
+            ):
+                continue
+            low, high = segment.stock_range(stock_id)
+            if low < high:
+                logs.extend(self._records(segment)[low:high])
+        logs.sort(key=lambda log: log.id)
+        return logs
+
+    def get_logs(self, log_ids: Iterable[int]) -> dict[int, StateTransitionLog]:
+        """
+        Looks up archived logs by ID.
+
+        Args:
+            log_ids (Iterable[int]): IDs of the logs.
+
+        Returns:
+            dict[int, StateTransitionLog]: The logs found, by ID.
+        """
+        found: dict[int, StateTransitionLog] = {}
+        wanted = set(log_ids)
+        for segment in self._log_segments:
+            if not wanted:
+                break
+            hits = [
+                (log_id, position)
+                for log_id in wanted
+                if (position := segment.position(log_id)) is not None
+            ]
+            if hits:
+                records = self._records(segment)
+                for log_id, position in hits:
+                    found[log_id] = records[position]
+                    wanted.discard(log_id)
+        return found
+
+    def stock_segments(self) -> tuple[ArchiveSegment, ...]:
+        """Returns the stock segments, including restored stocks' copies."""
+        return tuple(self._stock_segments)
+
+    def live_stock_ids(self) -> frozenset[int]:
+        """Returns the IDs of the stocks still archived."""
+        return frozenset(self._stock_directory)
+
+    def log_segments(self) -> tuple[ArchiveSegment, ...]:
+        """Returns the log segments."""
+        return tuple(self._log_segments)
+
+    def nbytes(self) -> int:
+        """Returns the memory held by every segment."""
+        return sum(
+            segment.nbytes for segment in self._stock_segments + self._log_segments
+        )
@@ -0,0 +1,619 @@
+import asyncio
+import json
+import time
+import uuid
+import zlib
+from datetime import date, datetime, timedelta
+from functools import lru_cache, wraps
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.models import get_utc_now, parse_effective_timestamp
+from app.services.board_store import BoardStore, BoardStoreError, get_board_store
+from app.services.boards import UnknownBoardError, get_board_defs
+from app.services.portfolio import board_summaries, merge_summaries
+from app.services.review_queue import REVIEW_STATUSES
+from app.services.stage_order import STAGE_SORTS
+from app.services.sync import SyncBatchError, apply_sync_batch
+
+API_PREFIX = "/api/v1"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+FRESHNESS_SECONDS = 60
+DEFAULT_DAILY_SPAN_DAYS = 30
+MAX_DAILY_SPAN_DAYS = 3660
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serializes the values json.dumps cannot handle on its own.
+
+    Args:
+        value (Any): A datetime or a model instance.
+
+    Returns:
+        Any: A JSON-serializable representation.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "dict"):
+        return value.dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encodes a response payload as compact JSON."""
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode()
+
+
+def _etag(store: BoardStore) -> str:
+    """
+    Returns the entity tag for a board's current contents.
+
+    The tag is built from what every worker agrees on: the backend version,
+    the board's stages and how much of it is archived. So the same tag
+    means the same contents on whichever worker answers. It also changes at
+    least every FRESHNESS_SECONDS, so days_in_stage in a cached response is
+    never older than that.
+
+    Args:
+        store (BoardStore): The board.
+
+    Returns:
+        str: A quoted entity tag.
+    """
+    if store.synced_version < 0:
+        # The cache is being reloaded after a failed commit; its contents
+        # are not known to match any other worker's.
+        return f'"{uuid.uuid4().hex}"'
+    stages = zlib.crc32("\x1f".join(store.stage_names).encode())
+    return (
+        f'"{store.synced_version}-{stages:08x}-{store.archive.stock_count()}.'
+        f'{store.archive.log_count()}-{int(time.time() // FRESHNESS_SECONDS)}"'
+    )
+
+
+def _cached_response(request: Request, etag: str, render) -> Response:
+    """
+    Answers a conditional GET with 304 or renders a fresh body.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current entity tag.
+        render (Callable[[], bytes]): Produces the body when it is needed.
+
+    Returns:
+        Response: The 304 or 200 response.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(render(), media_type="application/json", headers=headers)
+
+
+def _on_board(endpoint):
+    """
+    Routes an endpoint to the board named by the 'board' query parameter,
+    the default board if there is none. Unknown boards get a 404.
+
+    Args:
+        endpoint (Callable): Coroutine taking the request and the board's
+            store.
+
+    Returns:
+        Callable: The Starlette endpoint.
+    """
+
+    @wraps(endpoint)
+    async def routed(request: Request) -> Response:
+        try:
+            store = get_board_store(request.query_params.get("board") or None)
+        except UnknownBoardError as e:
+            return JSONResponse({"error": str(e)}, status_code=404)
+        return await endpoint(request, store)
+
+    return routed
+
+
+@lru_cache(maxsize=512)
+def _render_stocks_page(
+    store: BoardStore,
+    etag: str,
+    stage: str | None,
+    offset: int,
+    limit: int,
+    sort: str,
+) -> bytes:
+    """
+    Renders one page of the stock listing.
+
+    Cached by entity tag, so repeated reads between board mutations are
+    served without touching the store.
+
+    Args:
+        store (BoardStore): The board.
+        etag (str): Entity tag the page was rendered for.
+        stage (str | None): Stage filter.
+        offset (int): Number of stocks skipped.
+        limit (int): Page size.
+        sort (str): Sort order within the stage.
+
+    Returns:
+        bytes: The JSON body.
+    """
+    stocks, total = store.list_stocks(stage, offset, limit, sort)
+    next_offset = offset + limit if offset + limit < total else None
+    return _dumps(
+        {
+            "items": stocks,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
+        }
+    )
+
+
+def _int_param(request: Request, name: str, default: int, maximum: int) -> int:
+    """
+    Reads a non-negative integer query parameter.
+
+    Args:
+        request (Request): The incoming request.
+        name (str): Parameter name.
+        default (int): Value when the parameter is absent.
+        maximum (int): Upper bound the value is clamped to.
+
+    Returns:
+        int: The parameter value.
+
+    Raises:
+        ValueError: If the parameter is not a non-negative integer.
+    """
+    value = int(request.query_params.get(name, default))
+    if value < 0:
+        raise ValueError(f"{name} must not be negative.")
+    return min(value, maximum)
+
+
+@_on_board
+async def list_stages(request: Request, store: BoardStore) -> Response:
+    """GET /api/v1/stages: stage names in pipeline order with stock counts."""
+    return _cached_response(
+        request,
+        _etag(store),
+        lambda: _dumps(
+            {
+                "stages": [
+                    {"name": name, "count": count}
+                    for name, count in store.stage_counts().items()
+                ]
+            }
+        ),
+    )
+
+
+@_on_board
+async def list_stocks(request: Request, store: BoardStore) -> Response:
+    """GET /api/v1/stocks?stage=&offset=&limit=&sort=: one page of stocks."""
+    try:
+        offset = _int_param(request, "offset", 0, 2**31)
+        limit = _int_param(request, "limit", DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    stage = request.query_params.get("stage") or None
+    if stage is not None and stage not in store.stage_names:
+        return JSONResponse({"error": f"Invalid stage: {stage}"}, status_code=400)
+    sort = request.query_params.get("sort") or "board"
+    if sort not in STAGE_SORTS:
+        return JSONResponse({"error": f"Invalid sort order: {sort}"}, status_code=400)
+    if sort != "board" and stage is None:
+        return JSONResponse({"error": "Sorting requires a stage."}, status_code=400)
+    etag = _etag(store)
+    return _cached_response(
+        request,
+        etag,
+        lambda: _render_stocks_page(store, etag, stage, offset, limit, sort),
+    )
+
+
+@_on_board
+async def stock_history(request: Request, store: BoardStore) -> Response:
+    """GET /api/v1/stocks/{stock_id}/history: a stock and its transitions, newest first."""
+    stock_id = request.path_params["stock_id"]
+    stock = store.get_stock(stock_id)
+    if stock is None:
+        return JSONResponse(
+            {"error": f"Stock ID {stock_id} not found."}, status_code=404
+        )
+    return _cached_response(
+        request,
+        _etag(store),
+        lambda: _dumps({"stock": stock, "history": store.history(stock_id)}),
+    )
+
+
+def _time_param(request: Request, name: str) -> datetime | None:
+    """
+    Reads an optional ISO 8601 timestamp query parameter.
+
+    Args:
+        request (Request): The incoming request.
+        name (str): Parameter name.
+
+    Returns:
+        datetime | None: The timestamp in UTC, or None when absent.
+
+    Raises:
+        ValueError: If the parameter is not a timestamp.
+    """
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        return parse_effective_timestamp(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an ISO 8601 timestamp.") from None
+
+
+@_on_board
+async def list_transitions(request: Request, store: BoardStore) -> Response:
+    """
+    GET /api/v1/transitions?since=&until=&offset=&limit=&order=: transitions
+    that took effect in [since, until), by effective time.
+
+    order is 'asc' (default) or 'desc'. Backdated moves are listed at the
+    time they took effect, not when they were recorded.
+    """
+    try:
+        since = _time_param(request, "since")
+        until = _time_param(request, "until")
+        offset = _int_param(request, "offset", 0, 2**31)
+        limit = _int_param(request, "limit", DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    order = request.query_params.get("order", "asc")
+    if order not in ("asc", "desc"):
+        return JSONResponse({"error": "order must be asc or desc."}, status_code=400)
+
+    def render() -> bytes:
+        total = store.count_logs_between(since, until)
+        items = store.logs_between(
+            since, until, offset, limit, newest_first=order == "desc"
+        )
+        next_offset = offset + limit if offset + limit < total else None
+        return _dumps(
+            {
+                "items": items,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "next_offset": next_offset,
+            }
+        )
+
+    return _cached_response(request, _etag(store), render)
+
+
+def _day_range_params(request: Request) -> tuple[date, date]:
+    """
+    Reads inclusive since/until YYYY-MM-DD query parameters.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        tuple[date, date]: The first and last day; by default the last
+            DEFAULT_DAILY_SPAN_DAYS days.
+
+    Raises:
+        ValueError: If a date is malformed or the span is out of range.
+    """
+    try:
+        until = date.fromisoformat(
+            request.query_params.get("until") or get_utc_now().date().isoformat()
+        )
+        since = date.fromisoformat(
+            request.query_params.get("since")
+            or (until - timedelta(days=DEFAULT_DAILY_SPAN_DAYS - 1)).isoformat()
+        )
+    except ValueError:
+        raise ValueError("since and until must be YYYY-MM-DD dates.") from None
+    if since > until or (until - since).days >= MAX_DAILY_SPAN_DAYS:
+        raise ValueError(f"The range must span 1 to {MAX_DAILY_SPAN_DAYS} days.")
+    return since, until
+
+
+def _render_days(counts: dict[date, int]) -> bytes:
+    """Encodes per-day counts as a JSON body."""
+    return _dumps(
+        {
+            "days": [
+                {"date": day.isoformat(), "count": count}
+                for day, count in counts.items()
+            ]
+        }
+    )
+
+
+@_on_board
+async def daily_transitions(request: Request, store: BoardStore) -> Response:
+    """
+    GET /api/v1/transitions/daily?since=&until=: transitions per UTC day.
+
+    since and until are inclusive YYYY-MM-DD dates; the default is the last
+    DEFAULT_DAILY_SPAN_DAYS days.
+    """
+    try:
+        since, until = _day_range_params(request)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return _cached_response(
+        request,
+        _etag(store),
+        lambda: _render_days(store.daily_log_counts(since, until)),
+    )
+
+
+@_on_board
+async def user_activity(request: Request, store: BoardStore) -> Response:
+    """
+    GET /api/v1/users/{user}/activity?since=&until=&offset=&limit=: a user's
+    counters and one page of their transitions, newest first.
+
+    since and until bound the effective time as in /transitions.
+    """
+    user = request.path_params["user"]
+    try:
+        since = _time_param(request, "since")
+        until = _time_param(request, "until")
+        offset = _int_param(request, "offset", 0, 2**31)
+        limit = _int_param(request, "limit", DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    def render() -> bytes:
+        items, total = store.user_logs(user, since, until, offset, limit)
+        next_offset = offset + limit if offset + limit < total else None
+        return _dumps(
+            {
+                "summary": store.user_activity(user),
+                "items": items,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "next_offset": next_offset,
+            }
+        )
+
+    return _cached_response(request, _etag(store), render)
+
+
+@_on_board
+async def user_daily_activity(request: Request, store: BoardStore) -> Response:
+    """
+    GET /api/v1/users/{user}/activity/daily?since=&until=: a user's
+    transitions per UTC day, with the same range rules as /transitions/daily.
+    """
+    user = request.path_params["user"]
+    try:
+        since, until = _day_range_params(request)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return _cached_response(
+        request,
+        _etag(store),
+        lambda: _render_days(store.user_daily_log_counts(user, since, until)),
+    )
+
+
+@_on_board
+async def batch_moves(request: Request, store: BoardStore) -> Response:
+    """
+    POST /api/v1/moves: applies a batch of moves in order.
+
+    The body is {"moves": [...]} where each move has the fields of a sync
+    batch move item (stock_id, new_stage, user, comment, force, rationale,
+    effective_at, idempotency_key). The batch is applied on a worker
+    thread, since each move commits to the backend.
+    """
+    try:
+        payload = await request.json()
+    except ValueError:
+        return JSONResponse({"error": "Body must be JSON."}, status_code=400)
+    moves = payload.get("moves") if isinstance(payload, dict) else None
+    if not isinstance(moves, list):
+        return JSONResponse(
+            {"error": "Body must contain a moves list."}, status_code=400
+        )
+    items = [
+        {**move, "type": "move"} if isinstance(move, dict) else move for move in moves
+    ]
+    try:
+        results = await asyncio.to_thread(apply_sync_batch, items, store)
+    except SyncBatchError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return JSONResponse({"results": results})
+
+
+@_on_board
+async def list_reviews(request: Request, store: BoardStore) -> Response:
+    """
+    GET /api/v1/reviews?status=&offset=&limit=: forced transitions in one
+    review status (default pending), oldest first, with each status's count.
+    """
+    status = request.query_params.get("status", "pending")
+    if status not in REVIEW_STATUSES:
+        return JSONResponse(
+            {"error": f"status must be one of {', '.join(REVIEW_STATUSES)}."},
+            status_code=400,
+        )
+    try:
+        offset = _int_param(request, "offset", 0, 2**31)
+        limit = _int_param(request, "limit", DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    def render() -> bytes:
+        items, total = store.review_queue(status, offset, limit)
+        next_offset = offset + limit if offset + limit < total else None
+        return _dumps(
+            {
+                "counts": store.review_counts(),
+                "items": items,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "next_offset": next_offset,
+            }
+        )
+
+    return _cached_response(request, _etag(store), render)
+
+
+async def _review_request(request: Request) -> tuple[dict, list[int], str]:
+    """
+    Reads the body shared by the review actions.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        tuple[dict, list[int], str]: The body, its log_ids and its reviewer.
+
+    Raises:
+        ValueError: If the body is not JSON with a log_ids list of at most
+            MAX_PAGE_SIZE integers and a reviewer.
+    """
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise ValueError("Body must be JSON.") from None
+    if not isinstance(payload, dict):
+        payload = {}
+    log_ids = payload.get("log_ids")
+    if (
+        not isinstance(log_ids, list)
+        or not all(isinstance(log_id, int) for log_id in log_ids)
+        or len(log_ids) > MAX_PAGE_SIZE
+    ):
+        raise ValueError(
+            f"Body must contain a log_ids list of at most {MAX_PAGE_SIZE} integers."
+        )
+    reviewer = payload.get("reviewer")
+    if not isinstance(reviewer, str) or not reviewer:
+        raise ValueError("Body must contain a reviewer.")
+    return payload, log_ids, reviewer
+
+
+@_on_board
+async def claim_reviews(request: Request, store: BoardStore) -> Response:
+    """
+    POST /api/v1/reviews/claim: claims pending forced transitions.
+
+    The body is {"log_ids": [...], "reviewer": "..."}. Either every
+    transition is claimed or, with a 409, none is.
+    """
+    try:
+        _, log_ids, reviewer = await _review_request(request)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    try:
+        reviews = await asyncio.to_thread(store.claim_reviews, log_ids, reviewer)
+    except BoardStoreError as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
+    return Response(_dumps({"reviews": reviews}), media_type="application/json")
+
+
+@_on_board
+async def release_reviews(request: Request, store: BoardStore) -> Response:
+    """
+    POST /api/v1/reviews/release: returns claimed transitions to the queue.
+
+    The body is {"log_ids": [...], "reviewer": "..."} naming the reviewer
+    who claimed them.
+    """
+    try:
+        _, log_ids, reviewer = await _review_request(request)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    try:
+        reviews = await asyncio.to_thread(store.release_reviews, log_ids, reviewer)
+    except BoardStoreError as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
+    return Response(_dumps({"reviews": reviews}), media_type="application/json")
+
+
+@_on_board
+async def decide_reviews(request: Request, store: BoardStore) -> Response:
+    """
+    POST /api/v1/reviews/decisions: approves or rejects forced transitions.
+
+    The body is {"log_ids": [...], "reviewer": "...", "decision":
+    "approve" | "reject", "note": "..."}; rejections need a note. A batch is
+    decided in one commit, or not at all.
+    """
+    try:
+        payload, log_ids, reviewer = await _review_request(request)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    decision = payload.get("decision")
+    if decision not in ("approve", "reject"):
+        return JSONResponse(
+            {"error": "decision must be approve or reject."}, status_code=400
+        )
+    try:
+        reviews = await asyncio.to_thread(
+            store.decide_reviews,
+            log_ids,
+            reviewer,
+            decision == "approve",
+            str(payload.get("note", "")),
+        )
+    except BoardStoreError as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
+    return Response(_dumps({"reviews": reviews}), media_type="application/json")
+
+
+async def list_boards(request: Request) -> Response:
+    """
+    GET /api/v1/boards: every board with its stages and headline figures,
+    and the total across boards. The boards are read in parallel.
+    """
+    boards = get_board_defs()
+    summaries = await asyncio.to_thread(board_summaries, boards)
+    return Response(
+        _dumps(
+            {
+                "boards": [
+                    {
+                        **summary.dict(),
+                        "stages": [stage.name for stage in board.stages],
+                    }
+                    for board, summary in zip(boards, summaries, strict=True)
+                ],
+                "total": merge_summaries(summaries),
+            }
+        ),
+        media_type="application/json",
+    )
+
+
+ROUTES = [
+    (f"{API_PREFIX}/boards", list_boards, ["GET"]),
+    (f"{API_PREFIX}/stages", list_stages, ["GET"]),
+    (f"{API_PREFIX}/stocks", list_stocks, ["GET"]),
+    (f"{API_PREFIX}/stocks/{{stock_id:int}}/history", stock_history, ["GET"]),
+    (f"{API_PREFIX}/transitions", list_transitions, ["GET"]),
+    (f"{API_PREFIX}/transitions/daily", daily_transitions, ["GET"]),
+    (f"{API_PREFIX}/users/{{user}}/activity", user_activity, ["GET"]),
+    (f"{API_PREFIX}/users/{{user}}/activity/daily", user_daily_activity, ["GET"]),
+    (f"{API_PREFIX}/moves", batch_moves, ["POST"]),
+    (f"{API_PREFIX}/reviews", list_reviews, ["GET"]),
+    (f"{API_PREFIX}/reviews/claim", claim_reviews, ["POST"]),
+    (f"{API_PREFIX}/reviews/release", release_reviews, ["POST"]),
+    (f"{API_PREFIX}/reviews/decisions", decide_reviews, ["POST"]),
+]
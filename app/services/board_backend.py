@@ -0,0 +1,456 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import ContextManager
+
+from app.models import ForcedReview, Stock, StateTransitionLog
+from app.services.resp import RespClient
+from app.services.sequences import SequenceStore, default_sequence_store
+
+logger = logging.getLogger(__name__)
+
+
+class BoardLockLostError(TimeoutError):
+    """Raised when the board lock expired or was taken over before a commit."""
+
+
+@dataclass
+class BoardChange:
+    """
+    One committed board mutation, as persisted and broadcast to other workers.
+
+    Attributes:
+        version (int): The backend version this change produced.
+        stocks (list[Stock]): Stocks created or updated.
+        logs (list[StateTransitionLog]): Transition logs appended.
+        deleted (list[Stock]): Stocks removed from the board.
+        reviews (list[ForcedReview]): Compliance reviews created or updated.
+    """
+
+    version: int = 0
+    stocks: list[Stock] = field(default_factory=list)
+    logs: list[StateTransitionLog] = field(default_factory=list)
+    deleted: list[Stock] = field(default_factory=list)
+    reviews: list[ForcedReview] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.stocks or self.logs or self.deleted or self.reviews)
+
+    def to_json(self) -> str:
+        """Serializes the change for the notification channel."""
+        return json.dumps(
+            {
+                "version": self.version,
+                "stocks": [stock.json() for stock in self.stocks],
+                "logs": [log.json() for log in self.logs],
+                "deleted": [stock.json() for stock in self.deleted],
+                "reviews": [review.json() for review in self.reviews],
+            }
+        )
+
+    @classmethod
+    def from_json(cls, payload: str | bytes) -> "BoardChange":
+        """Parses a change received from the notification channel."""
+        data = json.loads(payload)
+        return cls(
+            version=data["version"],
+            stocks=[Stock.parse_raw(raw) for raw in data["stocks"]],
+            logs=[StateTransitionLog.parse_raw(raw) for raw in data["logs"]],
+            deleted=[Stock.parse_raw(raw) for raw in data["deleted"]],
+            reviews=[ForcedReview.parse_raw(raw) for raw in data.get("reviews", [])],
+        )
+
+
+class BoardBackend(ABC):
+    """
+    Where the board store persists its data and learns about other workers.
+
+    The board store keeps a full in-memory copy of the board for reads. A
+    backend decides whether that copy is the only one (in-process) or a cache
+    over shared storage that several workers write to.
+    """
+
+    shared: bool = False
+
+    @abstractmethod
+    def load(
+        self,
+    ) -> tuple[list[Stock], list[StateTransitionLog], list[ForcedReview], int]:
+        """
+        Loads the whole board.
+
+        Returns:
+            tuple: Stocks, transition logs in append order, the latest review
+                of each reviewed forced log, and the backend version.
+        """
+
+    @abstractmethod
+    def sequence_store(self) -> SequenceStore:
+        """
+        Returns the sequence store that stock and log IDs are leased from.
+
+        Returns:
+            SequenceStore: A store shared by every worker on this backend.
+        """
+
+    def lock(self) -> ContextManager:
+        """
+        Returns a context manager that serializes mutations across workers.
+
+        Returns:
+            ContextManager: A no-op for in-process backends.
+        """
+        return nullcontext()
+
+    def current_version(self) -> int:
+        """
+        Returns the version of the most recent committed change.
+
+        Returns:
+            int: The backend version, 0 for in-process backends.
+        """
+        return 0
+
+    @abstractmethod
+    def commit(self, change: BoardChange) -> None:
+        """
+        Persists a change and notifies other workers. Called under `lock()`.
+
+        Args:
+            change (BoardChange): The change, with the version following the
+                store's last synced one. Shared backends replace it with the
+                version they allocated.
+        """
+
+    def load_outcome(self, key: str) -> str | None:
+        """
+        Returns an event outcome another worker recorded, for idempotent
+        retries that land on a different worker.
+
+        Args:
+            key (str): The outcome's key.
+
+        Returns:
+            str | None: The outcome's JSON, or None if unknown or expired.
+                Always None for in-process backends.
+        """
+        return None
+
+    def save_outcome(self, key: str, payload: str, ttl_ms: int) -> None:
+        """
+        Records an event outcome for every worker on this backend.
+
+        Args:
+            key (str): The outcome's key.
+            payload (str): The outcome's JSON.
+            ttl_ms (int): How long the outcome stays replayable.
+        """
+
+    def subscribe(self, callback: Callable[[BoardChange | None], None]) -> None:
+        """
+        Starts delivering changes committed by other workers.
+
+        The callback receives None when notifications may have been missed,
+        e.g. after a reconnect, and the board should be reloaded.
+
+        Args:
+            callback (Callable): Called from a background thread per change.
+        """
+
+    def close(self) -> None:
+        """Releases connections and stops notifications."""
+
+
+class MemoryBoardBackend(BoardBackend):
+    """Backend for a single worker: the board lives only in process memory."""
+
+    def __init__(self, sequences: SequenceStore | None = None):
+        """
+        Args:
+            sequences (SequenceStore | None): Where IDs are leased from.
+                Defaults to the deployment's file-backed sequence store.
+        """
+        self._sequences = sequences
+
+    def load(
+        self,
+    ) -> tuple[list[Stock], list[StateTransitionLog], list[ForcedReview], int]:
+        return [], [], [], 0
+
+    def sequence_store(self) -> SequenceStore:
+        if self._sequences is None:
+            self._sequences = default_sequence_store()
+        return self._sequences
+
+    def commit(self, change: BoardChange) -> None:
+        pass
+
+
+class RespSequenceStore(SequenceStore):
+    """Sequence store kept in a hash on a Redis-protocol server."""
+
+    def __init__(self, client: RespClient, key: str):
+        """
+        Args:
+            client (RespClient): Server connection.
+            key (str): Hash holding one high-water mark per sequence.
+        """
+        self.client = client
+        self.key = key
+
+    def reserve(self, name: str, count: int) -> int:
+        reserved_to = self.client.execute("HINCRBY", self.key, name, count)
+        return reserved_to - count + 1
+
+
+class RespBoardBackend(BoardBackend):
+    """
+    Backend shared by several workers through a Redis-protocol server.
+
+    Keys, all under a common prefix:
+        {prefix}:stocks      hash of stock ID to stock JSON
+        {prefix}:tickers     hash of ticker to stock ID
+        {prefix}:logs        list of transition log JSON in append order
+        {prefix}:reviews     hash of forced log ID to its review JSON
+        {prefix}:version     number of committed changes, bumped with INCR
+        {prefix}:sequences   ID high-water marks
+        {prefix}:lock        mutation lock, held with a TTL renewed while held
+        {prefix}:outcomes:*  idempotent event outcomes, each with a TTL
+        {prefix}:changes     pub/sub channel carrying each committed change
+
+    A commit is one MULTI/EXEC block, run only if this worker still holds the
+    lock: the lock key is watched, so a lock that expired or was taken over
+    discards the block instead of interleaving two workers' writes.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "kanban",
+        lock_ttl_ms: int = 5000,
+        lock_timeout: float = 10.0,
+    ):
+        """
+        Args:
+            url (str): Server URL, e.g. redis://127.0.0.1:6379.
+            prefix (str): Prefix for every key and the change channel.
+            lock_ttl_ms (int): Expiry of the mutation lock, so a crashed
+                worker cannot hold it forever. A live holder renews it every
+                third of this, however long a reload under it takes.
+            lock_timeout (float): Seconds to wait for the lock before failing.
+        """
+        self.client = RespClient.from_url(url)
+        # Renewals use their own connection, so a long board load on the
+        # command connection cannot hold them up past the lock's expiry.
+        self._renew_client = RespClient.from_url(url)
+        self.prefix = prefix
+        self.lock_ttl_ms = lock_ttl_ms
+        self.lock_timeout = lock_timeout
+        self._lock_token: str | None = None
+        self._closed = threading.Event()
+
+    def _key(self, name: str) -> str:
+        """Returns the full key for a name under this backend's prefix."""
+        return f"{self.prefix}:{name}"
+
+    def load(
+        self,
+    ) -> tuple[list[Stock], list[StateTransitionLog], list[ForcedReview], int]:
+        raw_stocks, raw_logs, raw_reviews, version = self.client.pipeline(
+            [
+                ("HGETALL", self._key("stocks")),
+                ("LRANGE", self._key("logs"), 0, -1),
+                ("HGETALL", self._key("reviews")),
+                ("GET", self._key("version")),
+            ]
+        )
+        stocks = [Stock.parse_raw(raw) for raw in raw_stocks[1::2]]
+        stocks.sort(key=lambda stock: stock.id)
+        logs = [StateTransitionLog.parse_raw(raw) for raw in raw_logs]
+        reviews = [ForcedReview.parse_raw(raw) for raw in raw_reviews[1::2]]
+        return stocks, logs, reviews, int(version or 0)
+
+    def sequence_store(self) -> SequenceStore:
+        return RespSequenceStore(self.client, self._key("sequences"))
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        key, token = self._key("lock"), uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_timeout
+        while not self.client.execute("SET", key, token, "NX", "PX", self.lock_ttl_ms):
+            if time.monotonic() > deadline:
+                raise TimeoutError("Timed out waiting for the board lock.")
+            time.sleep(0.005)
+        self._lock_token = token
+        released = threading.Event()
+        renewer = threading.Thread(
+            target=self._renew_lock,
+            args=(token, released),
+            name="board-lock-renewal",
+            daemon=True,
+        )
+        renewer.start()
+        try:
+            yield
+        finally:
+            released.set()
+            renewer.join()
+            self._lock_token = None
+            self._while_holding(self.client, token, lambda: [("DEL", key)])
+
+    def _renew_lock(self, token: str, released: threading.Event) -> None:
+        """Extends the lock's expiry until it is released or lost."""
+        while not released.wait(self.lock_ttl_ms / 3000):
+            try:
+                renewed = self._while_holding(
+                    self._renew_client,
+                    token,
+                    lambda: [("PEXPIRE", self._key("lock"), self.lock_ttl_ms)],
+                )
+            except OSError as e:
+                logger.warning("Could not renew the board lock: %s", e)
+                continue
+            if renewed is None:
+                logger.warning("Board lock lost before it was released.")
+                return
+
+    def _while_holding(
+        self,
+        client: RespClient,
+        token: str,
+        build: Callable[..., list[tuple]],
+        *watched: str,
+    ) -> list | None:
+        """
+        Runs commands atomically if the lock is still held with a token.
+
+        The lock key, and any further watched keys, are watched before the
+        token is checked, so a lock that expires or changes hands before
+        EXEC discards the commands.
+
+        Args:
+            client (RespClient): The connection to use.
+            token (str): The token the lock was taken with.
+            build (Callable[..., list[tuple]]): Returns the commands to run
+                as one transaction, given the watched keys' values.
+            *watched (str): Further keys whose change discards the commands.
+
+        Returns:
+            list | None: The commands' replies, or None if the lock is no
+                longer held or a watched key changed.
+        """
+        with client.exclusive():
+            client.execute("WATCH", self._key("lock"), *watched)
+            holder, *values = client.pipeline(
+                [("GET", self._key("lock")), *(("GET", key) for key in watched)],
+                reconnect=False,
+            )
+            if holder != token.encode():
+                client.execute("UNWATCH")
+                return None
+            return client.transaction(build(*values))
+
+    def current_version(self) -> int:
+        return int(self.client.execute("GET", self._key("version")) or 0)
+
+    def commit(self, change: BoardChange) -> None:
+        if self._lock_token is None or not self._while_holding(
+            self.client,
+            self._lock_token,
+            lambda version: self._commit_commands(change, int(version or 0) + 1),
+            self._key("version"),
+        ):
+            raise BoardLockLostError("Lost the board lock before committing.")
+
+    def _commit_commands(self, change: BoardChange, version: int) -> list[tuple]:
+        """
+        Returns the commands persisting and announcing a change.
+
+        Args:
+            change (BoardChange): The change; its version is set to the one
+                INCR will allocate, which the watch on the version key holds
+                to.
+            version (int): The version after the current one.
+
+        Returns:
+            list[tuple]: The commands, to run as one transaction.
+        """
+        change.version = version
+        commands: list[tuple] = [("INCR", self._key("version"))]
+        for stock in change.stocks:
+            commands.append(("HSET", self._key("stocks"), stock.id, stock.json()))
+            commands.append(("HSET", self._key("tickers"), stock.ticker, stock.id))
+        for stock in change.deleted:
+            commands.append(("HDEL", self._key("stocks"), stock.id))
+            commands.append(("HDEL", self._key("tickers"), stock.ticker))
+        if change.logs:
+            commands.append(
+                ("RPUSH", self._key("logs"), *(log.json() for log in change.logs))
+            )
+        for review in change.reviews:
+            commands.append(
+                ("HSET", self._key("reviews"), review.log_id, review.json())
+            )
+        commands.append(("PUBLISH", self._key("changes"), change.to_json()))
+        return commands
+
+    def load_outcome(self, key: str) -> str | None:
+        payload = self.client.execute("GET", self._key(f"outcomes:{key}"))
+        return payload.decode() if payload is not None else None
+
+    def save_outcome(self, key: str, payload: str, ttl_ms: int) -> None:
+        self.client.execute("SET", self._key(f"outcomes:{key}"), payload, "PX", ttl_ms)
+
+    def subscribe(self, callback: Callable[[BoardChange | None], None]) -> None:
+        def listen() -> None:
+            reconnecting = False
+            while not self._closed.is_set():
+                if reconnecting:
+                    callback(None)
+                try:
+                    for payload in self.client.subscribe(self._key("changes")):
+                        callback(BoardChange.from_json(payload))
+                except OSError as e:
+                    logger.warning("Board change subscription lost: %s", e)
+                    time.sleep(1.0)
+                reconnecting = True
+
+        threading.Thread(target=listen, name="board-changes", daemon=True).start()
+
+    def close(self) -> None:
+        self._closed.set()
+        self.client.close()
+        self._renew_client.close()
+
+
+def create_board_backend(
+    url: str | None = None, prefix: str = "kanban"
+) -> BoardBackend:
+    """
+    Creates the backend selected by a URL.
+
+    Args:
+        url (str | None): 'memory' (or empty) for an in-process board, or a
+            redis:// URL for a board shared by several workers.
+        prefix (str): Key prefix for shared backends, so several boards can
+            share one server.
+
+    Returns:
+        BoardBackend: The backend.
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+    """
+    if not url or url == "memory":
+        return MemoryBoardBackend()
+    if url.startswith("redis://"):
+        return RespBoardBackend(url, prefix)
+    raise ValueError(f"Unsupported board backend: {url}")
@@ -0,0 +1,1488 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Container, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from app.models import (
+    ForcedReview,
+    ReviewQueueItem,
+    Stock,
+    StateTransitionLog,
+    UserActivity,
+    get_utc_now,
+)
+from app.services.archive import ArchivePolicy, ArchiveSegment, ColdArchive
+from app.services.board_backend import (
+    BoardBackend,
+    BoardChange,
+    MemoryBoardBackend,
+    create_board_backend,
+)
+from app.services.boards import (
+    DEFAULT_BOARD_ID,
+    BoardConfig,
+    boards_file_stamp,
+    default_board_id,
+    get_board_config,
+    get_board_def,
+    get_transition_policy,
+    install_board_config,
+    read_board_config,
+)
+from app.services.log_index import TemporalLogIndex, UserLogIndex
+from app.services.review_queue import (
+    OPEN_REVIEW_STATUSES,
+    REVIEW_STATUSES,
+    ForcedReviewIndex,
+)
+from app.services.sequences import IdSequence, MemorySequenceStore
+from app.services.stage_order import STAGE_SORTS, SortedStageIndex
+from app.services.transition_counts import TransitionCounts
+from app.services.transitions import TransitionPolicy
+
+logger = logging.getLogger(__name__)
+
+# Stocks whose sorted timeline is kept for detail views.
+TIMELINE_CACHE_SIZE = 1024
+# Days averaged over for a user's moves per day.
+ACTIVITY_RATE_DAYS = 30
+
+
+class BoardStoreError(ValueError):
+    """Raised when the store rejects a board mutation."""
+
+
+def days_since(moment: datetime | None) -> int:
+    """
+    Whole days elapsed since a moment, never negative.
+
+    Args:
+        moment (datetime | None): The start of the interval.
+
+    Returns:
+        int: Days elapsed, or 0 if the moment is unknown.
+    """
+    if moment is None:
+        return 0
+    return max(0, (get_utc_now() - moment).days)
+
+
+class BoardStore:
+    """
+    Process-wide repository of the board's stocks and transition logs.
+
+    UI sessions, the sync endpoint and the HTTP API all read from and write
+    to the same store, so a move made through any of them is visible to the
+    others. Stocks are handed out as copies with a fresh days_in_stage;
+    transition logs are immutable and shared.
+
+    The store is an in-memory cache in front of a BoardBackend. With a shared
+    backend, mutations run under the backend's lock after catching up with
+    any change another worker committed, and changes from other workers are
+    applied as they are announced.
+
+    With an ArchivePolicy, stocks in the board's archive stage (Ocean on
+    the standard pipeline) and old logs are moved out of the cache into a
+    compressed ColdArchive after every load and on each archive_cold() run.
+    Only lookups by ID, histories, the Ocean archive and audit snapshots
+    read the archive; listings, feeds and analytics cover the hot working
+    set.
+    """
+
+    def __init__(
+        self,
+        stage_names: list[str],
+        stock_ids: IdSequence | None = None,
+        log_ids: IdSequence | None = None,
+        backend: BoardBackend | None = None,
+        archive_policy: ArchivePolicy | None = None,
+        policy: TransitionPolicy | None = None,
+    ):
+        """
+        Args:
+            stage_names (list[str]): The board's stages in pipeline order.
+            stock_ids (IdSequence | None): Source of stock IDs. Defaults to a
+                sequence leased from the backend's sequence store.
+            log_ids (IdSequence | None): Source of log IDs. Defaults to a
+                sequence leased from the backend's sequence store.
+            backend (BoardBackend | None): Persistence and cross-worker
+                notifications. Defaults to an in-process backend with
+                in-memory sequences.
+            archive_policy (ArchivePolicy | None): When stocks and logs move
+                to the cold archive. None keeps everything hot.
+            policy (TransitionPolicy | None): The board's compiled transition
+                rules. Defaults to plain pipeline rules.
+        """
+        self.backend = backend or MemoryBoardBackend(MemorySequenceStore())
+        self.stage_names = list(stage_names)
+        self.policy = policy or TransitionPolicy(self.stage_names)
+        self.stock_ids = stock_ids or IdSequence(self.backend.sequence_store(), "stock")
+        self.log_ids = log_ids or IdSequence(self.backend.sequence_store(), "log")
+        self.archive_policy = archive_policy
+        self.version = 0
+        # Bumped whenever the hot log is replaced or shrinks, i.e. on every
+        # load and every archive run that moves logs. Within an epoch the
+        # hot log is only appended to.
+        self.log_epoch = 0
+        self._lock = threading.RLock()
+        self._listeners: list[Callable[[BoardChange | None], None]] = []
+        self._synced_version = 0
+        self._reset()
+        self.backend.subscribe(self._on_remote_change)
+        with self._lock:
+            self._load_from_backend()
+
+    def _reset(self) -> None:
+        """Clears the cached board."""
+        self._stocks: dict[int, Stock] = {}
+        self._stage_members: dict[str, dict[int, None]] = {
+            name: {} for name in self.stage_names
+        }
+        self._tickers: dict[str, int] = {}
+        self._orders: dict[tuple[str, str], SortedStageIndex] = {}
+        self._logs: list[StateTransitionLog] = []
+        self._logs_by_id: dict[int, StateTransitionLog] = {}
+        self._timelines: OrderedDict[
+            int, tuple[int | None, list[StateTransitionLog]]
+        ] = OrderedDict()
+        self.transition_counts = TransitionCounts(self.stage_names)
+        self._log_times = TemporalLogIndex()
+        self._user_logs = UserLogIndex()
+        self._reviews = ForcedReviewIndex()
+        self.archive = ColdArchive()
+
+    def _load_from_backend(self) -> None:
+        """Replaces the cached board with the backend's copy."""
+        stocks, logs, reviews, backend_version = self.backend.load()
+        self._reset()
+        for stock in stocks:
+            self._cache_stock(stock)
+        for log in logs:
+            self._append_log(log, index_time=False)
+        self._log_times.extend(logs)
+        self._user_logs.extend(logs)
+        for review in reviews:
+            self._reviews.put(review)
+        self._synced_version = backend_version
+        self.version += 1
+        self.log_epoch += 1
+        if self.archive_policy is not None:
+            self._archive_cold(get_utc_now())
+
+    @property
+    def synced_version(self) -> int:
+        """
+        The backend version this cache reflects. Unlike `version`, which
+        counts this process's reloads and changes, it is the same on every
+        worker holding the same board; -1 until a failed commit is reloaded.
+        """
+        return self._synced_version
+
+    def occupied_stages(self, stage_names: list[str]) -> list[str]:
+        """
+        Returns the stages outside the given ones that hold stocks, on the
+        board or in the archive.
+
+        Args:
+            stage_names (list[str]): The stages to keep.
+
+        Returns:
+            list[str]: The occupied stages that would be removed, sorted.
+        """
+        with self._lock:
+            occupied = {
+                stage
+                for stage, members in self._stage_members.items()
+                if members and stage not in stage_names
+            }
+            archive_stage = self.policy.archive_stage
+            if archive_stage not in stage_names and self.archive.stock_count():
+                occupied.add(archive_stage)
+        return sorted(occupied)
+
+    def reconfigure(self, stage_names: list[str], policy: TransitionPolicy) -> None:
+        """
+        Switches the board to new stages and transition rules, e.g. after
+        the boards file changed. Sessions are told to reload.
+
+        Stocks are never moved by a reconfiguration, so a stage still
+        holding stocks, on the board or in the archive, cannot be removed.
+        Transition logs name stages by name and are kept as they are; logs
+        into a removed stage stay in histories and audits but drop out of
+        the per-stage counts.
+
+        Args:
+            stage_names (list[str]): The board's stages in pipeline order.
+            policy (TransitionPolicy): The board's compiled transition rules.
+
+        Raises:
+            BoardStoreError: If a removed stage still holds stocks.
+        """
+        with self._lock:
+            occupied = self.occupied_stages(stage_names)
+            if occupied:
+                raise BoardStoreError(
+                    f"Stages still holding stocks cannot be removed: {', '.join(occupied)}"
+                )
+            self.policy = policy
+            if list(stage_names) != self.stage_names:
+                self.stage_names = list(stage_names)
+                self._stage_members = {
+                    name: self._stage_members.get(name, {}) for name in self.stage_names
+                }
+                self._orders = {
+                    key: index
+                    for key, index in self._orders.items()
+                    if key[0] in self._stage_members
+                }
+                self.transition_counts = TransitionCounts(self.stage_names)
+                for segment in self.archive.log_segments():
+                    for log in segment.decode():
+                        self.transition_counts.add(log)
+                for log in self._logs:
+                    self.transition_counts.add(log)
+                self.log_epoch += 1
+            self.version += 1
+        self._notify(None)
+
+    def archive_cold(self, now: datetime | None = None) -> tuple[int, int]:
+        """
+        Moves stocks and logs the archive policy no longer keeps hot into
+        the cold archive. Sessions are told to reload if the board changed.
+
+        Nothing is written to the backend: every worker archives its own
+        cache by the same policy, and rebuilds its archive on each load.
+
+        Args:
+            now (datetime | None): The moment the policy's ages are measured
+                from. Defaults to now.
+
+        Returns:
+            tuple[int, int]: The number of stocks and logs archived.
+        """
+        if self.archive_policy is None:
+            return 0, 0
+        with self._lock:
+            archived = self._archive_cold(now or get_utc_now())
+            if archived[0]:
+                self.version += 1
+        if archived[0]:
+            self._notify(None)
+        return archived
+
+    def _archive_cold(self, now: datetime) -> tuple[int, int]:
+        """
+        Archives stocks that entered the board's archive stage before the
+        policy's cutoff, and logs that took effect before it. Forced
+        transitions with an open review stay hot for the compliance queue.
+        """
+        stock_cutoff = self.archive_policy.stock_cutoff(now)
+        log_cutoff = self.archive_policy.log_cutoff(now)
+        archive_stage = self.policy.archive_stage
+        stocks = []
+        if stock_cutoff is not None and archive_stage in self._stage_members:
+            stocks = [
+                self._stocks[stock_id]
+                for stock_id in self._stage_members[archive_stage]
+                if self._stocks[stock_id].current_stage_entered_at
+                and self._stocks[stock_id].current_stage_entered_at < stock_cutoff
+            ]
+        logs = []
+        if log_cutoff is not None:
+            logs = [
+                log
+                for log in self._log_times.between(end=log_cutoff)
+                if (review := self._reviews.get(log.id)) is None
+                or review.status not in OPEN_REVIEW_STATUSES
+            ]
+        for stock in stocks:
+            self._uncache_stock(stock.id)
+        self.archive.add_stocks(stocks)
+        if logs:
+            log_ids = {log.id for log in logs}
+            self.archive.add_logs(logs)
+            self._logs = [log for log in self._logs if log.id not in log_ids]
+            for log_id in log_ids:
+                del self._logs_by_id[log_id]
+            self._log_times.discard_before(log_cutoff, log_ids)
+            self._user_logs.discard_before(log_cutoff, logs)
+            self.log_epoch += 1
+        if stocks or logs:
+            self._timelines.clear()
+            logger.info("Archived %d stocks and %d logs", len(stocks), len(logs))
+        return len(stocks), len(logs)
+
+    def add_listener(self, callback: Callable[[BoardChange | None], None]) -> None:
+        """
+        Registers a callback for every change to the board, local or remote.
+
+        Callbacks run on the thread that applied the change, outside the
+        store's lock. They receive None when the whole board was reloaded.
+
+        Args:
+            callback (Callable): Receives the BoardChange, or None.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, change: BoardChange | None) -> None:
+        """Calls every listener, logging rather than propagating failures."""
+        for callback in list(self._listeners):
+            try:
+                callback(change)
+            except Exception:
+                logger.exception("Board change listener failed")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[BoardChange]:
+        """
+        Runs a mutation under the local and backend locks and commits it.
+
+        Yields:
+            BoardChange: Collects the stocks and logs the mutation touched.
+                Nothing is committed if it stays empty or an error is raised.
+        """
+        with self._lock:
+            with self.backend.lock():
+                if self.backend.shared:
+                    backend_version = self.backend.current_version()
+                    if backend_version != self._synced_version:
+                        self._load_from_backend()
+                change = BoardChange(version=self._synced_version + 1)
+                yield change
+                if not change:
+                    return
+                try:
+                    self.backend.commit(change)
+                except Exception:
+                    # The cache now holds an uncommitted change; force a
+                    # reload from the backend before the next mutation.
+                    self._synced_version = -1
+                    raise
+                self._synced_version = change.version
+                self.version += 1
+        self._notify(change)
+
+    def _on_remote_change(self, change: BoardChange | None) -> None:
+        """
+        Applies a change announced by the backend.
+
+        Own changes arrive again and are skipped by version. A gap in
+        versions, or a None notification, reloads the whole board.
+
+        Args:
+            change (BoardChange | None): The change, or None after a reconnect.
+        """
+        with self._lock:
+            if change is not None and change.version <= self._synced_version:
+                return
+            if change is None or change.version != self._synced_version + 1:
+                self._load_from_backend()
+                change = None
+            else:
+                for stock in change.deleted:
+                    self._uncache_stock(stock.id)
+                for stock in change.stocks:
+                    self._uncache_stock(stock.id)
+                    self._cache_stock(stock.copy())
+                for log in change.logs:
+                    if log.id not in self._logs_by_id:
+                        self._append_log(log)
+                for review in change.reviews:
+                    self._reviews.put(review)
+                self._synced_version = change.version
+                self.version += 1
+        self._notify(change)
+
+    def _cache_stock(self, stock: Stock) -> None:
+        """Adds a stock to the cache and its stage and ticker indexes."""
+        self._stocks[stock.id] = stock
+        self._stage_members[stock.status][stock.id] = None
+        self._tickers[stock.ticker] = stock.id
+        self._index_stock(stock)
+
+    def _uncache_stock(self, stock_id: int) -> Stock | None:
+        """
+        Removes a stock from the cache and its indexes, or from the archive,
+        if present.
+        """
+        stock = self._stocks.pop(stock_id, None)
+        if stock is None:
+            return self.archive.forget_stock(stock_id)
+        self._stage_members[stock.status].pop(stock_id, None)
+        self._tickers.pop(stock.ticker, None)
+        self._unindex_stock(stock)
+        return stock
+
+    def _index_stock(self, stock: Stock) -> None:
+        """Adds a stock to the built sort orders of its stage."""
+        for sort in STAGE_SORTS:
+            index = self._orders.get((stock.status, sort))
+            if index is not None:
+                index.add(stock)
+
+    def _unindex_stock(self, stock: Stock) -> None:
+        """Removes a stock from the built sort orders of its stage."""
+        for sort in STAGE_SORTS:
+            index = self._orders.get((stock.status, sort))
+            if index is not None:
+                index.remove(stock)
+
+    def is_empty(self) -> bool:
+        """Returns True if the board holds no stocks."""
+        return not self._stocks
+
+    def stocks(self) -> list[Stock]:
+        """
+        Returns every stock on the board in insertion order.
+
+        Returns:
+            list[Stock]: Copies of the stocks.
+        """
+        with self._lock:
+            return [self._export(stock) for stock in self._stocks.values()]
+
+    def logs(self, start: int = 0) -> list[StateTransitionLog]:
+        """
+        Returns the hot transition log in append order.
+
+        Args:
+            start (int): Index of the first log to return, for callers that
+                only need logs appended since they last looked.
+
+        Returns:
+            list[StateTransitionLog]: The transition logs.
+        """
+        with self._lock:
+            return self._logs[start:]
+
+    def log_tail(
+        self, start: int, epoch: int
+    ) -> tuple[int, tuple[ArchiveSegment, ...], list[StateTransitionLog]]:
+        """
+        Returns the logs a reader has not seen yet.
+
+        Args:
+            start (int): Number of hot logs the reader has seen.
+            epoch (int): The log_epoch those logs were read in.
+
+        Returns:
+            tuple: The current epoch, the archived log segments, and the hot
+                logs. In the reader's epoch no segments are returned and only
+                the hot logs appended since; in another epoch every segment
+                and the whole hot log, read together so no log is missed or
+                seen twice.
+        """
+        with self._lock:
+            if epoch != self.log_epoch:
+                return self.log_epoch, self.archive.log_segments(), list(self._logs)
+            return epoch, (), self._logs[start:]
+
+    def log_count(self) -> int:
+        """Returns the number of hot transition logs."""
+        return len(self._logs)
+
+    def get_stock(self, stock_id: int) -> Stock | None:
+        """
+        Looks up a single stock, on the board or in the archive.
+
+        Args:
+            stock_id (int): ID of the stock.
+
+        Returns:
+            Stock | None: A copy of the stock, or None if it does not exist.
+        """
+        with self._lock:
+            stock = self._stocks.get(stock_id) or self.archive.get_stock(stock_id)
+            return self._export(stock) if stock else None
+
+    def get_stocks(self, stock_ids: Iterable[int]) -> list[Stock]:
+        """
+        Looks up many stocks under one lock acquisition.
+
+        Args:
+            stock_ids (Iterable[int]): IDs of the stocks.
+
+        Returns:
+            list[Stock]: Copies of the stocks that exist, in the given order.
+        """
+        with self._lock:
+            return [
+                self._export(self._stocks[stock_id])
+                for stock_id in stock_ids
+                if stock_id in self._stocks
+            ]
+
+    def get_log(self, log_id: int) -> StateTransitionLog | None:
+        """
+        Looks up a single transition log, hot or archived.
+
+        Args:
+            log_id (int): ID of the log.
+
+        Returns:
+            StateTransitionLog | None: The log, or None if it does not exist.
+        """
+        log = self._logs_by_id.get(log_id)
+        if log is None:
+            with self._lock:
+                log = self.archive.get_logs([log_id]).get(log_id)
+        return log
+
+    def archived_stocks(
+        self, offset: int = 0, limit: int | None = None
+    ) -> tuple[list[Stock], int]:
+        """
+        Returns a page of the Ocean archive, most recently archived first.
+
+        Args:
+            offset (int): Stocks to skip.
+            limit (int | None): Maximum number of stocks, or None for all.
+
+        Returns:
+            tuple[list[Stock], int]: Copies of the stocks and the number of
+                archived stocks.
+        """
+        with self._lock:
+            stocks = self.archive.stocks(offset, limit)
+            return [self._export(s) for s in stocks], self.archive.stock_count()
+
+    def logs_between(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> list[StateTransitionLog]:
+        """
+        Returns the transitions that took effect in [start, end).
+
+        Logs are ordered by effective time, so backdated moves appear where
+        they happened rather than where they were recorded.
+
+        Args:
+            start (datetime | None): Inclusive lower bound, or None.
+            end (datetime | None): Exclusive upper bound, or None.
+            offset (int): Logs to skip.
+            limit (int | None): Maximum number of logs, or None for all.
+            newest_first (bool): Whether to return the latest logs first.
+
+        Returns:
+            list[StateTransitionLog]: The logs.
+        """
+        with self._lock:
+            return self._log_times.between(start, end, offset, limit, newest_first)
+
+    def count_logs_between(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> int:
+        """
+        Counts the transitions that took effect in [start, end).
+
+        Args:
+            start (datetime | None): Inclusive lower bound, or None.
+            end (datetime | None): Exclusive upper bound, or None.
+
+        Returns:
+            int: The number of logs.
+        """
+        with self._lock:
+            return self._log_times.count(start, end)
+
+    def daily_log_counts(self, start: date, end: date) -> dict[date, int]:
+        """
+        Returns the number of transitions that took effect on each UTC day.
+
+        Args:
+            start (date): First day, inclusive.
+            end (date): Last day, inclusive.
+
+        Returns:
+            dict[date, int]: Every day in the range, including empty ones.
+        """
+        with self._lock:
+            return self._log_times.daily_counts(start, end)
+
+    def user_logs(
+        self,
+        user: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        newest_first: bool = True,
+    ) -> tuple[list[StateTransitionLog], int]:
+        """
+        Returns one page of the transitions a user recorded in [start, end).
+
+        Args:
+            user (str): The updated_by user.
+            start (datetime | None): Inclusive lower bound, or None.
+            end (datetime | None): Exclusive upper bound, or None.
+            offset (int): Logs to skip.
+            limit (int | None): Maximum number of logs, or None for all.
+            newest_first (bool): Whether to return the latest logs first.
+
+        Returns:
+            tuple[list[StateTransitionLog], int]: The page and the number of
+                the user's logs in the range.
+        """
+        with self._lock:
+            index = self._user_logs.index(user)
+            page = index.between(start, end, offset, limit, newest_first)
+            return page, index.count(start, end)
+
+    def user_daily_log_counts(
+        self, user: str, start: date, end: date
+    ) -> dict[date, int]:
+        """
+        Returns the number of transitions a user recorded on each UTC day.
+
+        Args:
+            user (str): The updated_by user.
+            start (date): First day, inclusive.
+            end (date): Last day, inclusive.
+
+        Returns:
+            dict[date, int]: Every day in the range, including empty ones.
+        """
+        with self._lock:
+            return self._user_logs.index(user).daily_counts(start, end)
+
+    def user_activity(self, user: str) -> UserActivity:
+        """
+        Summarises a user's transitions from the per-user counters.
+
+        Args:
+            user (str): The updated_by user.
+
+        Returns:
+            UserActivity: Totals, forced ratio, today's count and the
+                average per day over the last ACTIVITY_RATE_DAYS days.
+        """
+        today = get_utc_now().date()
+        with self._lock:
+            counters = self._user_logs.counters(user)
+            days = self._user_logs.index(user).daily_counts(
+                today - timedelta(days=ACTIVITY_RATE_DAYS - 1), today
+            )
+        return UserActivity(
+            user=user,
+            transitions=counters.transitions,
+            moves=counters.moves,
+            forced_moves=counters.forced_moves,
+            forced_ratio=(
+                round(counters.forced_moves / counters.moves, 3)
+                if counters.moves
+                else 0.0
+            ),
+            today=days[today],
+            transitions_per_day=round(sum(days.values()) / ACTIVITY_RATE_DAYS, 2),
+        )
+
+    def log_users(self) -> list[str]:
+        """Returns every user who has recorded a transition, sorted."""
+        with self._lock:
+            return self._user_logs.users()
+
+    def review_counts(self) -> dict[str, int]:
+        """
+        Returns the number of forced transitions in each review status.
+
+        Returns:
+            dict[str, int]: Status to count, for every status.
+        """
+        with self._lock:
+            return self._reviews.counts()
+
+    def review_queue(
+        self, status: str = "pending", offset: int = 0, limit: int | None = None
+    ) -> tuple[list[ReviewQueueItem], int]:
+        """
+        Returns one page of forced transitions in a review status, oldest
+        first, read from the review index rather than the whole log.
+
+        Args:
+            status (str): One of REVIEW_STATUSES.
+            offset (int): Transitions to skip.
+            limit (int | None): Page size, or None for all.
+
+        Returns:
+            tuple[list[ReviewQueueItem], int]: The page and the number of
+                transitions in that status.
+
+        Raises:
+            BoardStoreError: If the status is unknown.
+        """
+        if status not in REVIEW_STATUSES:
+            raise BoardStoreError(f"Invalid review status: {status}")
+        with self._lock:
+            reviews = self._reviews.page(status, offset, limit)
+            archived = self.archive.get_logs(
+                review.log_id
+                for review in reviews
+                if review.log_id not in self._logs_by_id
+            )
+            items = [
+                ReviewQueueItem(
+                    log=self._logs_by_id.get(review.log_id) or archived[review.log_id],
+                    review=review,
+                )
+                for review in reviews
+            ]
+            return items, self._reviews.counts()[status]
+
+    def get_review(self, log_id: int) -> ForcedReview | None:
+        """
+        Looks up the review of a forced transition.
+
+        Args:
+            log_id (int): ID of the transition log.
+
+        Returns:
+            ForcedReview | None: The review, or None if the log is not forced.
+        """
+        with self._lock:
+            return self._reviews.get(log_id)
+
+    def stage_counts(self) -> dict[str, int]:
+        """
+        Returns the number of stocks in each stage.
+
+        Returns:
+            dict[str, int]: Stage name to stock count.
+        """
+        with self._lock:
+            return {name: len(ids) for name, ids in self._stage_members.items()}
+
+    def list_stocks(
+        self,
+        stage: str | None = None,
+        offset: int = 0,
+        limit: int = 100,
+        sort: str = "board",
+    ) -> tuple[list[Stock], int]:
+        """
+        Returns one page of stocks, optionally restricted to a stage.
+
+        Args:
+            stage (str | None): Stage to list, or None for the whole board.
+            offset (int): Number of stocks to skip.
+            limit (int): Maximum number of stocks to return.
+            sort (str): One of STAGE_SORTS. Orders other than 'board' need a
+                stage.
+
+        Returns:
+            tuple[list[Stock], int]: The page of stocks and the total matching count.
+
+        Raises:
+            BoardStoreError: If the stage or sort order does not exist, or a
+                sorted listing has no stage.
+        """
+        with self._lock:
+            if sort != "board":
+                if stage is None:
+                    raise BoardStoreError("Sorting requires a stage.")
+                page = self.sorted_stage_ids(stage, sort, offset, limit)
+                total = len(self._stage_members[stage])
+                return [self._export(self._stocks[i]) for i in page], total
+            if stage is None:
+                ids = list(self._stocks)
+            elif stage in self._stage_members:
+                ids = list(self._stage_members[stage])
+            else:
+                raise BoardStoreError(f"Invalid stage: {stage}")
+            page = ids[offset : offset + limit]
+            return [self._export(self._stocks[i]) for i in page], len(ids)
+
+    def sorted_stage_ids(
+        self,
+        stage: str,
+        sort: str,
+        offset: int = 0,
+        limit: int = 100,
+        include: Container[int] | None = None,
+    ) -> list[int]:
+        """
+        Returns a window of a stage's stock IDs in a sort order.
+
+        Each (stage, sort) order is built on first use and then kept up to
+        date as stocks are created, moved and deleted, so reading a window
+        never re-sorts the stage.
+
+        Args:
+            stage (str): The stage.
+            sort (str): One of STAGE_SORTS; 'board' is insertion order.
+            offset (int): Matching IDs to skip.
+            limit (int): Maximum number of IDs to return.
+            include (Container[int] | None): Only IDs in here are returned.
+
+        Returns:
+            list[int]: The IDs in order.
+
+        Raises:
+            BoardStoreError: If the stage or sort order does not exist.
+        """
+        with self._lock:
+            if stage not in self._stage_members:
+                raise BoardStoreError(f"Invalid stage: {stage}")
+            if sort not in STAGE_SORTS:
+                raise BoardStoreError(f"Invalid sort order: {sort}")
+            if sort == "board":
+                ids = self._stage_members[stage]
+                if include is not None:
+                    ids = (stock_id for stock_id in ids if stock_id in include)
+                return list(islice(ids, offset, offset + limit))
+            index = self._orders.get((stage, sort))
+            if index is None:
+                index = self._orders[(stage, sort)] = SortedStageIndex(
+                    sort,
+                    [self._stocks[stock_id] for stock_id in self._stage_members[stage]],
+                )
+            return index.window(offset, limit, include)
+
+    def history(self, stock_id: int) -> list[StateTransitionLog]:
+        """
+        Returns a stock's transitions by walking its log chain from the head.
+
+        The walk continues into the archive once it reaches archived logs,
+        which are read for the stock in one pass.
+
+        Args:
+            stock_id (int): ID of the stock.
+
+        Returns:
+            list[StateTransitionLog]: Logs newest first, or an empty list if
+                the stock does not exist.
+        """
+        with self._lock:
+            stock = self._stocks.get(stock_id) or self.archive.get_stock(stock_id)
+            chain = []
+            archived = None
+            log_id = stock.last_log_id if stock else None
+            while log_id is not None:
+                log = self._logs_by_id.get(log_id)
+                if log is None:
+                    if archived is None:
+                        archived = {
+                            log.id: log for log in self.archive.logs_for_stock(stock_id)
+                        }
+                    log = archived.get(log_id)
+                if log is None:
+                    break
+                chain.append(log)
+                log_id = log.previous_log_id
+            return chain
+
+    def timeline(self, stock_id: int) -> list[StateTransitionLog]:
+        """
+        Returns a stock's transitions by effective time, newest first.
+
+        The sorted list is cached per stock and reused until the stock's head
+        log changes, i.e. until its next move. Callers must not modify it.
+
+        Args:
+            stock_id (int): ID of the stock.
+
+        Returns:
+            list[StateTransitionLog]: The logs, or an empty list if the stock
+                does not exist.
+        """
+        with self._lock:
+            stock = self._stocks.get(stock_id) or self.archive.get_stock(stock_id)
+            if stock is None:
+                self._timelines.pop(stock_id, None)
+                return []
+            cached = self._timelines.get(stock_id)
+            if cached is not None and cached[0] == stock.last_log_id:
+                self._timelines.move_to_end(stock_id)
+                return cached[1]
+            logs = sorted(
+                self.history(stock_id),
+                key=lambda log: log.timestamp or get_utc_now(),
+                reverse=True,
+            )
+            self._timelines[stock_id] = (stock.last_log_id, logs)
+            if len(self._timelines) > TIMELINE_CACHE_SIZE:
+                self._timelines.popitem(last=False)
+            return logs
+
+    def seed_if_empty(self, rows: list[tuple[str, str, str, datetime]]) -> bool:
+        """
+        Seeds the board with initial stocks unless it already has data.
+
+        Args:
+            rows (list[tuple]): (ticker, company_name, stage, entered_at) rows.
+
+        Returns:
+            bool: True if the rows were seeded.
+        """
+        with self._transaction() as change:
+            if self._stocks:
+                return False
+            self._import_rows(rows, "Initial Seed Data", "System", change)
+            return True
+
+    def import_stocks(
+        self,
+        rows: list[tuple[str, str, str, datetime]],
+        comment: str = "Bulk import",
+        user: str = "System",
+    ) -> list[Stock]:
+        """
+        Creates many stocks at once, leasing all their IDs in one call.
+
+        Rows are validated up front; nothing is imported if any row is invalid.
+
+        Args:
+            rows (list[tuple]): (ticker, company_name, stage, entered_at) rows.
+            comment (str): Comment recorded on each initial log.
+            user (str): User recorded on each initial log.
+
+        Returns:
+            list[Stock]: The created stocks.
+
+        Raises:
+            BoardStoreError: If a stage is invalid or a ticker already exists
+                or repeats within the rows.
+        """
+        with self._transaction() as change:
+            created = self._import_rows(rows, comment, user, change)
+        return [self._export(stock) for stock in created]
+
+    def _import_rows(
+        self,
+        rows: list[tuple[str, str, str, datetime]],
+        comment: str,
+        user: str,
+        change: BoardChange,
+    ) -> list[Stock]:
+        """Validates and inserts import rows inside a transaction."""
+        seen: set[str] = set()
+        for ticker, _, stage, _ in rows:
+            self._check_new_stock(ticker, stage)
+            if ticker.upper() in seen:
+                raise BoardStoreError(f"Stock {ticker} already exists.")
+            seen.add(ticker.upper())
+        stock_ids = self.stock_ids.lease(len(rows))
+        log_ids = self.log_ids.lease(len(rows))
+        return [
+            self._insert_stock(
+                stock_id, log_id, ticker, name, stage, entered_at, comment, user, change
+            )[0]
+            for stock_id, log_id, (ticker, name, stage, entered_at) in zip(
+                stock_ids, log_ids, rows
+            )
+        ]
+
+    def create_stock(
+        self,
+        ticker: str,
+        company_name: str,
+        stage: str,
+        effective_time: datetime | None = None,
+        comment: str = "Initial creation",
+        user: str = "System",
+    ) -> tuple[Stock, StateTransitionLog]:
+        """
+        Creates a stock together with its initial transition log.
+
+        Args:
+            ticker (str): Ticker symbol; stored upper-cased.
+            company_name (str): Company name.
+            stage (str): Initial stage.
+            effective_time (datetime | None): Creation time. Defaults to now.
+            comment (str): Comment recorded on the initial log.
+            user (str): User recorded on the initial log.
+
+        Returns:
+            tuple[Stock, StateTransitionLog]: The created stock and its log.
+
+        Raises:
+            BoardStoreError: If the stage is invalid or the ticker already exists.
+        """
+        with self._transaction() as change:
+            self._check_new_stock(ticker, stage)
+            stock, log = self._insert_stock(
+                self.stock_ids.next_id(),
+                self.log_ids.next_id(),
+                ticker,
+                company_name,
+                stage,
+                effective_time or get_utc_now(),
+                comment,
+                user,
+                change,
+            )
+        return self._export(stock), log
+
+    def _check_new_stock(self, ticker: str, stage: str) -> None:
+        """
+        Validates a stock about to be created.
+
+        Raises:
+            BoardStoreError: If the stage is invalid or the ticker already exists.
+        """
+        if stage not in self._stage_members:
+            raise BoardStoreError(f"Invalid stage: {stage}")
+        if ticker.upper() in self._tickers:
+            raise BoardStoreError(f"Stock {ticker} already exists.")
+        if self.archive.has_ticker(ticker.upper()):
+            raise BoardStoreError(
+                f"Stock {ticker} already exists in the Ocean archive."
+            )
+
+    def _insert_stock(
+        self,
+        stock_id: int,
+        log_id: int,
+        ticker: str,
+        company_name: str,
+        stage: str,
+        effective_time: datetime,
+        comment: str,
+        user: str,
+        change: BoardChange,
+    ) -> tuple[Stock, StateTransitionLog]:
+        """Inserts a validated stock and its initial log under pre-allocated IDs."""
+        stock = Stock(
+            id=stock_id,
+            ticker=ticker.upper(),
+            company_name=company_name,
+            status=stage,
+            last_updated=effective_time,
+            current_stage_entered_at=effective_time,
+            days_in_stage=days_since(effective_time),
+            last_log_id=log_id,
+        )
+        log = StateTransitionLog(
+            id=log_id,
+            stock_id=stock_id,
+            ticker=stock.ticker,
+            previous_stage="VOID",
+            new_stage=stage,
+            timestamp=effective_time,
+            user_comment=comment,
+            updated_by=user,
+            days_in_previous_stage=0,
+            previous_log_id=None,
+        )
+        self._cache_stock(stock)
+        self._append_log(log)
+        change.stocks.append(stock.copy())
+        change.logs.append(log)
+        return stock, log
+
+    def move_stock(
+        self,
+        stock_id: int,
+        new_stage: str,
+        comment: str,
+        user: str,
+        force_override: bool = False,
+        rationale: str = "",
+        effective_time: datetime | None = None,
+        from_stage: str | None = None,
+    ) -> tuple[Stock, StateTransitionLog] | None:
+        """
+        Moves a stock to a new stage and appends the transition log.
+
+        Transition rules are not checked here; callers validate the move and
+        decide whether it is forced, and pass the stage they validated it
+        from so a stock moved meanwhile by another session is not moved on
+        a stale check. An archived stock is restored to the board if the
+        board's policy allows the move out of Ocean, or it is forceable and
+        forced.
+
+        Args:
+            stock_id (int): ID of stock to move.
+            new_stage (str): Destination stage.
+            comment (str): User comment for the log.
+            user (str): User performing the move.
+            force_override (bool): Whether this is a forced move.
+            rationale (str): Reason for forcing, if applicable.
+            effective_time (datetime | None): When the move took effect. Defaults to now.
+            from_stage (str | None): The stage the move was validated from;
+                None skips the check.
+
+        Returns:
+            tuple[Stock, StateTransitionLog] | None: The moved stock and its new
+                log, or None if the stock is already in that stage.
+
+        Raises:
+            BoardStoreError: If the stage is invalid, the stock does not exist,
+                has left from_stage, or is archived and may not move to the
+                stage.
+        """
+        effective_time = effective_time or get_utc_now()
+        with self._transaction() as change:
+            if new_stage not in self._stage_members:
+                raise BoardStoreError(f"Invalid stage: {new_stage}")
+            stock = self._stocks.get(stock_id) or self.archive.get_stock(stock_id)
+            if stock is None:
+                raise BoardStoreError(f"Stock ID {stock_id} not found.")
+            if stock.status == new_stage:
+                return None
+            if from_stage is not None and stock.status != from_stage:
+                raise BoardStoreError(
+                    f"{stock.ticker} was moved to {stock.status} meanwhile; "
+                    "check the move again."
+                )
+            if stock_id not in self._stocks:
+                stock = self._restore_stock(stock, new_stage, force_override)
+            current_stage = stock.status
+            log = StateTransitionLog(
+                id=self.log_ids.next_id(),
+                stock_id=stock.id,
+                ticker=stock.ticker,
+                previous_stage=current_stage,
+                new_stage=new_stage,
+                timestamp=effective_time,
+                user_comment=comment,
+                updated_by=user,
+                days_in_previous_stage=days_since(stock.current_stage_entered_at),
+                is_forced_transition=force_override,
+                forced_rationale=rationale,
+                previous_log_id=stock.last_log_id,
+            )
+            del self._stage_members[current_stage][stock.id]
+            self._stage_members[new_stage][stock.id] = None
+            self._unindex_stock(stock)
+            stock.status = new_stage
+            stock.last_updated = effective_time
+            stock.current_stage_entered_at = effective_time
+            stock.is_forced = force_override
+            stock.last_log_id = log.id
+            self._index_stock(stock)
+            self._append_log(log)
+            change.stocks.append(stock.copy())
+            change.logs.append(log)
+        return self._export(stock), log
+
+    def _restore_stock(
+        self, stock: Stock, new_stage: str, force_override: bool
+    ) -> Stock:
+        """
+        Moves an archived stock back into the cache ahead of a move out of
+        Ocean.
+
+        Returns:
+            Stock: The cached stock.
+
+        Raises:
+            BoardStoreError: If the move is neither valid nor a forced,
+                forceable one.
+        """
+        is_valid, is_forceable, message = self.policy.check(stock.status, new_stage)
+        if not (is_valid or (is_forceable and force_override)):
+            raise BoardStoreError(f"{stock.ticker} is archived: {message}")
+        stock = self.archive.forget_stock(stock.id)
+        self._cache_stock(stock)
+        return stock
+
+    def delete_stock(self, stock_id: int) -> Stock | None:
+        """
+        Removes a stock from the board or the archive. Its transition logs
+        are kept.
+
+        Args:
+            stock_id (int): ID of the stock to delete.
+
+        Returns:
+            Stock | None: The deleted stock, or None if it did not exist.
+        """
+        with self._transaction() as change:
+            stock = self._uncache_stock(stock_id)
+            if stock is None:
+                return None
+            change.deleted.append(stock)
+        return stock
+
+    def claim_reviews(
+        self, log_ids: Iterable[int], reviewer: str
+    ) -> list[ForcedReview]:
+        """
+        Claims pending forced transitions for review, so other reviewers
+        leave them alone.
+
+        Args:
+            log_ids (Iterable[int]): IDs of the forced transition logs.
+            reviewer (str): The user claiming them.
+
+        Returns:
+            list[ForcedReview]: The claimed reviews.
+
+        Raises:
+            BoardStoreError: If any transition cannot be claimed by the
+                reviewer; none are claimed then.
+        """
+        return self._update_reviews(
+            log_ids, reviewer, ("pending",), status="claimed", claimed_by=reviewer
+        )
+
+    def release_reviews(
+        self, log_ids: Iterable[int], reviewer: str
+    ) -> list[ForcedReview]:
+        """
+        Returns the reviewer's claimed transitions to the pending queue.
+
+        Args:
+            log_ids (Iterable[int]): IDs of the forced transition logs.
+            reviewer (str): The user who claimed them.
+
+        Returns:
+            list[ForcedReview]: The released reviews.
+
+        Raises:
+            BoardStoreError: If any transition is not claimed by the reviewer;
+                none are released then.
+        """
+        return self._update_reviews(
+            log_ids, reviewer, ("claimed",), status="pending", claimed_by=""
+        )
+
+    def decide_reviews(
+        self, log_ids: Iterable[int], reviewer: str, approve: bool, note: str = ""
+    ) -> list[ForcedReview]:
+        """
+        Approves or rejects forced transitions, in one commit for a batch.
+
+        Pending transitions can be decided directly; claimed ones only by
+        the reviewer who claimed them.
+
+        Args:
+            log_ids (Iterable[int]): IDs of the forced transition logs.
+            reviewer (str): The user deciding.
+            approve (bool): True to approve, False to reject.
+            note (str): The reviewer's note. Required for a rejection.
+
+        Returns:
+            list[ForcedReview]: The decided reviews.
+
+        Raises:
+            BoardStoreError: If the note is missing from a rejection or any
+                transition cannot be decided by the reviewer; none are
+                decided then.
+        """
+        note = note.strip()
+        if not approve and not note:
+            raise BoardStoreError("A rejection needs a note.")
+        return self._update_reviews(
+            log_ids,
+            reviewer,
+            ("pending", "claimed"),
+            status="approved" if approve else "rejected",
+            reviewed_by=reviewer,
+            review_note=note,
+        )
+
+    def _update_reviews(
+        self,
+        log_ids: Iterable[int],
+        reviewer: str,
+        allowed: tuple[str, ...],
+        **update,
+    ) -> list[ForcedReview]:
+        """
+        Applies one review action to several forced transitions atomically.
+
+        Every transition is checked before any is changed: it must be
+        forced, in one of the allowed statuses, not claimed by another
+        reviewer, and not moved by the reviewer themselves.
+
+        Args:
+            log_ids (Iterable[int]): IDs of the forced transition logs.
+            reviewer (str): The user acting.
+            allowed (tuple[str, ...]): Statuses the action applies to.
+            **update: ForcedReview fields to set.
+
+        Returns:
+            list[ForcedReview]: The updated reviews.
+
+        Raises:
+            BoardStoreError: If the reviewer or any transition is invalid.
+        """
+        if not reviewer:
+            raise BoardStoreError("A reviewer is required.")
+        now = get_utc_now()
+        if update["status"] == "claimed":
+            update["claimed_at"] = now
+        elif update["status"] == "pending":
+            update["claimed_at"] = None
+        else:
+            update["reviewed_at"] = now
+        with self._transaction() as change:
+            for log_id in dict.fromkeys(log_ids):
+                review = self._reviews.get(log_id)
+                if review is None:
+                    raise BoardStoreError(f"Log #{log_id} is not a forced transition.")
+                if review.status not in allowed:
+                    raise BoardStoreError(f"Log #{log_id} is already {review.status}.")
+                if review.status == "claimed" and review.claimed_by != reviewer:
+                    raise BoardStoreError(
+                        f"Log #{log_id} is claimed by {review.claimed_by}."
+                    )
+                log = self._logs_by_id.get(log_id) or self.get_log(log_id)
+                if log.updated_by == reviewer:
+                    raise BoardStoreError(
+                        f"Log #{log_id} is your own move; another user must review it."
+                    )
+                change.reviews.append(review.copy(update=update))
+            for review in change.reviews:
+                self._reviews.put(review)
+        return change.reviews
+
+    def _append_log(self, log: StateTransitionLog, index_time: bool = True) -> None:
+        """
+        Appends a log to the audit trail, its ID index, the transition
+        counts and, if forced, the review queue, and unless index_time is
+        False to the temporal and per-user indexes, which bulk loads fill
+        with one sort instead.
+        """
+        self._logs.append(log)
+        self._logs_by_id[log.id] = log
+        self.transition_counts.add(log)
+        self._reviews.add_log(log)
+        if index_time:
+            self._log_times.add(log)
+            self._user_logs.add(log)
+
+    @staticmethod
+    def _export(stock: Stock) -> Stock:
+        """Returns a copy of a stored stock with an up-to-date days_in_stage."""
+        exported = stock.copy()
+        exported.days_in_stage = days_since(stock.current_stage_entered_at)
+        return exported
+
+
+_board_stores: dict[str, BoardStore] = {}
+_board_stores_lock = threading.Lock()
+# Stamp of boards files that failed to load, not retried until they change.
+_rejected_stamp: tuple | None = None
+
+
+def get_board_store(board_id: str | None = None) -> BoardStore:
+    """
+    Returns the process-wide store of a board, creating it on first use.
+
+    Each board is kept under its own key prefix, KANBAN_BOARD_PREFIX for the
+    default board and '<prefix>:<board ID>' for the others, in the board's
+    own backend if it names one and in KANBAN_BOARD_BACKEND otherwise. So
+    boards can share one server or be spread over several.
+
+    Args:
+        board_id (str | None): ID of the board. Defaults to the default
+            board.
+
+    Returns:
+        BoardStore: The board's shared store.
+
+    Raises:
+        UnknownBoardError: If no board has that ID.
+    """
+    board_id = board_id or default_board_id()
+    store = _board_stores.get(board_id)
+    if store is None:
+        with _board_stores_lock:
+            store = _board_stores.get(board_id)
+            if store is None:
+                board = get_board_def(board_id)
+                prefix = os.getenv("KANBAN_BOARD_PREFIX", "kanban")
+                if board.id != DEFAULT_BOARD_ID:
+                    prefix = f"{prefix}:{board.id}"
+                backend = create_board_backend(
+                    board.backend or os.getenv("KANBAN_BOARD_BACKEND", "memory"),
+                    prefix,
+                )
+                sequences = backend.sequence_store()
+                block_size = int(os.getenv("KANBAN_ID_BLOCK_SIZE", "1000"))
+                store = _board_stores[board_id] = BoardStore(
+                    [stage.name for stage in board.stages],
+                    policy=get_transition_policy(board_id),
+                    stock_ids=IdSequence(sequences, "stock", block_size),
+                    log_ids=IdSequence(sequences, "log", block_size),
+                    backend=backend,
+                    archive_policy=ArchivePolicy(
+                        ocean_days=int(os.getenv("KANBAN_ARCHIVE_OCEAN_DAYS", "180")),
+                        log_months=int(os.getenv("KANBAN_ARCHIVE_LOG_MONTHS", "24")),
+                    ),
+                )
+    return store
+
+
+def loaded_board_stores() -> dict[str, BoardStore]:
+    """
+    Returns the stores this process has opened so far, by board ID.
+
+    Background tasks and metrics cover these, so a board nobody has used
+    yet is not loaded just to be scanned.
+
+    Returns:
+        dict[str, BoardStore]: The open stores.
+    """
+    with _board_stores_lock:
+        return dict(_board_stores)
+
+
+def reload_board_config() -> bool:
+    """
+    Puts a changed boards file in effect without a restart.
+
+    The new file is read and compiled in full and checked against every
+    open store before anything changes; if any check fails the old config
+    stays in effect. Boards can be renamed and their stages, styling and
+    transition rules changed, but adding or removing boards needs a
+    restart, as does removing a stage that still holds stocks.
+
+    Returns:
+        bool: True if a changed config was put in effect.
+
+    Raises:
+        OSError: If the boards file cannot be read.
+        ValueError: If the new config is invalid or cannot be applied.
+    """
+    global _rejected_stamp
+    with _board_stores_lock:
+        current = get_board_config()
+        stamp = boards_file_stamp()
+        if stamp in (current.stamp, _rejected_stamp):
+            return False
+        try:
+            config = read_board_config()
+            if [board.id for board in config.boards] != [
+                board.id for board in current.boards
+            ]:
+                raise ValueError("Adding or removing boards needs a restart.")
+            _check_open_stores(config)
+        except ValueError:
+            _rejected_stamp = stamp
+            raise
+        install_board_config(config)
+        for board in config.boards:
+            store = _board_stores.get(board.id)
+            if store is not None:
+                store.reconfigure(
+                    [stage.name for stage in board.stages], config.policies[board.id]
+                )
+    logger.info(
+        "Boards file reloaded: %s", ", ".join(board.id for board in config.boards)
+    )
+    return True
+
+
+def _check_open_stores(config: BoardConfig) -> None:
+    """Rejects a config removing stages that still hold stocks on an open board."""
+    for board in config.boards:
+        store = _board_stores.get(board.id)
+        if store is None:
+            continue
+        occupied = store.occupied_stages([stage.name for stage in board.stages])
+        if occupied:
+            raise BoardStoreError(
+                f"Board {board.id}: stages still holding stocks cannot be "
+                f"removed: {', '.join(occupied)}"
+            )
@@ -0,0 +1,321 @@
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.models import BoardDef, StageDef
+from app.services.transitions import TransitionPolicy, TransitionRules
+
+# The board sessions, API calls and sync batches use when they name no board.
+DEFAULT_BOARD_ID = "default"
+BOARD_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,31}$")
+# The boards file shipped with the app. Its first board is the standard
+# pipeline: boards of a KANBAN_BOARDS_FILE listing no stages take its
+# stages and transition rules, and stages listed by name only its styling.
+BUNDLED_BOARDS_FILE = Path(__file__).resolve().parent.parent / "boards.json"
+# Styling of stages a boards file lists by name only and that are not
+# one of the standard stages.
+PLAIN_STAGE = {
+    "color": "text-gray-700",
+    "bg_color": "bg-gray-50",
+    "border_color": "border-gray-200",
+}
+
+
+class UnknownBoardError(ValueError):
+    """Raised when a board ID is not defined in this deployment."""
+
+
+@dataclass(frozen=True)
+class BoardConfig:
+    """
+    The boards of a deployment with each board's transition rules compiled.
+
+    A changed boards file is read into a new BoardConfig that replaces the
+    old one as a whole, so readers see either version, never a mix.
+
+    Attributes:
+        boards (tuple[BoardDef, ...]): The boards, in display order.
+        policies (dict[str, TransitionPolicy]): Compiled rules by board ID.
+        stamp (tuple): Modification times and sizes of the files read,
+            to tell whether they changed since.
+    """
+
+    boards: tuple[BoardDef, ...]
+    policies: dict[str, TransitionPolicy]
+    stamp: tuple = ()
+
+
+def boards_file() -> Path:
+    """Returns the boards file: KANBAN_BOARDS_FILE, else the bundled one."""
+    path = os.getenv("KANBAN_BOARDS_FILE")
+    return Path(path) if path else BUNDLED_BOARDS_FILE
+
+
+def boards_file_stamp() -> tuple:
+    """
+    Returns the modification times and sizes of the boards files, to tell
+    whether they changed since a config was read.
+
+    Raises:
+        OSError: If a boards file is missing.
+    """
+    paths = dict.fromkeys([BUNDLED_BOARDS_FILE, boards_file()])
+    return tuple(
+        (str(path), path.stat().st_mtime_ns, path.stat().st_size) for path in paths
+    )
+
+
+def _stage_def(entry: str | dict, standard: dict[str, StageDef], path: str) -> StageDef:
+    """
+    Builds a stage definition from a boards file entry.
+
+    Args:
+        entry (str | dict): A stage name, or a StageDef's fields.
+        standard (dict[str, StageDef]): The standard stages by name, whose
+            styling fills in what the entry leaves out.
+        path (str): Where the entry sits in the file, for errors.
+
+    Returns:
+        StageDef: The stage definition.
+
+    Raises:
+        ValueError: If the entry is not a name or an object of StageDef's
+            string fields.
+    """
+    if isinstance(entry, str):
+        entry = {"name": entry}
+    if not isinstance(entry, dict):
+        raise ValueError(f"{path} must be a stage name or an object.")
+    # The archive flag follows from the board's rules, not the file.
+    unknown = set(entry) - (set(StageDef.__fields__) - {"archive"})
+    if unknown:
+        raise ValueError(f"{path}: unknown fields: {', '.join(sorted(unknown))}")
+    for field, value in entry.items():
+        if not isinstance(value, str):
+            raise ValueError(f"{path}.{field} must be a string.")
+    if not entry.get("name"):
+        raise ValueError(f"{path} has no name.")
+    defaults = (
+        standard[entry["name"]].dict() if entry["name"] in standard else PLAIN_STAGE
+    )
+    return StageDef(**{**defaults, **entry, "archive": False})
+
+
+def parse_board_config(
+    entries: list[dict],
+    standard: BoardDef | None = None,
+    standard_rules: TransitionRules | None = None,
+) -> BoardConfig:
+    """
+    Validates the board definitions of a boards file and compiles their
+    transition rules.
+
+    Args:
+        entries (list[dict]): One object per board with an 'id', a 'name',
+            optional 'stages' (defaulting to the standard pipeline), optional
+            'transitions' (defaulting to the standard rules, as far as they
+            name the board's stages) and an optional 'backend' URL for a
+            board kept in its own shard.
+        standard (BoardDef | None): The standard pipeline. Without one,
+            every board must list its stages.
+        standard_rules (TransitionRules | None): The standard pipeline's
+            rules.
+
+    Returns:
+        BoardConfig: The boards, in file order, and their policies.
+
+    Raises:
+        ValueError: If an ID is malformed or repeated, a board has no
+            stages or repeats one, or its rules are malformed or name a
+            stage it does not have.
+    """
+    if not isinstance(entries, list):
+        raise ValueError("The boards file must hold a list of boards.")
+    standard_stages = (
+        {stage.name: stage for stage in standard.stages} if standard else {}
+    )
+    boards: list[BoardDef] = []
+    policies: dict[str, TransitionPolicy] = {}
+    for i, entry in enumerate(entries):
+        path = f"boards[{i}]"
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path} must be an object.")
+        for field in ("id", "name", "backend"):
+            if not isinstance(entry.get(field, ""), str):
+                raise ValueError(f"{path}.{field} must be a string.")
+        board_id = entry.get("id", "")
+        if not BOARD_ID_PATTERN.match(board_id):
+            raise ValueError(f"{path}: invalid board ID: {board_id!r}")
+        if board_id in policies:
+            raise ValueError(f"Board {board_id} is defined twice.")
+        if "stages" in entry and not isinstance(entry["stages"], list):
+            raise ValueError(f"{path}.stages must be a list.")
+        if entry.get("stages"):
+            stages = [
+                _stage_def(stage, standard_stages, f"{path}.stages[{j}]")
+                for j, stage in enumerate(entry["stages"])
+            ]
+        elif standard:
+            stages = list(standard.stages)
+        else:
+            raise ValueError(f"Board {board_id} defines no stages.")
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Board {board_id} repeats a stage.")
+        if "transitions" in entry:
+            rules = TransitionRules.parse(entry["transitions"], f"{path}.transitions")
+        else:
+            rules = (standard_rules or TransitionRules()).restricted_to(names)
+        try:
+            policies[board_id] = TransitionPolicy(names, rules)
+        except ValueError as e:
+            raise ValueError(f"Board {board_id}: {e}") from None
+        archive_stage = policies[board_id].archive_stage
+        boards.append(
+            BoardDef(
+                id=board_id,
+                name=entry.get("name") or board_id,
+                stages=[
+                    stage.copy(update={"archive": stage.name == archive_stage})
+                    for stage in stages
+                ],
+                backend=entry.get("backend", ""),
+            )
+        )
+    if not boards:
+        raise ValueError("The boards file defines no boards.")
+    return BoardConfig(boards=tuple(boards), policies=policies)
+
+
+def bundled_board_config() -> BoardConfig:
+    """
+    Reads the bundled boards file, whose first board is the standard
+    pipeline.
+
+    Returns:
+        BoardConfig: The bundled boards and their compiled transition rules.
+    """
+    return parse_board_config(json.loads(BUNDLED_BOARDS_FILE.read_text()))
+
+
+def read_board_config() -> BoardConfig:
+    """
+    Reads the boards of this deployment.
+
+    Boards are defined in the JSON file named by KANBAN_BOARDS_FILE; without
+    one the deployment has the boards of the bundled app/boards.json.
+
+    Returns:
+        BoardConfig: The boards and their compiled transition rules.
+
+    Raises:
+        OSError: If a boards file cannot be read.
+        ValueError: If a boards file is not valid.
+    """
+    path = boards_file()
+    stamp = boards_file_stamp()
+    bundled = bundled_board_config()
+    if path != BUNDLED_BOARDS_FILE:
+        standard = bundled.boards[0]
+        config = parse_board_config(
+            json.loads(path.read_text()), standard, bundled.policies[standard.id].rules
+        )
+    else:
+        config = bundled
+    return BoardConfig(boards=config.boards, policies=config.policies, stamp=stamp)
+
+
+_board_config: BoardConfig | None = None
+_board_config_lock = threading.Lock()
+
+
+def get_board_config() -> BoardConfig:
+    """
+    Returns the boards of this deployment, reading them on first use.
+
+    Returns:
+        BoardConfig: The config in effect.
+    """
+    global _board_config
+    if _board_config is None:
+        with _board_config_lock:
+            if _board_config is None:
+                _board_config = read_board_config()
+    return _board_config
+
+
+def install_board_config(config: BoardConfig) -> None:
+    """
+    Puts a newly read config in effect for every later lookup.
+
+    Args:
+        config (BoardConfig): The config.
+    """
+    global _board_config
+    with _board_config_lock:
+        _board_config = config
+
+
+def get_board_defs() -> list[BoardDef]:
+    """
+    Returns the boards of this deployment.
+
+    Returns:
+        list[BoardDef]: The boards, in display order.
+    """
+    return list(get_board_config().boards)
+
+
+def get_board_def(board_id: str) -> BoardDef:
+    """
+    Looks up one board.
+
+    Args:
+        board_id (str): ID of the board.
+
+    Returns:
+        BoardDef: The board.
+
+    Raises:
+        UnknownBoardError: If no board has that ID.
+    """
+    for board in get_board_config().boards:
+        if board.id == board_id:
+            return board
+    raise UnknownBoardError(f"Unknown board: {board_id}")
+
+
+def get_transition_policy(board_id: str) -> TransitionPolicy:
+    """
+    Looks up the compiled transition rules of one board.
+
+    Args:
+        board_id (str): ID of the board.
+
+    Returns:
+        TransitionPolicy: The board's policy.
+
+    Raises:
+        UnknownBoardError: If no board has that ID.
+    """
+    try:
+        return get_board_config().policies[board_id]
+    except KeyError:
+        raise UnknownBoardError(f"Unknown board: {board_id}") from None
+
+
+def default_board_id() -> str:
+    """
+    Returns the board used when none is named: the default board if the
+    deployment has one, else the first board.
+
+    Returns:
+        str: The board ID.
+    """
+    boards = get_board_config().boards
+    if any(board.id == DEFAULT_BOARD_ID for board in boards):
+        return DEFAULT_BOARD_ID
+    return boards[0].id
@@ -0,0 +1,328 @@
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from app.models import Stock, StateTransitionLog
+from app.services.board_backend import BoardChange
+from app.services.board_store import BoardStore, get_board_store
+from app.services.boards import default_board_id
+from app.services.metrics import BROADCAST_DELIVERIES, BROADCAST_FANOUT
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BoardFrame:
+    """
+    Board changes coalesced into one update for a client.
+
+    Attributes:
+        snapshot (bool): The client should reload the whole board instead
+            of applying the delta.
+        stocks (dict[int, Stock]): Latest version of each changed stock.
+        deleted (set[int]): IDs of stocks removed from the board.
+        logs (list[StateTransitionLog]): Transition logs appended.
+    """
+
+    snapshot: bool = False
+    stocks: dict[int, Stock] = field(default_factory=dict)
+    deleted: set[int] = field(default_factory=set)
+    logs: list[StateTransitionLog] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return self.snapshot or bool(self.stocks or self.deleted or self.logs)
+
+    def __len__(self) -> int:
+        return len(self.stocks) + len(self.deleted) + len(self.logs)
+
+    def add_change(self, change: BoardChange | None) -> None:
+        """
+        Folds a store change into the frame; None means a full reload.
+
+        Args:
+            change (BoardChange | None): The change from the board store.
+        """
+        if change is None:
+            self.mark_snapshot()
+            return
+        if self.snapshot:
+            return
+        for stock in change.deleted:
+            self.stocks.pop(stock.id, None)
+            self.deleted.add(stock.id)
+        for stock in change.stocks:
+            self.deleted.discard(stock.id)
+            self.stocks[stock.id] = stock
+        self.logs.extend(change.logs)
+
+    def merge(self, other: "BoardFrame") -> None:
+        """
+        Folds a later frame into this one.
+
+        Args:
+            other (BoardFrame): The later frame.
+        """
+        if other.snapshot:
+            self.mark_snapshot()
+            return
+        if self.snapshot:
+            return
+        for stock_id in other.deleted:
+            self.stocks.pop(stock_id, None)
+            self.deleted.add(stock_id)
+        for stock_id, stock in other.stocks.items():
+            self.deleted.discard(stock_id)
+            self.stocks[stock_id] = stock
+        self.logs.extend(other.logs)
+
+    def mark_snapshot(self) -> None:
+        """Drops the delta; the client will reload the whole board."""
+        self.snapshot = True
+        self.stocks.clear()
+        self.deleted.clear()
+        self.logs.clear()
+
+
+Deliver = Callable[[str, BoardFrame], Awaitable[bool]]
+
+
+class BoardBroadcaster:
+    """
+    Fans board changes out to every subscribed client session.
+
+    Changes from the board store, local or from other workers, are collected
+    for a short window and sent as a single frame, so a burst of moves costs
+    each client one update. Each client has at most one delivery in flight;
+    changes arriving meanwhile are merged into its backlog. A backlog that
+    grows past `max_pending` entries is replaced by a snapshot marker, and
+    the client reloads the board once it catches up.
+    """
+
+    def __init__(
+        self,
+        store: BoardStore,
+        coalesce_seconds: float = 0.05,
+        max_pending: int = 500,
+    ):
+        """
+        Args:
+            store (BoardStore): The board store to listen to.
+            coalesce_seconds (float): How long to collect changes before
+                sending a frame.
+            max_pending (int): Largest backlog a client may accumulate
+                before it is dropped to a snapshot.
+        """
+        self.store = store
+        self.coalesce_seconds = coalesce_seconds
+        self.max_pending = max_pending
+        self._subscribers: dict[str, BoardFrame | None] = {}
+        self._in_flight: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._pending = BoardFrame()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, token: str) -> None:
+        """
+        Starts sending board frames to a client.
+
+        Args:
+            token (str): The client token.
+        """
+        with self._lock:
+            self._subscribers.setdefault(token, None)
+
+    def unsubscribe(self, token: str) -> None:
+        """
+        Stops sending board frames to a client.
+
+        Args:
+            token (str): The client token.
+        """
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of subscribed clients."""
+        return len(self._subscribers)
+
+    async def run(self, deliver: Deliver):
+        """
+        Collects changes and delivers frames until cancelled.
+
+        Args:
+            deliver (Callable): Coroutine sending a frame to a client token;
+                returns False if the client is gone and should be dropped.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self.store.add_listener(self._on_store_change)
+        while True:
+            await self._wake.wait()
+            await asyncio.sleep(self.coalesce_seconds)
+            self._wake.clear()
+            frame, self._pending = self._pending, BoardFrame()
+            if not frame:
+                continue
+            with self._lock:
+                tokens = list(self._subscribers)
+            BROADCAST_FANOUT.observe(len(tokens))
+            for token in tokens:
+                self._enqueue(token, frame, deliver)
+
+    def _on_store_change(self, change: BoardChange | None) -> None:
+        """Store listener; hands the change to the event loop from any thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._collect, change)
+
+    def _collect(self, change: BoardChange | None) -> None:
+        """Adds a change to the frame being coalesced."""
+        self._pending.add_change(change)
+        self._wake.set()
+
+    def _enqueue(
+        self,
+        token: str,
+        frame: BoardFrame,
+        deliver: Deliver,
+    ) -> None:
+        """Adds a frame to a client's backlog and starts delivery if idle."""
+        with self._lock:
+            if token not in self._subscribers:
+                return
+            backlog = self._subscribers[token] or BoardFrame()
+            backlog.merge(frame)
+            if len(backlog) > self.max_pending:
+                backlog.mark_snapshot()
+            self._subscribers[token] = backlog
+            if token in self._in_flight:
+                return
+            self._in_flight.add(token)
+        task = asyncio.create_task(self._pump(token, deliver))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _pump(self, token: str, deliver: Deliver) -> None:
+        """Delivers a client's backlog one frame at a time until it is empty."""
+        while True:
+            with self._lock:
+                backlog = self._subscribers.get(token)
+                if not backlog:
+                    self._in_flight.discard(token)
+                    return
+                self._subscribers[token] = None
+            try:
+                delivered = await deliver(token, backlog)
+            except Exception:
+                logger.exception("Failed to deliver board frame to %s", token)
+                BROADCAST_DELIVERIES.inc(outcome="failed")
+                delivered = False
+            else:
+                if not delivered:
+                    BROADCAST_DELIVERIES.inc(outcome="gone")
+                elif backlog.snapshot:
+                    BROADCAST_DELIVERIES.inc(outcome="snapshot")
+                else:
+                    BROADCAST_DELIVERIES.inc(outcome="delta")
+            if not delivered:
+                with self._lock:
+                    self._subscribers.pop(token, None)
+                    self._in_flight.discard(token)
+                return
+
+
+class BroadcastRunner:
+    """
+    Runs each board's broadcaster on the event loop, starting it when the
+    board's first client subscribes, so a board nobody has opened is not
+    loaded. A board whose broadcaster fails is logged and stops alone.
+    """
+
+    def __init__(self, deliver_for: Callable[[str], Deliver]):
+        """
+        Args:
+            deliver_for (Callable): Returns the deliver coroutine for a
+                board ID; see BoardBroadcaster.run.
+        """
+        self.deliver_for = deliver_for
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def run(self) -> None:
+        """Runs the broadcasters started so far and later ones until cancelled."""
+        global _broadcast_runner
+        self._loop = asyncio.get_running_loop()
+        with _board_broadcasters_lock:
+            _broadcast_runner = self
+            started = dict(_board_broadcasters)
+        for board_id, broadcaster in started.items():
+            self._spawn(board_id, broadcaster)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            with _board_broadcasters_lock:
+                if _broadcast_runner is self:
+                    _broadcast_runner = None
+            for task in self._tasks:
+                task.cancel()
+
+    def start(self, board_id: str, broadcaster: BoardBroadcaster) -> None:
+        """
+        Starts a new broadcaster; safe to call from any thread.
+
+        Args:
+            board_id (str): ID of the board.
+            broadcaster (BoardBroadcaster): Its broadcaster.
+        """
+        self._loop.call_soon_threadsafe(self._spawn, board_id, broadcaster)
+
+    def _spawn(self, board_id: str, broadcaster: BoardBroadcaster) -> None:
+        """Runs a broadcaster as its own task."""
+        task = asyncio.create_task(self._run_board(board_id, broadcaster))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_board(self, board_id: str, broadcaster: BoardBroadcaster) -> None:
+        """Runs one board's broadcaster, logging it if it fails."""
+        try:
+            await broadcaster.run(self.deliver_for(board_id))
+        except Exception:
+            logger.exception("Broadcaster for board %s stopped", board_id)
+
+
+_board_broadcasters: dict[str, BoardBroadcaster] = {}
+_board_broadcasters_lock = threading.Lock()
+_broadcast_runner: BroadcastRunner | None = None
+
+
+def get_board_broadcaster(board_id: str | None = None) -> BoardBroadcaster:
+    """
+    Returns the process-wide broadcaster for a board's store.
+
+    Args:
+        board_id (str | None): ID of the board. Defaults to the default
+            board.
+
+    Returns:
+        BoardBroadcaster: The broadcaster.
+    """
+    board_id = board_id or default_board_id()
+    broadcaster = _board_broadcasters.get(board_id)
+    if broadcaster is None:
+        with _board_broadcasters_lock:
+            broadcaster = _board_broadcasters.get(board_id)
+            if broadcaster is None:
+                broadcaster = _board_broadcasters[board_id] = BoardBroadcaster(
+                    get_board_store(board_id),
+                    coalesce_seconds=int(os.getenv("BROADCAST_COALESCE_MS", "50"))
+                    / 1000,
+                    max_pending=int(os.getenv("BROADCAST_MAX_PENDING", "500")),
+                )
+                if _broadcast_runner is not None:
+                    _broadcast_runner.start(board_id, broadcaster)
+    return broadcaster
@@ -0,0 +1,203 @@
+import logging
+from datetime import datetime
+
+from app.services.board_store import BoardStore, BoardStoreError
+from app.services.idempotency import IdempotentOutcome
+
+
+def create_stock(
+    store: BoardStore,
+    ticker: str,
+    company_name: str,
+    stage: str,
+    effective_time: datetime | None = None,
+) -> IdempotentOutcome:
+    """
+    Creates a stock and reports the result as a replayable outcome.
+
+    Args:
+        store (BoardStore): The board to create the stock on.
+        ticker (str): Ticker symbol of the new stock.
+        company_name (str): Company name of the new stock.
+        stage (str): Initial stage of the new stock.
+        effective_time (datetime | None): When the stock was created. Defaults to now.
+
+    Returns:
+        IdempotentOutcome: The result of the creation.
+    """
+    if not ticker or not company_name:
+        return IdempotentOutcome(
+            ok=False, level="error", message="Ticker and Company Name are required."
+        )
+    try:
+        stock, log = store.create_stock(
+            ticker, company_name, stage, effective_time=effective_time
+        )
+    except BoardStoreError as e:
+        return IdempotentOutcome(ok=False, level="error", message=str(e))
+    logging.info("Created Stock #%d with initial Log #%d", stock.id, log.id)
+    return IdempotentOutcome(
+        ok=True,
+        level="success",
+        message=f"Added {stock.ticker} to {stage}",
+        stock_id=stock.id,
+        log_id=log.id,
+    )
+
+
+def move_stock(
+    store: BoardStore,
+    stock_id: int,
+    new_stage: str,
+    comment: str,
+    user: str,
+    force_override: bool = False,
+    rationale: str = "",
+    effective_time: datetime | None = None,
+    from_stage: str | None = None,
+) -> IdempotentOutcome:
+    """
+    Moves a stock without checking transition rules and reports the result.
+
+    Args:
+        store (BoardStore): The board to move the stock on.
+        stock_id (int): ID of stock to move.
+        new_stage (str): Destination stage.
+        comment (str): User comment for the logs.
+        user (str): Username performing the action.
+        force_override (bool): Flag if this was a forced move.
+        rationale (str): Reason for forcing if applicable.
+        effective_time (datetime | None): When the move took effect. Defaults to now.
+        from_stage (str | None): The stage the caller checked the move from;
+            the move fails if the stock has left it since.
+
+    Returns:
+        IdempotentOutcome: The result of the move. Moving a stock to the stage
+            it is already in is a silent no-op.
+    """
+    try:
+        result = store.move_stock(
+            stock_id,
+            new_stage,
+            comment,
+            user,
+            force_override=force_override,
+            rationale=rationale,
+            effective_time=effective_time,
+            from_stage=from_stage,
+        )
+    except BoardStoreError as e:
+        return IdempotentOutcome(ok=False, level="error", message=str(e))
+    if result is None:
+        return IdempotentOutcome(ok=False, level="info", stock_id=stock_id)
+    stock, log = result
+    logging.info(
+        "Log #%d (prev: #%s) created for Stock #%d [%s]",
+        log.id,
+        log.previous_log_id,
+        stock.id,
+        stock.ticker,
+    )
+    if force_override:
+        return IdempotentOutcome(
+            ok=True,
+            level="warning",
+            message=f"Forced move: {stock.ticker} → {new_stage}",
+            stock_id=stock.id,
+            log_id=log.id,
+        )
+    return IdempotentOutcome(
+        ok=True,
+        level="success",
+        message=f"Moved {stock.ticker} to {new_stage}",
+        stock_id=stock.id,
+        log_id=log.id,
+    )
+
+
+def validated_move(
+    store: BoardStore,
+    stock_id: int,
+    new_stage: str,
+    comment: str,
+    user: str,
+    force: bool = False,
+    rationale: str = "",
+    effective_time: datetime | None = None,
+) -> IdempotentOutcome:
+    """
+    Moves a stock after checking the transition rules, as a drop in the UI does.
+
+    A move the rules reject is only applied when it is forceable, the caller
+    asked to force it and a rationale is given. The move fails if the stock
+    leaves the stage it was checked from before the move is committed.
+
+    Args:
+        store (BoardStore): The board to move the stock on.
+        stock_id (int): ID of stock to move.
+        new_stage (str): Destination stage.
+        comment (str): User comment for the logs. Defaults to the rationale.
+        user (str): Username performing the action.
+        force (bool): Whether the caller accepts a forced move.
+        rationale (str): Reason for forcing, required for forced moves.
+        effective_time (datetime | None): When the move took effect. Defaults to now.
+
+    Returns:
+        IdempotentOutcome: The result of the move.
+    """
+    stock = store.get_stock(stock_id)
+    if stock is None:
+        return IdempotentOutcome(
+            ok=False, level="error", message=f"Stock ID {stock_id} not found."
+        )
+    is_valid, is_forceable, message = store.policy.check(stock.status, new_stage)
+    if not is_valid:
+        if not is_forceable:
+            return IdempotentOutcome(
+                ok=False, level="error", message=f"Move not allowed: {message}"
+            )
+        if not force:
+            return IdempotentOutcome(
+                ok=False,
+                level="error",
+                message=f"Forced transition required: {message}",
+            )
+        if not rationale:
+            return IdempotentOutcome(
+                ok=False,
+                level="error",
+                message="Rationale is required for forced transitions.",
+            )
+    return move_stock(
+        store,
+        stock_id,
+        new_stage,
+        comment or rationale or "No comment provided",
+        user,
+        force_override=not is_valid,
+        rationale=rationale if not is_valid else "",
+        effective_time=effective_time,
+        from_stage=stock.status,
+    )
+
+
+def delete_stock(store: BoardStore, stock_id: int) -> IdempotentOutcome:
+    """
+    Deletes a stock and reports the result.
+
+    Args:
+        store (BoardStore): The board to delete the stock from.
+        stock_id (int): ID of the stock to delete.
+
+    Returns:
+        IdempotentOutcome: The result of the deletion.
+    """
+    stock = store.delete_stock(stock_id)
+    if stock is None:
+        return IdempotentOutcome(ok=False, level="info", stock_id=stock_id)
+    return IdempotentOutcome(
+        ok=True,
+        level="success",
+        message=f"Deleted stock {stock.ticker}",
+        stock_id=stock.id,
+    )
@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.board_backend import BoardBackend
+
+
+@dataclass(frozen=True)
+class IdempotentOutcome:
+    """
+    The recorded result of a mutating event, replayed when a client retries it.
+
+    Attributes:
+        ok (bool): Whether the mutation was applied.
+        level (str): Toast level used to report the result ('success', 'warning', 'error').
+        message (str): Message shown to the user. Empty for silent outcomes.
+        stock_id (int | None): The stock the event created or moved.
+        log_id (int | None): The transition log the event appended.
+    """
+
+    ok: bool
+    level: str = "success"
+    message: str = ""
+    stock_id: int | None = None
+    log_id: int | None = None
+
+
+class IdempotencyCache:
+    """
+    Bounded TTL cache of event outcomes keyed by (user, idempotency key).
+
+    Clients attach a generated key to every mutating event and resend the
+    same key on retry. The first delivery records its outcome here and any
+    retry within the TTL receives that outcome instead of re-running the
+    mutation.
+
+    With a shared board backend, outcomes are also recorded in the backend,
+    so a retry that reconnects to another worker is replayed there too.
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_entries: int = 10_000):
+        """
+        Args:
+            ttl_seconds (float): How long an outcome remains replayable.
+            max_entries (int): Upper bound on stored outcomes across all users.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, IdempotentOutcome]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(
+        self, user: str, key: str, backend: "BoardBackend | None" = None
+    ) -> IdempotentOutcome | None:
+        """
+        Returns the recorded outcome for a key, if it has not expired.
+
+        Args:
+            user (str): The user the key is scoped to.
+            key (str): The client-generated idempotency key.
+            backend (BoardBackend | None): The board's backend, consulted on
+                a local miss if it is shared between workers.
+
+        Returns:
+            IdempotentOutcome | None: The original outcome, or None if unseen.
+        """
+        if not key:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            entry = self._entries.get((user, key))
+        if entry:
+            return entry[1]
+        if backend is None or not backend.shared:
+            return None
+        payload = backend.load_outcome(f"{user}:{key}")
+        if payload is None:
+            return None
+        outcome = IdempotentOutcome(**json.loads(payload))
+        self._store(user, key, outcome, now)
+        return outcome
+
+    def put(
+        self,
+        user: str,
+        key: str,
+        outcome: IdempotentOutcome,
+        backend: "BoardBackend | None" = None,
+    ) -> None:
+        """
+        Records the outcome of a keyed event.
+
+        Args:
+            user (str): The user the key is scoped to.
+            key (str): The client-generated idempotency key.
+            outcome (IdempotentOutcome): The result to replay on retry.
+            backend (BoardBackend | None): The board's backend, where the
+                outcome is also recorded if it is shared between workers.
+        """
+        if not key:
+            return
+        self._store(user, key, outcome, time.monotonic())
+        if backend is not None and backend.shared:
+            backend.save_outcome(
+                f"{user}:{key}",
+                json.dumps(asdict(outcome)),
+                int(self.ttl_seconds * 1000),
+            )
+
+    def _store(
+        self, user: str, key: str, outcome: IdempotentOutcome, now: float
+    ) -> None:
+        """Records an outcome in the local cache."""
+        with self._lock:
+            self._evict_expired(now)
+            self._entries[(user, key)] = (now + self.ttl_seconds, outcome)
+            self._entries.move_to_end((user, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops every recorded outcome."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_expired(self, now: float) -> None:
+        """
+        Drops expired entries from the oldest end. Entries are kept in
+        insertion order and share one TTL, so the scan stops at the first
+        live entry.
+        """
+        while self._entries:
+            expires_at, _ = next(iter(self._entries.values()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
+
+
+idempotency_cache = IdempotencyCache(
+    ttl_seconds=float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "600")),
+    max_entries=int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "10000")),
+)
@@ -0,0 +1,414 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from app.models import Stock, StateTransitionLog, get_utc_now
+from app.services.archive import ArchiveSegment, decode_segments
+from app.services.board_store import BoardStore, get_board_store
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobLimitError(ValueError):
+    """Raised when an owner already has the maximum number of active jobs."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation has been requested."""
+
+
+@dataclass(frozen=True)
+class BoardSnapshot:
+    """
+    Read-only copy of the board handed to a job process, for jobs that need
+    the full history. Other jobs are handed only their inputs.
+
+    The cold archive travels as its compressed segments and is only decoded
+    in the job process, by jobs that need the full history.
+
+    Attributes:
+        stage_names (tuple[str, ...]): Stages in pipeline order.
+        stocks (tuple[Stock, ...]): Stocks with days_in_stage as of the snapshot.
+        logs (tuple[StateTransitionLog, ...]): Hot transition logs in append order.
+        taken_at (datetime): When the snapshot was taken.
+        stock_segments (tuple[ArchiveSegment, ...]): Archived stocks, oldest
+            segment first, including copies of since-restored stocks.
+        archived_stock_ids (frozenset[int]): Stocks still archived.
+        log_segments (tuple[ArchiveSegment, ...]): Archived transition logs.
+    """
+
+    stage_names: tuple[str, ...]
+    stocks: tuple[Stock, ...]
+    logs: tuple[StateTransitionLog, ...]
+    taken_at: datetime
+    stock_segments: tuple[ArchiveSegment, ...] = ()
+    archived_stock_ids: frozenset[int] = frozenset()
+    log_segments: tuple[ArchiveSegment, ...] = ()
+
+    @classmethod
+    def of(cls, store: BoardStore) -> "BoardSnapshot":
+        """Takes a snapshot of a board store."""
+        return cls(
+            stage_names=tuple(store.stage_names),
+            stocks=tuple(store.stocks()),
+            logs=tuple(store.logs()),
+            taken_at=get_utc_now(),
+            stock_segments=store.archive.stock_segments(),
+            archived_stock_ids=store.archive.live_stock_ids(),
+            log_segments=store.archive.log_segments(),
+        )
+
+    def all_stocks(self) -> list[Stock]:
+        """Returns the board's stocks followed by the archived ones."""
+        archived: dict[int, Stock] = {}
+        for segment in reversed(self.stock_segments):
+            for stock in segment.decode():
+                if stock.id in self.archived_stock_ids:
+                    archived.setdefault(stock.id, stock)
+        return list(self.stocks) + list(archived.values())
+
+    def all_logs(self) -> list[StateTransitionLog]:
+        """Returns the hot transition logs followed by the archived ones."""
+        return list(self.logs) + list(decode_segments(self.log_segments))
+
+
+class JobReporter:
+    """
+    Passed to a job function in its worker process to report progress and
+    check for cancellation. Progress messages are throttled to whole percents.
+    """
+
+    def __init__(self, job_id: str, progress_queue, cancelled):
+        """
+        Args:
+            job_id (str): The job being run.
+            progress_queue: Shared queue the parent reads progress from.
+            cancelled: Shared dict of job IDs whose cancellation was requested.
+        """
+        self.job_id = job_id
+        self._queue = progress_queue
+        self._cancelled = cancelled
+        self._last_percent = -1
+
+    def progress(self, done: int, total: int, message: str = "") -> None:
+        """
+        Reports progress and raises if the job has been cancelled.
+
+        Args:
+            done (int): Units of work completed.
+            total (int): Total units of work.
+            message (str): Optional status text.
+
+        Raises:
+            JobCancelled: If cancellation was requested.
+        """
+        percent = 100 if total <= 0 else min(100, done * 100 // total)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self._queue.put((self.job_id, percent, message))
+            self.check_cancelled()
+
+    def check_cancelled(self) -> None:
+        """
+        Raises:
+            JobCancelled: If cancellation was requested.
+        """
+        if self._cancelled.get(self.job_id):
+            raise JobCancelled()
+
+
+def _run_job(kind: str, inputs: Any, reporter: JobReporter, params):
+    """Entry point in the worker process: looks up and runs a job function."""
+    from app.services.job_tasks import JOB_KINDS
+
+    reporter.progress(0, 1, "Started")
+    return JOB_KINDS[kind](inputs, reporter, **params)
+
+
+@dataclass
+class Job:
+    """
+    A background job and its latest known state.
+
+    Attributes:
+        id (str): Unique job ID.
+        kind (str): Key into JOB_KINDS.
+        owner (str): Who submitted it; concurrency limits are per owner.
+        status (str): queued, running, succeeded, failed or cancelled.
+        percent (int): Progress from 0 to 100.
+        message (str): Latest status text from the job.
+        result (Any): The job's return value once it succeeded.
+        error (str): Failure description once it failed.
+        created_at (datetime): Submission time.
+    """
+
+    id: str
+    kind: str
+    owner: str
+    status: str = QUEUED
+    percent: int = 0
+    message: str = ""
+    result: Any = None
+    error: str = ""
+    created_at: datetime = field(default_factory=get_utc_now)
+    _future: Future | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """True once the job succeeded, failed or was cancelled."""
+        return self.status in FINISHED
+
+
+class JobManager:
+    """
+    Runs heavy board computations in a process pool, off the event loop.
+
+    Each job receives a read-only copy of the board data it reads, so it
+    neither blocks nor races with board mutations. Copying that data takes
+    time on a large board, so call submit() from a worker thread rather than
+    the event loop. The pool size bounds how many jobs run at
+    once on this worker, and each owner may only have a limited number of
+    jobs queued or running.
+    """
+
+    def __init__(
+        self,
+        store: BoardStore,
+        max_workers: int = 2,
+        max_jobs_per_owner: int = 1,
+        history_size: int = 100,
+    ):
+        """
+        Args:
+            store (BoardStore): The board jobs snapshot unless they name
+                another.
+            max_workers (int): Size of the process pool.
+            max_jobs_per_owner (int): Active jobs allowed per owner.
+            history_size (int): Finished jobs kept for lookup.
+        """
+        self.store = store
+        self.max_workers = max_workers
+        self.max_jobs_per_owner = max_jobs_per_owner
+        self.history_size = history_size
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._manager = None
+        self._progress_queue = None
+        self._cancelled = None
+
+    def _start(self) -> None:
+        """Starts the pool, the shared progress queue and its reader thread."""
+        if self._pool is not None:
+            return
+        context = multiprocessing.get_context("spawn")
+        self._manager = context.Manager()
+        self._progress_queue = self._manager.Queue()
+        self._cancelled = self._manager.dict()
+        self._pool = self._new_pool()
+        threading.Thread(
+            target=self._read_progress, name="job-progress", daemon=True
+        ).start()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """Creates the worker process pool."""
+        context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(self.max_workers, mp_context=context)
+
+    def submit(
+        self, kind: str, owner: str, store: BoardStore | None = None, **params: Any
+    ) -> Job:
+        """
+        Queues a job with a copy of the board data its kind reads.
+
+        Args:
+            kind (str): Key into JOB_KINDS.
+            owner (str): Who is submitting; used for the concurrency limit.
+            store (BoardStore | None): The board to read. Defaults to the
+                manager's store; one pool serves every board.
+            **params (Any): Keyword arguments for the job kind; see
+                job_tasks.JOB_INPUTS.
+
+        Returns:
+            Job: The queued job.
+
+        Raises:
+            JobLimitError: If the owner already has too many active jobs.
+            KeyError: If the kind is unknown.
+            Exception: Whatever copying the inputs or queueing raised; the
+                job is then marked failed, so it does not hold the owner's
+                slot.
+        """
+        from app.services.job_tasks import JOB_INPUTS, JOB_KINDS
+
+        if kind not in JOB_KINDS:
+            raise KeyError(f"Unknown job kind: {kind}")
+        with self._lock:
+            active = sum(
+                1 for j in self._jobs.values() if j.owner == owner and not j.finished
+            )
+            if active >= self.max_jobs_per_owner:
+                raise JobLimitError("Another job is still running. Please wait.")
+            self._start()
+            job = Job(id=uuid.uuid4().hex, kind=kind, owner=owner)
+            self._jobs[job.id] = job
+            self._trim()
+        reporter = JobReporter(job.id, self._progress_queue, self._cancelled)
+        try:
+            inputs, params = JOB_INPUTS[kind](store or self.store, params)
+            job._future = self._queue(_run_job, kind, inputs, reporter, params)
+        except BaseException as e:
+            job.status = FAILED
+            job.error = str(e) or type(e).__name__
+            raise
+        job._future.add_done_callback(lambda future: self._finish(job, future))
+        return job
+
+    def _queue(self, fn, *args: Any) -> Future:
+        """
+        Submits a call to the pool, replacing the pool first if a worker died.
+
+        A worker killed mid-job, e.g. by the OOM killer, breaks the whole
+        pool; every later submit would fail until it is replaced.
+
+        Returns:
+            Future: The call's future.
+        """
+        pool = self._pool
+        try:
+            return pool.submit(fn, *args)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._pool is pool:
+                    logger.warning("Job pool is broken; starting a new one")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = self._new_pool()
+                pool = self._pool
+            return pool.submit(fn, *args)
+
+    def get(self, job_id: str) -> Job | None:
+        """Returns a job by ID, or None if unknown or expired."""
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancels a job. A queued job never starts; a running job stops at its
+        next progress report.
+
+        Args:
+            job_id (str): The job to cancel.
+
+        Returns:
+            bool: True if the job was still active.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+        if job._future is not None and job._future.cancel():
+            return True
+        self._cancelled[job_id] = True
+        return True
+
+    async def watch(self, job_id: str, interval: float = 0.25) -> AsyncIterator[Job]:
+        """
+        Yields a job each time its status or progress changes, until it finishes.
+
+        Args:
+            job_id (str): The job to watch.
+            interval (float): Polling interval in seconds.
+
+        Yields:
+            Job: The job after each change.
+        """
+        seen = None
+        while (job := self._jobs.get(job_id)) is not None:
+            state = (job.status, job.percent, job.message)
+            if state != seen:
+                seen = state
+                yield job
+            if job.finished:
+                return
+            await asyncio.sleep(interval)
+
+    def _read_progress(self) -> None:
+        """Applies progress messages from worker processes to their jobs."""
+        while True:
+            try:
+                job_id, percent, message = self._progress_queue.get()
+            except (EOFError, OSError):
+                return
+            job = self._jobs.get(job_id)
+            if job is not None and not job.finished:
+                job.status = RUNNING
+                job.percent = percent
+                job.message = message
+
+    def _finish(self, job: Job, future: Future) -> None:
+        """Records a job's outcome when its future completes."""
+        if future.cancelled():
+            job.status = CANCELLED
+        elif isinstance(future.exception(), JobCancelled):
+            job.status = CANCELLED
+        elif future.exception() is not None:
+            job.status = FAILED
+            job.error = str(future.exception())
+            logger.error("Job %s (%s) failed: %s", job.id, job.kind, job.error)
+        else:
+            job.result = future.result()
+            job.percent = 100
+            job.status = SUCCEEDED
+        if self._cancelled is not None:
+            self._cancelled.pop(job.id, None)
+
+    def _trim(self) -> None:
+        """Drops the oldest finished jobs beyond the history size."""
+        finished = [j.id for j in self._jobs.values() if j.finished]
+        for job_id in finished[: max(0, len(self._jobs) - self.history_size)]:
+            del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        """Cancels queued jobs and stops the pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._manager.shutdown()
+            self._pool = None
+
+
+_job_manager: JobManager | None = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    Returns the process-wide job manager for the shared board store.
+
+    Returns:
+        JobManager: The job manager.
+    """
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = JobManager(
+                    get_board_store(),
+                    max_workers=int(os.getenv("JOB_WORKERS", "2")),
+                    max_jobs_per_owner=int(os.getenv("JOB_MAX_PER_OWNER", "1")),
+                )
+    return _job_manager
@@ -0,0 +1,308 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Container, Iterable
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+
+from app.models import StateTransitionLog
+
+SECONDS_PER_DAY = 86_400
+
+
+def log_time(log: StateTransitionLog) -> float:
+    """
+    Returns a log's effective time as a POSIX timestamp.
+
+    Args:
+        log (StateTransitionLog): The log.
+
+    Returns:
+        float: The timestamp, or 0.0 for a log without one.
+    """
+    return log.timestamp.timestamp() if log.timestamp else 0.0
+
+
+def _day(timestamp: float) -> int:
+    """Returns the UTC day number (days since the epoch) of a timestamp."""
+    return int(timestamp // SECONDS_PER_DAY)
+
+
+class TemporalLogIndex:
+    """
+    Transition logs ordered by effective time rather than by ID.
+
+    Backdated moves carry a timestamp earlier than logs appended before
+    them, so the log's append order is not time order. Logs arriving in
+    time order are appended in O(1); backdated ones are placed by binary
+    search. Range queries locate both ends by binary search, so listing k
+    logs costs O(log n + k) and counting them O(log n). Per-day totals are
+    kept alongside and updated on every insert.
+    """
+
+    def __init__(self, logs: Iterable[StateTransitionLog] = ()):
+        """
+        Args:
+            logs (Iterable[StateTransitionLog]): Initial logs, in any order.
+        """
+        self._times: list[float] = []
+        self._logs: list[StateTransitionLog] = []
+        self._daily: dict[int, int] = {}
+        self.extend(logs)
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def add(self, log: StateTransitionLog) -> None:
+        """
+        Inserts one log at its place in time. Logs with equal timestamps
+        keep their insertion order.
+
+        Args:
+            log (StateTransitionLog): The log.
+        """
+        moment = log_time(log)
+        if not self._times or moment >= self._times[-1]:
+            self._times.append(moment)
+            self._logs.append(log)
+        else:
+            position = bisect_right(self._times, moment)
+            self._times.insert(position, moment)
+            self._logs.insert(position, log)
+        day = _day(moment)
+        self._daily[day] = self._daily.get(day, 0) + 1
+
+    def extend(self, logs: Iterable[StateTransitionLog]) -> None:
+        """
+        Inserts many logs with one sort, e.g. when loading a board.
+
+        Args:
+            logs (Iterable[StateTransitionLog]): The logs, in any order.
+        """
+        logs = list(logs)
+        if not logs:
+            return
+        times = [log_time(log) for log in logs]
+        for moment in times:
+            day = _day(moment)
+            self._daily[day] = self._daily.get(day, 0) + 1
+        times = self._times + times
+        logs = self._logs + logs
+        # A stable sort on the time alone keeps equal timestamps in insertion order.
+        order = sorted(range(len(times)), key=times.__getitem__)
+        self._times = [times[i] for i in order]
+        self._logs = [logs[i] for i in order]
+
+    def discard_before(self, before: datetime, log_ids: Container[int]) -> None:
+        """
+        Removes archived logs, all of which took effect before a cutoff, so
+        only the logs in front of it are scanned. Per-day totals keep
+        counting them.
+
+        Args:
+            before (datetime): Every removed log is earlier than this.
+            log_ids (Container[int]): IDs of the logs to remove.
+        """
+        stop = bisect_left(self._times, before.timestamp())
+        kept = [i for i in range(stop) if self._logs[i].id not in log_ids]
+        if len(kept) == stop:
+            return
+        self._times[:stop] = [self._times[i] for i in kept]
+        self._logs[:stop] = [self._logs[i] for i in kept]
+
+    def _bounds(self, start: datetime | None, end: datetime | None) -> tuple[int, int]:
+        """Returns the index range of logs with start <= time < end."""
+        low = 0 if start is None else bisect_left(self._times, start.timestamp())
+        high = (
+            len(self._times)
+            if end is None
+            else bisect_left(self._times, end.timestamp())
+        )
+        return low, max(low, high)
+
+    def between(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> list[StateTransitionLog]:
+        """
+        Returns logs whose effective time falls in [start, end).
+
+        Args:
+            start (datetime | None): Inclusive lower bound, or None for no bound.
+            end (datetime | None): Exclusive upper bound, or None for no bound.
+            offset (int): Logs to skip from the first one returned.
+            limit (int | None): Maximum number of logs, or None for all.
+            newest_first (bool): Whether to return the latest logs first.
+
+        Returns:
+            list[StateTransitionLog]: The logs, oldest or newest first.
+        """
+        low, high = self._bounds(start, end)
+        count = high - low - offset
+        if limit is not None:
+            count = min(count, limit)
+        if count <= 0:
+            return []
+        if newest_first:
+            stop = high - offset
+            return self._logs[stop - count : stop][::-1]
+        return self._logs[low + offset : low + offset + count]
+
+    def count(self, start: datetime | None = None, end: datetime | None = None) -> int:
+        """
+        Counts logs whose effective time falls in [start, end).
+
+        Args:
+            start (datetime | None): Inclusive lower bound, or None.
+            end (datetime | None): Exclusive upper bound, or None.
+
+        Returns:
+            int: The number of logs.
+        """
+        low, high = self._bounds(start, end)
+        return high - low
+
+    def daily_counts(self, start: date, end: date) -> dict[date, int]:
+        """
+        Returns the number of logs on each UTC day from start to end.
+
+        Args:
+            start (date): First day, inclusive.
+            end (date): Last day, inclusive.
+
+        Returns:
+            dict[date, int]: Every day in the range, including empty ones.
+        """
+        epoch = date(1970, 1, 1).toordinal()
+        first = start.toordinal() - epoch
+        last = end.toordinal() - epoch
+        return {
+            date.fromordinal(day + epoch): self._daily.get(day, 0)
+            for day in range(first, last + 1)
+        }
+
+
+@dataclass
+class UserCounters:
+    """
+    Running totals of one user's transitions.
+
+    Attributes:
+        transitions (int): Every log the user recorded, including creations.
+        moves (int): Stage-to-stage moves, i.e. excluding initial creations.
+        forced_moves (int): Moves made with a forced override.
+    """
+
+    transitions: int = 0
+    moves: int = 0
+    forced_moves: int = 0
+
+
+class UserLogIndex:
+    """
+    Secondary index from updated_by to that user's logs.
+
+    Each user's logs are held in their own TemporalLogIndex, so a user's
+    feed is paged and date-filtered in O(log n + k) without touching other
+    users' logs, and their counters are updated in O(1) per log.
+    """
+
+    def __init__(self, logs: Iterable[StateTransitionLog] = ()):
+        """
+        Args:
+            logs (Iterable[StateTransitionLog]): Initial logs, in any order.
+        """
+        self._indexes: dict[str, TemporalLogIndex] = {}
+        self._counters: dict[str, UserCounters] = {}
+        self.extend(logs)
+
+    def add(self, log: StateTransitionLog) -> None:
+        """
+        Indexes one log under its user.
+
+        Args:
+            log (StateTransitionLog): The log.
+        """
+        index = self._indexes.get(log.updated_by)
+        if index is None:
+            index = self._indexes[log.updated_by] = TemporalLogIndex()
+        index.add(log)
+        self._count(log)
+
+    def extend(self, logs: Iterable[StateTransitionLog]) -> None:
+        """
+        Indexes many logs with one sort per user.
+
+        Args:
+            logs (Iterable[StateTransitionLog]): The logs, in any order.
+        """
+        by_user: dict[str, list[StateTransitionLog]] = {}
+        for log in logs:
+            by_user.setdefault(log.updated_by, []).append(log)
+            self._count(log)
+        for user, user_logs in by_user.items():
+            index = self._indexes.get(user)
+            if index is None:
+                self._indexes[user] = TemporalLogIndex(user_logs)
+            else:
+                index.extend(user_logs)
+
+    def discard_before(
+        self, before: datetime, logs: Iterable[StateTransitionLog]
+    ) -> None:
+        """
+        Removes archived logs from their users' indexes. The counters keep
+        counting them.
+
+        Args:
+            before (datetime): Every removed log is earlier than this.
+            logs (Iterable[StateTransitionLog]): The logs to remove.
+        """
+        by_user: dict[str, set[int]] = {}
+        for log in logs:
+            by_user.setdefault(log.updated_by, set()).add(log.id)
+        for user, log_ids in by_user.items():
+            index = self._indexes.get(user)
+            if index is not None:
+                index.discard_before(before, log_ids)
+
+    def _count(self, log: StateTransitionLog) -> None:
+        """Adds a log to its user's counters."""
+        counters = self._counters.get(log.updated_by)
+        if counters is None:
+            counters = self._counters[log.updated_by] = UserCounters()
+        counters.transitions += 1
+        if log.previous_stage != "VOID":
+            counters.moves += 1
+            if log.is_forced_transition:
+                counters.forced_moves += 1
+
+    def users(self) -> list[str]:
+        """Returns every user with at least one log, sorted."""
+        return sorted(self._indexes)
+
+    def index(self, user: str) -> TemporalLogIndex:
+        """
+        Returns a user's logs by effective time.
+
+        Args:
+            user (str): The user.
+
+        Returns:
+            TemporalLogIndex: The index, empty for a user without logs.
+        """
+        return self._indexes.get(user) or TemporalLogIndex()
+
+    def counters(self, user: str) -> UserCounters:
+        """
+        Returns a copy of a user's running totals.
+
+        Args:
+            user (str): The user.
+
+        Returns:
+            UserCounters: The totals, all zero for a user without logs.
+        """
+        return replace(self._counters.get(user) or UserCounters())
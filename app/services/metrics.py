@@ -0,0 +1,450 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Metrics are per process: with several workers, scrape each one.
+"""
+
+import functools
+import inspect
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+FANOUT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def _format_value(value: float) -> str:
+    """Formats a sample value the way Prometheus expects."""
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """Formats a label set, escaping values."""
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Metric:
+    """
+    Base class for a named metric with a fixed set of label names.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        """
+        Args:
+            name (str): Metric name.
+            documentation (str): HELP text.
+            labelnames (Iterable[str]): Label names, in order.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Returns the label values for a label dict in label-name order."""
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self) -> list[str]:
+        """Returns the sample lines for this metric."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Returns the HELP, TYPE and sample lines."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """
+    A monotonically increasing count.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increments the counter.
+
+        Args:
+            amount (float): Amount to add.
+            **labels (str): Label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Gauge(Metric):
+    """
+    A value read at scrape time from a callback.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        collect: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ):
+        """
+        Args:
+            name (str): Metric name.
+            documentation (str): HELP text.
+            labelnames (Iterable[str]): Label names, in order.
+            collect (Callable | None): Returns current values keyed by label
+                value tuples. Can also be set later with set_collector.
+        """
+        super().__init__(name, documentation, labelnames)
+        self._collect = collect
+
+    def set_collector(
+        self, collect: Callable[[], dict[tuple[str, ...], float]]
+    ) -> None:
+        """
+        Sets the callback that reads the gauge's values.
+
+        Args:
+            collect (Callable): Returns values keyed by label value tuples.
+        """
+        self._collect = collect
+
+    def samples(self) -> list[str]:
+        if self._collect is None:
+            return []
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._collect().items())
+        ]
+
+
+class Histogram(Metric):
+    """
+    Counts observations into cumulative buckets, with their sum and count.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        """
+        Args:
+            name (str): Metric name.
+            documentation (str): HELP text.
+            labelnames (Iterable[str]): Label names, in order.
+            buckets (Iterable[float]): Upper bounds, ascending; +Inf is added.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Records one observation.
+
+        Args:
+            value (float): The observed value.
+            **labels (str): Label values.
+        """
+        key = self._key(labels)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            series = {
+                key: (list(counts), total, count)
+                for key, (counts, total, count) in self._series.items()
+            }
+        names = self.labelnames + ("le",)
+        lines = []
+        for key, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds metrics and renders them for scraping.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Adds a metric, or returns the one already registered under its name.
+
+        Args:
+            metric (Metric): The metric.
+
+        Returns:
+            Metric: The registered metric.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self) -> str:
+        """
+        Renders every metric in the text exposition format.
+
+        Returns:
+            str: The scrape response body.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HANDLER_SECONDS = REGISTRY.register(
+    Histogram(
+        "kanban_event_handler_seconds",
+        "Time spent in event handlers.",
+        ["handler"],
+    )
+)
+HANDLER_ERRORS = REGISTRY.register(
+    Counter(
+        "kanban_event_handler_errors_total",
+        "Event handler calls that raised.",
+        ["handler"],
+    )
+)
+COMPUTED_VAR_SECONDS = REGISTRY.register(
+    Histogram(
+        "kanban_computed_var_seconds",
+        "Time spent recomputing computed vars.",
+        ["var"],
+    )
+)
+STATE_PAYLOAD_BYTES = REGISTRY.register(
+    Histogram(
+        "kanban_state_payload_bytes",
+        "Size of state updates sent to clients over the websocket.",
+        buckets=SIZE_BUCKETS,
+    )
+)
+BOARD_STOCKS = REGISTRY.register(
+    Gauge("kanban_board_stocks", "Stocks on each board by stage.", ["board", "stage"])
+)
+BOARD_LOGS = REGISTRY.register(
+    Gauge(
+        "kanban_board_transition_logs",
+        "Transition logs in each board's hot working set.",
+        ["board"],
+    )
+)
+BOARD_ARCHIVED = REGISTRY.register(
+    Gauge(
+        "kanban_board_archived_records",
+        "Stocks and transition logs moved to each board's cold archive.",
+        ["board", "kind"],
+    )
+)
+CONNECTED_CLIENTS = REGISTRY.register(
+    Gauge("kanban_connected_clients", "Websocket clients connected to this worker.")
+)
+BROADCAST_FANOUT = REGISTRY.register(
+    Histogram(
+        "kanban_broadcast_fanout_clients",
+        "Clients each coalesced board frame is fanned out to.",
+        buckets=FANOUT_BUCKETS,
+    )
+)
+BROADCAST_DELIVERIES = REGISTRY.register(
+    Counter(
+        "kanban_broadcast_deliveries_total",
+        "Board frames delivered to clients, by outcome.",
+        ["outcome"],
+    )
+)
+
+
+def resident_memory_bytes() -> dict[tuple[str, ...], float]:
+    """
+    Reads this process's resident set size from /proc.
+
+    Returns:
+        dict: The RSS in bytes, or nothing where /proc is unavailable.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return {}
+    return {(): pages * os.sysconf("SC_PAGE_SIZE")}
+
+
+PROCESS_RSS = REGISTRY.register(
+    Gauge(
+        "process_resident_memory_bytes",
+        "Resident memory size in bytes.",
+        collect=resident_memory_bytes,
+    )
+)
+
+
+@contextmanager
+def timer(histogram: Histogram, **labels: str):
+    """
+    Times the enclosed block into a histogram.
+
+    Computed vars time their body with this rather than with timed(), because
+    Reflex derives a computed var's dependencies from its getter's bytecode
+    and would not see through a wrapper.
+
+    Args:
+        histogram (Histogram): Where to record the duration in seconds.
+        **labels (str): Label values.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started, **labels)
+
+
+def timed(name: str):
+    """
+    Decorator timing an event handler into HANDLER_SECONDS.
+
+    The wrapper has the same kind as the handler (plain, coroutine, generator
+    or async generator), so Reflex treats it exactly like the original. For
+    generators the time runs until the handler is exhausted. Apply it below
+    @rx.event.
+
+    Args:
+        name (str): The handler label.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def record(started: float, failed: bool) -> None:
+        HANDLER_SECONDS.observe(time.perf_counter() - started, handler=name)
+        if failed:
+            HANDLER_ERRORS.inc(handler=name)
+
+    def decorator(fn):
+        if inspect.isasyncgenfunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                started, failed = time.perf_counter(), True
+                try:
+                    async for event in fn(*args, **kwargs):
+                        yield event
+                    failed = False
+                finally:
+                    record(started, failed)
+
+        elif inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                started, failed = time.perf_counter(), True
+                try:
+                    result = await fn(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    record(started, failed)
+
+        elif inspect.isgeneratorfunction(fn):
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                started, failed = time.perf_counter(), True
+                try:
+                    yield from fn(*args, **kwargs)
+                    failed = False
+                finally:
+                    record(started, failed)
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                started, failed = time.perf_counter(), True
+                try:
+                    result = fn(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    record(started, failed)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from app.models import BoardDef, BoardSummary, get_utc_now
+from app.services.board_store import get_board_store
+from app.services.boards import get_board_defs
+
+# Boards summarized at once. Loading a board from its shard is I/O bound,
+# so the overview waits for the slowest shard rather than for all of them.
+MAX_PARALLEL_BOARDS = 8
+PORTFOLIO_ID = "all"
+PORTFOLIO_NAME = "All boards"
+
+
+def summarize_board(board: BoardDef) -> BoardSummary:
+    """
+    Reads one board's headline figures from its store.
+
+    Args:
+        board (BoardDef): The board.
+
+    Returns:
+        BoardSummary: The board's figures.
+    """
+    store = get_board_store(board.id)
+    stage_counts = store.stage_counts()
+    return BoardSummary(
+        board_id=board.id,
+        name=board.name,
+        stocks=sum(stage_counts.values()),
+        stage_counts=stage_counts,
+        logs=store.log_count(),
+        moves_this_week=store.count_logs_between(
+            get_utc_now() - timedelta(days=7), None
+        ),
+        pending_reviews=store.review_counts()["pending"],
+        archived_stocks=store.archive.stock_count(),
+    )
+
+
+def board_summaries(boards: list[BoardDef] | None = None) -> list[BoardSummary]:
+    """
+    Summarizes boards in parallel, one thread per board.
+
+    Args:
+        boards (list[BoardDef] | None): The boards. Defaults to every board
+            of the deployment.
+
+    Returns:
+        list[BoardSummary]: One summary per board, in board order.
+    """
+    boards = get_board_defs() if boards is None else boards
+    if len(boards) <= 1:
+        return [summarize_board(board) for board in boards]
+    with ThreadPoolExecutor(
+        min(len(boards), MAX_PARALLEL_BOARDS), thread_name_prefix="portfolio"
+    ) as pool:
+        return list(pool.map(summarize_board, boards))
+
+
+def merge_summaries(summaries: list[BoardSummary]) -> BoardSummary:
+    """
+    Adds up board summaries into the portfolio total.
+
+    Stages of the same name on different boards are counted together;
+    stages appear in the order they are first seen.
+
+    Args:
+        summaries (list[BoardSummary]): The boards' summaries.
+
+    Returns:
+        BoardSummary: The total across boards.
+    """
+    stage_counts: dict[str, int] = {}
+    for summary in summaries:
+        for stage, count in summary.stage_counts.items():
+            stage_counts[stage] = stage_counts.get(stage, 0) + count
+    return BoardSummary(
+        board_id=PORTFOLIO_ID,
+        name=PORTFOLIO_NAME,
+        stocks=sum(summary.stocks for summary in summaries),
+        stage_counts=stage_counts,
+        logs=sum(summary.logs for summary in summaries),
+        moves_this_week=sum(summary.moves_this_week for summary in summaries),
+        pending_reviews=sum(summary.pending_reviews for summary in summaries),
+        archived_stocks=sum(summary.archived_stocks for summary in summaries),
+    )
@@ -0,0 +1,405 @@
+"""
+Opt-in profiling of individual event handlers.
+
+Profiling is configured from the environment and installed by swapping a
+state's dispatch table entries for profiled copies, so when it is disabled
+event handlers run untouched.
+"""
+
+import cProfile
+import dataclasses
+import functools
+import inspect
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.models import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+CPROFILE = "cprofile"
+SAMPLING = "sampling"
+PROFILE_SUFFIXES = {CPROFILE: ".prof", SAMPLING: ".folded"}
+PROFILE_NAME = re.compile(r"^[A-Za-z0-9_.-]+\.(prof|folded)$")
+
+
+def _split(value: str) -> frozenset[str] | None:
+    """Parses a comma-separated filter; empty or '*' means no filter."""
+    items = frozenset(item.strip() for item in value.split(",") if item.strip())
+    return None if not items or "*" in items else items
+
+
+def _slug(value: str) -> str:
+    """Makes a value safe for use in a file name."""
+    return re.sub(r"[^A-Za-z0-9.-]+", "-", value).strip("-")[:40] or "anon"
+
+
+@dataclass(frozen=True)
+class ProfilerConfig:
+    """
+    Which events to profile and how.
+
+    Attributes:
+        mode (str): 'cprofile' for deterministic profiles or 'sampling' for
+            low-overhead stack samples.
+        events (frozenset[str] | None): Handler names to profile; None for all.
+        users (frozenset[str] | None): Client tokens or acting users to
+            profile; None for all.
+        sample_rate (float): Fraction of matching events profiled.
+        interval (float): Seconds between stack samples in sampling mode.
+        directory (Path): Where profiles are written.
+        max_profiles (int): Profiles kept before the oldest are deleted.
+        max_bytes (int): Total size kept before the oldest are deleted.
+    """
+
+    mode: str
+    events: frozenset[str] | None = None
+    users: frozenset[str] | None = None
+    sample_rate: float = 1.0
+    interval: float = 0.005
+    directory: Path = Path(".kanban/profiles")
+    max_profiles: int = 100
+    max_bytes: int = 100 * 1024 * 1024
+
+    @classmethod
+    def from_env(cls) -> "ProfilerConfig | None":
+        """
+        Reads the configuration from PROFILE_* environment variables.
+
+        Returns:
+            ProfilerConfig | None: The configuration, or None if PROFILE_MODE
+                is unset or 'off'.
+
+        Raises:
+            ValueError: If PROFILE_MODE is not a known mode.
+        """
+        mode = os.getenv("PROFILE_MODE", "off").strip().lower()
+        if mode in ("", "off"):
+            return None
+        if mode not in PROFILE_SUFFIXES:
+            raise ValueError(f"Unknown PROFILE_MODE: {mode}")
+        data_dir = Path(os.getenv("KANBAN_DATA_DIR", ".kanban"))
+        return cls(
+            mode=mode,
+            events=_split(os.getenv("PROFILE_EVENTS", "")),
+            users=_split(os.getenv("PROFILE_USERS", "")),
+            sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "1.0")),
+            interval=int(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5")) / 1000,
+            directory=Path(os.getenv("PROFILE_DIR", str(data_dir / "profiles"))),
+            max_profiles=int(os.getenv("PROFILE_MAX_FILES", "100")),
+            max_bytes=int(os.getenv("PROFILE_MAX_MB", "100")) * 1024 * 1024,
+        )
+
+
+class ProfileStore:
+    """
+    A directory of captured profiles with count and size retention.
+    """
+
+    def __init__(self, directory: Path, max_profiles: int, max_bytes: int):
+        """
+        Args:
+            directory (Path): Where profiles are written.
+            max_profiles (int): Profiles kept before the oldest are deleted.
+            max_bytes (int): Total size kept before the oldest are deleted.
+        """
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def new_path(self, event: str, user: str, duration: float, suffix: str) -> Path:
+        """
+        Returns the path for a new profile, creating the directory if needed.
+
+        Args:
+            event (str): The profiled handler.
+            user (str): Who triggered it.
+            duration (float): How long the handler took, in seconds.
+            suffix (str): File suffix for the profile format.
+
+        Returns:
+            Path: A path that does not exist yet.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = get_utc_now().strftime("%Y%m%dT%H%M%S%f")
+        name = f"{stamp}_{_slug(event)}_{_slug(user)}_{round(duration * 1000)}ms"
+        return self.directory / f"{name}{suffix}"
+
+    def list(self) -> list[dict]:
+        """
+        Lists stored profiles, newest first.
+
+        Returns:
+            list[dict]: Name, size in bytes and modification time of each profile.
+        """
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.iterdir():
+            if PROFILE_NAME.match(path.name):
+                stat = path.stat()
+                entries.append(
+                    {
+                        "name": path.name,
+                        "bytes": stat.st_size,
+                        "modified": stat.st_mtime,
+                    }
+                )
+        return sorted(entries, key=lambda e: e["name"], reverse=True)
+
+    def path(self, name: str) -> Path | None:
+        """
+        Resolves a profile name to its file.
+
+        Args:
+            name (str): A name returned by list().
+
+        Returns:
+            Path | None: The file, or None if the name is invalid or unknown.
+        """
+        if not PROFILE_NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    def prune(self) -> None:
+        """Deletes the oldest profiles beyond the count and size limits."""
+        with self._lock:
+            entries = self.list()
+            total = 0
+            for index, entry in enumerate(entries):
+                total += entry["bytes"]
+                if index >= self.max_profiles or total > self.max_bytes:
+                    (self.directory / entry["name"]).unlink(missing_ok=True)
+
+
+class StackSampler:
+    """
+    Samples one thread's stack at a fixed interval and aggregates the samples
+    as folded stacks, the input format of flame graph tools.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Args:
+            thread_id (int): The thread to sample.
+            interval (float): Seconds between samples.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="profile-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        """Starts sampling."""
+        self._thread.start()
+
+    def stop(self) -> str:
+        """
+        Stops sampling.
+
+        Returns:
+            str: One line per distinct stack, root first, with its sample count.
+        """
+        self._stop.set()
+        self._thread.join()
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class EventProfiler:
+    """
+    Captures profiles of matching event handler calls.
+
+    Only one capture runs at a time; a matching event that arrives while
+    another is being profiled runs unprofiled. Both modes observe the whole
+    event loop thread while the handler runs, so other events interleaved
+    with an async handler appear in its profile.
+    """
+
+    def __init__(self, config: ProfilerConfig):
+        """
+        Args:
+            config (ProfilerConfig): What to profile.
+        """
+        self.config = config
+        self.store = ProfileStore(
+            config.directory, config.max_profiles, config.max_bytes
+        )
+        self._busy = threading.Lock()
+
+    def matches(self, event: str) -> bool:
+        """
+        Returns whether a handler is profiled at all.
+
+        Args:
+            event (str): The handler name.
+
+        Returns:
+            bool: True if the handler passes the event filter.
+        """
+        return self.config.events is None or event in self.config.events
+
+    def _user_of(self, state) -> str:
+        """Returns the acting user of a state, falling back to its client token."""
+        return getattr(state, "modal_user", "") or state.router.session.client_token
+
+    def _selected(self, state) -> bool:
+        """Applies the user filter and sample rate to one call."""
+        if self.config.users is not None:
+            token = state.router.session.client_token
+            if not {token, getattr(state, "modal_user", "")} & self.config.users:
+                return False
+        return random.random() < self.config.sample_rate
+
+    @contextmanager
+    def capture(self, event: str, state):
+        """
+        Profiles the enclosed block if the call is selected and no other
+        capture is running.
+
+        Args:
+            event (str): The handler name.
+            state: The state the handler runs on.
+        """
+        if not self._selected(state) or not self._busy.acquire(blocking=False):
+            yield
+            return
+        user = self._user_of(state)
+        started = time.perf_counter()
+        if self.config.mode == CPROFILE:
+            profile = cProfile.Profile()
+            profile.enable()
+        else:
+            sampler = StackSampler(threading.get_ident(), self.config.interval)
+            sampler.start()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            try:
+                path = self.store.new_path(
+                    event, user, duration, PROFILE_SUFFIXES[self.config.mode]
+                )
+                if self.config.mode == CPROFILE:
+                    profile.disable()
+                    profile.dump_stats(path)
+                else:
+                    path.write_text(sampler.stop())
+                self.store.prune()
+            except OSError:
+                logger.exception("Failed to save profile of %s", event)
+            finally:
+                self._busy.release()
+
+    def wrap(self, event: str, fn):
+        """
+        Returns a profiled version of an event handler function with the same
+        kind (plain, coroutine, generator or async generator).
+
+        Args:
+            event (str): The handler name.
+            fn: The handler function; its first argument is the state.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+        capture = self.capture
+
+        if inspect.isasyncgenfunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(state, *args, **kwargs):
+                with capture(event, state):
+                    async for update in fn(state, *args, **kwargs):
+                        yield update
+
+        elif inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(state, *args, **kwargs):
+                with capture(event, state):
+                    return await fn(state, *args, **kwargs)
+
+        elif inspect.isgeneratorfunction(fn):
+
+            @functools.wraps(fn)
+            def wrapper(state, *args, **kwargs):
+                with capture(event, state):
+                    yield from fn(state, *args, **kwargs)
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(state, *args, **kwargs):
+                with capture(event, state):
+                    return fn(state, *args, **kwargs)
+
+        return wrapper
+
+    def install(self, state_cls) -> list[str]:
+        """
+        Replaces a state's matching event handlers in its dispatch table with
+        profiled copies. Components keep referring to the original handlers.
+
+        Args:
+            state_cls: The state class, e.g. KanbanState.
+
+        Returns:
+            list[str]: The names of the profiled handlers.
+        """
+        installed = []
+        for name, handler in list(state_cls.event_handlers.items()):
+            if not self.matches(name) or getattr(handler.fn, "_profiled", False):
+                continue
+            wrapped = self.wrap(name, handler.fn)
+            wrapped._profiled = True
+            state_cls.event_handlers[name] = dataclasses.replace(handler, fn=wrapped)
+            installed.append(name)
+        return installed
+
+
+_event_profiler: EventProfiler | None = None
+_event_profiler_loaded = False
+_event_profiler_lock = threading.Lock()
+
+
+def get_event_profiler() -> EventProfiler | None:
+    """
+    Returns the process-wide event profiler.
+
+    Returns:
+        EventProfiler | None: The profiler, or None if profiling is disabled.
+    """
+    global _event_profiler, _event_profiler_loaded
+    if not _event_profiler_loaded:
+        with _event_profiler_lock:
+            if not _event_profiler_loaded:
+                config = ProfilerConfig.from_env()
+                _event_profiler = EventProfiler(config) if config else None
+                _event_profiler_loaded = True
+    return _event_profiler
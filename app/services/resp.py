@@ -0,0 +1,308 @@
+import socket
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+
+class RespError(Exception):
+    """Raised when the server answers a command with an error reply."""
+
+
+def encode_command(*args: Any) -> bytes:
+    """
+    Encodes a command as a RESP array of bulk strings.
+
+    Args:
+        *args (Any): Command name and arguments; str, int and bytes are supported.
+
+    Returns:
+        bytes: The wire encoding.
+    """
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode()
+        else:
+            data = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def read_reply(stream) -> Any:
+    """
+    Reads one RESP2 reply from a buffered binary stream.
+
+    Args:
+        stream: A file-like object opened in 'rb' mode.
+
+    Returns:
+        Any: bytes for simple/bulk strings, int, None, or a list of replies.
+            Errors inside a list, e.g. in an EXEC reply, are returned as
+            RespError instances so the rest of the list is still read.
+
+    Raises:
+        RespError: If the reply is an error.
+        ConnectionError: If the connection was closed.
+    """
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connection closed by server.")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload
+    if kind == b"-":
+        raise RespError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length == -1:
+            return None
+        data = stream.read(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length == -1:
+            return None
+        return [_read_element(stream) for _ in range(length)]
+    raise RespError(f"Unknown reply type {kind!r}")
+
+
+def _read_element(stream) -> Any:
+    """Reads one element of an array reply, returning an error as a value."""
+    try:
+        return read_reply(stream)
+    except RespError as e:
+        return e
+
+
+class RespClient:
+    """
+    Minimal blocking client for Redis-protocol (RESP2) servers.
+
+    One connection is shared by all threads and guarded by a lock.
+    Subscriptions use their own dedicated connection. Every connection
+    authenticates and selects the database first if the client has them.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        timeout: float = 5.0,
+        username: str | None = None,
+        password: str | None = None,
+        db: int = 0,
+    ):
+        """
+        Args:
+            host (str): Server host.
+            port (int): Server port.
+            timeout (float): Socket timeout in seconds for commands.
+            username (str | None): ACL user to authenticate as, with password.
+            password (str | None): Password sent with AUTH on connect.
+            db (int): Database index selected on connect.
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.username = username
+        self.password = password
+        self.db = db
+        # Reentrant, so exclusive() can hold the connection across calls.
+        self._lock = threading.RLock()
+        self._sock: socket.socket | None = None
+        self._stream = None
+
+    @classmethod
+    def from_url(cls, url: str) -> "RespClient":
+        """
+        Creates a client from a redis://[[user]:password@]host[:port][/db] URL.
+
+        Args:
+            url (str): The server URL.
+
+        Returns:
+            RespClient: The client.
+
+        Raises:
+            ValueError: If the database index is not a number.
+        """
+        parsed = urlparse(url)
+        db = parsed.path.strip("/")
+        if db and not db.isdigit():
+            raise ValueError(f"Invalid database index in {url!r}: {db!r}")
+        return cls(
+            parsed.hostname or "127.0.0.1",
+            parsed.port or 6379,
+            username=unquote(parsed.username) if parsed.username else None,
+            password=unquote(parsed.password) if parsed.password else None,
+            db=int(db or 0),
+        )
+
+    def execute(self, *args: Any) -> Any:
+        """
+        Sends one command and returns its reply.
+
+        Args:
+            *args (Any): Command name and arguments.
+
+        Returns:
+            Any: The decoded reply.
+        """
+        return self.pipeline([args])[0]
+
+    def pipeline(self, commands: list[tuple], reconnect: bool = True) -> list[Any]:
+        """
+        Sends several commands in one round trip.
+
+        A dropped connection is re-established once if the commands could not
+        be sent. Once they have been sent nothing is retried, so a command is
+        never applied twice.
+
+        Args:
+            commands (list[tuple]): Commands as argument tuples.
+            reconnect (bool): Whether to reconnect if the commands could not
+                be sent. Off inside a WATCH, which a new connection drops.
+
+        Returns:
+            list[Any]: One reply per command. Error replies are raised after
+                all replies have been read.
+        """
+        payload = b"".join(encode_command(*command) for command in commands)
+        with self._lock:
+            try:
+                self._send(payload)
+            except OSError:
+                self._disconnect()
+                if not reconnect:
+                    raise
+                self._send(payload)
+            try:
+                return self._read_replies(len(commands))
+            except OSError:
+                self._disconnect()
+                raise
+
+    def transaction(self, commands: list[tuple]) -> list[Any] | None:
+        """
+        Runs commands atomically in a MULTI/EXEC block, in one round trip.
+
+        Call it inside exclusive() after WATCH to make it conditional: the
+        block is discarded if a watched key changed since. The connection is
+        not re-established on failure, as that would drop the WATCH.
+
+        Args:
+            commands (list[tuple]): Commands as argument tuples.
+
+        Returns:
+            list[Any] | None: One reply per command, or None if a watched
+                key changed and nothing was run.
+
+        Raises:
+            RespError: If a command was rejected or failed.
+        """
+        replies = self.pipeline([("MULTI",), *commands, ("EXEC",)], reconnect=False)
+        results = replies[-1]
+        if results is None:
+            return None
+        for result in results:
+            if isinstance(result, RespError):
+                raise result
+        return results
+
+    @contextmanager
+    def exclusive(self) -> Iterator["RespClient"]:
+        """
+        Reserves the command connection for a sequence of calls, e.g. WATCH,
+        GET and a transaction, so other threads cannot interleave commands.
+
+        Yields:
+            RespClient: This client.
+        """
+        with self._lock:
+            yield self
+
+    def subscribe(self, channel: str) -> Iterator[bytes]:
+        """
+        Subscribes to a channel on a dedicated connection.
+
+        Args:
+            channel (str): The channel name.
+
+        Yields:
+            bytes: Each published message payload, until the connection closes.
+        """
+        sock, stream = self._connect()
+        sock.settimeout(None)
+        try:
+            sock.sendall(encode_command("SUBSCRIBE", channel))
+            read_reply(stream)
+            while True:
+                reply = read_reply(stream)
+                if isinstance(reply, list) and reply and reply[0] == b"message":
+                    yield reply[2]
+        finally:
+            stream.close()
+            sock.close()
+
+    def close(self) -> None:
+        """Closes the command connection."""
+        with self._lock:
+            self._disconnect()
+
+    def _send(self, payload: bytes) -> None:
+        """Writes a payload on the shared connection, connecting if needed."""
+        if self._sock is None:
+            self._sock, self._stream = self._connect()
+        self._sock.sendall(payload)
+
+    def _connect(self) -> tuple[socket.socket, Any]:
+        """Opens a connection, authenticated and on the selected database."""
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        stream = sock.makefile("rb")
+        handshake = []
+        if self.password is not None:
+            handshake.append(
+                ("AUTH", self.username, self.password)
+                if self.username
+                else ("AUTH", self.password)
+            )
+        if self.db:
+            handshake.append(("SELECT", self.db))
+        try:
+            if handshake:
+                sock.sendall(b"".join(encode_command(*c) for c in handshake))
+                for _ in handshake:
+                    read_reply(stream)
+        except (OSError, RespError):
+            stream.close()
+            sock.close()
+            raise
+        return sock, stream
+
+    def _read_replies(self, count: int) -> list[Any]:
+        """Reads `count` replies from the shared connection."""
+        replies, error = [], None
+        for _ in range(count):
+            try:
+                replies.append(read_reply(self._stream))
+            except RespError as e:
+                replies.append(None)
+                error = error or e
+        if error:
+            raise error
+        return replies
+
+    def _disconnect(self) -> None:
+        """Drops the shared connection so the next command reconnects."""
+        if self._stream is not None:
+            self._stream.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._stream = None
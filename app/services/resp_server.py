@@ -0,0 +1,413 @@
+"""
+In-memory Redis-protocol server for local development and multi-worker tests.
+
+Implements the subset of commands used by the board backend. It is a
+stand-in, not a database: data lives in one process and is lost on exit.
+
+Run it with:
+
+    python -m app.services.resp_server --port 6390
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from typing import Any
+
+from app.services.resp import encode_command
+
+_OK = b"+OK\r\n"
+
+
+def _bulk(value: bytes | None) -> bytes:
+    """Encodes a bulk string reply."""
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _integer(value: int) -> bytes:
+    """Encodes an integer reply."""
+    return b":%d\r\n" % value
+
+
+def _array(values: list[bytes | None]) -> bytes:
+    """Encodes an array of bulk strings."""
+    return b"*%d\r\n" % len(values) + b"".join(_bulk(v) for v in values)
+
+
+def _error(message: str, code: str = "ERR") -> bytes:
+    """Encodes an error reply."""
+    return b"-%s %s\r\n" % (code.encode(), message.encode())
+
+
+# Commands that change the keys they name: the first argument, or all of
+# them for DEL. Writes bump the key's revision, which fails a WATCH on it.
+_WRITES = {
+    b"SET",
+    b"DEL",
+    b"INCR",
+    b"INCRBY",
+    b"PEXPIRE",
+    b"HSET",
+    b"HSETNX",
+    b"HDEL",
+    b"HINCRBY",
+    b"RPUSH",
+}
+
+
+class _Connection:
+    """Per-connection state: authentication, open transaction and watches."""
+
+    def __init__(self, authenticated: bool):
+        self.authenticated = authenticated
+        # Commands queued since MULTI, or None outside a transaction.
+        self.queued: list[tuple[bytes, list[bytes]]] | None = None
+        # Revisions of the watched keys when WATCH was called.
+        self.watched: dict[bytes, int] = {}
+
+
+class RespServer:
+    """
+    Single-process RESP2 server holding strings, hashes and lists in memory.
+
+    Supported commands: PING, ECHO, GET, SET (NX, PX, EX), DEL, EXISTS,
+    INCR, INCRBY, PEXPIRE, HSET, HSETNX, HGET, HMGET, HDEL, HGETALL,
+    HINCRBY, HLEN, RPUSH, LRANGE, LLEN, PUBLISH, SUBSCRIBE, MULTI, EXEC,
+    DISCARD, WATCH, UNWATCH, AUTH, SELECT (database 0 only), FLUSHDB and
+    QUIT.
+    """
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 6390, password: str | None = None
+    ):
+        """
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on; 0 picks a free port.
+            password (str | None): Password clients must AUTH with first.
+                Defaults to none.
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self._data: dict[bytes, Any] = {}
+        self._expires: dict[bytes, float] = {}
+        self._revisions: dict[bytes, int] = {}
+        self._revision = 0
+        self._subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self._server: asyncio.base_events.Server | None = None
+
+    async def start(self) -> None:
+        """Starts listening; the bound port is stored on `self.port`."""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Starts the server and serves until cancelled."""
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Reads commands from one connection and writes their replies."""
+        connection = _Connection(authenticated=self.password is None)
+        try:
+            while True:
+                command = await self._read_command(reader)
+                if command is None:
+                    break
+                name = command[0].upper()
+                if name == b"QUIT":
+                    writer.write(_OK)
+                    break
+                if name == b"AUTH":
+                    writer.write(self._auth(connection, command[1:]))
+                elif not connection.authenticated:
+                    writer.write(_error("Authentication required.", "NOAUTH"))
+                elif name == b"SUBSCRIBE":
+                    for channel in command[1:]:
+                        self._subscribers.setdefault(channel, set()).add(writer)
+                        writer.write(encode_command("subscribe", channel, 1))
+                else:
+                    writer.write(self._transact(connection, name, command[1:]))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for subscribers in self._subscribers.values():
+                subscribers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> list[bytes] | None:
+        """Reads one command array, or returns None at end of stream."""
+        line = await reader.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.strip().split()
+        args = []
+        for _ in range(int(line[1:-2])):
+            header = await reader.readline()
+            length = int(header[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _auth(self, connection: _Connection, args: list[bytes]) -> bytes:
+        """Checks an AUTH password, optionally preceded by a user name."""
+        if self.password is None:
+            return _error("AUTH called without any password configured.")
+        if not args or args[-1].decode() != self.password:
+            return _error("invalid username-password pair.", "WRONGPASS")
+        connection.authenticated = True
+        return _OK
+
+    def _transact(
+        self, connection: _Connection, name: bytes, args: list[bytes]
+    ) -> bytes:
+        """Runs a command, or queues it inside MULTI, and returns its reply."""
+        if name == b"MULTI":
+            if connection.queued is not None:
+                return _error("MULTI calls can not be nested")
+            connection.queued = []
+            return _OK
+        if name == b"DISCARD":
+            if connection.queued is None:
+                return _error("DISCARD without MULTI")
+            connection.queued = None
+            connection.watched.clear()
+            return _OK
+        if name == b"EXEC":
+            if connection.queued is None:
+                return _error("EXEC without MULTI")
+            queued, connection.queued = connection.queued, None
+            changed = any(
+                self._touched(key) != revision
+                for key, revision in connection.watched.items()
+            )
+            connection.watched.clear()
+            if changed:
+                return b"*-1\r\n"
+            replies = [self._execute(*command) for command in queued]
+            return b"*%d\r\n" % len(replies) + b"".join(replies)
+        if connection.queued is not None:
+            if name in (b"WATCH", b"UNWATCH"):
+                return _error(f"{name.decode()} inside MULTI is not allowed")
+            connection.queued.append((name, args))
+            return b"+QUEUED\r\n"
+        if name == b"WATCH":
+            for key in args:
+                connection.watched.setdefault(key, self._touched(key))
+            return _OK
+        if name == b"UNWATCH":
+            connection.watched.clear()
+            return _OK
+        return self._execute(name, args)
+
+    def _touched(self, key: bytes) -> int:
+        """Returns the revision of a key's last change, expiry included."""
+        self._get(key)
+        return self._revisions.get(key, 0)
+
+    def _touch(self, key: bytes) -> None:
+        """Records a change to a key, failing transactions watching it."""
+        self._revision += 1
+        self._revisions[key] = self._revision
+
+    def _get(self, key: bytes, default: Any = None) -> Any:
+        """Returns a key's value, dropping it first if it has expired."""
+        expires = self._expires.get(key)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(key, None)
+            del self._expires[key]
+            self._touch(key)
+        return self._data.get(key, default)
+
+    def _execute(self, name: bytes, args: list[bytes]) -> bytes:
+        """Runs one non-subscription command and returns its encoded reply."""
+        handler = getattr(self, f"_cmd_{name.decode().lower()}", None)
+        if handler is None:
+            return _error(f"unknown command '{name.decode()}'")
+        try:
+            reply = handler(*args)
+        except (TypeError, ValueError) as e:
+            return _error(str(e))
+        # A SET NX on an existing key writes nothing and replies nil.
+        if name in _WRITES and reply != _bulk(None):
+            for key in args if name == b"DEL" else args[:1]:
+                self._touch(key)
+        return reply
+
+    def _cmd_ping(self, *args: bytes) -> bytes:
+        return _bulk(args[0]) if args else b"+PONG\r\n"
+
+    def _cmd_echo(self, value: bytes) -> bytes:
+        return _bulk(value)
+
+    def _cmd_select(self, index: bytes) -> bytes:
+        if int(index) != 0:
+            return _error("DB index is out of range")
+        return _OK
+
+    def _cmd_flushdb(self) -> bytes:
+        for key in self._data:
+            self._touch(key)
+        self._data.clear()
+        self._expires.clear()
+        return _OK
+
+    def _cmd_get(self, key: bytes) -> bytes:
+        return _bulk(self._get(key))
+
+    def _cmd_set(self, key: bytes, value: bytes, *options: bytes) -> bytes:
+        options = [o.upper() for o in options]
+        if b"NX" in options and self._get(key) is not None:
+            return _bulk(None)
+        self._data[key] = value
+        self._expires.pop(key, None)
+        for unit, scale in ((b"PX", 0.001), (b"EX", 1.0)):
+            if unit in options:
+                ttl = int(options[options.index(unit) + 1]) * scale
+                self._expires[key] = time.monotonic() + ttl
+        return _OK
+
+    def _cmd_del(self, *keys: bytes) -> bytes:
+        removed = 0
+        for key in keys:
+            if self._get(key) is not None:
+                del self._data[key]
+                self._expires.pop(key, None)
+                removed += 1
+        return _integer(removed)
+
+    def _cmd_exists(self, *keys: bytes) -> bytes:
+        return _integer(sum(self._get(key) is not None for key in keys))
+
+    def _cmd_pexpire(self, key: bytes, milliseconds: bytes) -> bytes:
+        if self._get(key) is None:
+            return _integer(0)
+        self._expires[key] = time.monotonic() + int(milliseconds) / 1000
+        return _integer(1)
+
+    def _cmd_incr(self, key: bytes) -> bytes:
+        return self._cmd_incrby(key, b"1")
+
+    def _cmd_incrby(self, key: bytes, amount: bytes) -> bytes:
+        value = int(self._get(key, b"0")) + int(amount)
+        self._data[key] = str(value).encode()
+        return _integer(value)
+
+    def _hash(self, key: bytes) -> dict[bytes, bytes]:
+        """Returns the hash stored at key, creating it if missing."""
+        value = self._get(key)
+        if value is None:
+            value = self._data[key] = {}
+        return value
+
+    def _cmd_hset(self, key: bytes, *pairs: bytes) -> bytes:
+        table = self._hash(key)
+        added = 0
+        for field, value in zip(pairs[::2], pairs[1::2]):
+            added += field not in table
+            table[field] = value
+        return _integer(added)
+
+    def _cmd_hsetnx(self, key: bytes, field: bytes, value: bytes) -> bytes:
+        table = self._hash(key)
+        if field in table:
+            return _integer(0)
+        table[field] = value
+        return _integer(1)
+
+    def _cmd_hget(self, key: bytes, field: bytes) -> bytes:
+        return _bulk(self._get(key, {}).get(field))
+
+    def _cmd_hmget(self, key: bytes, *fields: bytes) -> bytes:
+        table = self._get(key, {})
+        return _array([table.get(field) for field in fields])
+
+    def _cmd_hdel(self, key: bytes, *fields: bytes) -> bytes:
+        table = self._get(key, {})
+        return _integer(sum(table.pop(field, None) is not None for field in fields))
+
+    def _cmd_hgetall(self, key: bytes) -> bytes:
+        table = self._get(key, {})
+        return _array([item for pair in table.items() for item in pair])
+
+    def _cmd_hincrby(self, key: bytes, field: bytes, amount: bytes) -> bytes:
+        table = self._hash(key)
+        value = int(table.get(field, b"0")) + int(amount)
+        table[field] = str(value).encode()
+        return _integer(value)
+
+    def _cmd_hlen(self, key: bytes) -> bytes:
+        return _integer(len(self._get(key, {})))
+
+    def _cmd_rpush(self, key: bytes, *values: bytes) -> bytes:
+        items = self._get(key)
+        if items is None:
+            items = self._data[key] = []
+        items.extend(values)
+        return _integer(len(items))
+
+    def _cmd_lrange(self, key: bytes, start: bytes, stop: bytes) -> bytes:
+        items = self._get(key, [])
+        start, stop = int(start), int(stop)
+        stop = len(items) if stop == -1 else stop + 1
+        return _array(items[start:stop])
+
+    def _cmd_llen(self, key: bytes) -> bytes:
+        return _integer(len(self._get(key, [])))
+
+    def _cmd_publish(self, channel: bytes, message: bytes) -> bytes:
+        subscribers = self._subscribers.get(channel, set())
+        frame = encode_command("message", channel, message)
+        for writer in list(subscribers):
+            writer.write(frame)
+        return _integer(len(subscribers))
+
+
+def start_in_thread(
+    host: str = "127.0.0.1", port: int = 0, password: str | None = None
+) -> RespServer:
+    """
+    Starts a stand-in server on a daemon thread, e.g. for local tests.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on; 0 picks a free port.
+        password (str | None): Password clients must AUTH with first.
+
+    Returns:
+        RespServer: The running server; its bound port is `server.port`.
+    """
+    server = RespServer(host, port, password)
+    ready = threading.Event()
+
+    def run() -> None:
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(server.start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, name="resp-server", daemon=True).start()
+    ready.wait()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6390)
+    parser.add_argument("--password", default=None)
+    options = parser.parse_args()
+    server = RespServer(options.host, options.port, options.password)
+    print(f"Listening on redis://{options.host}:{options.port}")
+    asyncio.run(server.serve_forever())
@@ -0,0 +1,94 @@
+from bisect import bisect_left, insort
+
+from app.models import ForcedReview, StateTransitionLog
+
+REVIEW_STATUSES = {
+    "pending": "Pending",
+    "claimed": "Claimed",
+    "approved": "Approved",
+    "rejected": "Rejected",
+}
+# Statuses still waiting for a decision.
+OPEN_REVIEW_STATUSES = ("pending", "claimed")
+
+
+class ForcedReviewIndex:
+    """
+    Reviews of forced transitions, indexed by review status.
+
+    Only forced logs are indexed, and each status keeps the log IDs of its
+    reviews in a sorted list, so the pending queue is read oldest first in
+    O(k) for a page of k and counted in O(1) however long the transition
+    log grows. A status change moves one ID between lists by binary search.
+    """
+
+    def __init__(self):
+        self._reviews: dict[int, ForcedReview] = {}
+        self._queues: dict[str, list[int]] = {status: [] for status in REVIEW_STATUSES}
+
+    def __len__(self) -> int:
+        return len(self._reviews)
+
+    def add_log(self, log: StateTransitionLog) -> None:
+        """
+        Queues a forced log for review. Other logs are ignored, as are logs
+        that already have a review.
+
+        Args:
+            log (StateTransitionLog): The log.
+        """
+        if log.is_forced_transition and log.id not in self._reviews:
+            self.put(ForcedReview(log_id=log.id))
+
+    def put(self, review: ForcedReview) -> None:
+        """
+        Stores a review, replacing any earlier one for the same log.
+
+        Args:
+            review (ForcedReview): The review.
+        """
+        previous = self._reviews.get(review.log_id)
+        if previous is not None:
+            queue = self._queues[previous.status]
+            del queue[bisect_left(queue, review.log_id)]
+        self._reviews[review.log_id] = review
+        insort(self._queues[review.status], review.log_id)
+
+    def get(self, log_id: int) -> ForcedReview | None:
+        """
+        Returns the review of a log.
+
+        Args:
+            log_id (int): ID of the forced log.
+
+        Returns:
+            ForcedReview | None: The review, or None if the log is not forced.
+        """
+        return self._reviews.get(log_id)
+
+    def page(
+        self, status: str, offset: int = 0, limit: int | None = None
+    ) -> list[ForcedReview]:
+        """
+        Returns reviews in one status, oldest transition first.
+
+        Args:
+            status (str): One of REVIEW_STATUSES.
+            offset (int): Reviews to skip.
+            limit (int | None): Maximum number of reviews, or None for all.
+
+        Returns:
+            list[ForcedReview]: The reviews.
+        """
+        queue = self._queues[status]
+        stop = len(queue) if limit is None else offset + limit
+        return [self._reviews[log_id] for log_id in queue[offset:stop]]
+
+    def counts(self) -> dict[str, int]:
+        """
+        Returns the number of reviews in each status.
+
+        Returns:
+            dict[str, int]: Status to count, for every status.
+        """
+        return {status: len(queue) for status, queue in self._queues.items()}
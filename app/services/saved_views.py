@@ -0,0 +1,397 @@
+import fcntl
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+
+from app.models import SavedView, Stock
+from app.services.board_backend import BoardChange
+from app.services.board_store import BoardStore, get_board_store
+from app.services.boards import DEFAULT_BOARD_ID, default_board_id
+
+logger = logging.getLogger(__name__)
+
+# Days in a stage after which a stock counts as stale.
+STALE_DAYS = 30
+VIEW_SORTS = {
+    "board": "Board order",
+    "ticker": "Ticker",
+    "days_in_stage": "Days in stage",
+    "last_updated": "Last updated",
+}
+
+
+class SavedViewError(ValueError):
+    """Raised when a saved view is invalid or not visible to the user."""
+
+
+def _updated_at(stock: Stock) -> float:
+    """Returns when a stock last changed as a POSIX timestamp, 0 if unknown."""
+    moment = stock.last_updated or stock.current_stage_entered_at
+    return moment.timestamp() if moment else 0.0
+
+
+class SavedViewStore:
+    """
+    Saved view definitions, optionally persisted to a JSON file.
+
+    Writes hold an exclusive flock on a sidecar lock file and replace the
+    file atomically. Readers reload it whenever its modification time
+    changes, so views saved on one worker show up on the others.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """
+        Args:
+            path (Path | None): Location of the JSON file, or None to keep
+                views in memory only.
+        """
+        self.path = Path(path) if path is not None else None
+        self._views: dict[str, SavedView] = {}
+        self._mtime: float | None = None
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def all(self) -> list[SavedView]:
+        """
+        Returns every saved view.
+
+        Returns:
+            list[SavedView]: The views in the order they were saved.
+        """
+        with self._lock:
+            self._refresh()
+            return list(self._views.values())
+
+    def put(self, view: SavedView) -> None:
+        """
+        Adds or replaces a view.
+
+        Args:
+            view (SavedView): The view, keyed by its ID.
+        """
+        with self._lock, self._file_lock():
+            self._refresh()
+            self._views[view.id] = view
+            self._write()
+
+    def remove(self, view_id: str) -> SavedView | None:
+        """
+        Deletes a view.
+
+        Args:
+            view_id (str): ID of the view.
+
+        Returns:
+            SavedView | None: The deleted view, or None if it did not exist.
+        """
+        with self._lock, self._file_lock():
+            self._refresh()
+            view = self._views.pop(view_id, None)
+            if view is not None:
+                self._write()
+            return view
+
+    def _file_lock(self):
+        """Returns a context manager holding the cross-process write lock."""
+        return _FileLock(self.path.with_suffix(".lock") if self.path else None)
+
+    def _refresh(self) -> None:
+        """Reloads the views if the file changed since it was last read."""
+        if self.path is None:
+            return
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            rows = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            logger.exception("Could not read saved views from %s", self.path)
+            return
+        self._views = {row["id"]: SavedView(**row) for row in rows}
+        self._mtime = mtime
+
+    def _write(self) -> None:
+        """Durably replaces the views file."""
+        if self.path is None:
+            return
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump([view.dict() for view in self._views.values()], f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._mtime = self.path.stat().st_mtime
+
+
+class _FileLock:
+    """Exclusive flock on a file for the duration of a with block."""
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        if self.path is not None:
+            self._file = open(self.path, "a")
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+class SavedViews:
+    """
+    Saved views with a materialized result set per view.
+
+    Each view's matching stock IDs are kept up to date from board change
+    notifications: only the stocks a change touched are re-evaluated, so
+    opening a view costs O(result) rather than a scan of the board.
+
+    Staleness depends on the clock rather than on board changes, so it is
+    not part of the materialized set; stale-only views drop fresh stocks
+    when their results are read.
+    """
+
+    def __init__(self, store: BoardStore, views: SavedViewStore | None = None):
+        """
+        Args:
+            store (BoardStore): The board the views filter.
+            views (SavedViewStore | None): Where view definitions are kept.
+                Defaults to an in-memory store.
+        """
+        self.store = store
+        self.views = views or SavedViewStore()
+        self._lock = threading.Lock()
+        self._members: dict[str, set[int]] = {}
+        self._definitions: dict[str, SavedView] = {}
+        store.add_listener(self._on_board_change)
+
+    def visible_to(self, user: str) -> list[SavedView]:
+        """
+        Returns the views a user can open: their own and shared ones.
+
+        Args:
+            user (str): The user.
+
+        Returns:
+            list[SavedView]: The views, own views first.
+        """
+        views = [v for v in self.views.all() if v.owner == user or v.shared]
+        return sorted(views, key=lambda v: v.owner != user)
+
+    def get(self, view_id: str, user: str) -> SavedView:
+        """
+        Looks up a view the user is allowed to open.
+
+        Args:
+            view_id (str): ID of the view.
+            user (str): The user opening it.
+
+        Returns:
+            SavedView: The view.
+
+        Raises:
+            SavedViewError: If the view does not exist or is private to
+                another user.
+        """
+        for view in self.views.all():
+            if view.id == view_id and (view.owner == user or view.shared):
+                return view
+        raise SavedViewError("Saved view not found.")
+
+    def save(self, view: SavedView) -> SavedView:
+        """
+        Creates a view, or updates one the user owns.
+
+        Args:
+            view (SavedView): The definition. An empty ID creates a new view.
+
+        Returns:
+            SavedView: The stored view.
+
+        Raises:
+            SavedViewError: If the name, stages or sort are invalid, or the
+                view belongs to another user.
+        """
+        if not view.name.strip():
+            raise SavedViewError("A saved view needs a name.")
+        unknown = set(view.stages) - set(self.store.stage_names)
+        if unknown:
+            raise SavedViewError(f"Invalid stage: {min(unknown)}")
+        if view.sort not in VIEW_SORTS:
+            raise SavedViewError(f"Invalid sort order: {view.sort}")
+        view = view.copy(update={"name": view.name.strip()})
+        if view.id:
+            existing = self.get(view.id, view.owner)
+            if existing.owner != view.owner:
+                raise SavedViewError("Only the owner can change a saved view.")
+        else:
+            view.id = uuid.uuid4().hex
+        self.views.put(view)
+        return view
+
+    def delete(self, view_id: str, user: str) -> None:
+        """
+        Deletes a view the user owns.
+
+        Args:
+            view_id (str): ID of the view.
+            user (str): The user deleting it.
+
+        Raises:
+            SavedViewError: If the view does not exist or belongs to another user.
+        """
+        if self.get(view_id, user).owner != user:
+            raise SavedViewError("Only the owner can delete a saved view.")
+        self.views.remove(view_id)
+        with self._lock:
+            self._members.pop(view_id, None)
+            self._definitions.pop(view_id, None)
+
+    def stock_ids(self, view: SavedView) -> list[int]:
+        """
+        Returns the IDs of the stocks a view shows, in its sort order.
+
+        Args:
+            view (SavedView): The view.
+
+        Returns:
+            list[int]: The matching stock IDs.
+        """
+        return [stock.id for stock in self.stocks(view)]
+
+    def stocks(self, view: SavedView) -> list[Stock]:
+        """
+        Returns the stocks a view shows, in its sort order.
+
+        Args:
+            view (SavedView): The view.
+
+        Returns:
+            list[Stock]: Copies of the matching stocks.
+        """
+        with self._lock:
+            members = self._materialize(view)
+            stock_ids = sorted(members)
+        stocks = self.store.get_stocks(stock_ids)
+        if view.stale_only:
+            stocks = [s for s in stocks if s.days_in_stage > STALE_DAYS]
+        if view.sort == "ticker":
+            stocks.sort(key=lambda s: s.ticker)
+        elif view.sort == "days_in_stage":
+            stocks.sort(key=lambda s: s.days_in_stage, reverse=True)
+        elif view.sort == "last_updated":
+            stocks.sort(key=_updated_at, reverse=True)
+        return stocks
+
+    def _materialize(self, view: SavedView) -> set[int]:
+        """
+        Returns a view's member set, building it if the view is new or its
+        definition changed. Must be called with the lock held.
+        """
+        members = self._members.get(view.id)
+        if members is None or self._definitions.get(view.id) != view:
+            members = {
+                stock.id for stock in self.store.stocks() if self._matches(view, stock)
+            }
+            self._members[view.id] = members
+            self._definitions[view.id] = view
+        return members
+
+    def _matches(self, view: SavedView, stock: Stock) -> bool:
+        """Returns whether a stock meets a view's clock-independent criteria."""
+        if view.stages and stock.status not in view.stages:
+            return False
+        if view.forced_only and not stock.is_forced:
+            return False
+        if view.query:
+            query = view.query.lower()
+            if query not in stock.ticker.lower() and (
+                query not in stock.company_name.lower()
+            ):
+                return False
+        if view.moved_by:
+            log = (
+                self.store.get_log(stock.last_log_id)
+                if stock.last_log_id is not None
+                else None
+            )
+            if log is None or log.updated_by != view.moved_by:
+                return False
+        return True
+
+    def _on_board_change(self, change: BoardChange | None) -> None:
+        """
+        Re-evaluates the stocks a change touched against every built view.
+
+        The current copy of each stock is read back from the store, so
+        notifications handled out of order still leave the sets correct.
+        A whole-board reload drops every set; they are rebuilt on next use.
+        """
+        with self._lock:
+            if change is None:
+                self._members.clear()
+                return
+            if not self._members:
+                return
+            deleted = {stock.id for stock in change.deleted}
+            touched = [stock.id for stock in change.stocks if stock.id not in deleted]
+            current = self.store.get_stocks(touched)
+            missing = set(touched) - {stock.id for stock in current}
+            for view_id, members in self._members.items():
+                view = self._definitions[view_id]
+                members.difference_update(deleted)
+                members.difference_update(missing)
+                for stock in current:
+                    if self._matches(view, stock):
+                        members.add(stock.id)
+                    else:
+                        members.discard(stock.id)
+
+
+_saved_views: dict[str, SavedViews] = {}
+_saved_views_lock = threading.Lock()
+
+
+def get_saved_views(board_id: str | None = None) -> SavedViews:
+    """
+    Returns the process-wide saved views of a board.
+
+    Views are stored under KANBAN_DATA_DIR (default '.kanban'), in
+    saved_views.json for the default board and saved_views.<board ID>.json
+    for the others.
+
+    Args:
+        board_id (str | None): ID of the board. Defaults to the default
+            board.
+
+    Returns:
+        SavedViews: The saved views.
+    """
+    board_id = board_id or default_board_id()
+    views = _saved_views.get(board_id)
+    if views is None:
+        with _saved_views_lock:
+            views = _saved_views.get(board_id)
+            if views is None:
+                data_dir = Path(os.getenv("KANBAN_DATA_DIR", ".kanban"))
+                name = (
+                    "saved_views.json"
+                    if board_id == DEFAULT_BOARD_ID
+                    else f"saved_views.{board_id}.json"
+                )
+                views = _saved_views[board_id] = SavedViews(
+                    get_board_store(board_id), SavedViewStore(data_dir / name)
+                )
+    return views
@@ -0,0 +1,162 @@
+import fcntl
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class SequenceStore(ABC):
+    """
+    Durable record of how far each ID sequence has been handed out.
+
+    The store only tracks a high-water mark per sequence. Workers reserve
+    whole blocks from it and hand IDs out of their block locally, so the
+    shared store is touched once per block rather than once per ID.
+    """
+
+    @abstractmethod
+    def reserve(self, name: str, count: int) -> int:
+        """
+        Atomically advances a sequence's high-water mark.
+
+        Args:
+            name (str): The sequence name, e.g. 'stock' or 'log'.
+            count (int): Number of IDs to reserve.
+
+        Returns:
+            int: The first ID of the reserved block [first, first + count).
+        """
+
+
+class MemorySequenceStore(SequenceStore):
+    """Sequence store for a single process that does not survive restarts."""
+
+    def __init__(self):
+        self._next: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, name: str, count: int) -> int:
+        with self._lock:
+            first = self._next.get(name, 1)
+            self._next[name] = first + count
+            return first
+
+
+class FileSequenceStore(SequenceStore):
+    """
+    Sequence store persisted to a JSON file.
+
+    Reservations hold an exclusive flock on a sidecar lock file, so workers
+    on the same host never receive overlapping blocks. The new high-water
+    mark is written to a temporary file, fsynced and renamed into place
+    before the block is returned, so an ID is never handed out twice even
+    across crashes.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): Location of the JSON high-water-mark file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+        self._lock = threading.Lock()
+
+    def reserve(self, name: str, count: int) -> int:
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                marks = self._read()
+                first = int(marks.get(name, 1))
+                marks[name] = first + count
+                self._write(marks)
+                return first
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, int]:
+        """Reads the current high-water marks, or none if the file is new."""
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, marks: dict[str, int]) -> None:
+        """Durably replaces the high-water-mark file."""
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(marks, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class IdSequence:
+    """
+    Per-worker source of unique IDs backed by leased blocks.
+
+    IDs are handed out in increasing order from the current block; when it
+    runs out a new block is leased from the sequence store. IDs left in a
+    block when the worker exits are never reused, which leaves gaps but
+    keeps every ID unique across workers and restarts.
+    """
+
+    def __init__(self, store: SequenceStore, name: str, block_size: int = 1000):
+        """
+        Args:
+            store (SequenceStore): Where blocks are leased from.
+            name (str): The sequence name.
+            block_size (int): Number of IDs leased at a time.
+        """
+        self.store = store
+        self.name = name
+        self.block_size = block_size
+        self._next = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        """
+        Returns the next unused ID, leasing a new block if needed.
+
+        Returns:
+            int: A unique ID.
+        """
+        with self._lock:
+            if self._next >= self._end:
+                self._next = self.store.reserve(self.name, self.block_size)
+                self._end = self._next + self.block_size
+            value = self._next
+            self._next += 1
+            return value
+
+    def lease(self, count: int) -> range:
+        """
+        Leases a contiguous block of IDs in one call, e.g. for a bulk import.
+
+        The block is reserved directly from the store and does not disturb
+        the worker's current block.
+
+        Args:
+            count (int): Number of IDs needed.
+
+        Returns:
+            range: The leased IDs.
+        """
+        if count <= 0:
+            return range(0)
+        first = self.store.reserve(self.name, count)
+        return range(first, first + count)
+
+
+def default_sequence_store() -> SequenceStore:
+    """
+    Returns the sequence store configured for this deployment.
+
+    Returns:
+        SequenceStore: A file store under KANBAN_DATA_DIR (default '.kanban').
+    """
+    data_dir = Path(os.getenv("KANBAN_DATA_DIR", ".kanban"))
+    return FileSequenceStore(data_dir / "sequences.json")
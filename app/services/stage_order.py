@@ -0,0 +1,133 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Container
+
+from app.models import Stock
+
+STAGE_SORTS = {
+    "board": "Board order",
+    "days_in_stage": "Days in stage",
+    "last_updated": "Last updated",
+    "ticker": "Ticker",
+    "forced_first": "Forced first",
+}
+# Pushes forced stocks ahead of every real timestamp in the forced_first order.
+FORCED_OFFSET = 1e12
+
+
+def _timestamp(stock: Stock, recent: bool = False) -> float:
+    """Returns the stock's stage entry (or last update) as a POSIX timestamp."""
+    moment = stock.current_stage_entered_at
+    if recent:
+        moment = stock.last_updated or moment
+    return moment.timestamp() if moment else 0.0
+
+
+def stage_sort_key(sort: str, stock: Stock) -> float | str:
+    """
+    Returns a stock's key in a sort order; smaller keys come first.
+
+    Args:
+        sort (str): One of STAGE_SORTS other than 'board'.
+        stock (Stock): The stock.
+
+    Returns:
+        float | str: The key.
+
+    Raises:
+        ValueError: If the sort order is unknown.
+    """
+    if sort == "days_in_stage":
+        return _timestamp(stock)
+    if sort == "last_updated":
+        return -_timestamp(stock, recent=True)
+    if sort == "ticker":
+        return stock.ticker
+    if sort == "forced_first":
+        return _timestamp(stock) - (FORCED_OFFSET if stock.is_forced else 0.0)
+    raise ValueError(f"Invalid sort order: {sort}")
+
+
+class SortedStageIndex:
+    """
+    One stage's stock IDs kept in one sort order.
+
+    Keys and IDs are held in parallel lists; inserts and removals find their
+    position by binary search, so a move re-positions a stock in O(log n)
+    comparisons instead of re-sorting the stage. Equal keys keep insertion
+    order.
+    """
+
+    def __init__(self, sort: str, stocks: list[Stock] = ()):
+        """
+        Args:
+            sort (str): The sort order.
+            stocks (list[Stock]): The stage's stocks at creation time.
+        """
+        self.sort = sort
+        entries = sorted(
+            ((stage_sort_key(sort, stock), stock.id) for stock in stocks),
+            key=lambda entry: entry[0],
+        )
+        self._keys = [key for key, _ in entries]
+        self._ids = [stock_id for _, stock_id in entries]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, stock: Stock) -> None:
+        """
+        Inserts a stock at its sorted position.
+
+        Args:
+            stock (Stock): The stock, as it is now stored.
+        """
+        key = stage_sort_key(self.sort, stock)
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._ids.insert(position, stock.id)
+
+    def remove(self, stock: Stock) -> None:
+        """
+        Removes a stock. Must be given the stock as it was when added.
+
+        Args:
+            stock (Stock): The stock.
+        """
+        key = stage_sort_key(self.sort, stock)
+        position = bisect_left(self._keys, key)
+        while position < len(self._keys) and self._keys[position] == key:
+            if self._ids[position] == stock.id:
+                del self._keys[position]
+                del self._ids[position]
+                return
+            position += 1
+
+    def window(
+        self, offset: int, limit: int, include: Container[int] | None = None
+    ) -> list[int]:
+        """
+        Returns a slice of the ordered IDs.
+
+        Args:
+            offset (int): Matching IDs to skip.
+            limit (int): Maximum number of IDs to return.
+            include (Container[int] | None): Only IDs in here count, e.g. a
+                session's filtered stocks. The scan stops once the window is
+                full, so cost follows the window rather than the stage.
+
+        Returns:
+            list[int]: The IDs in order.
+        """
+        if include is None:
+            return self._ids[offset : offset + limit]
+        result = []
+        for stock_id in self._ids:
+            if stock_id not in include:
+                continue
+            if offset:
+                offset -= 1
+                continue
+            if len(result) >= limit:
+                break
+            result.append(stock_id)
+        return result
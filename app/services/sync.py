@@ -0,0 +1,201 @@
+import logging
+from typing import Any
+
+from app.models import parse_effective_timestamp
+from app.services import commands
+from app.services.board_store import BoardStore, get_board_store
+from app.services.idempotency import IdempotentOutcome, idempotency_cache
+
+SYNC_BATCH_MAX_ITEMS = 500
+
+
+class SyncBatchError(ValueError):
+    """Raised when a sync batch is malformed as a whole and cannot be applied."""
+
+
+def apply_sync_batch(
+    items: list[dict[str, Any]], store: BoardStore | None = None
+) -> list[dict[str, Any]]:
+    """
+    Applies a batch of moves and creates queued by an offline client.
+
+    Items are applied strictly in order, each with its original effective
+    timestamp, and each is validated against the transition rules exactly
+    like a drop in the UI. A rejected item does not stop the batch.
+
+    Items look like:
+        {"type": "create", "idempotency_key": "...", "client_ref": "tmp-1",
+         "ticker": "ABC", "company_name": "ABC Corp", "stage": "Universe",
+         "effective_at": "2024-05-01T09:30:00+00:00"}
+        {"type": "move", "idempotency_key": "...", "stock_id": 3,
+         "new_stage": "Outreach", "user": "Analyst A", "comment": "...",
+         "force": false, "rationale": "", "effective_at": "..."}
+
+    A move may reference a stock created earlier in the same batch with
+    "stock_ref" set to that create's "client_ref".
+
+    Args:
+        items (list[dict]): The queued items in client order.
+        store (BoardStore | None): The board to apply to. Defaults to the
+            default board.
+
+    Returns:
+        list[dict]: One result per item with its status ('applied', 'replayed',
+            'skipped' or 'rejected'), message and resulting stock/log IDs.
+
+    Raises:
+        SyncBatchError: If the batch is not a list or exceeds the size limit.
+    """
+    if not isinstance(items, list):
+        raise SyncBatchError("Items must be a list.")
+    if len(items) > SYNC_BATCH_MAX_ITEMS:
+        raise SyncBatchError(
+            f"Batch of {len(items)} items exceeds the limit of {SYNC_BATCH_MAX_ITEMS}."
+        )
+    store = store or get_board_store()
+    refs: dict[str, int] = {}
+    results = [
+        _apply_item(store, index, item, refs) for index, item in enumerate(items)
+    ]
+    logging.info(
+        "Applied sync batch of %d items (%d applied)",
+        len(items),
+        sum(1 for r in results if r["status"] == "applied"),
+    )
+    return results
+
+
+def _apply_item(
+    store: BoardStore, index: int, item: Any, refs: dict[str, int]
+) -> dict[str, Any]:
+    """
+    Applies a single queued item and shapes its result.
+
+    Args:
+        store (BoardStore): The board to apply the item to.
+        index (int): Position of the item in the batch.
+        item (Any): The raw item payload.
+        refs (dict[str, int]): Client refs of stocks created earlier in the batch.
+
+    Returns:
+        dict: The per-item result.
+    """
+    if not isinstance(item, dict):
+        return _result(
+            index,
+            {},
+            IdempotentOutcome(
+                ok=False, level="error", message="Item must be an object."
+            ),
+            "rejected",
+        )
+    key = str(item.get("idempotency_key") or "")
+    user = str(item.get("user") or "System")
+    outcome = idempotency_cache.get(user, key, store.backend)
+    replayed = outcome is not None
+    if outcome is None:
+        try:
+            outcome = _apply_fresh_item(store, item, user, refs)
+        except (KeyError, TypeError, ValueError) as e:
+            return _result(
+                index,
+                item,
+                IdempotentOutcome(
+                    ok=False, level="error", message=f"Malformed item: {e}"
+                ),
+                "rejected",
+            )
+        idempotency_cache.put(user, key, outcome, store.backend)
+    if item.get("type") == "create" and item.get("client_ref") and outcome.stock_id:
+        refs[str(item["client_ref"])] = outcome.stock_id
+    if replayed:
+        status = "replayed"
+    elif outcome.ok:
+        status = "applied"
+    elif outcome.level == "info":
+        status = "skipped"
+    else:
+        status = "rejected"
+    return _result(index, item, outcome, status)
+
+
+def _apply_fresh_item(
+    store: BoardStore, item: dict[str, Any], user: str, refs: dict[str, int]
+) -> IdempotentOutcome:
+    """
+    Validates and applies an item that has not been seen before.
+
+    Args:
+        store (BoardStore): The board to apply the item to.
+        item (dict): The item payload.
+        user (str): The user that queued the item.
+        refs (dict[str, int]): Client refs of stocks created earlier in the batch.
+
+    Returns:
+        IdempotentOutcome: The result of applying the item.
+
+    Raises:
+        KeyError, TypeError, ValueError: If required fields are missing or invalid.
+    """
+    effective_at = str(item.get("effective_at") or "")
+    effective_time = parse_effective_timestamp(effective_at) if effective_at else None
+    kind = item.get("type")
+    if kind == "create":
+        return commands.create_stock(
+            store,
+            str(item["ticker"]),
+            str(item["company_name"]),
+            str(item.get("stage") or store.stage_names[0]),
+            effective_time=effective_time,
+        )
+    if kind != "move":
+        return IdempotentOutcome(
+            ok=False, level="error", message=f"Unknown item type: {kind!r}."
+        )
+    if item.get("stock_id") is None and item.get("stock_ref") is not None:
+        stock_id = refs.get(str(item["stock_ref"]))
+        if stock_id is None:
+            return IdempotentOutcome(
+                ok=False,
+                level="error",
+                message=f"Unknown stock_ref {item['stock_ref']!r}.",
+            )
+    else:
+        stock_id = int(item["stock_id"])
+    return commands.validated_move(
+        store,
+        stock_id,
+        str(item["new_stage"]),
+        str(item.get("comment") or ""),
+        user,
+        force=bool(item.get("force")),
+        rationale=str(item.get("rationale") or ""),
+        effective_time=effective_time,
+    )
+
+
+def _result(
+    index: int, item: dict[str, Any], outcome: IdempotentOutcome, status: str
+) -> dict[str, Any]:
+    """
+    Shapes the JSON result for one batch item.
+
+    Args:
+        index (int): Position of the item in the batch.
+        item (dict): The item payload.
+        outcome (IdempotentOutcome): The outcome of the item.
+        status (str): The result status.
+
+    Returns:
+        dict: The per-item result.
+    """
+    return {
+        "index": index,
+        "type": item.get("type"),
+        "idempotency_key": item.get("idempotency_key"),
+        "status": status,
+        "ok": outcome.ok,
+        "message": outcome.message,
+        "stock_id": outcome.stock_id,
+        "log_id": outcome.log_id,
+    }
@@ -0,0 +1,135 @@
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from app.models import StateTransitionLog, get_utc_now
+
+
+def month_index(moment: datetime) -> int:
+    """
+    Months since year 0, so consecutive months have consecutive indexes.
+
+    Args:
+        moment (datetime): The moment to bucket.
+
+    Returns:
+        int: The month index.
+    """
+    return moment.year * 12 + moment.month - 1
+
+
+class TransitionCounts:
+    """
+    Pre-aggregated transition counts maintained as logs are appended.
+
+    Counts live in one array indexed by (from_stage, to_stage, forced, user,
+    month). Recording a log is a single increment; the user and month axes
+    grow by doubling when a new user or an out-of-range month appears.
+    Initial creations (from 'VOID') are not stage-to-stage moves and are
+    skipped.
+    """
+
+    def __init__(self, stage_names: list[str]):
+        """
+        Args:
+            stage_names (list[str]): Stages in pipeline order; axis order follows it.
+        """
+        self.stage_names = list(stage_names)
+        self.stage_codes = {name: code for code, name in enumerate(stage_names)}
+        self.user_codes: dict[str, int] = {}
+        self.first_month: int | None = None
+        self._lock = threading.Lock()
+        stages = len(stage_names)
+        self._counts = np.zeros((stages, stages, 2, 4, 12), dtype=np.int64)
+
+    def add(self, log: StateTransitionLog) -> None:
+        """
+        Records one transition log.
+
+        Args:
+            log (StateTransitionLog): The appended log.
+        """
+        source = self.stage_codes.get(log.previous_stage)
+        target = self.stage_codes.get(log.new_stage)
+        if source is None or target is None:
+            return
+        month = month_index(log.timestamp or get_utc_now())
+        with self._lock:
+            user = self.user_codes.get(log.updated_by)
+            if user is None:
+                user = self.user_codes[log.updated_by] = len(self.user_codes)
+            if self.first_month is None:
+                self.first_month = month
+            if month < self.first_month:
+                self._grow_months_before(self.first_month - month)
+                self.first_month = month
+            self._ensure_shape(user + 1, month - self.first_month + 1)
+            self._counts[
+                source,
+                target,
+                int(log.is_forced_transition),
+                user,
+                month - self.first_month,
+            ] += 1
+
+    def _ensure_shape(self, users: int, months: int) -> None:
+        """Grows the user and month axes to at least the given sizes."""
+        shape = self._counts.shape
+        if users <= shape[3] and months <= shape[4]:
+            return
+        new_users, new_months = shape[3], shape[4]
+        while new_users < users:
+            new_users *= 2
+        while new_months < months:
+            new_months *= 2
+        grown = np.zeros(shape[:3] + (new_users, new_months), dtype=np.int64)
+        grown[..., : shape[3], : shape[4]] = self._counts
+        self._counts = grown
+
+    def _grow_months_before(self, months: int) -> None:
+        """Prepends empty months for a log older than any seen so far."""
+        shape = self._counts.shape
+        grown = np.zeros(shape[:4] + (shape[4] + months,), dtype=np.int64)
+        grown[..., months:] = self._counts
+        self._counts = grown
+
+    def matrix(
+        self,
+        forced: bool | None = None,
+        users: list[str] | None = None,
+        start_month: int | None = None,
+        end_month: int | None = None,
+    ) -> np.ndarray:
+        """
+        Returns from-stage by to-stage counts for a slice.
+
+        Args:
+            forced (bool | None): Only forced (True) or unforced (False) moves.
+            users (list[str] | None): Only moves by these users.
+            start_month (int | None): First month index included.
+            end_month (int | None): Last month index included.
+
+        Returns:
+            np.ndarray: Array of shape (stages, stages).
+        """
+        with self._lock:
+            counts = self._counts
+            if forced is not None:
+                counts = counts[:, :, int(forced) : int(forced) + 1]
+            if users is not None:
+                codes = [self.user_codes[u] for u in users if u in self.user_codes]
+                counts = counts[:, :, :, codes]
+            if self.first_month is not None and (
+                start_month is not None or end_month is not None
+            ):
+                lo = (
+                    0 if start_month is None else max(0, start_month - self.first_month)
+                )
+                hi = (
+                    counts.shape[4]
+                    if end_month is None
+                    else max(0, end_month - self.first_month + 1)
+                )
+                counts = counts[..., lo:hi]
+            return counts.sum(axis=(2, 3, 4))
@@ -0,0 +1,238 @@
+import logging
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# (is_valid, is_forceable, message), as every caller unpacks it.
+Verdict = tuple[bool, bool, str]
+
+VALID: Verdict = (True, False, "")
+SAME_STAGE: Verdict = (False, False, "Already in this stage.")
+UNKNOWN_STAGE: Verdict = (False, False, "Invalid stage definition.")
+
+
+@dataclass(frozen=True)
+class TransitionRules:
+    """
+    A board's transition rules as declared in the boards file.
+
+    Without rules only the move to the next stage is valid; every other
+    move between two stages can be forced.
+
+    Attributes:
+        open_to_all (tuple[str, ...]): Stages any stock may enter unforced,
+            e.g. a graveyard stage. The first is the board's archive stage.
+        restores_to (dict[str, tuple[str, ...]]): Stages whose stocks leave
+            unforced only for the listed stages.
+        allow (tuple[tuple[str, str], ...]): Further unforced moves as
+            (from, to) pairs.
+        deny (tuple[tuple[str, str], ...]): Moves not allowed even forced.
+    """
+
+    open_to_all: tuple[str, ...] = ()
+    restores_to: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    allow: tuple[tuple[str, str], ...] = ()
+    deny: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def parse(cls, entry: dict, path: str = "transitions") -> "TransitionRules":
+        """
+        Reads the 'transitions' object of a board in the boards file.
+
+        Args:
+            entry (dict): e.g. {"open_to_all": ["Ocean"], "restores_to":
+                {"Ocean": ["Prospects"]}, "allow": [["Tracker", "Execute"]],
+                "deny": []}.
+            path (str): Where the object sits in the file, for errors.
+
+        Returns:
+            TransitionRules: The rules.
+
+        Raises:
+            ValueError: If the object is malformed, naming the bad entry.
+        """
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path} must be an object.")
+        unknown = set(entry) - {"open_to_all", "restores_to", "allow", "deny"}
+        if unknown:
+            raise ValueError(f"{path}: unknown rules: {', '.join(sorted(unknown))}")
+        restores_to = entry.get("restores_to", {})
+        if not isinstance(restores_to, dict):
+            raise ValueError(f"{path}.restores_to must be an object.")
+        return cls(
+            open_to_all=_stage_list(
+                entry.get("open_to_all", []), f"{path}.open_to_all"
+            ),
+            restores_to={
+                stage: _stage_list(targets, f"{path}.restores_to.{stage}")
+                for stage, targets in restores_to.items()
+            },
+            allow=_moves(entry.get("allow", []), f"{path}.allow"),
+            deny=_moves(entry.get("deny", []), f"{path}.deny"),
+        )
+
+    def stages(self) -> set[str]:
+        """Returns every stage the rules name."""
+        named = set(self.open_to_all) | set(self.restores_to)
+        for targets in self.restores_to.values():
+            named.update(targets)
+        for move in self.allow + self.deny:
+            named.update(move)
+        return named
+
+    def restricted_to(self, stage_names: list[str]) -> "TransitionRules":
+        """
+        Drops the rules naming stages outside the given ones, for a board
+        taking the standard rules over a subset of the standard stages.
+
+        Args:
+            stage_names (list[str]): The board's stages.
+
+        Returns:
+            TransitionRules: The rules that apply to those stages.
+        """
+        names = set(stage_names)
+        return TransitionRules(
+            open_to_all=tuple(stage for stage in self.open_to_all if stage in names),
+            restores_to={
+                stage: kept
+                for stage, targets in self.restores_to.items()
+                if stage in names
+                and (kept := tuple(target for target in targets if target in names))
+            },
+            allow=tuple(move for move in self.allow if set(move) <= names),
+            deny=tuple(move for move in self.deny if set(move) <= names),
+        )
+
+
+def _stage_list(value: list[str], path: str) -> tuple[str, ...]:
+    """Reads a list of stage names of a rule."""
+    if not isinstance(value, list):
+        raise ValueError(f"{path} must be a list of stage names.")
+    for i, stage in enumerate(value):
+        if not isinstance(stage, str):
+            raise ValueError(f"{path}[{i}] must be a stage name.")
+    return tuple(value)
+
+
+def _moves(value: list[list[str]], path: str) -> tuple[tuple[str, str], ...]:
+    """Reads the [from, to] moves of an allow or deny rule."""
+    if not isinstance(value, list):
+        raise ValueError(f"{path} must be a list of [from, to] moves.")
+    moves = []
+    for i, move in enumerate(value):
+        if (
+            not isinstance(move, list)
+            or len(move) != 2
+            or not all(isinstance(stage, str) for stage in move)
+        ):
+            raise ValueError(f"{path}[{i}] must be a [from, to] pair of stage names.")
+        moves.append((move[0], move[1]))
+    return tuple(moves)
+
+
+class TransitionPolicy:
+    """
+    A board's transition rules compiled against its stages.
+
+    Stage names are interned to their pipeline positions and the verdict
+    for every (from, to) pair is worked out once, so checking a move costs
+    two dict lookups and a table read. Policies are immutable; a changed
+    boards file compiles a new one.
+
+    The board's archive stage is its first stage open to all, such as
+    Ocean: stocks left there are moved to cold storage. Archived stocks are
+    restored to the first stage it restores to, or else the first stage it
+    may move to unforced.
+    """
+
+    __slots__ = (
+        "_verdicts",
+        "archive_stage",
+        "restore_stage",
+        "rules",
+        "stage_ids",
+        "stage_names",
+    )
+
+    def __init__(self, stage_names: list[str], rules: TransitionRules | None = None):
+        """
+        Args:
+            stage_names (list[str]): The board's stages in pipeline order.
+            rules (TransitionRules | None): The declared rules. Defaults to
+                none.
+
+        Raises:
+            ValueError: If the rules name a stage the board does not have.
+        """
+        self.stage_names = tuple(stage_names)
+        self.stage_ids = {name: i for i, name in enumerate(self.stage_names)}
+        self.rules = rules or TransitionRules()
+        unknown = self.rules.stages() - set(self.stage_ids)
+        if unknown:
+            raise ValueError(
+                f"Transition rules name unknown stages: {', '.join(sorted(unknown))}"
+            )
+        self._verdicts = tuple(
+            tuple(self._judge(source, target) for target in self.stage_names)
+            for source in self.stage_names
+        )
+        self.archive_stage: str | None = next(iter(self.rules.open_to_all), None)
+        self.restore_stage: str | None = None
+        if self.archive_stage is not None:
+            targets = self.rules.restores_to.get(self.archive_stage, ())
+            self.restore_stage = next(
+                (
+                    target
+                    for target in (*targets, *self.stage_names)
+                    if self.check(self.archive_stage, target)[0]
+                ),
+                None,
+            )
+
+    def _judge(self, source: str, target: str) -> Verdict:
+        """Works out the verdict for one move from the rules."""
+        if source == target:
+            return SAME_STAGE
+        if (source, target) in self.rules.deny:
+            return (False, False, f"Moves from {source} to {target} are not allowed.")
+        if (source, target) in self.rules.allow or target in self.rules.open_to_all:
+            return VALID
+        targets = self.rules.restores_to.get(source)
+        if targets is not None:
+            if target in targets:
+                return VALID
+            restores = " or ".join(targets)
+            return (
+                False,
+                True,
+                f"Non-standard restoration ({source} only restores to {restores}).",
+            )
+        skipped = self.stage_ids[target] - self.stage_ids[source] - 1
+        if skipped == 0:
+            return VALID
+        if skipped < 0:
+            return (False, True, "Backward transition detected.")
+        return (False, True, f"Skipping {skipped} stages.")
+
+    def check(self, current_stage: str, new_stage: str) -> Verdict:
+        """
+        Validates if a transition is allowed based on business rules.
+
+        Args:
+            current_stage (str): The current stage of the stock.
+            new_stage (str): The target stage.
+
+        Returns:
+            tuple[bool, bool, str]: (is_valid, is_forceable, message)
+        """
+        if current_stage == new_stage:
+            return SAME_STAGE
+        source = self.stage_ids.get(current_stage)
+        target = self.stage_ids.get(new_stage)
+        if source is None or target is None:
+            logger.warning(
+                "Transition between unknown stages: %s -> %s", current_stage, new_stage
+            )
+            return UNKNOWN_STAGE
+        return self._verdicts[source][target]
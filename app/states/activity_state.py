@@ -0,0 +1,168 @@
+import reflex as rx
+from datetime import datetime, timedelta, timezone
+from app.models import ActivityDay, StateTransitionLog, UserActivity, get_utc_now
+from app.services.metrics import timed
+from app.states.base_state import BaseState
+
+FEED_PAGE_SIZE = 50
+# Days shown in the daily activity strip when no date range is set.
+DEFAULT_ACTIVITY_DAYS = 30
+
+
+class ActivityState(BaseState):
+    """
+    Manages the per-user activity feed: one user's transitions, newest
+    first, with their running totals and daily counts.
+    """
+
+    feed_user: str = "Analyst A"
+    start_date: str = ""
+    end_date: str = ""
+    feed_offset: int = 0
+    feed_total: int = 0
+    feed_logs: list[StateTransitionLog] = []
+    summary: UserActivity = UserActivity(user="")
+    activity_days: list[ActivityDay] = []
+
+    @rx.var
+    def feed_range_label(self) -> str:
+        """
+        Describes which part of the feed is shown.
+
+        Returns:
+            str: e.g. '1-50 of 1234', or 'No transitions'.
+        """
+        if not self.feed_total:
+            return "No transitions"
+        last = min(self.feed_offset + FEED_PAGE_SIZE, self.feed_total)
+        return f"{self.feed_offset + 1}-{last} of {self.feed_total}"
+
+    @rx.var
+    def forced_ratio_label(self) -> str:
+        """
+        Formats the user's forced moves and their share of all moves.
+
+        Returns:
+            str: e.g. '12 (4.5%)'.
+        """
+        return f"{self.summary.forced_moves} ({self.summary.forced_ratio * 100:.1f}%)"
+
+    @rx.var
+    def has_previous_page(self) -> bool:
+        """Returns whether there are newer transitions before this page."""
+        return self.feed_offset > 0
+
+    @rx.var
+    def has_next_page(self) -> bool:
+        """Returns whether there are older transitions after this page."""
+        return self.feed_offset + FEED_PAGE_SIZE < self.feed_total
+
+    @staticmethod
+    def _parse_date(value: str) -> datetime | None:
+        """
+        Parses a YYYY-MM-DD date input as midnight UTC.
+
+        Args:
+            value (str): The date string, possibly empty.
+
+        Returns:
+            datetime | None: The date, or None if empty or invalid.
+        """
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    @rx.event
+    @timed("activity_refresh")
+    def refresh(self):
+        """
+        Reloads the current page of the feed, the user's totals and the
+        daily counts from the board store's per-user index.
+        """
+        store = self._board_store()
+        start = self._parse_date(self.start_date)
+        end = self._parse_date(self.end_date)
+        self.feed_logs, self.feed_total = store.user_logs(
+            self.feed_user,
+            start,
+            end + timedelta(days=1) if end else None,
+            self.feed_offset,
+            FEED_PAGE_SIZE,
+        )
+        self.summary = store.user_activity(self.feed_user)
+        last_day = end.date() if end else get_utc_now().date()
+        first_day = (
+            start.date()
+            if start and start.date() <= last_day
+            else last_day - timedelta(days=DEFAULT_ACTIVITY_DAYS - 1)
+        )
+        first_day = max(first_day, last_day - timedelta(days=365))
+        counts = store.user_daily_log_counts(self.feed_user, first_day, last_day)
+        peak = max(counts.values(), default=0)
+        self.activity_days = [
+            ActivityDay(
+                date=day.isoformat(),
+                count=count,
+                intensity=round(count / peak, 2) if peak else 0.0,
+            )
+            for day, count in counts.items()
+        ]
+
+    @rx.event
+    def set_feed_user(self, value: str):
+        """
+        Shows another user's activity.
+
+        Args:
+            value (str): The user.
+        """
+        self.feed_user = value
+        self.feed_offset = 0
+        self.refresh()
+
+    @rx.event
+    def set_start_date(self, value: str):
+        """
+        Sets the first day included in the feed.
+
+        Args:
+            value (str): The date as YYYY-MM-DD, or empty.
+        """
+        self.start_date = value
+        self.feed_offset = 0
+        self.refresh()
+
+    @rx.event
+    def set_end_date(self, value: str):
+        """
+        Sets the last day included in the feed.
+
+        Args:
+            value (str): The date as YYYY-MM-DD, or empty.
+        """
+        self.end_date = value
+        self.feed_offset = 0
+        self.refresh()
+
+    @rx.event
+    def clear_filters(self):
+        """Resets the date range and returns to the newest transitions."""
+        self.start_date = ""
+        self.end_date = ""
+        self.feed_offset = 0
+        self.refresh()
+
+    @rx.event
+    def next_page(self):
+        """Shows the next, older page of transitions."""
+        if self.feed_offset + FEED_PAGE_SIZE < self.feed_total:
+            self.feed_offset += FEED_PAGE_SIZE
+            self.refresh()
+
+    @rx.event
+    def previous_page(self):
+        """Shows the previous, newer page of transitions."""
+        if self.feed_offset > 0:
+            self.feed_offset = max(0, self.feed_offset - FEED_PAGE_SIZE)
+            self.refresh()
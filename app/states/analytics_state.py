@@ -0,0 +1,209 @@
+import reflex as rx
+import asyncio
+from datetime import datetime, timedelta, timezone
+from app.models import (
+    HeatmapCell,
+    HeatmapRow,
+    StageConversion,
+    StageTimeStat,
+    ThroughputWeek,
+)
+from app.services.analytics import get_pipeline_analytics
+from app.services.metrics import timed
+from app.services.transition_counts import month_index
+from app.states.base_state import BaseState
+
+
+class AnalyticsState(BaseState):
+    """
+    Manages the pipeline analytics dashboard and its filters.
+    """
+
+    filter_user: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    log_count: int = 0
+    forward_moves: int = 0
+    backward_moves: int = 0
+    forced_moves: int = 0
+    stage_times: list[StageTimeStat] = []
+    conversions: list[StageConversion] = []
+    throughput: list[ThroughputWeek] = []
+    heatmap_forced: str = "All Moves"
+    heatmap_rows: list[HeatmapRow] = []
+    audit_summary: str = ""
+    audit_problems: list[str] = []
+    _refresh_seq: int = 0
+
+    @rx.var
+    def max_weekly_throughput(self) -> int:
+        """
+        Returns the largest weekly throughput, used to scale the bars.
+
+        Returns:
+            int: The largest execute + ocean count in a week, at least 1.
+        """
+        return max((w.execute + w.ocean for w in self.throughput), default=1) or 1
+
+    @staticmethod
+    def _parse_date(value: str) -> datetime | None:
+        """
+        Parses a YYYY-MM-DD date input as midnight UTC.
+
+        Args:
+            value (str): The date string, possibly empty.
+
+        Returns:
+            datetime | None: The date, or None if empty or invalid.
+        """
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    @rx.event(background=True)
+    @timed("analytics_refresh")
+    async def refresh(self):
+        """
+        Recomputes the analytics for the current filters.
+
+        The report is computed on a worker thread, so a cache miss over a
+        large log does not hold up other sessions' events. If the filters
+        change meanwhile, only the newest refresh's figures are shown.
+        """
+        async with self:
+            self._refresh_seq += 1
+            seq = self._refresh_seq
+            board_id = self._board().id
+            users = [self.filter_user] if self.filter_user else None
+            start = self._parse_date(self.start_date)
+            end = self._parse_date(self.end_date)
+        report = await asyncio.to_thread(
+            get_pipeline_analytics(board_id).report,
+            users=users,
+            start=start,
+            end=end + timedelta(days=1) if end else None,
+        )
+        async with self:
+            if seq != self._refresh_seq:
+                return
+            self.log_count = report.log_count
+            self.forward_moves = report.forward_moves
+            self.backward_moves = report.backward_moves
+            self.forced_moves = report.forced_moves
+            self.stage_times = report.stage_times
+            self.conversions = report.conversions
+            self.throughput = report.throughput
+            self._refresh_heatmap()
+
+    def _refresh_heatmap(self):
+        """
+        Reads the transition heatmap for the current filters from the
+        store's pre-aggregated transition counts.
+        """
+        start = self._parse_date(self.start_date)
+        end = self._parse_date(self.end_date)
+        counts = self._board_store().transition_counts
+        matrix = counts.matrix(
+            forced={"Forced": True, "Unforced": False}.get(self.heatmap_forced),
+            users=[self.filter_user] if self.filter_user else None,
+            start_month=month_index(start) if start else None,
+            end_month=month_index(end) if end else None,
+        )
+        peak = int(matrix.max()) if matrix.size else 0
+        self.heatmap_rows = [
+            HeatmapRow(
+                stage=stage,
+                cells=[
+                    HeatmapCell(
+                        count=int(count),
+                        intensity=round(int(count) / peak, 2) if peak else 0.0,
+                    )
+                    for count in row
+                ],
+            )
+            for stage, row in zip(counts.stage_names, matrix)
+        ]
+
+    @rx.event
+    def set_heatmap_forced(self, value: str):
+        """
+        Restricts the heatmap to forced or unforced moves.
+
+        Args:
+            value (str): 'All Moves', 'Forced' or 'Unforced'.
+        """
+        self.heatmap_forced = value
+        self._refresh_heatmap()
+
+    @rx.event
+    def set_filter_user(self, value: str):
+        """
+        Restricts the analytics to one user's moves.
+
+        Args:
+            value (str): The user, or 'All Users'.
+        """
+        self.filter_user = "" if value == "All Users" else value
+        return AnalyticsState.refresh
+
+    @rx.event
+    def set_start_date(self, value: str):
+        """
+        Sets the first day included in the analytics.
+
+        Args:
+            value (str): The date as YYYY-MM-DD, or empty.
+        """
+        self.start_date = value
+        return AnalyticsState.refresh
+
+    @rx.event
+    def set_end_date(self, value: str):
+        """
+        Sets the last day included in the analytics.
+
+        Args:
+            value (str): The date as YYYY-MM-DD, or empty.
+        """
+        self.end_date = value
+        return AnalyticsState.refresh
+
+    @rx.event
+    def clear_filters(self):
+        """
+        Resets all filters and recomputes the analytics.
+        """
+        self.filter_user = ""
+        self.start_date = ""
+        self.end_date = ""
+        return AnalyticsState.refresh
+
+    @rx.event(background=True)
+    async def verify_audit_trail(self):
+        """
+        Replays every stock's transition history in a background job and
+        reports any gaps or inconsistencies with the board.
+        """
+        async with self:
+            self.audit_summary = ""
+            self.audit_problems = []
+        async for event in self._run_job(
+            "verify_audit_trail", "Audit trail check", on_result=self._show_audit
+        ):
+            yield event
+
+    async def _show_audit(self, result: dict):
+        """
+        Stores the result of an audit trail check for display.
+
+        Args:
+            result (dict): The verify_audit_trail job result.
+        """
+        async with self:
+            self.audit_summary = (
+                f"Checked {result['stocks_checked']} stocks and "
+                f"{result['logs_checked']} transitions: "
+                f"{result['problem_count']} problem(s) found."
+            )
+            self.audit_problems = result["problems"]
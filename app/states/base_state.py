@@ -1,4 +1,24 @@
 import reflex as rx
+import asyncio
+import inspect
+import logging
+from collections.abc import Callable
+from typing import Any
+from app.models import BoardDef
+from app.services.board_store import BoardStore, get_board_store
+from app.services.boards import (
+    UnknownBoardError,
+    default_board_id,
+    get_board_def,
+    get_board_defs,
+)
+from app.services.jobs import (
+    CANCELLED,
+    SUCCEEDED,
+    Job,
+    JobLimitError,
+    get_job_manager,
+)
 
 
 class BaseState(rx.State):
@@ -12,4 +32,136 @@ class BaseState(rx.State):
         "Portfolio Manager",
         "Compliance Officer",
     ]
-    theme_mode: str = "light"
\ No newline at end of file
+    theme_mode: str = "light"
+    board_id: str = rx.LocalStorage("", name="kanban_board")
+    active_job_id: str = ""
+    active_job_label: str = ""
+
+    @rx.var
+    def boards(self) -> list[BoardDef]:
+        """
+        Returns the boards of this deployment for the board switcher.
+
+        Returns:
+            list[BoardDef]: The boards, in display order.
+        """
+        return get_board_defs()
+
+    @rx.var
+    def board_name(self) -> str:
+        """
+        Returns the name of the board this session works on.
+
+        Returns:
+            str: The board's name.
+        """
+        return self._board().name
+
+    def _board(self) -> BoardDef:
+        """
+        Returns the board this session works on: the one last chosen in
+        this browser, or the default board if none was or it no longer
+        exists.
+
+        Returns:
+            BoardDef: The board.
+        """
+        try:
+            return get_board_def(self.board_id or default_board_id())
+        except UnknownBoardError:
+            return get_board_def(default_board_id())
+
+    def _board_store(self) -> BoardStore:
+        """
+        Returns the store of the board this session works on.
+
+        Returns:
+            BoardStore: The board's store.
+        """
+        return get_board_store(self._board().id)
+
+    @rx.event
+    def cancel_active_job(self):
+        """Cancels this session's running background job, if any."""
+        if self.active_job_id:
+            get_job_manager().cancel(self.active_job_id)
+
+    async def _run_job(
+        self,
+        kind: str,
+        label: str,
+        on_result: Callable[[Any], Any] | None = None,
+        **params,
+    ):
+        """
+        Submits a background job for this session and yields progress toasts
+        until it finishes. Must be called from a background event handler.
+
+        Args:
+            kind (str): The job kind.
+            label (str): Name shown in the progress toasts.
+            on_result (Callable | None): Called with a successful job's result;
+                may be async. Whatever it returns, e.g. a download, is yielded.
+            **params: Keyword arguments for the job function.
+
+        Yields:
+            EventSpec: Toasts reporting progress and the outcome.
+        """
+        manager = get_job_manager()
+        try:
+            # Snapshotting the job's inputs copies board data; keep it off
+            # the event loop.
+            job = await asyncio.to_thread(
+                manager.submit,
+                kind,
+                self.router.session.client_token,
+                store=self._board_store(),
+                **params,
+            )
+        except JobLimitError as e:
+            yield rx.toast.warning(str(e))
+            return
+        except Exception as e:
+            logging.exception("Could not start %s job: %s", kind, e)
+            yield rx.toast.error(f"{label} could not start: {e}")
+            return
+        async with self:
+            self.active_job_id = job.id
+            self.active_job_label = label
+        try:
+            async for update in manager.watch(job.id):
+                if not update.finished:
+                    yield rx.toast.info(
+                        f"{label}: {update.percent}%",
+                        id=job.id,
+                        duration=60_000,
+                    )
+        finally:
+            async with self:
+                self.active_job_id = ""
+                self.active_job_label = ""
+        if job.status == SUCCEEDED and on_result is not None:
+            event = on_result(job.result)
+            if inspect.isawaitable(event):
+                event = await event
+            if event is not None:
+                yield event
+        yield self._job_outcome_toast(job, label)
+
+    @staticmethod
+    def _job_outcome_toast(job: Job, label: str):
+        """
+        Builds the toast that replaces a job's progress toast when it ends.
+
+        Args:
+            job (Job): The finished job.
+            label (str): Name shown in the toast.
+
+        Returns:
+            EventSpec: The toast event.
+        """
+        if job.status == SUCCEEDED:
+            return rx.toast.success(f"{label} finished.", id=job.id, duration=4000)
+        if job.status == CANCELLED:
+            return rx.toast.info(f"{label} cancelled.", id=job.id, duration=4000)
+        return rx.toast.error(f"{label} failed: {job.error}", id=job.id, duration=8000)
@@ -0,0 +1,244 @@
+import reflex as rx
+from collections.abc import Callable
+from app.models import ForcedReview, ReviewQueueItem
+from app.services.board_store import BoardStoreError
+from app.services.metrics import timed
+from app.services.review_queue import REVIEW_STATUSES
+from app.states.base_state import BaseState
+
+REVIEW_PAGE_SIZE = 50
+
+
+class ComplianceState(BaseState):
+    """
+    Manages the compliance review queue of forced transitions.
+    """
+
+    reviewer: str = "Compliance Officer"
+    review_status: str = "pending"
+    review_offset: int = 0
+    review_total: int = 0
+    review_items: list[ReviewQueueItem] = []
+    review_counts: dict[str, int] = dict.fromkeys(REVIEW_STATUSES, 0)
+    selected_log_ids: list[int] = []
+    review_note: str = ""
+
+    @rx.var
+    def review_range_label(self) -> str:
+        """
+        Describes which part of the queue is shown.
+
+        Returns:
+            str: e.g. '1-50 of 1234', or 'Nothing to show'.
+        """
+        if not self.review_total:
+            return "Nothing to show"
+        last = min(self.review_offset + REVIEW_PAGE_SIZE, self.review_total)
+        return f"{self.review_offset + 1}-{last} of {self.review_total}"
+
+    @rx.var
+    def has_previous_page(self) -> bool:
+        """Returns whether there are older transitions before this page."""
+        return self.review_offset > 0
+
+    @rx.var
+    def has_next_page(self) -> bool:
+        """Returns whether there are newer transitions after this page."""
+        return self.review_offset + REVIEW_PAGE_SIZE < self.review_total
+
+    @rx.var
+    def selected_count(self) -> int:
+        """Returns the number of transitions selected for a batch action."""
+        return len(self.selected_log_ids)
+
+    @rx.event
+    @timed("review_refresh")
+    def refresh(self):
+        """
+        Reloads the current page of the queue and the per-status counts
+        from the board store's review index.
+        """
+        store = self._board_store()
+        self.review_items, self.review_total = store.review_queue(
+            self.review_status, self.review_offset, REVIEW_PAGE_SIZE
+        )
+        if self.review_offset and not self.review_items:
+            self.review_offset = 0
+            self.review_items, self.review_total = store.review_queue(
+                self.review_status, 0, REVIEW_PAGE_SIZE
+            )
+        self.review_counts = store.review_counts()
+        shown = {item.log.id for item in self.review_items}
+        self.selected_log_ids = [i for i in self.selected_log_ids if i in shown]
+
+    @rx.event
+    def set_reviewer(self, value: str):
+        """
+        Sets the user the review actions are taken as.
+
+        Args:
+            value (str): The reviewer.
+        """
+        self.reviewer = value
+
+    @rx.event
+    def set_review_note(self, value: str):
+        """
+        Sets the note recorded with the next approval or rejection.
+
+        Args:
+            value (str): The note.
+        """
+        self.review_note = value
+
+    @rx.event
+    def set_review_status(self, value: str):
+        """
+        Shows the transitions in another review status.
+
+        Args:
+            value (str): One of REVIEW_STATUSES.
+        """
+        self.review_status = value
+        self.review_offset = 0
+        self.selected_log_ids = []
+        self.refresh()
+
+    @rx.event
+    def toggle_selected(self, log_id: int):
+        """
+        Adds a transition to, or removes it from, the batch selection.
+
+        Args:
+            log_id (int): ID of the forced transition log.
+        """
+        if log_id in self.selected_log_ids:
+            self.selected_log_ids.remove(log_id)
+        else:
+            self.selected_log_ids.append(log_id)
+
+    @rx.event
+    def toggle_select_page(self):
+        """
+        Selects every transition on the page the reviewer may decide, or
+        clears the selection. Their own moves and other reviewers' claims
+        are left out so a batch approval does not fail on them.
+        """
+        if self.selected_log_ids:
+            self.selected_log_ids = []
+            return
+        self.selected_log_ids = [
+            item.log.id
+            for item in self.review_items
+            if item.log.updated_by != self.reviewer
+            and item.review.status in ("pending", "claimed")
+            and item.review.claimed_by in ("", self.reviewer)
+        ]
+
+    def _review(
+        self,
+        action: Callable[[], list[ForcedReview]],
+        verb: str,
+        decision: bool = False,
+    ) -> rx.event.EventSpec:
+        """
+        Runs a review action, refreshes the queue and reports the outcome.
+
+        Args:
+            action (Callable): Calls the board store; raises BoardStoreError
+                if the action is not allowed.
+            verb (str): Past tense of the action for the confirmation.
+            decision (bool): Whether the action used up the review note.
+
+        Returns:
+            EventSpec: A toast with the outcome.
+        """
+        try:
+            reviews = action()
+        except BoardStoreError as e:
+            return rx.toast.error(str(e))
+        if decision:
+            self.review_note = ""
+        self.refresh()
+        noun = "transition" if len(reviews) == 1 else "transitions"
+        return rx.toast.success(f"{verb} {len(reviews)} forced {noun}")
+
+    @rx.event
+    def claim_review(self, log_id: int):
+        """
+        Claims a pending transition for the current reviewer.
+
+        Args:
+            log_id (int): ID of the forced transition log.
+        """
+        return self._review(
+            lambda: self._board_store().claim_reviews([log_id], self.reviewer),
+            "Claimed",
+        )
+
+    @rx.event
+    def release_review(self, log_id: int):
+        """
+        Returns a transition the current reviewer claimed to the queue.
+
+        Args:
+            log_id (int): ID of the forced transition log.
+        """
+        return self._review(
+            lambda: self._board_store().release_reviews([log_id], self.reviewer),
+            "Released",
+        )
+
+    @rx.event
+    def approve_review(self, log_id: int):
+        """
+        Approves one transition with the current note.
+
+        Args:
+            log_id (int): ID of the forced transition log.
+        """
+        return self._decide([log_id], approve=True)
+
+    @rx.event
+    def reject_review(self, log_id: int):
+        """
+        Rejects one transition; the current note is required.
+
+        Args:
+            log_id (int): ID of the forced transition log.
+        """
+        return self._decide([log_id], approve=False)
+
+    @rx.event
+    @timed("approve_selected_reviews")
+    def approve_selected(self):
+        """Approves every selected transition in one commit."""
+        if not self.selected_log_ids:
+            return rx.toast.warning("Select transitions to approve first.")
+        return self._decide(self.selected_log_ids, approve=True)
+
+    def _decide(self, log_ids: list[int], approve: bool) -> rx.event.EventSpec:
+        """Approves or rejects transitions with the current note."""
+        return self._review(
+            lambda: self._board_store().decide_reviews(
+                log_ids, self.reviewer, approve, self.review_note
+            ),
+            "Approved" if approve else "Rejected",
+            decision=True,
+        )
+
+    @rx.event
+    def next_page(self):
+        """Shows the next, newer page of the queue."""
+        if self.review_offset + REVIEW_PAGE_SIZE < self.review_total:
+            self.review_offset += REVIEW_PAGE_SIZE
+            self.selected_log_ids = []
+            self.refresh()
+
+    @rx.event
+    def previous_page(self):
+        """Shows the previous, older page of the queue."""
+        if self.review_offset > 0:
+            self.review_offset = max(0, self.review_offset - REVIEW_PAGE_SIZE)
+            self.selected_log_ids = []
+            self.refresh()
@@ -1,13 +1,37 @@
 import reflex as rx
 from typing import Optional
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 import logging
-import csv
-import io
 import os
-from app.models import Stock, StateTransitionLog, StageDef, STAGES_DATA, get_utc_now
+from app.models import (
+    SavedView,
+    Stock,
+    StateTransitionLog,
+    StageDef,
+    get_utc_now,
+    parse_effective_timestamp,
+)
+from app.services import commands
+from app.services.boards import DEFAULT_BOARD_ID, UnknownBoardError, get_board_def
+from app.services.broadcast import BoardFrame, get_board_broadcaster
+from app.services.idempotency import IdempotentOutcome, idempotency_cache
+from app.services.metrics import COMPUTED_VAR_SECONDS, timed, timer
+from app.services.saved_views import SavedViewError, get_saved_views
+from app.services.stage_order import STAGE_SORTS
 from app.states.base_state import BaseState
 
+# Viewport width at which the board switches from tabs to columns (Tailwind md).
+DESKTOP_MIN_WIDTH = 768
+# Cards rendered per column before "Show more" is needed.
+STAGE_PAGE_SIZE = 50
+# Archived stocks loaded into the Ocean modal at a time.
+ARCHIVE_PAGE_SIZE = 50
+
+
+def _no_stock() -> Stock:
+    """Returns the placeholder stock shown while no detail view is open."""
+    return Stock(id=-1, ticker="", company_name="", status="")
+
 
 class KanbanState(BaseState):
     """
@@ -15,9 +39,11 @@ class KanbanState(BaseState):
     Inherits from BaseState for shared app configuration.
     """
 
-    stocks: list[Stock] = []
-    logs: list[StateTransitionLog] = []
-    stage_defs: list[StageDef] = [StageDef(**data) for data in STAGES_DATA]
+    # The session's copy of the board by stock ID. It stays on the server:
+    # only the windows and counts of _refresh_columns are sent to the client.
+    _stocks: dict[int, Stock] = {}
+    # Filled in from the session's board by _apply_board on load.
+    stage_defs: list[StageDef] = []
     last_error: str = ""
     search_query: str = ""
     show_stale_only: bool = False
@@ -25,6 +51,7 @@ class KanbanState(BaseState):
     pending_move_ticker: str = ""
     pending_move_stock_id: int = -1
     pending_move_stage: str = ""
+    _pending_move_from: str = ""
     transition_warning: str = ""
     modal_comment: str = ""
     modal_user: str = "Analyst A"
@@ -34,128 +61,142 @@ class KanbanState(BaseState):
     is_add_modal_open: bool = False
     new_stock_ticker: str = ""
     new_stock_company: str = ""
-    new_stock_stage: str = "Universe"
+    new_stock_stage: str = ""
     is_detail_modal_open: bool = False
     detail_stock_id: int = -1
+    current_detail_stock: Stock = _no_stock()
+    current_detail_logs: list[StateTransitionLog] = []
     active_detail_tab: str = "overview"
     is_ocean_modal_open: bool = False
-    next_stock_id: int = 1
-    next_log_id: int = 1
+    archive_stage: str = ""
+    restore_stage: str = ""
+    ocean_stocks: list[Stock] = []
+    archived_stocks: list[Stock] = []
+    archived_ocean_count: int = 0
     is_mobile_menu_open: bool = False
-    mobile_active_stage: str = "Universe"
+    mobile_active_stage: str = ""
+    is_desktop_layout: bool = True
+    stage_sorts: dict[str, str] = {}
+    stage_limits: dict[str, int] = {}
+    last_visit_at: str = rx.LocalStorage("", name="kanban_last_visit")
+    moves_since_last_visit: int = 0
+    saved_views: list[SavedView] = []
+    active_view_id: str = ""
+    _view_stocks: list[Stock] = []
+    is_view_modal_open: bool = False
+    view_name: str = ""
+    view_stages: list[str] = []
+    view_moved_by: str = ""
+    view_forced_only: bool = False
+    view_sort: str = "board"
+    view_shared: bool = False
+    stocks_by_stage: dict[str, list[Stock]] = {}
+    stage_counts: dict[str, int] = {}
 
     @rx.var
-    def current_detail_stock(self) -> Stock:
+    def stages(self) -> list[str]:
         """
-        Returns the stock currently being viewed in the detail modal.
+        Returns list of stage names for compatibility and iteration.
 
         Returns:
-            Stock: The stock object or a default empty stock if not found.
+            list[str]: List of stage names.
         """
-        return next(
-            (s for s in self.stocks if s.id == self.detail_stock_id),
-            Stock(id=-1, ticker="", company_name="", status=""),
-        )
+        return [s.name for s in self.stage_defs]
 
     @rx.var
-    def current_detail_logs(self) -> list[StateTransitionLog]:
+    def active_view_name(self) -> str:
         """
-        Returns history logs for the detailed stock.
+        Returns the name of the saved view shown on the board.
 
         Returns:
-            list[StateTransitionLog]: List of transition logs sorted by timestamp descending.
+            str: The view's name, or an empty string for ad hoc filters.
         """
-        logs = [log for log in self.logs if log.stock_id == self.detail_stock_id]
-        return sorted(logs, key=lambda x: x.timestamp or get_utc_now(), reverse=True)
+        for view in self.saved_views:
+            if view.id == self.active_view_id:
+                return view.name
+        return ""
 
-    @rx.var
-    def ocean_stocks(self) -> list[Stock]:
+    def _filtered_stocks(self) -> list[Stock]:
         """
-        Returns all stocks in the Ocean stage.
+        Returns stocks matching the search query and filters, or the
+        results of the active saved view.
 
         Returns:
-            list[Stock]: List of stocks in 'Ocean' status.
-        """
-        return [s for s in self.stocks if s.status == "Ocean"]
-
-    @rx.var
-    def stages(self) -> list[str]:
+            list[Stock]: List of filtered stock objects.
         """
-        Returns list of stage names for compatibility and iteration.
+        with timer(COMPUTED_VAR_SECONDS, var="filtered_stocks"):
+            if self.active_view_id:
+                return list(self._view_stocks)
+            stocks = list(self._stocks.values())
+            if self.search_query:
+                query = self.search_query.lower()
+                stocks = [
+                    s
+                    for s in stocks
+                    if query in s.ticker.lower() or query in s.company_name.lower()
+                ]
+            if self.show_stale_only:
+                stocks = [s for s in stocks if s.days_in_stage > 30]
+            return stocks
 
-        Returns:
-            list[str]: List of stage names.
+    @rx.event(background=True)
+    @timed("export_to_csv")
+    async def export_to_csv(self):
         """
-        return [s.name for s in self.stage_defs]
+        Generates and downloads a CSV export of the current filtered stock list.
 
-    @rx.var
-    def filtered_stocks(self) -> list[Stock]:
+        The CSV is rendered by a background job in a worker process, so large
+        exports do not hold up other sessions' events.
         """
-        Returns stocks matching the search query and filters.
+        async with self:
+            stock_ids = [stock.id for stock in self._filtered_stocks()]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        async for event in self._run_job(
+            "export_csv",
+            "CSV export",
+            on_result=lambda csv_content: rx.download(
+                data=csv_content, filename=f"kanban_export_{timestamp}.csv"
+            ),
+            stock_ids=stock_ids,
+        ):
+            yield event
 
-        Returns:
-            list[Stock]: List of filtered stock objects.
+    @rx.event(background=True)
+    @timed("export_view")
+    async def export_view(self, view_id: str):
         """
-        stocks = self.stocks
-        if self.search_query:
-            query = self.search_query.lower()
-            stocks = [
-                s
-                for s in stocks
-                if query in s.ticker.lower() or query in s.company_name.lower()
-            ]
-        if self.show_stale_only:
-            stocks = [s for s in stocks if s.days_in_stage > 30]
-        return stocks
+        Generates and downloads a CSV export of a saved view's results.
 
-    @rx.event
-    async def export_to_csv(self):
-        """
-        Generates and downloads a CSV export of the current filtered stock list.
+        Args:
+            view_id (str): ID of the saved view to export.
         """
+        async with self:
+            user = self.modal_user
+            board_id = self._board().id
+        views = get_saved_views(board_id)
         try:
-            yield rx.toast.info("Generating CSV export...")
-            output = io.StringIO()
-            writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
-            writer.writerow(
-                [
-                    "Stock ID",
-                    "Ticker",
-                    "Company Name",
-                    "Current Stage",
-                    "Days in Stage",
-                    "Last Updated (UTC)",
-                ]
-            )
-            for stock in self.filtered_stocks:
-                last_updated_str = (
-                    stock.last_updated.strftime("%Y-%m-%d %H:%M")
-                    if stock.last_updated
-                    else ""
-                )
-                writer.writerow(
-                    [
-                        stock.id,
-                        stock.ticker,
-                        stock.company_name,
-                        stock.status,
-                        stock.days_in_stage,
-                        last_updated_str,
-                    ]
-                )
-            csv_content = output.getvalue()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"kanban_export_{timestamp}.csv"
-            yield rx.download(data=csv_content, filename=filename)
-            yield rx.toast.success("Export ready for download.")
-        except Exception as e:
-            logging.exception(f"Export failed: {e}")
-            yield rx.toast.error(f"Export failed: {str(e)}")
+            view = views.get(view_id, user)
+        except SavedViewError as e:
+            yield rx.toast.error(str(e))
+            return
+        stock_ids = views.stock_ids(view)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        async for event in self._run_job(
+            "export_csv",
+            f"Export of {view.name}",
+            on_result=lambda csv_content: rx.download(
+                data=csv_content, filename=f"kanban_view_{timestamp}.csv"
+            ),
+            stock_ids=stock_ids,
+        ):
+            yield event
 
     @rx.event
     def toggle_stale_filter(self):
         """Toggles the stale stock filter on/off."""
         self.show_stale_only = not self.show_stale_only
+        self._leave_view()
+        self._refresh_columns()
 
     @rx.event
     def toggle_mobile_menu(self):
@@ -171,8 +212,24 @@ class KanbanState(BaseState):
             stage_name (str): The name of the stage to display.
         """
         self.mobile_active_stage = stage_name
+        self._refresh_columns()
+
+    @rx.event
+    def set_viewport_width(self, width: int, height: int = 0):
+        """
+        Picks the mobile or desktop layout for the client's viewport.
+
+        Args:
+            width (int): The window's inner width in CSS pixels.
+            height (int): The window's inner height; unused.
+        """
+        is_desktop = width >= DESKTOP_MIN_WIDTH
+        if is_desktop != self.is_desktop_layout:
+            self.is_desktop_layout = is_desktop
+            self._refresh_columns()
 
     @rx.event
+    @timed("set_search_query")
     def set_search_query(self, query: str):
         """
         Sets the search query for filtering stocks.
@@ -181,26 +238,249 @@ class KanbanState(BaseState):
             query (str): The search text.
         """
         self.search_query = query
+        self._leave_view()
+        self._refresh_columns()
 
     @rx.event
     def clear_filters(self):
-        """Clears all active filters (search and stale)."""
+        """Clears all active filters (search, stale and saved view)."""
         self.search_query = ""
         self.show_stale_only = False
+        self._leave_view()
+        self._refresh_columns()
 
-    @rx.var
-    def stocks_by_stage(self) -> dict[str, list[Stock]]:
+    def _load_saved_views(self):
+        """Lists the saved views the current user can open."""
+        self.saved_views = get_saved_views(self._board().id).visible_to(self.modal_user)
+
+    def _refresh_view(self):
         """
-        Returns filtered stocks organized by stage for easier rendering.
+        Reloads the active saved view's results from its materialized set.
+        Leaves the view if it was deleted or is no longer visible.
+        """
+        if not self.active_view_id:
+            return
+        views = get_saved_views(self._board().id)
+        try:
+            view = views.get(self.active_view_id, self.modal_user)
+        except SavedViewError:
+            self._leave_view()
+            return
+        self._view_stocks = views.stocks(view)
 
-        Returns:
-            dict[str, list[Stock]]: Dictionary mapping stage names to lists of stocks.
+    def _leave_view(self):
+        """Returns the board to ad hoc filtering."""
+        self.active_view_id = ""
+        self._view_stocks = []
+
+    @rx.event
+    @timed("apply_view")
+    def apply_view(self, view_id: str):
+        """
+        Shows a saved view's results on the board.
+
+        Args:
+            view_id (str): ID of the saved view.
+        """
+        try:
+            view = get_saved_views(self._board().id).get(view_id, self.modal_user)
+        except SavedViewError as e:
+            self._load_saved_views()
+            return rx.toast.error(str(e))
+        self.search_query = view.query
+        self.show_stale_only = view.stale_only
+        self.active_view_id = view.id
+        self._refresh_view()
+        self._refresh_columns()
+
+    @rx.event
+    def open_view_modal(self):
+        """Opens the modal that saves the current filters as a view."""
+        self.view_name = ""
+        self.view_stages = []
+        self.view_moved_by = ""
+        self.view_forced_only = False
+        self.view_sort = "board"
+        self.view_shared = False
+        self.is_view_modal_open = True
+
+    @rx.event
+    def close_view_modal(self):
+        """Closes the save view modal."""
+        self.is_view_modal_open = False
+
+    @rx.event
+    def set_view_name(self, value: str):
+        """Sets the name for the save view form."""
+        self.view_name = value
+
+    @rx.event
+    def toggle_view_stage(self, stage: str):
+        """
+        Adds a stage to the view's stage subset, or removes it.
+
+        Args:
+            stage (str): The stage name.
+        """
+        if stage in self.view_stages:
+            self.view_stages = [s for s in self.view_stages if s != stage]
+        else:
+            self.view_stages = [
+                s for s in self.stages if s in self.view_stages or s == stage
+            ]
+
+    @rx.event
+    def set_view_moved_by(self, value: str):
+        """Sets the last-moved-by user for the save view form."""
+        self.view_moved_by = value
+
+    @rx.event
+    def set_view_forced_only(self, value: bool):
+        """Sets whether the view shows only forced transitions."""
+        self.view_forced_only = value
+
+    @rx.event
+    def set_view_sort(self, value: str):
+        """Sets the sort order for the save view form."""
+        self.view_sort = value
+
+    @rx.event
+    def set_view_shared(self, value: bool):
+        """Sets whether the view is shared with every user."""
+        self.view_shared = value
+
+    @rx.event
+    @timed("save_view")
+    def save_view(self):
+        """
+        Saves the current search and stale filters, plus the modal's
+        criteria, as a view owned by the current user, and opens it.
         """
-        result = {stage: [] for stage in self.stages}
-        for stock in self.filtered_stocks:
-            if stock.status in result:
-                result[stock.status].append(stock)
-        return result
+        try:
+            view = get_saved_views(self._board().id).save(
+                SavedView(
+                    id="",
+                    name=self.view_name,
+                    owner=self.modal_user,
+                    shared=self.view_shared,
+                    query=self.search_query,
+                    stale_only=self.show_stale_only,
+                    stages=self.view_stages,
+                    moved_by=self.view_moved_by,
+                    forced_only=self.view_forced_only,
+                    sort=self.view_sort,
+                )
+            )
+        except SavedViewError as e:
+            return rx.toast.error(str(e))
+        self.is_view_modal_open = False
+        self._load_saved_views()
+        self.active_view_id = view.id
+        self._refresh_view()
+        self._refresh_columns()
+        return rx.toast.success(f"Saved view {view.name}")
+
+    @rx.event
+    def delete_view(self, view_id: str):
+        """
+        Deletes a saved view owned by the current user.
+
+        Args:
+            view_id (str): ID of the saved view.
+        """
+        try:
+            get_saved_views(self._board().id).delete(view_id, self.modal_user)
+        except SavedViewError as e:
+            return rx.toast.error(str(e))
+        if view_id == self.active_view_id:
+            self._leave_view()
+            self._refresh_columns()
+        self._load_saved_views()
+
+    def _refresh_columns(self):
+        """
+        Recomputes what the client is sent of the board: the visible window
+        of filtered stocks in each stage, in the stage's chosen sort order,
+        and how many filtered stocks each stage holds.
+
+        Sorted stages read their window from the board store's maintained
+        per-stage order, so a long column costs only the cards shown. The
+        mobile layout shows one stage at a time, so only that stage's window
+        is filled in. Values are only reassigned when they changed, so a
+        change to stocks outside every window sends the client nothing.
+        """
+        with timer(COMPUTED_VAR_SECONDS, var="stocks_by_stage"):
+            stocks = self._filtered_stocks()
+            result = {stage: [] for stage in self.stages}
+            counts = dict.fromkeys(result, 0)
+            for stock in stocks:
+                if stock.status in counts:
+                    counts[stock.status] += 1
+            shown = None if self.is_desktop_layout else self.mobile_active_stage
+            limits = {
+                stage: self.stage_limits.get(stage, STAGE_PAGE_SIZE)
+                for stage in result
+                if shown in (None, stage)
+            }
+            sorts = {stage: self.stage_sorts.get(stage, "board") for stage in limits}
+            board_limits = {
+                stage: limit
+                for stage, limit in limits.items()
+                if sorts[stage] == "board"
+            }
+            if board_limits:
+                for stock in stocks:
+                    limit = board_limits.get(stock.status)
+                    if limit is not None and len(result[stock.status]) < limit:
+                        result[stock.status].append(stock)
+            if len(board_limits) < len(limits):
+                store = self._board_store()
+                visible = {stock.id: stock for stock in stocks}
+                for stage, limit in limits.items():
+                    if stage in board_limits:
+                        continue
+                    stock_ids = store.sorted_stage_ids(
+                        stage, sorts[stage], limit=limit, include=visible
+                    )
+                    result[stage] = [visible[stock_id] for stock_id in stock_ids]
+            if result != self.stocks_by_stage:
+                self.stocks_by_stage = result
+            if counts != self.stage_counts:
+                self.stage_counts = counts
+            if self.is_ocean_modal_open:
+                ocean = [
+                    s for s in self._stocks.values() if s.status == self.archive_stage
+                ]
+                if ocean != self.ocean_stocks:
+                    self.ocean_stocks = ocean
+
+    @rx.event
+    def set_stage_sort(self, stage: str, sort: str):
+        """
+        Changes the order cards are listed in within one stage.
+
+        Args:
+            stage (str): The stage name.
+            sort (str): One of STAGE_SORTS.
+        """
+        if stage not in self.stage_sorts or sort not in STAGE_SORTS:
+            return
+        self.stage_sorts[stage] = sort
+        self.stage_limits[stage] = STAGE_PAGE_SIZE
+        self._refresh_columns()
+
+    @rx.event
+    def show_more_stocks(self, stage: str):
+        """
+        Extends a stage's rendered window by another page of cards.
+
+        Args:
+            stage (str): The stage name.
+        """
+        self.stage_limits[stage] = (
+            self.stage_limits.get(stage, STAGE_PAGE_SIZE) + STAGE_PAGE_SIZE
+        )
+        self._refresh_columns()
 
     @rx.event
     def validate_transition(
@@ -216,37 +496,10 @@ class KanbanState(BaseState):
         Returns:
             tuple[bool, bool, str]: (is_valid, is_forceable, message)
         """
-        if current_stage == new_stage:
-            return (False, False, "Already in this stage.")
-        try:
-            current_idx = next(
-                (i for i, s in enumerate(self.stage_defs) if s.name == current_stage)
-            )
-            new_idx = next(
-                (i for i, s in enumerate(self.stage_defs) if s.name == new_stage)
-            )
-        except StopIteration as e:
-            logging.exception(f"Error: {e}")
-            return (False, False, "Invalid stage definition.")
-        if new_stage == "Ocean":
-            return (True, False, "")
-        if current_stage == "Ocean":
-            if new_stage == "Prospects":
-                return (True, False, "")
-            return (
-                False,
-                True,
-                "Non-standard restoration (Ocean only restores to Prospects).",
-            )
-        if new_idx == current_idx + 1:
-            return (True, False, "")
-        if new_idx < current_idx:
-            return (False, True, "Backward transition detected.")
-        if new_idx > current_idx + 1:
-            return (False, True, f"Skipping {new_idx - current_idx - 1} stages.")
-        return (False, True, "Unknown transition pattern.")
+        return self._board_store().policy.check(current_stage, new_stage)
 
     @rx.event
+    @timed("handle_drop")
     def handle_drop(self, item: dict[str, str | int], new_stage: str):
         """
         Initiates a stock move when a card is dropped. Opens the confirmation modal or force modal.
@@ -261,9 +514,9 @@ class KanbanState(BaseState):
         try:
             stock_id = int(stock_id)
         except (ValueError, TypeError) as e:
-            logging.exception(f"Error converting stock_id to int: {e}")
+            logging.exception("Error converting stock_id to int: %s", e)
             return
-        stock = next((s for s in self.stocks if s.id == stock_id), None)
+        stock = self._stocks.get(stock_id)
         if not stock:
             return
         is_valid, is_forceable, message = self.validate_transition(
@@ -275,6 +528,7 @@ class KanbanState(BaseState):
         self.pending_move_stock_id = stock_id
         self.pending_move_ticker = stock.ticker
         self.pending_move_stage = new_stage
+        self._pending_move_from = stock.status
         self.transition_warning = message
         self.custom_transition_date = datetime.now().strftime("%Y-%m-%dT%H:%M")
         if not is_valid and is_forceable:
@@ -284,44 +538,125 @@ class KanbanState(BaseState):
             self.modal_comment = ""
             self.is_modal_open = True
 
+    def _recall_outcome(
+        self, user: str, idempotency_key: str
+    ) -> IdempotentOutcome | None:
+        """
+        Looks up the outcome of an event that was already applied under this key.
+
+        Args:
+            user (str): The user the key is scoped to.
+            idempotency_key (str): Client-generated key sent with the event.
+
+        Returns:
+            IdempotentOutcome | None: The original outcome if this is a retry.
+        """
+        outcome = idempotency_cache.get(
+            user, idempotency_key, self._board_store().backend
+        )
+        if outcome is not None:
+            logging.info("Replaying outcome for idempotency key %s", idempotency_key)
+        return outcome
+
+    def _remember_outcome(
+        self, user: str, idempotency_key: str, outcome: IdempotentOutcome
+    ) -> IdempotentOutcome:
+        """
+        Records an event outcome so that retries with the same key replay it.
+
+        Args:
+            user (str): The user the key is scoped to.
+            idempotency_key (str): Client-generated key sent with the event.
+            outcome (IdempotentOutcome): The result of applying the event.
+
+        Returns:
+            IdempotentOutcome: The recorded outcome.
+        """
+        idempotency_cache.put(
+            user, idempotency_key, outcome, self._board_store().backend
+        )
+        return outcome
+
+    @staticmethod
+    def _outcome_toast(outcome: IdempotentOutcome):
+        """
+        Builds the toast that reports an event outcome to the user.
+
+        Args:
+            outcome (IdempotentOutcome): The outcome to report.
+
+        Returns:
+            EventSpec: The toast event for the outcome's level.
+        """
+        return getattr(rx.toast, outcome.level)(outcome.message)
+
     @rx.event
-    def confirm_move(self):
+    @timed("confirm_move")
+    def confirm_move(self, idempotency_key: str = ""):
         """
         Executes the pending move after user confirmation.
+
+        Args:
+            idempotency_key (str): Client-generated key that makes retries safe.
         """
-        if self.pending_move_stock_id != -1 and self.pending_move_stage:
+        outcome = self._recall_outcome(self.modal_user, idempotency_key)
+        if (
+            outcome is None
+            and self.pending_move_stock_id != -1
+            and self.pending_move_stage
+        ):
             final_comment = self.modal_comment or "No comment provided"
             if self.transition_warning:
                 final_comment = f"[{self.transition_warning}] {final_comment}"
-            self.move_stock(
-                self.pending_move_stock_id,
-                self.pending_move_stage,
-                final_comment,
+            outcome = self._remember_outcome(
                 self.modal_user,
-                force_override=False,
-                custom_timestamp=self.custom_transition_date,
+                idempotency_key,
+                self._apply_move(
+                    self.pending_move_stock_id,
+                    self.pending_move_stage,
+                    final_comment,
+                    self.modal_user,
+                    force_override=False,
+                    custom_timestamp=self.custom_transition_date,
+                    from_stage=self._pending_move_from or None,
+                ),
             )
         self.cancel_move()
+        if outcome is not None and outcome.message:
+            yield self._outcome_toast(outcome)
 
     @rx.event
-    def confirm_force_move(self):
+    @timed("confirm_force_move")
+    def confirm_force_move(self, idempotency_key: str = ""):
         """
         Executes a forced transition.
+
+        Args:
+            idempotency_key (str): Client-generated key that makes retries safe.
         """
-        if not self.force_rationale:
-            yield rx.toast.error("Rationale is required for forced transitions.")
-            return
-        if self.pending_move_stock_id != -1 and self.pending_move_stage:
-            self.move_stock(
-                self.pending_move_stock_id,
-                self.pending_move_stage,
-                self.force_rationale,
-                self.modal_user,
-                force_override=True,
-                rationale=self.force_rationale,
-                custom_timestamp=self.custom_transition_date,
-            )
+        outcome = self._recall_outcome(self.modal_user, idempotency_key)
+        if outcome is None:
+            if not self.force_rationale:
+                yield rx.toast.error("Rationale is required for forced transitions.")
+                return
+            if self.pending_move_stock_id != -1 and self.pending_move_stage:
+                outcome = self._remember_outcome(
+                    self.modal_user,
+                    idempotency_key,
+                    self._apply_move(
+                        self.pending_move_stock_id,
+                        self.pending_move_stage,
+                        self.force_rationale,
+                        self.modal_user,
+                        force_override=True,
+                        rationale=self.force_rationale,
+                        custom_timestamp=self.custom_transition_date,
+                        from_stage=self._pending_move_from or None,
+                    ),
+                )
         self.close_force_modal()
+        if outcome is not None and outcome.message:
+            yield self._outcome_toast(outcome)
 
     @rx.event
     def cancel_move(self):
@@ -332,6 +667,7 @@ class KanbanState(BaseState):
         self.pending_move_stock_id = -1
         self.pending_move_ticker = ""
         self.pending_move_stage = ""
+        self._pending_move_from = ""
         self.modal_comment = ""
         self.transition_warning = ""
         self.custom_transition_date = ""
@@ -343,6 +679,7 @@ class KanbanState(BaseState):
         self.pending_move_stock_id = -1
         self.pending_move_ticker = ""
         self.pending_move_stage = ""
+        self._pending_move_from = ""
         self.force_rationale = ""
         self.transition_warning = ""
         self.custom_transition_date = ""
@@ -353,7 +690,7 @@ class KanbanState(BaseState):
         self.is_add_modal_open = True
         self.new_stock_ticker = ""
         self.new_stock_company = ""
-        self.new_stock_stage = "Universe"
+        self.new_stock_stage = self.stage_defs[0].name
 
     @rx.event
     def close_add_modal(self):
@@ -361,6 +698,7 @@ class KanbanState(BaseState):
         self.is_add_modal_open = False
 
     @rx.event
+    @timed("open_detail_modal")
     def open_detail_modal(self, stock_id: int, tab: str = "overview"):
         """
         Opens the detail modal for a specific stock.
@@ -372,12 +710,28 @@ class KanbanState(BaseState):
         self.detail_stock_id = stock_id
         self.active_detail_tab = tab
         self.is_detail_modal_open = True
+        self._load_detail()
 
     @rx.event
     def close_detail_modal(self):
         """Closes the detail modal."""
         self.is_detail_modal_open = False
+        self._release_detail()
+
+    def _load_detail(self):
+        """
+        Fetches the detail modal's stock and its history from the board store.
+        """
+        store = self._board_store()
+        stock = store.get_stock(self.detail_stock_id)
+        self.current_detail_stock = stock or _no_stock()
+        self.current_detail_logs = list(store.timeline(self.detail_stock_id))
+
+    def _release_detail(self):
+        """Clears the detail modal's data so it is no longer kept or sent."""
         self.detail_stock_id = -1
+        self.current_detail_stock = _no_stock()
+        self.current_detail_logs = []
 
     @rx.event
     def set_active_detail_tab(self, value: str):
@@ -391,13 +745,67 @@ class KanbanState(BaseState):
 
     @rx.event
     def open_ocean_modal(self):
-        """Opens the Ocean archive modal."""
+        """Opens the Ocean archive modal with the first page of cold storage."""
         self.is_ocean_modal_open = True
+        self._load_archive(ARCHIVE_PAGE_SIZE)
+        self._refresh_columns()
 
     @rx.event
     def close_ocean_modal(self):
-        """Closes the Ocean archive modal."""
+        """Closes the Ocean archive modal and drops the stocks it listed."""
         self.is_ocean_modal_open = False
+        self.ocean_stocks = []
+        self.archived_stocks = []
+
+    @rx.event
+    def load_more_archived(self):
+        """Loads the next page of archived stocks into the Ocean modal."""
+        self._load_archive(len(self.archived_stocks) + ARCHIVE_PAGE_SIZE)
+
+    def _load_archive(self, limit: int):
+        """
+        Reads the first archived stocks from the board store's cold tier.
+
+        Args:
+            limit (int): Number of stocks to show.
+        """
+        self.archived_stocks, self.archived_ocean_count = (
+            self._board_store().archived_stocks(0, limit)
+        )
+
+    @rx.event
+    @timed("restore_archived_stock")
+    def restore_archived_stock(self, stock_id: int, idempotency_key: str = ""):
+        """
+        Restores an archived stock to the board by moving it to the stage
+        the board's rules restore its archive stage to.
+
+        Args:
+            stock_id (int): ID of the archived stock.
+            idempotency_key (str): Client-generated key that makes retries safe.
+        """
+        outcome = self._recall_outcome(self.modal_user, idempotency_key)
+        if outcome is None:
+            restore_stage = self._board_store().policy.restore_stage
+            if restore_stage is None:
+                yield rx.toast.error(
+                    f"{self._board().name} has no stage archived stocks restore to."
+                )
+                return
+            outcome = self._remember_outcome(
+                self.modal_user,
+                idempotency_key,
+                self._apply_move(
+                    stock_id,
+                    restore_stage,
+                    f"Restored from the {self.archive_stage} archive",
+                    self.modal_user,
+                ),
+            )
+        if outcome.ok:
+            self._load_archive(max(len(self.archived_stocks), ARCHIVE_PAGE_SIZE))
+        if outcome.message:
+            yield self._outcome_toast(outcome)
 
     @rx.event
     def set_new_stock_ticker(self, value: str):
@@ -418,6 +826,9 @@ class KanbanState(BaseState):
     def set_modal_user(self, value: str):
         """Sets the user performing the action in the confirmation modal."""
         self.modal_user = value
+        self._load_saved_views()
+        self._refresh_view()
+        self._refresh_columns()
 
     @rx.event
     def set_custom_transition_date(self, value: str):
@@ -435,71 +846,133 @@ class KanbanState(BaseState):
         self.force_rationale = value
 
     @rx.event
-    def submit_new_stock(self):
+    @timed("submit_new_stock")
+    def submit_new_stock(self, idempotency_key: str = ""):
         """
         Creates a new stock entity based on form data.
+
+        Args:
+            idempotency_key (str): Client-generated key that makes retries safe.
         """
-        if not self.new_stock_ticker or not self.new_stock_company:
-            yield rx.toast.error("Ticker and Company Name are required.")
-            return
-        if any(
-            (s.ticker.upper() == self.new_stock_ticker.upper() for s in self.stocks)
-        ):
-            yield rx.toast.error(f"Stock {self.new_stock_ticker} already exists.")
-            return
-        new_id = self.next_stock_id
-        self.next_stock_id += 1
-        new_log_id = self.next_log_id
-        self.next_log_id += 1
-        new_stock = Stock(
-            id=new_id,
-            ticker=self.new_stock_ticker.upper(),
-            company_name=self.new_stock_company,
-            status=self.new_stock_stage,
-            last_updated=get_utc_now(),
-            current_stage_entered_at=get_utc_now(),
-            days_in_stage=0,
-            last_log_id=new_log_id,
-        )
-        self.stocks.append(new_stock)
-        initial_log = StateTransitionLog(
-            id=new_log_id,
-            stock_id=new_id,
-            ticker=new_stock.ticker,
-            previous_stage="VOID",
-            new_stage=self.new_stock_stage,
-            timestamp=get_utc_now(),
-            user_comment="Initial creation",
-            updated_by="System",
-            previous_log_id=None,
+        outcome = self._recall_outcome(self.modal_user, idempotency_key)
+        if outcome is None:
+            outcome = self._remember_outcome(
+                self.modal_user,
+                idempotency_key,
+                self._apply_create(
+                    self.new_stock_ticker, self.new_stock_company, self.new_stock_stage
+                ),
+            )
+        yield self._outcome_toast(outcome)
+        if outcome.ok:
+            self.close_add_modal()
+
+    def _apply_create(
+        self,
+        ticker: str,
+        company_name: str,
+        stage: str,
+        effective_time: datetime | None = None,
+    ) -> IdempotentOutcome:
+        """
+        Creates a stock on the shared board and adds it to this session's view.
+
+        Args:
+            ticker (str): Ticker symbol of the new stock.
+            company_name (str): Company name of the new stock.
+            stage (str): Initial stage of the new stock.
+            effective_time (datetime | None): When the stock was created. Defaults to now.
+
+        Returns:
+            IdempotentOutcome: The result of the creation.
+        """
+        store = self._board_store()
+        outcome = commands.create_stock(
+            store, ticker, company_name, stage, effective_time=effective_time
         )
-        self.logs.append(initial_log)
-        logging.info(f"Created Stock #{new_id} with initial Log #{new_log_id}")
-        yield rx.toast.success(f"Added {new_stock.ticker} to {self.new_stock_stage}")
-        self.close_add_modal()
+        if outcome.ok:
+            self._upsert_stock(store.get_stock(outcome.stock_id))
+            self._refresh_view()
+            self._refresh_columns()
+        return outcome
+
+    def _upsert_stock(self, stock: Stock | None):
+        """
+        Replaces a stock in this session's view, appending it if it is new.
+
+        Args:
+            stock (Stock | None): The fresh copy from the store.
+        """
+        if stock is None:
+            return
+        if stock.id == self.detail_stock_id:
+            self._load_detail()
+        self._stocks[stock.id] = stock
 
     @rx.event
-    def delete_stock(self, stock_id: int):
+    @timed("delete_stock")
+    def delete_stock(self, stock_id: int, idempotency_key: str = ""):
         """
         Deletes a stock from the board.
 
         Args:
             stock_id (int): ID of the stock to delete.
+            idempotency_key (str): Client-generated key that makes retries safe.
+        """
+        outcome = self._recall_outcome(self.modal_user, idempotency_key)
+        if outcome is None:
+            outcome = commands.delete_stock(self._board_store(), stock_id)
+            if not outcome.ok:
+                return
+            self._remember_outcome(self.modal_user, idempotency_key, outcome)
+        self._stocks.pop(stock_id, None)
+        if self.is_detail_modal_open and self.detail_stock_id == stock_id:
+            self.is_detail_modal_open = False
+            self._release_detail()
+        self._refresh_view()
+        self._refresh_columns()
+        yield self._outcome_toast(outcome)
+
+    def _apply_board_frame(self, frame: BoardFrame):
+        """
+        Applies board changes made by other sessions or workers to this view.
+
+        The changes go to the session's server-side copy; the client is only
+        sent the stage windows and counts that came out different.
+
+        Args:
+            frame (BoardFrame): Coalesced changes, or a snapshot marker after
+                which the board's layout and stocks are reloaded, e.g. once
+                the boards file changed.
         """
-        stock = next((s for s in self.stocks if s.id == stock_id), None)
-        if stock:
-            self.stocks = [s for s in self.stocks if s.id != stock_id]
-            if self.is_detail_modal_open and self.detail_stock_id == stock_id:
-                self.is_detail_modal_open = False
-                self.detail_stock_id = -1
-            yield rx.toast.success(f"Deleted stock {stock.ticker}")
+        if frame.snapshot:
+            self._apply_board()
+            self.load_stocks()
+            return
+        for stock_id in frame.deleted:
+            self._stocks.pop(stock_id, None)
+        if self.detail_stock_id in frame.deleted:
+            self.is_detail_modal_open = False
+            self._release_detail()
+        for stock in frame.stocks.values():
+            self._upsert_stock(self._calculate_days_in_stage(stock.copy()))
+        self._refresh_view()
+        self._refresh_columns()
 
     @rx.event
+    @timed("load_stocks")
     def load_stocks(self):
         """
-        Load all stocks from the database (simulated).
+        Load all stocks from the shared board store.
         """
+        store = self._board_store()
+        self._stocks = {stock.id: stock for stock in store.stocks()}
+        self.archived_ocean_count = store.archive.stock_count()
         self.refresh_stock_ages()
+        if self.detail_stock_id != -1:
+            self._load_detail()
+        if self.is_ocean_modal_open:
+            self._load_archive(max(len(self.archived_stocks), ARCHIVE_PAGE_SIZE))
 
     def _calculate_days_in_stage(self, stock: Stock) -> Stock:
         """
@@ -522,16 +995,22 @@ class KanbanState(BaseState):
         """
         Recalculates days_in_stage for all stocks to ensure staleness is accurate.
         """
-        self.stocks = [self._calculate_days_in_stage(s) for s in self.stocks]
+        for stock in self._stocks.values():
+            self._calculate_days_in_stage(stock)
+        self._refresh_view()
+        self._refresh_columns()
 
     @rx.event
     def initialize_sample_data(self):
         """
-        Seeds the database with sample data if the Stock table is empty.
+        Seeds the default board with sample data if it is empty. Other
+        boards have stages of their own and start empty.
         """
+        if self._board().id != DEFAULT_BOARD_ID:
+            return
         try:
-            if not self.stocks:
-                logging.info("State empty. Seeding sample data...")
+            store = self._board_store()
+            if store.is_empty():
                 sample_data = [
                     ("AAPL", "Apple Inc.", "Universe", 2),
                     ("MSFT", "Microsoft Corp.", "Universe", 45),
@@ -546,50 +1025,18 @@ class KanbanState(BaseState):
                     ("CRM", "Salesforce", "Prospects", 8),
                     ("UBER", "Uber Technologies", "Outreach", 3),
                 ]
-                for ticker, name, status, days_stale in sample_data:
-                    entered_at = get_utc_now() - timedelta(days=days_stale)
-                    s_id = self.next_stock_id
-                    self.next_stock_id += 1
-                    l_id = self.next_log_id
-                    self.next_log_id += 1
-                    stock = Stock(
-                        id=s_id,
-                        ticker=ticker,
-                        company_name=name,
-                        status=status,
-                        last_updated=entered_at,
-                        current_stage_entered_at=entered_at,
-                        days_in_stage=days_stale,
-                        last_log_id=l_id,
-                    )
-                    self.stocks.append(stock)
-                    log = StateTransitionLog(
-                        id=l_id,
-                        stock_id=s_id,
-                        ticker=ticker,
-                        previous_stage="VOID",
-                        new_stage=status,
-                        timestamp=entered_at,
-                        user_comment="Initial Seed Data",
-                        updated_by="System",
-                        days_in_previous_stage=0,
-                        previous_log_id=None,
-                    )
-                    self.logs.append(log)
-            else:
-                migrated = False
-                for stock in self.stocks:
-                    if stock.id == 0:
-                        stock.id = self.next_stock_id
-                        self.next_stock_id += 1
-                        migrated = True
-                if migrated:
-                    self.stocks = list(self.stocks)
+                rows = [
+                    (ticker, name, status, get_utc_now() - timedelta(days=days_stale))
+                    for ticker, name, status, days_stale in sample_data
+                ]
+                if store.seed_if_empty(rows):
+                    logging.info("Board empty. Seeded sample data.")
         except Exception as e:
-            logging.exception(f"Error initializing sample data: {e}")
+            logging.exception("Error initializing sample data: %s", e)
             self.last_error = f"Initialization Error: {str(e)}"
 
     @rx.event
+    @timed("move_stock")
     def move_stock(
         self,
         stock_id: int,
@@ -599,6 +1046,7 @@ class KanbanState(BaseState):
         force_override: bool = False,
         rationale: str = "",
         custom_timestamp: str = "",
+        idempotency_key: str = "",
     ):
         """
         Moves a stock to a new stage transactionally.
@@ -611,66 +1059,110 @@ class KanbanState(BaseState):
             force_override (bool): Flag if this was a forced move.
             rationale (str): Reason for forcing if applicable.
             custom_timestamp (str): Optional override string (ISO 8601).
+            idempotency_key (str): Client-generated key that makes retries safe.
+        """
+        outcome = self._recall_outcome(user, idempotency_key)
+        if outcome is None:
+            outcome = self._remember_outcome(
+                user,
+                idempotency_key,
+                self._apply_move(
+                    stock_id,
+                    new_stage,
+                    comment,
+                    user,
+                    force_override=force_override,
+                    rationale=rationale,
+                    custom_timestamp=custom_timestamp,
+                ),
+            )
+        if outcome.message:
+            yield self._outcome_toast(outcome)
+
+    def _apply_move(
+        self,
+        stock_id: int,
+        new_stage: str,
+        comment: str,
+        user: str,
+        force_override: bool = False,
+        rationale: str = "",
+        custom_timestamp: str = "",
+        from_stage: str | None = None,
+    ) -> IdempotentOutcome:
+        """
+        Applies a stage move on the shared board and updates this session's view.
+
+        Args:
+            stock_id (int): ID of stock to move.
+            new_stage (str): Destination stage.
+            comment (str): User comment for the logs.
+            user (str): Username performing the action.
+            force_override (bool): Flag if this was a forced move.
+            rationale (str): Reason for forcing if applicable.
+            custom_timestamp (str): Optional override string (ISO 8601).
+            from_stage (str | None): The stage the move was checked from; it
+                fails if another session moved the stock since.
+
+        Returns:
+            IdempotentOutcome: The result of the move.
         """
-        if new_stage not in self.stages:
-            self.last_error = f"Invalid stage: {new_stage}"
-            return
         effective_time = get_utc_now()
         if custom_timestamp:
             try:
-                dt_local = datetime.strptime(custom_timestamp, "%Y-%m-%dT%H:%M")
-                effective_time = dt_local.astimezone(timezone.utc)
+                effective_time = parse_effective_timestamp(custom_timestamp)
             except (ValueError, TypeError) as e:
                 logging.exception(
-                    f"Invalid custom timestamp '{custom_timestamp}': {e}, using current time"
+                    "Invalid custom timestamp '%s': %s, using current time",
+                    custom_timestamp,
+                    e,
                 )
-        found_stock = False
-        for stock in self.stocks:
-            if stock.id == stock_id:
-                found_stock = True
-                if stock.status == new_stage:
-                    return
-                current_stage = stock.status
-                duration = stock.days_in_stage
-                previous_log_id = stock.last_log_id
-                l_id = self.next_log_id
-                self.next_log_id += 1
-                stock.status = new_stage
-                stock.last_updated = effective_time
-                stock.current_stage_entered_at = effective_time
-                stock.days_in_stage = 0
-                stock.is_forced = force_override
-                stock.last_log_id = l_id
-                log = StateTransitionLog(
-                    id=l_id,
-                    stock_id=stock.id,
-                    ticker=stock.ticker,
-                    previous_stage=current_stage,
-                    new_stage=new_stage,
-                    timestamp=effective_time,
-                    user_comment=comment,
-                    updated_by=user,
-                    days_in_previous_stage=duration,
-                    is_forced_transition=force_override,
-                    forced_rationale=rationale,
-                    previous_log_id=previous_log_id,
-                )
-                self.logs.append(log)
-                logging.info(
-                    f"Log #{l_id} (prev: #{previous_log_id}) created for Stock #{stock.id} [{stock.ticker}]"
+        store = self._board_store()
+        outcome = commands.move_stock(
+            store,
+            stock_id,
+            new_stage,
+            comment,
+            user,
+            force_override=force_override,
+            rationale=rationale,
+            effective_time=effective_time,
+            from_stage=from_stage,
+        )
+        if outcome.level == "error":
+            self.last_error = outcome.message
+        elif outcome.ok:
+            self._upsert_stock(store.get_stock(stock_id))
+            self._refresh_view()
+            self._refresh_columns()
+            self.last_error = ""
+        return outcome
+
+    def _count_moves_since_last_visit(self):
+        """
+        Counts transitions that took effect since this browser last loaded
+        the board, then records the current visit.
+        """
+        now = get_utc_now()
+        self.moves_since_last_visit = 0
+        if self.last_visit_at:
+            try:
+                since = parse_effective_timestamp(self.last_visit_at)
+            except ValueError:
+                since = None
+            if since is not None:
+                self.moves_since_last_visit = self._board_store().count_logs_between(
+                    since, now
                 )
-                if force_override:
-                    yield rx.toast.warning(f"Forced move: {stock.ticker} → {new_stage}")
-                else:
-                    yield rx.toast.success(f"Moved {stock.ticker} to {new_stage}")
-                break
-        self.stocks = list(self.stocks)
-        if not found_stock:
-            self.last_error = f"Stock ID {stock_id} not found."
-            return
-        self.last_error = ""
+        self.last_visit_at = now.isoformat()
+
+    @rx.event
+    def dismiss_visit_summary(self):
+        """Hides the count of transitions since the last visit."""
+        self.moves_since_last_visit = 0
 
     @rx.event
+    @timed("on_load")
     def on_load(self):
         """
         Event handler for page load. Initializes DB and loads data.
@@ -680,6 +1172,69 @@ class KanbanState(BaseState):
             logging.info(
                 "Database URL found, but using in-memory list for this Starter Code."
             )
+        self._apply_board()
         self.initialize_sample_data()
         self.load_stocks()
-        self.refresh_stock_ages()
\ No newline at end of file
+        self.refresh_stock_ages()
+        self._load_saved_views()
+        self._count_moves_since_last_visit()
+        get_board_broadcaster(self.board_id).subscribe(self.router.session.client_token)
+
+    def _apply_board(self):
+        """
+        Lays the board out for the board this session works on: its
+        columns, and the sort order and page size of each. Choices made for
+        stages of the same name are kept.
+        """
+        board = self._board()
+        self.board_id = board.id
+        self.stage_defs = list(board.stages)
+        self.archive_stage = next(
+            (stage.name for stage in board.stages if stage.archive), ""
+        )
+        self.restore_stage = self._board_store().policy.restore_stage or ""
+        names = [stage.name for stage in board.stages]
+        self.stage_sorts = {name: self.stage_sorts.get(name, "board") for name in names}
+        self.stage_limits = {
+            name: self.stage_limits.get(name, STAGE_PAGE_SIZE) for name in names
+        }
+        if self.new_stock_stage not in names:
+            self.new_stock_stage = names[0]
+        if self.mobile_active_stage not in names:
+            self.mobile_active_stage = names[0]
+
+    @rx.event
+    @timed("switch_board")
+    def switch_board(self, board_id: str):
+        """
+        Opens another board in this session: closes the modals, leaves the
+        saved view, and reloads the stocks, views and live updates from the
+        new board's store.
+
+        Args:
+            board_id (str): ID of the board.
+        """
+        if board_id == self._board().id:
+            return
+        try:
+            get_board_def(board_id)
+        except UnknownBoardError as e:
+            return rx.toast.error(str(e))
+        token = self.router.session.client_token
+        get_board_broadcaster(self._board().id).unsubscribe(token)
+        self.board_id = board_id
+        self.is_modal_open = False
+        self.is_force_modal_open = False
+        self.is_add_modal_open = False
+        self.is_view_modal_open = False
+        self.is_detail_modal_open = False
+        self._release_detail()
+        self.close_ocean_modal()
+        self._leave_view()
+        self.stage_sorts = {}
+        self.stage_limits = {}
+        self._apply_board()
+        self.load_stocks()
+        self._load_saved_views()
+        self.moves_since_last_visit = 0
+        get_board_broadcaster(board_id).subscribe(token)
@@ -0,0 +1,56 @@
+import reflex as rx
+import asyncio
+from app.models import BoardSummary
+from app.services.metrics import timed
+from app.services.portfolio import (
+    PORTFOLIO_ID,
+    PORTFOLIO_NAME,
+    board_summaries,
+    merge_summaries,
+)
+from app.states.base_state import BaseState
+
+
+class PortfolioState(BaseState):
+    """
+    Manages the cross-board overview: every desk's board side by side with
+    the portfolio total.
+    """
+
+    summaries: list[BoardSummary] = []
+    total: BoardSummary = BoardSummary(board_id=PORTFOLIO_ID, name=PORTFOLIO_NAME)
+    stage_columns: list[str] = []
+
+    @rx.event(background=True)
+    @timed("portfolio_refresh")
+    async def refresh(self):
+        """
+        Reads every board's figures, in parallel, and adds them up. Each
+        board's stage counts are filled in for every stage column, so
+        stages a board lacks show as 0.
+
+        The boards are read on a worker thread, so a slow board does not
+        hold up other sessions' events.
+        """
+        summaries = await asyncio.to_thread(board_summaries)
+        total = merge_summaries(summaries)
+        stage_columns = list(total.stage_counts)
+        for summary in summaries:
+            summary.stage_counts = {
+                stage: summary.stage_counts.get(stage, 0) for stage in stage_columns
+            }
+        async with self:
+            self.total = total
+            self.stage_columns = stage_columns
+            self.summaries = summaries
+
+    @rx.event
+    def open_board(self, board_id: str):
+        """
+        Opens a board on the dashboard.
+
+        Args:
+            board_id (str): ID of the board.
+        """
+        self.board_id = board_id
+        return rx.redirect("/")
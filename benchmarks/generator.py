@@ -0,0 +1,211 @@
+"""
+Deterministic synthetic boards for benchmarks.
+
+The same scale and seed always produce the same stocks and transition
+histories. Histories follow the pipeline mostly forward, with occasional
+backward, skipping and Ocean moves recorded as forced where the board's
+transition rules require it, so logs look like the ones analysts produce.
+"""
+
+import random
+import string
+from datetime import datetime, timedelta
+
+from app.models import (
+    ForcedReview,
+    Stock,
+    StateTransitionLog,
+    get_utc_now,
+)
+from app.services.board_backend import MemoryBoardBackend
+from app.services.board_store import BoardStore, days_since
+from app.services.boards import bundled_board_config
+from app.services.sequences import IdSequence, MemorySequenceStore
+
+# Generated boards have the standard pipeline of the bundled boards file.
+_STANDARD = bundled_board_config()
+STANDARD_BOARD = _STANDARD.boards[0]
+STAGE_NAMES = [stage.name for stage in STANDARD_BOARD.stages]
+POLICY = _STANDARD.policies[STANDARD_BOARD.id]
+USERS = [
+    "Analyst A",
+    "Analyst B",
+    "Senior Analyst",
+    "Portfolio Manager",
+    "Compliance Officer",
+]
+HISTORY_DAYS = 730
+MEAN_DAYS_IN_STAGE = 21.0
+MEAN_MOVES = 3.0
+
+
+def ticker_for(index: int) -> str:
+    """
+    Returns a unique ticker for a stock index: A..Z, then AA..ZZ, and so on.
+
+    Args:
+        index (int): Zero-based stock index.
+
+    Returns:
+        str: The ticker.
+    """
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = string.ascii_uppercase[remainder] + letters
+    return letters
+
+
+class PresetBoardBackend(MemoryBoardBackend):
+    """
+    In-process backend whose initial board is a pre-built set of stocks and
+    logs, so a large board loads without running one transaction per move.
+    """
+
+    def __init__(
+        self,
+        stocks: list[Stock],
+        logs: list[StateTransitionLog],
+        sequences: MemorySequenceStore,
+    ):
+        """
+        Args:
+            stocks (list[Stock]): The board's stocks.
+            logs (list[StateTransitionLog]): Their logs in append order.
+            sequences (MemorySequenceStore): IDs already reserved past the
+                preset stocks and logs.
+        """
+        super().__init__(sequences)
+        self._stocks = stocks
+        self._logs = logs
+
+    def load(
+        self,
+    ) -> tuple[list[Stock], list[StateTransitionLog], list[ForcedReview], int]:
+        return self._stocks, self._logs, [], 0
+
+
+def _next_stage(rng: random.Random, stage: str) -> str:
+    """Picks a plausible next stage for a stock."""
+    index = STAGE_NAMES.index(stage)
+    roll = rng.random()
+    if stage == "Ocean":
+        return "Prospects" if roll < 0.9 else rng.choice(STAGE_NAMES[:-1])
+    if roll < 0.08:
+        return "Ocean"
+    if roll < 0.16 and index > 0:
+        return STAGE_NAMES[rng.randrange(index)]
+    if roll < 0.22 and index + 2 < len(STAGE_NAMES) - 1:
+        return STAGE_NAMES[index + 2]
+    return STAGE_NAMES[min(index + 1, len(STAGE_NAMES) - 2)]
+
+
+def generate_board(
+    stock_count: int, seed: int = 42, now: datetime | None = None
+) -> tuple[list[Stock], list[StateTransitionLog]]:
+    """
+    Generates stocks and their transition histories.
+
+    Every stock starts with a creation log in 'Universe' and then moves a
+    geometric number of times (MEAN_MOVES on average), spending an
+    exponentially distributed number of days in each stage.
+
+    Args:
+        stock_count (int): Number of stocks.
+        seed (int): Random seed.
+        now (datetime | None): Latest time a log may have. Defaults to now.
+
+    Returns:
+        tuple[list[Stock], list[StateTransitionLog]]: Stocks with IDs from 1,
+            and logs with IDs from 1 in timestamp order per stock.
+    """
+    rng = random.Random(seed)
+    now = now or get_utc_now()
+    stocks: list[Stock] = []
+    logs: list[StateTransitionLog] = []
+    for index in range(stock_count):
+        stock_id = index + 1
+        ticker = ticker_for(index)
+        moment = now - timedelta(days=rng.uniform(0, HISTORY_DAYS))
+        stage = "Universe"
+        creation = StateTransitionLog.construct(
+            id=len(logs) + 1,
+            stock_id=stock_id,
+            ticker=ticker,
+            previous_stage="VOID",
+            new_stage=stage,
+            timestamp=moment,
+            user_comment="Initial creation",
+            updated_by="System",
+            days_in_previous_stage=0,
+            is_forced_transition=False,
+            forced_rationale="",
+            previous_log_id=None,
+        )
+        logs.append(creation)
+        last = creation
+        forced = False
+        while rng.random() < MEAN_MOVES / (MEAN_MOVES + 1):
+            moved_at = moment + timedelta(days=rng.expovariate(1 / MEAN_DAYS_IN_STAGE))
+            if moved_at >= now:
+                break
+            new_stage = _next_stage(rng, stage)
+            if new_stage == stage:
+                break
+            is_valid, _, message = POLICY.check(stage, new_stage)
+            forced = not is_valid
+            last = StateTransitionLog.construct(
+                id=len(logs) + 1,
+                stock_id=stock_id,
+                ticker=ticker,
+                previous_stage=stage,
+                new_stage=new_stage,
+                timestamp=moved_at,
+                user_comment=f"Moved to {new_stage}",
+                updated_by=rng.choice(USERS),
+                days_in_previous_stage=(moved_at - moment).days,
+                is_forced_transition=forced,
+                forced_rationale=message if forced else "",
+                previous_log_id=last.id,
+            )
+            logs.append(last)
+            stage, moment = new_stage, moved_at
+        stocks.append(
+            Stock.construct(
+                id=stock_id,
+                ticker=ticker,
+                company_name=f"{ticker} Holdings",
+                status=stage,
+                last_updated=moment,
+                current_stage_entered_at=moment,
+                days_in_stage=days_since(moment),
+                is_forced=forced,
+                last_log_id=last.id,
+            )
+        )
+    return stocks, logs
+
+
+def build_store(stock_count: int, seed: int = 42) -> BoardStore:
+    """
+    Builds a standalone board store holding a generated board.
+
+    Args:
+        stock_count (int): Number of stocks.
+        seed (int): Random seed.
+
+    Returns:
+        BoardStore: A store that does not touch the deployment's data.
+    """
+    stocks, logs = generate_board(stock_count, seed)
+    sequences = MemorySequenceStore()
+    sequences.reserve("stock", len(stocks))
+    sequences.reserve("log", len(logs))
+    return BoardStore(
+        STAGE_NAMES,
+        policy=POLICY,
+        stock_ids=IdSequence(sequences, "stock"),
+        log_ids=IdSequence(sequences, "log"),
+        backend=PresetBoardBackend(stocks, logs, sequences),
+    )
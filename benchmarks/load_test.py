@@ -0,0 +1,570 @@
+"""
+Headless load generator for a running app.
+
+Opens many analyst sessions over the same websocket protocol the browser
+uses, seeds each one through /_create_state when the server enables it, and
+replays a weighted mix of searches, drops with confirmation, detail-modal
+opens, stale filters and exports with exponential think times. Reports
+throughput, latency percentiles per action and the server's resident memory
+read from /metrics.
+
+Usage:
+    python -m benchmarks.load_test --url http://localhost:8000 --sessions 200
+    python -m benchmarks.load_test --sessions 50 --record trace.jsonl
+    python -m benchmarks.load_test --replay trace.jsonl --speed 2
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+import websockets
+from reflex import constants
+
+from benchmarks.generator import STAGE_NAMES, USERS
+
+ROOT_STATE = "reflex___state____state"
+KANBAN_STATE = (
+    f"{ROOT_STATE}.app___states___base_state____base_state"
+    ".app___states___kanban_state____kanban_state"
+)
+NAMESPACE = "/_event"
+EVENT_PREFIX = f"42{NAMESPACE},"
+DEFAULT_MIX = {
+    "search": 30,
+    "drop": 20,
+    "detail": 20,
+    "clear": 10,
+    "stale": 5,
+    "export": 2,
+}
+SEARCH_TERMS = ["a", "ab", "co", "in", "hold", "tech", "x", "corp"]
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Returns the q-th percentile of values by linear interpolation.
+
+    Args:
+        values (list[float]): Samples.
+        q (float): Percentile from 0 to 100.
+
+    Returns:
+        float: The percentile, or 0.0 for no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class Action:
+    """
+    One user action: a named group of events sent back to back.
+
+    Attributes:
+        kind (str): Action name, e.g. 'drop'.
+        at (float): Seconds after the session started.
+        events (list[tuple[str, dict]]): Handler names and payloads.
+    """
+
+    kind: str
+    at: float
+    events: list[tuple[str, dict]]
+
+
+@dataclass
+class _Waiting:
+    """An event awaiting its final state update."""
+
+    marker: str
+    future: asyncio.Future
+    matched: bool = False
+    events: list[dict] = field(default_factory=list)
+
+
+class ReflexSession:
+    """
+    One websocket session speaking Engine.IO 4 / Socket.IO to the backend.
+
+    Events are sent one at a time. Each carries a unique query parameter in
+    its router data, so the update that answers it can be told apart from
+    board updates pushed to the session in between.
+    """
+
+    def __init__(self, base_url: str, token: str, timeout: float):
+        """
+        Args:
+            base_url (str): The backend URL, e.g. http://localhost:8000.
+            token (str): The client token.
+            timeout (float): Seconds to wait for an event to finish.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.stocks: dict[int, str] = {}
+        self._seq = 0
+        self._waiting: _Waiting | None = None
+        self._ws = None
+        self._reader: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        """Opens the websocket, joins the event namespace and loads the page."""
+        url = self.base_url.replace("http", "ws", 1)
+        self._ws = await websockets.connect(
+            f"{url}{NAMESPACE}/?EIO=4&transport=websocket&token={self.token}",
+            subprotocols=[constants.Reflex.VERSION],
+            max_size=None,
+        )
+        opened = await self._ws.recv()
+        if not opened.startswith("0"):
+            raise ConnectionError(f"Unexpected Engine.IO open packet: {opened!r}")
+        await self._ws.send(f"40{NAMESPACE},")
+        while not (await self._ws.recv()).startswith(f"40{NAMESPACE}"):
+            pass
+        self._reader = asyncio.create_task(self._read())
+        # The browser sends these two on page load; the second runs on_load.
+        await self.call(f"{ROOT_STATE}.{constants.CompileVars.HYDRATE}", {})
+        await self.call(f"{ROOT_STATE}.{constants.CompileVars.ON_LOAD_INTERNAL}", {})
+
+    async def close(self) -> None:
+        """Closes the websocket."""
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def call(self, name: str, payload: dict) -> None:
+        """
+        Sends an event and waits until it and any backend events it chains
+        (such as on_load after hydrate) have finished.
+
+        Args:
+            name (str): Handler name, relative to the board state unless it
+                contains a dot.
+            payload (dict): Handler arguments.
+
+        Raises:
+            TimeoutError: If the server does not finish the event in time.
+        """
+        pending = [(name if "." in name else f"{KANBAN_STATE}.{name}", payload)]
+        while pending:
+            full_name, event_payload = pending.pop(0)
+            chained = await self._send(full_name, event_payload)
+            pending.extend(
+                (event["name"], event.get("payload") or {})
+                for event in chained
+                if "." in event.get("name", "") and not event["name"].startswith("_")
+            )
+
+    async def _send(self, name: str, payload: dict) -> list[dict]:
+        """Sends one event and returns the events its updates asked to run."""
+        self._seq += 1
+        marker = str(self._seq)
+        waiting = _Waiting(marker, asyncio.get_running_loop().create_future())
+        self._waiting = waiting
+        event = {
+            "name": name,
+            "payload": payload,
+            "token": self.token,
+            "router_data": {
+                "pathname": "/",
+                "query": {"lt": marker},
+                "asPath": f"/?lt={marker}",
+            },
+        }
+        await self._ws.send(EVENT_PREFIX + json.dumps(["event", event]))
+        try:
+            return await asyncio.wait_for(waiting.future, self.timeout)
+        finally:
+            self._waiting = None
+
+    async def _read(self) -> None:
+        """Answers pings and dispatches state updates."""
+        async for message in self._ws:
+            if message == "2":
+                await self._ws.send("3")
+            elif message.startswith(EVENT_PREFIX):
+                name, *data = json.loads(message[len(EVENT_PREFIX) :])
+                if name == "event" and data:
+                    self._on_update(data[0])
+
+    def _on_update(self, update: dict) -> None:
+        """Tracks the board and resolves the waiting event on its final update."""
+        delta = update.get("delta") or {}
+        board = delta.get(KANBAN_STATE, {})
+        for key, value in board.items():
+            if key.split("_rx_state_")[0] == "stocks_by_stage" and value:
+                self.stocks = {
+                    stock["id"]: stock["status"]
+                    for stocks in value.values()
+                    for stock in stocks
+                }
+        waiting = self._waiting
+        if waiting is None or waiting.future.done():
+            return
+        if not waiting.matched:
+            # A background event is acknowledged with an empty final update;
+            # any other event's first update carries its router marker.
+            waiting.matched = (not delta and bool(update.get("final"))) or (
+                f'"lt": "{waiting.marker}"' in json.dumps(delta.get(ROOT_STATE, {}))
+            )
+        if waiting.matched:
+            waiting.events.extend(update.get("events") or [])
+            if update.get("final"):
+                waiting.future.set_result(waiting.events)
+
+
+def next_action(rng: random.Random, session: ReflexSession, mix: dict, at: float):
+    """
+    Picks the next action for a simulated analyst.
+
+    Args:
+        rng (random.Random): The session's random generator.
+        session (ReflexSession): Its session, for the board it has seen.
+        mix (dict): Action weights.
+        at (float): Seconds since the session started.
+
+    Returns:
+        Action: The action.
+    """
+    kind = rng.choices(list(mix), weights=list(mix.values()))[0]
+    stock_ids = list(session.stocks)
+    if kind in ("drop", "detail") and not stock_ids:
+        kind = "search"
+    if kind == "search":
+        events = [("set_search_query", {"query": rng.choice(SEARCH_TERMS)})]
+    elif kind == "drop":
+        stock_id = rng.choice(stock_ids)
+        status = session.stocks[stock_id]
+        index = STAGE_NAMES.index(status) if status in STAGE_NAMES else 0
+        new_stage = "Prospects" if status == "Ocean" else STAGE_NAMES[index + 1]
+        events = [
+            ("handle_drop", {"item": {"stock_id": stock_id}, "new_stage": new_stage}),
+            ("set_modal_user", {"value": rng.choice(USERS)}),
+            ("confirm_move", {"idempotency_key": uuid.uuid4().hex}),
+        ]
+    elif kind == "detail":
+        stock_id = rng.choice(stock_ids)
+        events = [
+            ("open_detail_modal", {"stock_id": stock_id, "tab": "history"}),
+            ("close_detail_modal", {}),
+        ]
+    elif kind == "stale":
+        events = [("toggle_stale_filter", {})]
+    elif kind == "export":
+        events = [("export_to_csv", {})]
+    else:
+        events = [("clear_filters", {})]
+    return Action(kind, at, events)
+
+
+@dataclass
+class LoadResult:
+    """
+    Measurements collected during a run.
+
+    Attributes:
+        latencies (dict[str, list[float]]): Seconds per completed action, by kind.
+        errors (dict[str, int]): Failed or timed-out actions, by kind.
+        trace (list[dict]): Actions performed, for recording.
+        rss (list[int]): Server RSS samples in bytes.
+    """
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    trace: list[dict] = field(default_factory=list)
+    rss: list[int] = field(default_factory=list)
+
+
+async def create_token(client: httpx.AsyncClient, user: str) -> str:
+    """
+    Seeds a new session through /_create_state, falling back to a fresh token
+    that hydrates with defaults when the server does not expose the endpoint.
+
+    Args:
+        client (httpx.AsyncClient): Client for the backend.
+        user (str): The analyst acting in the session.
+
+    Returns:
+        str: The client token.
+    """
+    try:
+        response = await client.post(
+            "/_create_state", json={"KanbanState": {"modal_user": user}}
+        )
+        if response.status_code == 200 and isinstance(response.json(), str):
+            return response.json()
+    except httpx.HTTPError:
+        pass
+    return uuid.uuid4().hex
+
+
+async def run_session(
+    index: int,
+    args: argparse.Namespace,
+    client: httpx.AsyncClient,
+    result: LoadResult,
+    deadline: float,
+    script: list[Action] | None,
+) -> None:
+    """
+    Runs one simulated analyst until the deadline or the end of its script.
+
+    Args:
+        index (int): Session number.
+        args (argparse.Namespace): Command line options.
+        client (httpx.AsyncClient): Client for the backend.
+        result (LoadResult): Where to record measurements.
+        deadline (float): Loop time at which to stop.
+        script (list[Action] | None): Recorded actions to replay, if any.
+    """
+    rng = random.Random(args.seed * 100_003 + index)
+    if script is None:
+        await asyncio.sleep(rng.uniform(0, args.ramp))
+    session = ReflexSession(
+        args.url, await create_token(client, rng.choice(USERS)), args.timeout
+    )
+    loop = asyncio.get_running_loop()
+    try:
+        await session.connect()
+    except (OSError, TimeoutError, websockets.WebSocketException):
+        result.errors["connect"] = result.errors.get("connect", 0) + 1
+        return
+    started = loop.time()
+    actions = iter(script) if script is not None else None
+    try:
+        while True:
+            if actions is not None:
+                action = next(actions, None)
+                if action is None:
+                    break
+                delay = started + action.at / args.speed - loop.time()
+            else:
+                delay = rng.expovariate(1 / args.think) if args.think > 0 else 0
+                action = next_action(
+                    rng, session, args.mix, loop.time() + delay - started
+                )
+            if loop.time() + max(delay, 0) >= deadline:
+                break
+            await asyncio.sleep(max(delay, 0))
+            action_started = time.perf_counter()
+            try:
+                for name, payload in action.events:
+                    await session.call(name, payload)
+            except (TimeoutError, websockets.WebSocketException):
+                result.errors[action.kind] = result.errors.get(action.kind, 0) + 1
+                continue
+            result.latencies.setdefault(action.kind, []).append(
+                time.perf_counter() - action_started
+            )
+            result.trace.append(
+                {
+                    "session": index,
+                    "at": round(action.at, 3),
+                    "kind": action.kind,
+                    "events": action.events,
+                }
+            )
+    finally:
+        await session.close()
+
+
+async def sample_rss(
+    client: httpx.AsyncClient, result: LoadResult, interval: float
+) -> None:
+    """
+    Samples process_resident_memory_bytes from /metrics until cancelled.
+
+    Args:
+        client (httpx.AsyncClient): Client for the backend.
+        result (LoadResult): Where to record samples.
+        interval (float): Seconds between samples.
+    """
+    while True:
+        try:
+            response = await client.get("/metrics")
+            for line in response.text.splitlines():
+                if line.startswith("process_resident_memory_bytes "):
+                    result.rss.append(int(float(line.split()[1])))
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(interval)
+
+
+def load_trace(path: Path) -> dict[int, list[Action]]:
+    """
+    Reads a recorded trace.
+
+    Args:
+        path (Path): A JSON Lines file written with --record.
+
+    Returns:
+        dict[int, list[Action]]: Actions per session, in time order.
+    """
+    scripts: dict[int, list[Action]] = {}
+    for line in path.read_text().splitlines():
+        if line.strip():
+            entry = json.loads(line)
+            scripts.setdefault(entry["session"], []).append(
+                Action(
+                    entry["kind"],
+                    entry["at"],
+                    [(name, payload) for name, payload in entry["events"]],
+                )
+            )
+    for actions in scripts.values():
+        actions.sort(key=lambda action: action.at)
+    return scripts
+
+
+def summarize(result: LoadResult, elapsed: float, sessions: int) -> dict:
+    """
+    Builds the report for a run.
+
+    Args:
+        result (LoadResult): Measurements.
+        elapsed (float): Wall-clock seconds of the run.
+        sessions (int): Sessions started.
+
+    Returns:
+        dict: Throughput, latency percentiles in milliseconds, errors and RSS.
+    """
+    every = [value for values in result.latencies.values() for value in values]
+
+    def stats(values: list[float]) -> dict:
+        return {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(values) * 1000, 2) if values else 0.0,
+        }
+
+    return {
+        "sessions": sessions,
+        "elapsed_seconds": round(elapsed, 2),
+        "actions_per_second": round(len(every) / elapsed, 2) if elapsed else 0.0,
+        "overall": stats(every),
+        "actions": {kind: stats(values) for kind, values in result.latencies.items()},
+        "errors": result.errors,
+        "rss_bytes": {
+            "start": result.rss[0] if result.rss else None,
+            "peak": max(result.rss) if result.rss else None,
+            "end": result.rss[-1] if result.rss else None,
+        },
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """
+    Runs the load test.
+
+    Args:
+        args (argparse.Namespace): Command line options.
+
+    Returns:
+        dict: The report.
+    """
+    scripts = load_trace(args.replay) if args.replay else None
+    sessions = len(scripts) if scripts is not None else args.sessions
+    result = LoadResult()
+    async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout) as client:
+        sampler = asyncio.create_task(sample_rss(client, result, args.rss_interval))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        if scripts is not None:
+            last = max(action.at for actions in scripts.values() for action in actions)
+            deadline = started + last / args.speed + args.timeout
+        else:
+            deadline = started + args.ramp + args.duration
+        await asyncio.gather(
+            *(
+                run_session(
+                    index,
+                    args,
+                    client,
+                    result,
+                    deadline,
+                    scripts.get(index) if scripts is not None else None,
+                )
+                for index in (scripts if scripts is not None else range(sessions))
+            )
+        )
+        elapsed = loop.time() - started
+        sampler.cancel()
+    if args.record:
+        args.record.write_text(
+            "".join(json.dumps(entry) + "\n" for entry in result.trace)
+        )
+    return summarize(result, elapsed, sessions)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    Parses action weights such as 'search=30,drop=20'.
+
+    Args:
+        value (str): The weights; unknown actions are rejected.
+
+    Returns:
+        dict[str, float]: Weights by action.
+
+    Raises:
+        argparse.ArgumentTypeError: If an action is unknown.
+    """
+    mix = {}
+    for item in value.split(","):
+        kind, _, weight = item.partition("=")
+        if kind not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown action: {kind}")
+        mix[kind] = float(weight)
+    return mix
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:8000", help="Backend URL.")
+    parser.add_argument("--sessions", type=int, default=100, help="Analysts.")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds of load.")
+    parser.add_argument("--ramp", type=float, default=10, help="Seconds to ramp up.")
+    parser.add_argument("--think", type=float, default=3, help="Mean think time.")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Action weights, e.g. search=30,drop=20,detail=20.",
+    )
+    parser.add_argument("--timeout", type=float, default=30, help="Event timeout.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument("--record", type=Path, help="Write the actions performed.")
+    parser.add_argument("--replay", type=Path, help="Replay a recorded trace.")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed-up.")
+    parser.add_argument(
+        "--rss-interval", type=float, default=1.0, help="Seconds between RSS samples."
+    )
+    parser.add_argument("--output", type=Path, help="Write the report as JSON.")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    print(text)
+    return 0 if not report["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""
+Times board operations on generated boards and stores the results as JSON.
+
+Usage:
+    python -m benchmarks.run_benchmarks --scales 1k,10k,100k
+    python -m benchmarks.run_benchmarks --scales 1m --repeat 3 --skip state_serialization
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/abc1234.json
+
+Results are written to benchmarks/results/<commit>.json unless --output is
+given, so runs on different commits can be compared with --compare.
+"""
+
+import argparse
+import gc
+import json
+import pickle
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.generator import STAGE_NAMES, STANDARD_BOARD, USERS, build_store
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SCALE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+class NullReporter:
+    """Job reporter that ignores progress, for running job functions inline."""
+
+    def progress(self, done: int, total: int, message: str = "") -> None:
+        pass
+
+    def check_cancelled(self) -> None:
+        pass
+
+
+def parse_scale(value: str) -> int:
+    """
+    Parses a scale such as 10000, 10k or 1m.
+
+    Args:
+        value (str): The scale.
+
+    Returns:
+        int: Number of stocks.
+    """
+    value = value.strip().lower()
+    if value[-1:] in SCALE_SUFFIXES:
+        return int(float(value[:-1]) * SCALE_SUFFIXES[value[-1]])
+    return int(value)
+
+
+def git_revision() -> tuple[str, bool]:
+    """
+    Returns the current commit and whether the work tree has changes.
+
+    Returns:
+        tuple[str, bool]: Short commit hash ('unknown' outside git) and dirty flag.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        return commit, bool(status)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def measure(
+    fn: Callable[[], object],
+    repeat: int,
+    number: int = 1,
+    setup: Callable[[], None] | None = None,
+) -> dict:
+    """
+    Times a callable.
+
+    Args:
+        fn (Callable): The operation.
+        repeat (int): Timed runs.
+        number (int): Calls per run.
+        setup (Callable | None): Untimed preparation before each run.
+
+    Returns:
+        dict: Runs, calls per run and min/median/mean milliseconds per run.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "runs": repeat,
+        "number": number,
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "mean_ms": round(statistics.fmean(timings), 4),
+    }
+
+
+def run_scale(
+    stock_count: int,
+    repeat: int,
+    seed: int,
+    selected: Callable[[str], bool] = lambda name: True,
+) -> dict:
+    """
+    Generates a board and runs the selected benchmarks against it.
+
+    Args:
+        stock_count (int): Number of stocks.
+        repeat (int): Timed runs per benchmark.
+        seed (int): Generator seed.
+        selected (Callable): Returns whether a benchmark should run.
+
+    Returns:
+        dict: Board size, generation time, benchmark timings and payload size.
+    """
+    from reflex.utils import format
+
+    import app.services.board_store as board_store
+    from app.services.boards import DEFAULT_BOARD_ID
+    from app.services.job_tasks import JOB_INPUTS, export_rows, export_stocks_csv
+    from app.services.jobs import BoardSnapshot
+    from app.states.kanban_state import KanbanState
+
+    started = time.perf_counter()
+    store = build_store(stock_count, seed)
+    generate_seconds = time.perf_counter() - started
+    # State handlers read the process-wide store; point it at the generated board.
+    board_store._board_stores[DEFAULT_BOARD_ID] = store
+
+    state = KanbanState(_reflex_internal_init=True, init_substates=False)
+    # A standalone state has no session board to lay out; use the generated one.
+    state.stage_defs = list(STANDARD_BOARD.stages)
+    state.load_stocks()
+    rng = random.Random(seed)
+    stock_ids = [stock.id for stock in store.stocks()]
+    pairs = [(rng.choice(STAGE_NAMES), rng.choice(STAGE_NAMES)) for _ in range(1000)]
+    rows = export_rows(store.get_stocks(stock_ids))
+
+    def set_filters():
+        state.search_query = "ab"
+        state.show_stale_only = True
+
+    def clear_filters():
+        state.search_query = ""
+        state.show_stale_only = False
+        state.stage_sorts = dict.fromkeys(STAGE_NAMES, "board")
+
+    def sort_columns():
+        clear_filters()
+        state.stage_sorts = dict.fromkeys(STAGE_NAMES, "days_in_stage")
+
+    def open_detail():
+        state.open_detail_modal(rng.choice(stock_ids))
+
+    def move_one():
+        stock = store.get_stock(rng.choice(stock_ids))
+        index = STAGE_NAMES.index(stock.status)
+        new_stage = "Prospects" if stock.status == "Ocean" else STAGE_NAMES[index + 1]
+        for _ in state.move_stock(
+            stock.id, new_stage, "Benchmark move", rng.choice(USERS)
+        ):
+            pass
+
+    benchmarks = {
+        "validate_transition_x1000": (
+            lambda: [store.policy.check(a, b) for a, b in pairs],
+            1,
+            None,
+        ),
+        "filtered_stocks": (state._filtered_stocks, 1, set_filters),
+        "stocks_by_stage": (state._refresh_columns, 1, clear_filters),
+        "stocks_by_stage_sorted": (state._refresh_columns, 1, sort_columns),
+        "open_detail_x100": (open_detail, 100, None),
+        "refresh_stock_ages": (state.refresh_stock_ages, 1, None),
+        # What submitting a job costs: its inputs copied and pickled for
+        # the process pool, for the audit check and for an export.
+        "board_snapshot": (lambda: pickle.dumps(BoardSnapshot.of(store)), 1, None),
+        "export_inputs": (
+            lambda: pickle.dumps(
+                JOB_INPUTS["export_csv"](store, {"stock_ids": stock_ids})
+            ),
+            1,
+            None,
+        ),
+        "export_csv": (
+            lambda: export_stocks_csv(rows, NullReporter()),
+            1,
+            None,
+        ),
+        "state_serialization": (lambda: format.json_dumps(state.dict()), 1, None),
+        "move_stock_x10": (move_one, 10, None),
+    }
+    results = {}
+    for name, (fn, number, setup) in benchmarks.items():
+        if selected(name):
+            results[name] = measure(fn, repeat, number, setup)
+
+    return {
+        "stocks": stock_count,
+        "logs": store.log_count(),
+        "generate_seconds": round(generate_seconds, 3),
+        "state_payload_bytes": (
+            len(format.json_dumps(state.dict()))
+            if selected("state_serialization")
+            else None
+        ),
+        "benchmarks": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> str:
+    """
+    Formats a table of median timings against a baseline run.
+
+    Args:
+        baseline (dict): Earlier results.
+        current (dict): New results.
+
+    Returns:
+        str: One row per scale and benchmark present in both.
+    """
+    rows = [
+        f"{'scale':>9}  {'benchmark':<28}{'baseline ms':>13}{'current ms':>13}{'ratio':>8}"
+    ]
+    for scale, result in current["scales"].items():
+        before = baseline["scales"].get(scale)
+        if before is None:
+            continue
+        for name, timing in result["benchmarks"].items():
+            old = before["benchmarks"].get(name)
+            if old is None:
+                continue
+            ratio = timing["median_ms"] / old["median_ms"] if old["median_ms"] else 0
+            rows.append(
+                f"{scale:>9}  {name:<28}{old['median_ms']:>13.3f}"
+                f"{timing['median_ms']:>13.3f}{ratio:>7.2f}x"
+            )
+        if before["state_payload_bytes"] and result["state_payload_bytes"]:
+            rows.append(
+                f"{scale:>9}  {'state_payload_bytes':<28}"
+                f"{before['state_payload_bytes']:>13}"
+                f"{result['state_payload_bytes']:>13}"
+            )
+    return "\n".join(rows)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scales", default="1k,10k,100k", help="Comma-separated board sizes."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs each.")
+    parser.add_argument("--seed", type=int, default=42, help="Generator seed.")
+    parser.add_argument(
+        "--only", default="", help="Benchmarks to run, comma-separated."
+    )
+    parser.add_argument(
+        "--skip", default="", help="Benchmarks to skip, comma-separated."
+    )
+    parser.add_argument("--output", type=Path, help="Where to write the results.")
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare.")
+    args = parser.parse_args(argv)
+
+    only = {name for name in args.only.split(",") if name}
+    skip = {name for name in args.skip.split(",") if name}
+
+    def selected(name: str) -> bool:
+        return (not only or name in only) and name not in skip
+
+    commit, dirty = git_revision()
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "scales": {},
+    }
+    for scale in args.scales.split(","):
+        stock_count = parse_scale(scale)
+        print(f"Running {stock_count} stocks...", file=sys.stderr)
+        report["scales"][str(stock_count)] = run_scale(
+            stock_count, args.repeat, args.seed, selected
+        )
+
+    output = args.output or RESULTS_DIR / f"{commit}{'-dirty' if dirty else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Wrote {output}", file=sys.stderr)
+
+    if args.compare:
+        print(compare(json.loads(args.compare.read_text()), report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Measures how long a fresh process takes to import and compile the app.
+
+Each run starts a new interpreter, so nothing is cached between runs, and
+times three phases: importing the Reflex modules the app builds on,
+importing the app itself (its models, services, states, components and
+pages), and a dry-run compile that evaluates every page and renders it to
+JavaScript without writing files.
+
+Usage:
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --compare benchmarks/results/startup-abc1234.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.run_benchmarks import RESULTS_DIR, git_revision
+
+ROOT = Path(__file__).resolve().parent.parent
+PHASES = ("import_framework", "import_app", "compile")
+RESULT_TAG = "STARTUP "
+
+# Runs in the child interpreter and prints its phase timings as JSON on a
+# tagged line, since Reflex writes its own console output alongside it.
+CHILD = """
+import json, time
+started = time.perf_counter()
+import reflex.app, reflex.state, reflex_enterprise
+imported_framework = time.perf_counter()
+from app.app import app
+imported_app = time.perf_counter()
+app._compile(dry_run=True, use_rich=False)
+compiled = time.perf_counter()
+print("STARTUP " + json.dumps({
+    "import_framework": imported_framework - started,
+    "import_app": imported_app - imported_framework,
+    "compile": compiled - imported_app,
+}), flush=True)
+"""
+
+
+def run_once() -> dict[str, float]:
+    """
+    Starts a fresh interpreter and times its startup phases.
+
+    Returns:
+        dict[str, float]: Seconds per phase, plus the interpreter's total
+            wall-clock time including its own startup.
+
+    Raises:
+        RuntimeError: If the child process fails.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+    )
+    total = time.perf_counter() - started
+    tagged = [
+        line.removeprefix(RESULT_TAG)
+        for line in (result.stdout + result.stderr).replace("\x03", "").splitlines()
+        if line.startswith(RESULT_TAG)
+    ]
+    if result.returncode != 0 or not tagged:
+        output = (result.stderr or result.stdout)[-2000:]
+        raise RuntimeError(f"Startup run failed ({result.returncode}):\n{output}")
+    return {**json.loads(tagged[-1]), "total": total}
+
+
+def summarize(runs: list[dict[str, float]]) -> dict:
+    """
+    Aggregates phase timings across runs.
+
+    Args:
+        runs (list[dict[str, float]]): Seconds per phase for each run.
+
+    Returns:
+        dict: Min/median/mean milliseconds per phase.
+    """
+    return {
+        phase: {
+            "min_ms": round(min(run[phase] for run in runs) * 1000, 2),
+            "median_ms": round(statistics.median(run[phase] for run in runs) * 1000, 2),
+            "mean_ms": round(statistics.fmean(run[phase] for run in runs) * 1000, 2),
+        }
+        for phase in (*PHASES, "total")
+    }
+
+
+def compare(baseline: dict, current: dict) -> str:
+    """
+    Formats a table of median phase timings against a baseline run.
+
+    Args:
+        baseline (dict): Earlier results.
+        current (dict): New results.
+
+    Returns:
+        str: One row per phase present in both.
+    """
+    rows = [f"{'phase':<16}{'baseline ms':>13}{'current ms':>13}{'ratio':>8}"]
+    for phase, timing in current["phases"].items():
+        old = baseline["phases"].get(phase)
+        if old is None:
+            continue
+        ratio = timing["median_ms"] / old["median_ms"] if old["median_ms"] else 0
+        rows.append(
+            f"{phase:<16}{old['median_ms']:>13.1f}"
+            f"{timing['median_ms']:>13.1f}{ratio:>7.2f}x"
+        )
+    return "\n".join(rows)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes.")
+    parser.add_argument("--output", type=Path, help="Where to write the results.")
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare.")
+    args = parser.parse_args(argv)
+
+    runs = []
+    for index in range(args.runs):
+        print(f"Run {index + 1}/{args.runs}...", file=sys.stderr)
+        runs.append(run_once())
+
+    commit, dirty = git_revision()
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "runs": args.runs,
+        "phases": summarize(runs),
+    }
+    suffix = "-dirty" if dirty else ""
+    output = args.output or RESULTS_DIR / f"startup-{commit}{suffix}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Wrote {output}", file=sys.stderr)
+
+    if args.compare:
+        print(compare(json.loads(args.compare.read_text()), report))
+    else:
+        print(json.dumps(report["phases"], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
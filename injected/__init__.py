@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import re
 import sys
+import threading
 import time
 import traceback
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -140,6 +149,9 @@ class ErrorPrefixFormatter(logging.Formatter):
 
     def format(self, record):  # noqa: ANN001
         formatted_message = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            formatted_message += f" ({suppressed} similar messages suppressed)"
 
         if record.levelno >= logging.ERROR:
             return f"[ERROR]: {formatted_message}"
@@ -147,25 +159,236 @@ class ErrorPrefixFormatter(logging.Formatter):
         return formatted_message
 
 
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders each record as one JSON object per line."""
+
+    def format(self, record):  # noqa: ANN001
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        return json.dumps(entry, default=str)
+
+
+class LogRateLimitFilter(logging.Filter):
+    """Samples and rate-limits records below WARNING.
+
+    Records are keyed by logger and unformatted message, so lazy %-style
+    calls such as ``logging.info("Moved #%d", stock_id)`` share one budget no
+    matter their arguments. Each key may log ``rate`` records per second,
+    with bursts of up to ``rate`` records, or one for rates below 1. The
+    next record let through for a key carries the number suppressed since.
+    """
+
+    max_keys = 1000
+
+    def __init__(self, rate: float = 0, sample: float = 1.0):
+        """
+        Args:
+            rate: Records per second allowed per key; 0 disables the limit.
+            sample: Fraction of records kept before rate limiting.
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = max(1.0, rate)
+        self.sample = sample
+        self._buckets: dict[tuple[str, str], tuple[float, float]] = {}
+        self._suppressed: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):  # noqa: ANN001
+        if record.levelno >= logging.WARNING:
+            return True
+        if self.sample < 1 and random.random() >= self.sample:
+            return False
+        if self.rate <= 0:
+            return True
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            if len(self._buckets) >= self.max_keys and key not in self._buckets:
+                self._buckets.clear()
+            tokens, last = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            self._buckets[key] = (tokens - 1, now)
+            suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
 class FlexgenStreamHandler(logging.StreamHandler):
     """Custom StreamHandler with ErrorPrefixFormatter for Flexgen logging."""
 
-    def __init__(self, stream=None):  # noqa: ANN001
+    def __init__(self, stream=None, json_format: bool = False):  # noqa: ANN001
         super().__init__(stream or sys.stdout)
-        formatter = ErrorPrefixFormatter("%(name)s - %(levelname)s - %(message)s")
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = ErrorPrefixFormatter("%(name)s - %(levelname)s - %(message)s")
         self.setFormatter(formatter)
 
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        """Write several records with a single write and flush.
+
+        Args:
+            records: The records, in order.
+        """
+        if not records:
+            return
+        try:
+            text = "".join(self.format(record) + self.terminator for record in records)
+            with self.lock:
+                self.stream.write(text)
+                self.flush()
+        except Exception:
+            self.handleError(records[0])
+
+
+class FlexgenQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to a writer thread so logging never blocks on stdout.
+
+    The caller only applies filters and interpolates the message; formatting
+    and writing happen on the writer thread, which drains the queue in
+    batches through a FlexgenStreamHandler. When the queue is full, new
+    records are dropped rather than blocking the event loop, and the writer
+    reports how many were lost, counting warnings and errors separately.
+    """
+
+    def __init__(
+        self,
+        sink: FlexgenStreamHandler,
+        max_queue: int = 10000,
+        batch_size: int = 512,
+    ):
+        """
+        Args:
+            sink: Where the writer thread writes records.
+            max_queue: Records buffered before new ones are dropped.
+            batch_size: Most records written per write call.
+        """
+        super().__init__(queue.Queue(max_queue))
+        self.sink = sink
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.dropped_warnings = 0
+        self._stopped = threading.Event()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="log-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.stop)
+
+    @classmethod
+    def from_env(cls) -> FlexgenQueueHandler:
+        """Build the handler from LOG_* environment variables.
+
+        Returns:
+            The handler, with its writer thread running.
+        """
+        handler = cls(
+            FlexgenStreamHandler(
+                json_format=os.getenv("LOG_FORMAT", "text").lower() == "json"
+            ),
+            max_queue=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+            batch_size=int(os.getenv("LOG_BATCH_SIZE", "512")),
+        )
+        handler.addFilter(
+            LogRateLimitFilter(
+                rate=float(os.getenv("LOG_INFO_RATE", "0")),
+                sample=float(os.getenv("LOG_INFO_SAMPLE", "1.0")),
+            )
+        )
+        return handler
+
+    def prepare(self, record):  # noqa: ANN001
+        # Unlike the base class, leave formatting to the writer thread; only
+        # resolve what may change or reference frames after the call returns.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self.sink.formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):  # noqa: ANN001
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if record.levelno >= logging.WARNING:
+                self.dropped_warnings += 1
+
+    def _write_loop(self) -> None:
+        """Drain the queue in batches until stopped."""
+        while True:
+            record = self.queue.get()
+            batch = [] if record is None else [record]
+            stop = record is None
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                else:
+                    batch.append(record)
+            if self.dropped:
+                dropped, self.dropped = self.dropped, 0
+                warnings, self.dropped_warnings = self.dropped_warnings, 0
+                batch.append(
+                    logging.makeLogRecord(
+                        {
+                            "name": __name__,
+                            "levelno": logging.WARNING,
+                            "levelname": "WARNING",
+                            "msg": f"Dropped {dropped} log records, {warnings} "
+                            "of them warnings or errors: queue full",
+                        }
+                    )
+                )
+            self.sink.emit_batch(batch)
+            if stop:
+                return
+
+    def stop(self) -> None:
+        """Write out queued records and stop the writer thread."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self.queue.put(None)
+        self._writer.join(timeout=5)
+
+    def close(self) -> None:
+        self.stop()
+        super().close()
+
 
 def set_logger():
     root_logger = logging.getLogger()
 
-    # Check if FlexgenStreamHandler already exists
+    # Check if FlexgenQueueHandler already exists
     for handler in root_logger.handlers:
-        if isinstance(handler, FlexgenStreamHandler):
+        if isinstance(handler, FlexgenQueueHandler):
             return
 
     # Add our custom handler if it doesn't exist
-    handler = FlexgenStreamHandler()
+    handler = FlexgenQueueHandler.from_env()
     root_logger.addHandler(handler)
 
 
@@ -299,6 +522,583 @@ class CreateStatePlugin(BasePlugin):
         )
 
 
+SYNC_BATCH = "/_sync_batch"
+
+
+class SyncBatchPlugin(BasePlugin):
+    def post_compile(self, **context: Unpack[PostCompileContext]) -> None:
+        """Called after the compilation of the plugin.
+
+        Args:
+            context: The context for the plugin.
+        """
+        app = context["app"]
+        self._sync_batch_endpoint(app)
+
+    @staticmethod
+    def _sync_batch_endpoint(app: App) -> None:
+        """Add an endpoint that applies a batch of moves queued by an offline client.
+
+        The request body is ``{"token": <client token>, "items": [...]}``,
+        with an optional ``"board"`` ID. The items are applied in order to
+        that board, by default the one the client has open, then that
+        client's state is reloaded and the delta pushed to it if it is
+        connected. The batch runs on a worker thread without the client's
+        state lock, which is only taken for the reload.
+
+        Args:
+            app: The application instance to which the endpoint will be added.
+        """
+        if not app._api:
+            return
+
+        async def sync_batch(request: Request) -> Response:
+            import asyncio
+
+            from reflex.state import _substate_key
+            from starlette.responses import JSONResponse
+
+            from app.services.board_store import get_board_store
+            from app.services.boards import UnknownBoardError, default_board_id
+            from app.services.sync import SyncBatchError, apply_sync_batch
+            from app.states.kanban_state import KanbanState
+
+            try:
+                if not app.event_namespace:
+                    return JSONResponse({})
+
+                payload: dict[str, object] = await request.json()
+
+                if not isinstance(payload, dict) or not isinstance(
+                    payload.get("token"), str
+                ):
+                    return JSONResponse(
+                        {"error": "Payload must be a dictionary with a string token."},
+                        status_code=400,
+                    )
+
+                token_key = _substate_key(payload["token"], KanbanState)
+                board_id = payload.get("board")
+                if not board_id:
+                    root_state = await app.state_manager.get_state(token_key)
+                    board_id = (await root_state.get_state(KanbanState)).board_id
+                board_id = str(board_id or default_board_id())
+                try:
+                    results = await asyncio.to_thread(
+                        lambda: apply_sync_batch(
+                            payload.get("items"), get_board_store(board_id)
+                        )
+                    )
+                except (SyncBatchError, UnknownBoardError) as e:
+                    return JSONResponse({"error": str(e)}, status_code=400)
+
+                async with app.modify_state(token_key) as root_state:
+                    state = await root_state.get_state(KanbanState)
+                    if state._board().id == board_id:
+                        state.load_stocks()
+
+                return JSONResponse({"results": results})
+            except Exception as e:
+                return JSONResponse(
+                    {
+                        "error": "Internal server error.",
+                        "error_message": str(e),
+                        "traceback": traceback.format_exc(),
+                    },
+                    status_code=500,
+                )
+
+        app._api.add_route(
+            SYNC_BATCH,
+            sync_batch,
+            methods=["POST"],
+        )
+
+
+class BoardApiPlugin(BasePlugin):
+    def post_compile(self, **context: Unpack[PostCompileContext]) -> None:
+        """Called after the compilation of the plugin.
+
+        Args:
+            context: The context for the plugin.
+        """
+        app = context["app"]
+        self._board_api_endpoints(app)
+
+    @staticmethod
+    def _board_api_endpoints(app: App) -> None:
+        """Add the versioned board HTTP API to the app.
+
+        The endpoints read from and write to the shared board store directly,
+        without creating a UI state per request.
+
+        Args:
+            app: The application instance to which the endpoints will be added.
+        """
+        if not app._api:
+            return
+
+        from app.services.board_api import ROUTES
+
+        for path, endpoint, methods in ROUTES:
+            app._api.add_route(path, endpoint, methods=methods)
+
+
+class BoardBroadcastPlugin(BasePlugin):
+    def post_compile(self, **context: Unpack[PostCompileContext]) -> None:
+        """Called after the compilation of the plugin.
+
+        Args:
+            context: The context for the plugin.
+        """
+        app = context["app"]
+        self._board_broadcast_task(app)
+
+    @staticmethod
+    def _board_broadcast_task(app: App) -> None:
+        """Run the board broadcaster for the lifetime of the app.
+
+        Each board's changes are pushed to every client subscribed to it as
+        coalesced frames. A board's broadcaster starts with its first
+        subscriber. Clients that have disconnected or switched to another
+        board are unsubscribed.
+
+        Args:
+            app: The application instance to which the task will be added.
+        """
+        from reflex.state import _substate_key
+
+        from app.services.broadcast import BoardFrame, BroadcastRunner
+        from app.states.kanban_state import KanbanState
+
+        def deliver_for(board_id: str):
+            async def deliver(token: str, frame: BoardFrame) -> bool:
+                if (
+                    not app.event_namespace
+                    or token not in app.event_namespace.token_to_sid
+                ):
+                    return False
+                async with app.modify_state(
+                    _substate_key(token, KanbanState)
+                ) as root_state:
+                    state = await root_state.get_state(KanbanState)
+                    if state.board_id != board_id:
+                        return False
+                    state._apply_board_frame(frame)
+                return True
+
+            return deliver
+
+        async def board_broadcast() -> None:
+            await BroadcastRunner(deliver_for).run()
+
+        app.register_lifespan_task(board_broadcast)
+
+
+class BoardArchivePlugin(BasePlugin):
+    def post_compile(self, **context: Unpack[PostCompileContext]) -> None:
+        """Called after the compilation of the plugin.
+
+        Args:
+            context: The context for the plugin.
+        """
+        app = context["app"]
+        self._board_archive_task(app)
+
+    @staticmethod
+    def _board_archive_task(app: App) -> None:
+        """Re-apply the board's archive policy for the lifetime of the app.
+
+        The board store archives aged Ocean stocks and logs when it loads.
+        This task repeats that every KANBAN_ARCHIVE_INTERVAL seconds on a
+        worker thread for every board this worker has open, so deals keep
+        leaving the hot working set as they age. An interval of 0 disables
+        it.
+
+        Args:
+            app: The application instance to which the task will be added.
+        """
+        import asyncio
+
+        from app.services.board_store import loaded_board_stores
+
+        interval = float(os.getenv("KANBAN_ARCHIVE_INTERVAL", "3600"))
+        if interval <= 0:
+            return
+
+        async def board_archive() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                for board_id, store in loaded_board_stores().items():
+                    try:
+                        await asyncio.to_thread(store.archive_cold)
+                    except Exception:
+                        logging.exception("Archiving board %s failed", board_id)
+
+        app.register_lifespan_task(board_archive)
+
+
+class BoardConfigPlugin(BasePlugin):
+    def post_compile(self, **context: Unpack[PostCompileContext]) -> None:
+        """Called after the compilation of the plugin.
+
+        Args:
+            context: The context for the plugin.
+        """
+        app = context["app"]
+        self._board_config_task(app)
+
+    @staticmethod
+    def _board_config_task(app: App) -> None:
+        """Hot-reload the boards file for the lifetime of the app.
+
+        Every KANBAN_CONFIG_POLL seconds the boards file is checked on a
+        worker thread; a changed file is compiled and swapped in whole, and
+        sessions on an affected board reload its columns. An invalid file
+        is logged once and ignored until it changes again. An interval of 0
+        disables it.
+
+        Args:
+            app: The application instance to which the task will be added.
+        """
+        import asyncio
+
+        from app.services.board_store import reload_board_config
+
+        interval = float(os.getenv("KANBAN_CONFIG_POLL", "5"))
+        if interval <= 0:
+            return
+
+        async def board_config() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await asyncio.to_thread(reload_board_config)
+                except (OSError, ValueError) as e:
+                    logging.error("Boards file not reloaded: %s", e)
+                except Exception:
+                    logging.exception("Reloading the boards file failed")
+
+        app.register_lifespan_task(board_config)
+
+
+METRICS = "/metrics"
+
+
+class MetricsPlugin(BasePlugin):
+    def post_compile(self, **context: Unpack[PostCompileContext]) -> None:
+        """Called after the compilation of the plugin.
+
+        Args:
+            context: The context for the plugin.
+        """
+        app = context["app"]
+        self._measure_payloads(app)
+        self._collect_board_gauges(app)
+        self._metrics_endpoint(app)
+
+    @staticmethod
+    def _measure_payloads(app: App) -> None:
+        """Record the size of every state update sent over the websocket.
+
+        The Socket.IO packet encoder is wrapped, so each update is measured
+        from the JSON it is already serialized to.
+
+        Args:
+            app: The application whose socket server will be measured.
+        """
+        from types import SimpleNamespace
+
+        from reflex.constants import SocketEvent
+
+        from app.services.metrics import STATE_PAYLOAD_BYTES
+
+        if not app.sio:
+            return
+
+        packet_json = app.sio.packet_class.json
+        dumps = packet_json.dumps
+        if getattr(dumps, "_measures_payloads", False):
+            return
+        event_name = str(SocketEvent.EVENT)
+
+        def measured_dumps(data: object, *args: object, **kwargs: object) -> str:
+            encoded = dumps(data, *args, **kwargs)
+            if isinstance(data, list) and data and data[0] == event_name:
+                STATE_PAYLOAD_BYTES.observe(len(encoded))
+            return encoded
+
+        measured_dumps._measures_payloads = True
+        app.sio.packet_class.json = SimpleNamespace(
+            dumps=measured_dumps, loads=packet_json.loads
+        )
+
+    @staticmethod
+    def _collect_board_gauges(app: App) -> None:
+        """Read board sizes and connected clients at scrape time.
+
+        Args:
+            app: The application whose clients will be counted.
+        """
+        from app.services.board_store import loaded_board_stores
+        from app.services.metrics import (
+            BOARD_ARCHIVED,
+            BOARD_LOGS,
+            BOARD_STOCKS,
+            CONNECTED_CLIENTS,
+        )
+
+        BOARD_STOCKS.set_collector(
+            lambda: {
+                (board_id, stage): count
+                for board_id, store in loaded_board_stores().items()
+                for stage, count in store.stage_counts().items()
+            }
+        )
+        BOARD_LOGS.set_collector(
+            lambda: {
+                (board_id,): store.log_count()
+                for board_id, store in loaded_board_stores().items()
+            }
+        )
+        BOARD_ARCHIVED.set_collector(
+            lambda: {
+                (board_id, kind): count
+                for board_id, store in loaded_board_stores().items()
+                for kind, count in (
+                    ("stocks", store.archive.stock_count()),
+                    ("logs", store.archive.log_count()),
+                )
+            }
+        )
+        CONNECTED_CLIENTS.set_collector(
+            lambda: {
+                (): len(app.event_namespace.token_to_sid) if app.event_namespace else 0
+            }
+        )
+
+    @staticmethod
+    def _metrics_endpoint(app: App) -> None:
+        """Add an endpoint serving metrics in the Prometheus text format.
+
+        Args:
+            app: The application instance to which the endpoint will be added.
+        """
+        if not app._api:
+            return
+
+        async def metrics(request: Request) -> Response:
+            from starlette.responses import PlainTextResponse
+
+            from app.services.metrics import REGISTRY
+
+            return PlainTextResponse(
+                REGISTRY.render(), media_type="text/plain; version=0.0.4"
+            )
+
+        app._api.add_route(METRICS, metrics, methods=["GET"])
+
+
+PROFILES = "/_admin/profiles"
+
+
+class ProfilerPlugin(BasePlugin):
+    def post_compile(self, **context: Unpack[PostCompileContext]) -> None:
+        """Called after the compilation of the plugin.
+
+        Args:
+            context: The context for the plugin.
+        """
+        app = context["app"]
+        self._install_profiler(app)
+
+    @staticmethod
+    def _install_profiler(app: App) -> None:
+        """Profile matching board events and serve the captured profiles.
+
+        Does nothing unless PROFILE_MODE is set, so event dispatch is
+        untouched when profiling is off. The profile routes also require
+        PROFILE_ADMIN_TOKEN, sent as a bearer token.
+
+        Args:
+            app: The application instance to which the routes will be added.
+        """
+        import hmac
+
+        from app.services.profiler import get_event_profiler
+        from app.states.kanban_state import KanbanState
+
+        profiler = get_event_profiler()
+        if profiler is None:
+            return
+        installed = profiler.install(KanbanState)
+        logging.getLogger(__name__).warning(
+            "Profiling %s in %s mode", ", ".join(installed), profiler.config.mode
+        )
+
+        admin_token = os.getenv("PROFILE_ADMIN_TOKEN", "")
+        if not app._api or not admin_token:
+            return
+
+        def authorized(request: Request) -> bool:
+            supplied = request.headers.get("authorization", "")
+            return hmac.compare_digest(supplied, f"Bearer {admin_token}")
+
+        async def list_profiles(request: Request) -> Response:
+            from starlette.responses import JSONResponse
+
+            if not authorized(request):
+                return JSONResponse({"error": "Unauthorized."}, status_code=401)
+            return JSONResponse({"profiles": profiler.store.list()})
+
+        async def download_profile(request: Request) -> Response:
+            from starlette.responses import FileResponse, JSONResponse
+
+            if not authorized(request):
+                return JSONResponse({"error": "Unauthorized."}, status_code=401)
+            path = profiler.store.path(request.path_params["name"])
+            if path is None:
+                return JSONResponse({"error": "Profile not found."}, status_code=404)
+            return FileResponse(path, filename=path.name)
+
+        app._api.add_route(PROFILES, list_profiles, methods=["GET"])
+        app._api.add_route(f"{PROFILES}/{{name}}", download_profile, methods=["GET"])
+
+
+COMPILE_HASH_FILE = "kanban_compile_hash"
+COMPILE_SOURCES = ("app", "injected", "assets", "rxconfig.py")
+
+
+class CompileCachePlugin(BasePlugin):
+    """Skip recompiling the frontend when none of its sources changed.
+
+    The frontend is compiled from the app's components, states, assets and
+    configuration. After a compile, a hash of those files, the Reflex
+    versions and the env mode is stored next to the output. When the next
+    start finds the same hash and the compiled pages still on disk, it asks
+    Reflex to reuse them.
+
+    Both steps wrap ``App._compile`` rather than using the plugin hooks:
+    ``pre_compile`` only runs once Reflex has already chosen to compile, and
+    the CLI process that compiles never calls ``post_compile``. Backend
+    workers are started with the nocompile marker in place, so only the
+    compiling process hashes anything.
+    """
+
+    def __init__(self):
+        from reflex.app import App
+
+        compile_app = App._compile
+        if getattr(compile_app, "_compile_cache", False):
+            return
+
+        def _compile(app: App, *args, **kwargs) -> None:
+            if kwargs.get("dry_run", False) or not self._would_compile():
+                compile_app(app, *args, **kwargs)
+                return
+            source_hash = self._source_hash()
+            reused = self._skip_unchanged_compile(source_hash)
+            compile_app(app, *args, **kwargs)
+            if not reused:
+                self._record_compile(app, source_hash)
+
+        _compile._compile_cache = True
+        App._compile = _compile
+
+    @staticmethod
+    def _source_hash() -> str:
+        """Hash everything the compiled frontend is built from.
+
+        Returns:
+            The hex digest.
+        """
+        import hashlib
+        from importlib import metadata
+
+        from reflex.environment import environment
+
+        digest = hashlib.sha256()
+        for package in ("reflex", "reflex-enterprise"):
+            try:
+                version = metadata.version(package)
+            except metadata.PackageNotFoundError:
+                version = ""
+            digest.update(f"{package}=={version}\n".encode())
+        digest.update(f"{environment.REFLEX_ENV_MODE.get().value}\n".encode())
+        # Config fields can be overridden from the environment, e.g. API_URL.
+        fields = {name.upper() for name in rx.Config.__dataclass_fields__}
+        for key, value in sorted(os.environ.items()):
+            if key.removeprefix("REFLEX_") in fields:
+                digest.update(f"{key}={value}\n".encode())
+        root = Path(__file__).resolve().parent.parent
+        for source in COMPILE_SOURCES:
+            path = root / source
+            files = sorted(path.rglob("*")) if path.is_dir() else [path]
+            for file in files:
+                if file.is_file() and "__pycache__" not in file.parts:
+                    digest.update(file.relative_to(root).as_posix().encode())
+                    digest.update(file.read_bytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _would_compile() -> bool:
+        """Check whether Reflex is about to write the frontend.
+
+        Returns:
+            False when compiling is already being skipped.
+        """
+        from reflex import constants
+        from reflex.environment import environment
+        from reflex.utils import prerequisites
+
+        if environment.REFLEX_SKIP_COMPILE.get():
+            return False
+        return not (prerequisites.get_web_dir() / constants.NOCOMPILE_FILE).exists()
+
+    @staticmethod
+    def _skip_unchanged_compile(source_hash: str) -> bool:
+        """Tell Reflex to skip the next compile if its output is current.
+
+        Args:
+            source_hash: The hash of the current sources.
+
+        Returns:
+            Whether the previous output is reused.
+        """
+        from reflex import constants
+        from reflex.utils import prerequisites
+
+        web_dir = prerequisites.get_web_dir()
+        hash_file = web_dir / COMPILE_HASH_FILE
+        nocompile = web_dir / constants.NOCOMPILE_FILE
+        pages = web_dir / constants.Dirs.PAGES / constants.Dirs.ROUTES
+        if not (
+            pages.is_dir()
+            and hash_file.is_file()
+            and hash_file.read_text() == source_hash
+        ):
+            return False
+        nocompile.touch()
+        return True
+
+    @staticmethod
+    def _record_compile(app: App, source_hash: str) -> None:
+        """Store the source hash after a full compile.
+
+        Args:
+            app: The compiled application instance.
+            source_hash: The hash of the sources it was compiled from.
+        """
+        from reflex.utils import prerequisites
+
+        # Pages are only kept when the frontend was actually compiled.
+        if not app._pages:
+            return
+        web_dir = prerequisites.get_web_dir()
+        if web_dir.is_dir():
+            (web_dir / COMPILE_HASH_FILE).write_text(source_hash)
+
+
 LAST_COMPILED_FILE = Path("/home/user/.last_compiled")
 
 
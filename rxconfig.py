@@ -1,3 +1,34 @@
+import os
+
 import reflex as rx
+from injected import (
+    BoardApiPlugin,
+    BoardArchivePlugin,
+    BoardBroadcastPlugin,
+    BoardConfigPlugin,
+    CompileCachePlugin,
+    CreateStatePlugin,
+    MetricsPlugin,
+    ProfilerPlugin,
+    SyncBatchPlugin,
+)
 
-config = rx.Config(app_name="app", plugins=[rx.plugins.TailwindV3Plugin()])
+config = rx.Config(
+    app_name="app",
+    plugins=[
+        rx.plugins.TailwindV3Plugin(),
+        SyncBatchPlugin(),
+        BoardApiPlugin(),
+        BoardBroadcastPlugin(),
+        BoardArchivePlugin(),
+        BoardConfigPlugin(),
+        MetricsPlugin(),
+        ProfilerPlugin(),
+        CompileCachePlugin(),
+        *(
+            [CreateStatePlugin()]
+            if os.getenv("KANBAN_ENABLE_CREATE_STATE", "0") == "1"
+            else []
+        ),
+    ],
+)